@@ -25,7 +25,12 @@ from botocore.exceptions import (
 )
 from diskcache import Cache
 
+from infrahouse_toolkit.aws.client_registry import get_cached_client, get_role_session
 from infrahouse_toolkit.aws.config import AWSConfig
+from infrahouse_toolkit.aws.credential_cache import (
+    STATIC_CREDENTIALS_MIN_LIFETIME,
+    cached_role_credentials,
+)
 from infrahouse_toolkit.aws.exceptions import IHAWSException
 from infrahouse_toolkit.fs import ensure_permissions
 
@@ -48,6 +53,11 @@ def assume_role(role_arn, region=None) -> dict:
     """
     Assume a given role and return a dictionary with credentials.
 
+    Credentials are reused from the on-disk cache of
+    :mod:`~infrahouse_toolkit.aws.credential_cache` only while they have
+    at least :data:`~infrahouse_toolkit.aws.credential_cache.STATIC_CREDENTIALS_MIN_LIFETIME`
+    seconds left: they are exported as static environment variables and can't refresh themselves.
+
     :param role_arn: Role to be assumed.
     :type role_arn: str
     :param region: AWS region name.
@@ -56,10 +66,11 @@ def assume_role(role_arn, region=None) -> dict:
     """
     try:
         LOG.debug("Assuming role %s", role_arn)
-        client = boto3.client("sts", region_name=region)
-        response = client.assume_role(RoleArn=role_arn, RoleSessionName="ih-s3-reprepro-s3fs")
-        LOG.debug("Got credentials %r", response["Credentials"])
-        return {var: response["Credentials"].get(key) for var, key in VALUE_MAP.items()}
+        credentials = cached_role_credentials(
+            role_arn, "ih-s3-reprepro-s3fs", region=region, min_lifetime=STATIC_CREDENTIALS_MIN_LIFETIME
+        )
+        LOG.debug("Got credentials %r", credentials)
+        return {var: credentials.get(key) for var, key in VALUE_MAP.items()}
     except ClientError as err:
         LOG.error(err)
         LOG.debug("To revert environment:\n%s", "\n".join([f"unset {key}" for key in VALUE_MAP]))
@@ -136,6 +147,11 @@ def get_client(service_name, role_arn=None, region=None, session_name=__name__):
     """
     Get an AWS service client assuming a role if specified.
 
+    Clients are created once per process and shared, see
+    :mod:`~infrahouse_toolkit.aws.client_registry`.  Role credentials come
+    from the on-disk cache of :mod:`~infrahouse_toolkit.aws.credential_cache`
+    and refresh themselves.
+
     :param service_name: AWS service. ec2, sts, etc.
     :type service_name: str
     :param role_arn: Role ARN if it needs to be assumed.
@@ -147,21 +163,8 @@ def get_client(service_name, role_arn=None, region=None, session_name=__name__):
     :type region: str
     :return: AWS boto3 client.
     """
-    if role_arn:
-        sts = boto3.client("sts", region_name=region)
-        aws_iam_role = sts.assume_role(RoleArn=role_arn, RoleSessionName=session_name)
-        session = boto3.Session(
-            aws_access_key_id=aws_iam_role["Credentials"]["AccessKeyId"],
-            aws_secret_access_key=aws_iam_role["Credentials"]["SecretAccessKey"],
-            aws_session_token=aws_iam_role["Credentials"]["SessionToken"],
-            region_name=region,
-        )
-        sts = session.client("sts", region_name=region)
-        response = sts.get_caller_identity()
-        LOG.debug("Assumed role: %s", response)
-        return session.client(service_name, region_name=region)
-
-    return boto3.client(service_name, region_name=region)
+    session = get_role_session(role_arn, session_name=session_name) if role_arn else None
+    return get_cached_client(service_name, region=region, session=session)
 
 
 def get_credentials_from_environ():
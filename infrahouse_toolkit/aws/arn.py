@@ -0,0 +1,58 @@
+"""
+Amazon Resource Name (ARN) helpers.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+ARN_PATTERN = re.compile(
+    r"^arn:(?P<partition>[^:]+):(?P<service>[^:]+):(?P<region>[^:]*):(?P<account>[^:]*):(?P<resource>.+)$"
+)
+
+# Number of distinct ARNs :func:`parse_arn` remembers.  Discovery,
+# verification and deletion each parse the same ARNs, so a cache the size
+# of a large inventory saves most of the work.
+PARSE_ARN_CACHE_SIZE = 2**17
+
+
+def parse_arn(arn: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Parse an ARN into its components.
+
+    ARN format: ``arn:partition:service:region:account-id:resource-type/resource-id``
+    or: ``arn:partition:service:region:account-id:resource-type:resource-id``
+
+    Results are memoized; every call returns a new dictionary, so callers
+    may modify it.
+
+    :param arn: Amazon Resource Name string.
+    :return: Dictionary with keys ``partition``, ``service``, ``region``,
+        ``account``, ``resource``, ``resource_type``, and ``resource_id``.
+        Returns ``None`` when the ARN cannot be parsed.
+    """
+    result = _parse_arn(arn)
+    return dict(result) if result is not None else None
+
+
+@lru_cache(maxsize=PARSE_ARN_CACHE_SIZE)
+def _parse_arn(arn: str) -> Optional[Dict[str, Optional[str]]]:
+    match = ARN_PATTERN.match(arn)
+    if not match:
+        return None
+
+    result = match.groupdict()
+
+    resource = result["resource"]
+    colon_pos = resource.find(":")
+    slash_pos = resource.find("/")
+
+    if colon_pos != -1 and (slash_pos == -1 or colon_pos < slash_pos):
+        result["resource_type"], result["resource_id"] = resource.split(":", 1)
+    elif slash_pos != -1:
+        result["resource_type"], result["resource_id"] = resource.split("/", 1)
+    else:
+        result["resource_type"] = None
+        result["resource_id"] = resource
+
+    return result
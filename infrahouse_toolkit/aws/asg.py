@@ -3,21 +3,37 @@ Module for ASG class - a class to work with Autoscaling group.
 """
 
 from logging import getLogger
-from typing import Dict, List
+from time import monotonic
+from typing import Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
 from infrahouse_toolkit.aws import get_client
 from infrahouse_toolkit.aws.asg_instance import ASGInstance
+from infrahouse_toolkit.aws.ec2_instance import describe_in_bulk
 
 LOG = getLogger()
 
 
 class ASG:
-    """AWS Autoscaling group."""
+    """
+    AWS Autoscaling group.
 
-    def __init__(self, asg_name: str):
+    :param asg_name: Autoscaling group name.
+    :type asg_name: str
+    :param cache_ttl: Seconds to reuse the group description and the
+        instances behind :attr:`instances`.  By default, the group is
+        described on every access, so code that waits for the group to
+        change sees the current state.  Call :meth:`invalidate_cache` to
+        read the current state before the cache expires.
+    :type cache_ttl: float
+    """
+
+    def __init__(self, asg_name: str, cache_ttl: float = 0):
         self._asg_name = asg_name
+        self._cache_ttl = cache_ttl
+        self._instances: Optional[List[ASGInstance]] = None
+        self._instances_described_at = 0.0
 
     @property
     def instance_refreshes(self) -> List[Dict]:
@@ -31,12 +47,18 @@ class ASG:
     @property
     def instances(self) -> List[ASGInstance]:
         """
+        Instances come with their lifecycle state from the group description.
+        The first ``tags`` or ``state`` read describes all of them with a few
+        bulk ``describe_instances`` calls, so reading every instance takes no
+        more API calls, and reading only ``instance_id`` takes none.  With a
+        ``cache_ttl``, the same instances are returned until the cache expires.
+
         :return: List of EC2 instances in the autoscaling group.
         """
-        return [
-            ASGInstance(instance_id=instance["InstanceId"])
-            for instance in self._describe_auto_scaling_groups["AutoScalingGroups"][0]["Instances"]
-        ]
+        if self._instances is None or monotonic() - self._instances_described_at >= self._cache_ttl:
+            self._instances = self._describe_instances()
+            self._instances_described_at = monotonic()
+        return list(self._instances)
 
     def cancel_instance_refresh(self):
         """Cancel all instance refreshes."""
@@ -67,15 +89,27 @@ class ASG:
             LifecycleActionResult=result,
             InstanceId=instance_id or ASGInstance().instance_id,
         )
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Forget the cached group description and instances, so the next lookup reads the current state."""
+        self._instances = None
 
     @property
     def _autoscaling_client(self):
         return get_client("autoscaling")
 
-    @property
-    def _describe_auto_scaling_groups(self):
-        return self._autoscaling_client.describe_auto_scaling_groups(
+    def _describe_instances(self) -> List[ASGInstance]:
+        response = self._autoscaling_client.describe_auto_scaling_groups(
             AutoScalingGroupNames=[
                 self._asg_name,
             ],
         )
+        instances = []
+        for description in response["AutoScalingGroups"][0]["Instances"]:
+            instance = ASGInstance(instance_id=description["InstanceId"])
+            # pylint: disable=protected-access
+            instance._describe_auto_scaling_instance = dict(description, AutoScalingGroupName=self._asg_name)
+            instances.append(instance)
+        describe_in_bulk(instances)
+        return instances
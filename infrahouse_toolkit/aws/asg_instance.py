@@ -6,7 +6,7 @@ an instance that is a part of an Autoscaling group.
 from cached_property import cached_property_with_ttl
 
 from infrahouse_toolkit.aws import get_client
-from infrahouse_toolkit.aws.ec2_instance import EC2Instance
+from infrahouse_toolkit.aws.ec2_instance import DESCRIBE_CACHE_TTL, EC2Instance
 
 
 class ASGInstance(EC2Instance):
@@ -38,12 +38,18 @@ class ASGInstance(EC2Instance):
             InstanceId=self.instance_id,
             HealthStatus="Unhealthy",
         )
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Forget cached describe responses, so the next lookup reads the current state."""
+        super().invalidate_cache()
+        del self._describe_auto_scaling_instance
 
     @property
     def _autoscaling_client(self):
         return get_client("autoscaling")
 
-    @cached_property_with_ttl(ttl=10)
+    @cached_property_with_ttl(ttl=DESCRIBE_CACHE_TTL)
     def _describe_auto_scaling_instance(self):
         return self._autoscaling_client.describe_auto_scaling_instances(
             InstanceIds=[
@@ -0,0 +1,177 @@
+"""
+Benchmarks of tag-based resource discovery and deletion.
+
+Each scenario runs against a fresh
+:class:`~infrahouse_toolkit.aws.benchmarks.fake_account.FakeAccount` and
+reports wall time, API calls per service, peak memory and the memory its
+result holds on to.  Run them with::
+
+    python -m infrahouse_toolkit.aws.benchmarks --size 1000 --size 10000 --size 50000
+
+or ``make benchmark``.
+"""
+
+import time
+import tracemalloc
+from collections import namedtuple
+from os import path as osp
+from tempfile import TemporaryDirectory
+from typing import Callable, List, Sized, Union
+
+from click.testing import CliRunner
+from tabulate import tabulate
+
+from infrahouse_toolkit.aws.benchmarks.fake_account import FakeAccount
+from infrahouse_toolkit.aws.resource_discovery import (
+    DEFAULT_VERIFY_CONCURRENCY,
+    find_iam_roles_by_tag,
+    find_resources_by_tags,
+    resource_for_arn,
+)
+from infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_delete import cmd_delete
+
+BenchmarkResult = namedtuple(
+    "BenchmarkResult",
+    ["scenario", "resources", "roles", "wall_time", "api_calls", "peak_memory", "found", "retained_memory"],
+    defaults=[None],
+)
+BenchmarkResult.__doc__ = """Measurements of one scenario run.
+
+``api_calls`` maps service names to call counts.  ``peak_memory`` is the
+peak of Python allocations in bytes, or ``None`` when memory wasn't traced.
+``found`` is the number of resources the scenario returned or deleted.
+``retained_memory`` is the number of bytes freed when the scenario's
+result is dropped, or ``None`` when memory wasn't traced or the scenario
+only returns a count.
+"""
+
+TAG_FILTERS = [{"key": "environment", "value": "benchmark"}]
+
+
+def _discover(account: FakeAccount, concurrency: int) -> List:
+    return find_resources_by_tags(account.session(), TAG_FILTERS, concurrency=concurrency)
+
+
+def _discover_as_dicts(account: FakeAccount, concurrency: int) -> List:
+    """Discovery with every record copied into a plain dict, the result layout before compact records."""
+    return [resource.to_dict() for resource in _discover(account, concurrency)]
+
+
+def _iam_scan(account: FakeAccount, concurrency: int) -> int:  # pylint: disable=unused-argument
+    return len(find_iam_roles_by_tag(account.session(), "environment", "benchmark"))
+
+
+def _delete(account: FakeAccount, concurrency: int) -> int:
+    with TemporaryDirectory() as tmp_dir:
+        result = CliRunner().invoke(
+            cmd_delete,
+            [
+                "--tag",
+                "environment=benchmark",
+                "--yes",
+                "--concurrency",
+                str(concurrency),
+                "--journal",
+                osp.join(tmp_dir, "journal.jsonl"),
+            ],
+            obj={"aws_session": account.session(), "aws_config": None},
+            catch_exceptions=False,
+        )
+    return result.output.count("  OK: ")
+
+
+def _dispatch(account: FakeAccount, concurrency: int) -> int:  # pylint: disable=unused-argument
+    session = account.session()
+    return sum(resource_for_arn(arn, session=session) is not None for arn in account.arns)
+
+
+SCENARIOS = {
+    "find_resources_by_tags": _discover,
+    "find_resources_as_dicts": _discover_as_dicts,
+    "find_iam_roles_by_tag": _iam_scan,
+    "cmd_delete": _delete,
+    "resource_for_arn": _dispatch,
+}
+
+
+def run_scenario(  # pylint: disable=too-many-arguments
+    scenario: str,
+    resources: int,
+    roles: int,
+    latency: float = 0.0,
+    concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+    trace_memory: bool = True,
+) -> BenchmarkResult:
+    """
+    Run one scenario against a new synthetic account.
+
+    :param scenario: Name of a scenario in :data:`SCENARIOS`.
+    :param resources: Number of tagged resources in the account.
+    :param roles: Number of IAM roles in the account.
+    :param latency: Seconds every API call takes.
+    :param concurrency: ``--concurrency`` of the code under test.
+    :param trace_memory: Measure peak memory with :mod:`tracemalloc`.  It
+        slows Python down, so turn it off to compare wall times.
+    :return: Measurements.
+    """
+    account = FakeAccount(resources, roles=roles, latency=latency)
+    run: Callable[[FakeAccount, int], Union[int, Sized]] = SCENARIOS[scenario]
+    if trace_memory:
+        tracemalloc.start()
+    started = time.monotonic()
+    retained_memory = peak_memory = None
+    try:
+        found = run(account, concurrency)
+        wall_time = time.monotonic() - started
+        if trace_memory:
+            held, peak_memory = tracemalloc.get_traced_memory()
+        if not isinstance(found, int):
+            result, found = found, len(found)
+            del result
+            if trace_memory:
+                # Clients and caches the scenario created stay; only the result is freed.
+                retained_memory = held - tracemalloc.get_traced_memory()[0]
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return BenchmarkResult(
+        scenario, resources, roles, wall_time, account.calls_by_service(), peak_memory, found, retained_memory
+    )
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """
+    Format benchmark results as a table.
+
+    :param results: Results of :func:`run_scenario`.
+    :return: Formatted string ready for printing.
+    """
+    rows = [
+        [
+            result.scenario,
+            result.resources,
+            result.roles,
+            f"{result.wall_time:.2f}",
+            sum(result.api_calls.values()),
+            ", ".join(f"{service}={count}" for service, count in sorted(result.api_calls.items())),
+            "-" if result.peak_memory is None else f"{result.peak_memory / 2**20:.1f}",
+            "-" if result.retained_memory is None else f"{result.retained_memory / 2**20:.1f}",
+            result.found,
+        ]
+        for result in results
+    ]
+    return tabulate(
+        rows,
+        headers=[
+            "Scenario",
+            "Resources",
+            "Roles",
+            "Wall time, s",
+            "API calls",
+            "By service",
+            "Peak memory, MiB",
+            "Retained memory, MiB",
+            "Found",
+        ],
+        tablefmt="outline",
+    )
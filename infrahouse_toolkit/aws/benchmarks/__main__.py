@@ -0,0 +1,77 @@
+"""Command line entry point of the resource discovery benchmarks."""
+
+import click
+
+from infrahouse_toolkit.aws.benchmarks import SCENARIOS, format_results, run_scenario
+from infrahouse_toolkit.aws.resource_discovery import DEFAULT_VERIFY_CONCURRENCY
+
+
+@click.command()
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=[1000, 10000, 50000],
+    show_default=True,
+    help="Number of tagged resources in the synthetic account.  May be repeated.",
+)
+@click.option(
+    "--roles",
+    type=click.IntRange(min=0),
+    default=2000,
+    show_default=True,
+    help="Number of IAM roles in the synthetic account.",
+)
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(list(SCENARIOS)),
+    multiple=True,
+    help="Scenario to run.  May be repeated.  Runs all scenarios by default.",
+)
+@click.option(
+    "--latency",
+    type=float,
+    default=0.01,
+    show_default=True,
+    help="Simulated duration of every API call in seconds.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_VERIFY_CONCURRENCY,
+    show_default=True,
+    help="Concurrency of the code under test.",
+)
+@click.option(
+    "--no-trace-memory",
+    is_flag=True,
+    default=False,
+    help="Don't measure peak memory.  tracemalloc slows Python down, so use it to compare wall times.",
+)
+def main(  # pylint: disable=too-many-arguments
+    sizes: tuple, roles: int, scenarios: tuple, latency: float, concurrency: int, no_trace_memory: bool
+) -> None:
+    """
+    Benchmark resource discovery and deletion against synthetic accounts.
+    """
+    results = []
+    for size in sizes:
+        for scenario in scenarios or SCENARIOS:
+            click.echo(f"Running {scenario} with {size} resources and {roles} roles ...", err=True)
+            results.append(
+                run_scenario(
+                    scenario,
+                    size,
+                    roles,
+                    latency=latency,
+                    concurrency=concurrency,
+                    trace_memory=not no_trace_memory,
+                )
+            )
+    click.echo(format_results(results))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,274 @@
+"""
+In-process stand-in for a large AWS account.
+
+:class:`FakeAccount` answers boto3 calls from synthetic data the same way
+:class:`botocore.stub.Stubber` does: a ``before-call`` handler returns the
+parsed response, so no request leaves the process.  Unlike ``Stubber`` it
+doesn't need responses queued in call order, which makes it usable with
+the concurrent discovery and deletion code.  Every call sleeps for a
+configurable latency to model the round trip to AWS.
+"""
+
+import time
+from collections import Counter
+from threading import Lock
+from typing import Dict, List, Optional
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+ACCOUNT_ID = "123456789012"
+
+# Resource kinds of the synthetic account, repeated in this proportion.
+RESOURCE_MIX = ["instance", "instance", "volume", "volume", "security-group", "sns", "sns", "sns", "sqs", "sqs"]
+
+# Every this many resources one is gone but still returned by the Tagging API.
+STALE_EVERY = 20
+
+PAGE_SIZE = 100
+
+
+class FakeAccount:
+    """
+    Synthetic AWS account served to boto3 sessions without network access.
+
+    Resources are tagged ``environment=benchmark`` and
+    ``service=svc-<N>`` (50 services).  IAM roles carry the same tags.
+
+    :param resources: Number of tagged resources, spread over EC2 instances,
+        EBS volumes, security groups, SNS topics and SQS queues.
+    :param roles: Number of IAM roles.
+    :param region: Region of all regional resources.
+    :param latency: Seconds every API call takes.
+    """
+
+    def __init__(self, resources: int, roles: int = 0, region: str = "us-east-1", latency: float = 0.0):
+        self.region = region
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self._lock = Lock()
+        self._tags: Dict[str, Dict[str, str]] = {}
+        self._gone = set()
+        self._roles: List[str] = []
+
+        for i in range(resources):
+            arn = self._arn(RESOURCE_MIX[i % len(RESOURCE_MIX)], i)
+            self._tags[arn] = {"environment": "benchmark", "service": f"svc-{i % 50}"}
+            if i % STALE_EVERY == STALE_EVERY - 1:
+                self._gone.add(arn)
+        for i in range(roles):
+            arn = f"arn:aws:iam::{ACCOUNT_ID}:role/role-{i}"
+            self._roles.append(arn)
+            self._tags[arn] = {"environment": "benchmark", "service": f"svc-{i % 50}"}
+
+    @property
+    def arns(self) -> List[str]:
+        """ARNs of all resources and roles, whether they still exist or not."""
+        return list(self._tags)
+
+    def session(self) -> boto3.Session:
+        """
+        Return a boto3 session whose clients are answered by this account.
+
+        :return: boto3 session with dummy credentials.
+        """
+        session = boto3.Session(
+            region_name=self.region, aws_access_key_id="AKIDBENCHMARK", aws_secret_access_key="benchmark"
+        )
+        session.events.register("before-parameter-build", self._on_parameters)
+        session.events.register("before-call", self._on_call)
+        return session
+
+    def calls_by_service(self) -> Dict[str, int]:
+        """
+        Return the number of API calls per service.
+
+        :return: Dictionary from service name to call count.
+        """
+        by_service: Counter = Counter()
+        for (service, _), count in self.calls.items():
+            by_service[service] += count
+        return dict(by_service)
+
+    # -- request dispatch ------------------------------------------------------
+
+    @staticmethod
+    def _on_parameters(params, context, **kwargs):  # pylint: disable=unused-argument
+        """Keep the API parameters; ``before-call`` only sees the serialized request."""
+        context["fake_account_params"] = params
+
+    def _on_call(self, model, context, **kwargs):  # pylint: disable=unused-argument
+        params = context["fake_account_params"]
+        service = model.service_model.service_name
+        with self._lock:
+            self.calls[(service, model.name)] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        handler = getattr(self, f"_{service}_{model.name}", None)
+        parsed = handler(params) if handler else self._empty(model)
+        status = 400 if "Error" in parsed else 200
+        parsed.setdefault("ResponseMetadata", {"HTTPStatusCode": status, "RetryAttempts": 0})
+        return AWSResponse(None, status, {}, None), parsed
+
+    @staticmethod
+    def _empty(model) -> dict:
+        """Response with every list member empty, e.g. no policies attached to a role."""
+        shape = model.output_shape
+        if shape is None:
+            return {}
+        return {name: [] for name, member in shape.members.items() if member.type_name == "list"}
+
+    @staticmethod
+    def _error(code: str) -> dict:
+        return {"Error": {"Code": code, "Message": code}}
+
+    def _arn(self, kind: str, i: int) -> str:
+        if kind == "sns":
+            return f"arn:aws:sns:{self.region}:{ACCOUNT_ID}:topic-{i}"
+        if kind == "sqs":
+            return f"arn:aws:sqs:{self.region}:{ACCOUNT_ID}:queue-{i}"
+        prefix = {"instance": "i", "volume": "vol", "security-group": "sg"}[kind]
+        return f"arn:aws:ec2:{self.region}:{ACCOUNT_ID}:{kind}/{prefix}-{i:017x}"
+
+    def _ec2_arn(self, kind: str, resource_id: str) -> str:
+        return f"arn:aws:ec2:{self.region}:{ACCOUNT_ID}:{kind}/{resource_id}"
+
+    def _alive(self, arn: str) -> bool:
+        return arn in self._tags and arn not in self._gone
+
+    def _delete(self, arn: str, not_found: str) -> dict:
+        with self._lock:
+            if not self._alive(arn):
+                return self._error(not_found)
+            self._gone.add(arn)
+        return {}
+
+    @staticmethod
+    def _filter_ids(params: dict, name: str) -> Optional[List[str]]:
+        for flt in params.get("Filters", []):
+            if flt["Name"] == name:
+                return flt["Values"]
+        return None
+
+    # -- Resource Groups Tagging API -----------------------------------------
+
+    def _resourcegroupstaggingapi_GetResources(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        def _matches(tags: Dict[str, str]) -> bool:
+            return all(
+                tf["Key"] in tags and ("Values" not in tf or tags[tf["Key"]] in tf["Values"])
+                for tf in params.get("TagFilters", [])
+            )
+
+        arns = [arn for arn, tags in self._tags.items() if ":iam:" not in arn and _matches(tags)]
+        start = int(params.get("PaginationToken") or 0)
+        page = arns[start : start + params.get("ResourcesPerPage", PAGE_SIZE)]
+        response = {
+            "ResourceTagMappingList": [
+                {"ResourceARN": arn, "Tags": [{"Key": k, "Value": v} for k, v in self._tags[arn].items()]}
+                for arn in page
+            ]
+        }
+        if start + len(page) < len(arns):
+            response["PaginationToken"] = str(start + len(page))
+        return response
+
+    # -- STS -----------------------------------------------------------------
+
+    def _sts_GetCallerIdentity(self, params: dict) -> dict:  # pylint: disable=invalid-name,unused-argument
+        return {"Account": ACCOUNT_ID, "Arn": f"arn:aws:iam::{ACCOUNT_ID}:user/benchmark", "UserId": "AIDABENCHMARK"}
+
+    # -- IAM -----------------------------------------------------------------
+
+    def _iam_GetAccountAuthorizationDetails(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        start = int(params.get("Marker") or 0)
+        roles = [arn for arn in self._roles if self._alive(arn)]
+        page = roles[start : start + params.get("MaxItems", PAGE_SIZE)]
+        response = {
+            "RoleDetailList": [
+                {
+                    "RoleName": arn.rsplit("/", 1)[1],
+                    "Arn": arn,
+                    "Tags": [{"Key": k, "Value": v} for k, v in self._tags[arn].items()],
+                }
+                for arn in page
+            ],
+            "IsTruncated": start + len(page) < len(roles),
+        }
+        if response["IsTruncated"]:
+            response["Marker"] = str(start + len(page))
+        return response
+
+    def _iam_GetRole(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        arn = f"arn:aws:iam::{ACCOUNT_ID}:role/{params['RoleName']}"
+        return (
+            {"Role": {"RoleName": params["RoleName"], "Arn": arn}} if self._alive(arn) else self._error("NoSuchEntity")
+        )
+
+    def _iam_DeleteRole(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        return self._delete(f"arn:aws:iam::{ACCOUNT_ID}:role/{params['RoleName']}", "NoSuchEntity")
+
+    # -- EC2 -----------------------------------------------------------------
+
+    def _ec2_DescribeInstances(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        ids = self._filter_ids(params, "instance-id") or params.get("InstanceIds", [])
+        instances = []
+        for instance_id in ids:
+            arn = self._ec2_arn("instance", instance_id)
+            if arn in self._tags:
+                state = "running" if self._alive(arn) else "terminated"
+                instances.append({"InstanceId": instance_id, "State": {"Name": state}, "Tags": []})
+        return {"Reservations": [{"Instances": instances}] if instances else []}
+
+    def _ec2_TerminateInstances(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        # Like EC2, fail the whole call when one of the instances doesn't exist.
+        arns = [self._ec2_arn("instance", instance_id) for instance_id in params["InstanceIds"]]
+        with self._lock:
+            if not all(self._alive(arn) for arn in arns):
+                return self._error("InvalidInstanceID.NotFound")
+            self._gone.update(arns)
+        return {"TerminatingInstances": []}
+
+    def _ec2_DescribeVolumes(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        ids = self._filter_ids(params, "volume-id") or params.get("VolumeIds", [])
+        volumes = [
+            {"VolumeId": volume_id, "State": "available", "Attachments": []}
+            for volume_id in ids
+            if self._alive(self._ec2_arn("volume", volume_id))
+        ]
+        if "VolumeIds" in params and not volumes:
+            return self._error("InvalidVolume.NotFound")
+        return {"Volumes": volumes}
+
+    def _ec2_DeleteVolume(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        return self._delete(self._ec2_arn("volume", params["VolumeId"]), "InvalidVolume.NotFound")
+
+    def _ec2_DescribeSecurityGroups(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        ids = self._filter_ids(params, "group-id") or params.get("GroupIds", [])
+        return {
+            "SecurityGroups": [
+                {"GroupId": group_id} for group_id in ids if self._alive(self._ec2_arn("security-group", group_id))
+            ]
+        }
+
+    def _ec2_DeleteSecurityGroup(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        return self._delete(self._ec2_arn("security-group", params["GroupId"]), "InvalidGroup.NotFound")
+
+    # -- SNS / SQS -----------------------------------------------------------
+
+    def _sns_GetTopicAttributes(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        return {"Attributes": {}} if self._alive(params["TopicArn"]) else self._error("NotFoundException")
+
+    def _sns_DeleteTopic(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        return self._delete(params["TopicArn"], "NotFoundException")
+
+    def _queue_arn(self, queue_url: str) -> str:
+        return f"arn:aws:sqs:{self.region}:{ACCOUNT_ID}:{queue_url.rsplit('/', 1)[1]}"
+
+    def _sqs_GetQueueAttributes(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        if self._alive(self._queue_arn(params["QueueUrl"])):
+            return {"Attributes": {}}
+        return self._error("AWS.SimpleQueueService.NonExistentQueue")
+
+    def _sqs_DeleteQueue(self, params: dict) -> dict:  # pylint: disable=invalid-name
+        return self._delete(self._queue_arn(params["QueueUrl"]), "AWS.SimpleQueueService.NonExistentQueue")
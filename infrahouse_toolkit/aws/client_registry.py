@@ -0,0 +1,196 @@
+"""
+Process-wide cache of boto3 clients.
+
+Building a botocore client takes tens of milliseconds and a few megabytes
+of memory.  Resource wrappers and discovery code verify thousands of
+resources of a handful of types, so they share clients through
+:func:`get_cached_client` instead of creating one per resource.  botocore
+clients are thread-safe once created; creating them isn't, which is why
+the registry creates clients under a lock.  Roles are assumed under a
+lock of their own, so a slow STS call doesn't hold up other clients.
+
+Clients use botocore's ``adaptive`` retry mode, so clients shared by many
+threads also share one client-side rate limiter per API; see
+:mod:`infrahouse_toolkit.aws.throttling`.  They keep idle connections
+alive with TCP keepalive and give up on unreachable endpoints after
+:data:`DEFAULT_CONNECT_TIMEOUT` seconds instead of botocore's 60.
+"""
+
+from logging import getLogger
+from threading import Lock, RLock
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary
+
+import boto3
+from botocore.config import Config
+
+from infrahouse_toolkit.aws.credential_cache import (
+    cached_role_session,
+    refreshable_role_session,
+)
+from infrahouse_toolkit.aws.throttling import DEFAULT_MAX_RETRIES, ApiCallCounter
+
+LOG = getLogger(__name__)
+
+# Connection pool size of cached clients.  botocore's default of 10 is
+# below the number of worker threads ``--concurrency`` may start, which
+# makes threads wait for a connection and logs "Connection pool is full".
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+# Seconds to wait for a connection and for a response.
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+
+ROLE_SESSION_NAME = "infrahouse-toolkit"
+
+
+class ClientRegistry:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe cache of boto3 clients keyed by session, service, region and role.
+
+    Sessions are held by weak reference: clients of a session go away
+    together with the session.  ``session=None`` means the boto3 default
+    session.  Clients for a role are created from refreshable credentials
+    that re-assume the role before they expire.  Roles assumed with the
+    default session share the on-disk cache of
+    :func:`~infrahouse_toolkit.aws.credential_cache.cached_role_session`
+    with other processes.
+
+    Calls of all clients are counted in :attr:`counter`.
+
+    :param config: botocore configuration of every client the registry creates.
+    """
+
+    def __init__(self, config: Config = None):
+        self._config = config or Config(
+            max_pool_connections=DEFAULT_MAX_POOL_CONNECTIONS,
+            retries={"mode": "adaptive", "max_attempts": DEFAULT_MAX_RETRIES},
+            tcp_keepalive=True,
+            connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+            read_timeout=DEFAULT_READ_TIMEOUT,
+        )
+        self.counter = ApiCallCounter()
+        self._lock = RLock()
+        self._clients: WeakKeyDictionary = WeakKeyDictionary()
+        self._default_clients: Dict[tuple, object] = {}
+        self._role_sessions: WeakKeyDictionary = WeakKeyDictionary()
+        self._default_role_sessions: Dict[str, boto3.Session] = {}
+        self._role_locks: WeakKeyDictionary = WeakKeyDictionary()
+        self._default_role_locks: Dict[str, Lock] = {}
+
+    def client(
+        self, service_name: str, region: str = None, session: boto3.Session = None, role_arn: Optional[str] = None
+    ):
+        """
+        Return a cached client, creating it on first use.
+
+        :param service_name: AWS service, e.g. ``ec2``.
+        :param region: AWS region.  ``None`` means the region of the session.
+        :param session: boto3 session.  ``None`` means the default session.
+        :param role_arn: Role to assume with *session* before creating the client.
+        :return: boto3 client.
+        """
+        key = (service_name, region, role_arn)
+        with self._lock:
+            clients = self._default_clients if session is None else self._clients.setdefault(session, {})
+            if key in clients:
+                return clients[key]
+
+        # Assume the role outside the registry lock, it may take a while.
+        source = self.role_session(role_arn, session=session) if role_arn else session or boto3
+        with self._lock:
+            clients = self._default_clients if session is None else self._clients.setdefault(session, {})
+            if key not in clients:
+                LOG.debug("Creating %s client for region %s, role %s", service_name, region, role_arn)
+                clients[key] = source.client(service_name, region_name=region, config=self._config)
+                self.counter.register(clients[key])
+            return clients[key]
+
+    def clear(self) -> None:
+        """Drop all cached clients."""
+        with self._lock:
+            self._clients.clear()
+            self._default_clients.clear()
+            self._role_sessions.clear()
+            self._default_role_sessions.clear()
+            self._role_locks.clear()
+            self._default_role_locks.clear()
+
+    def role_session(
+        self, role_arn: str, session: boto3.Session = None, session_name: str = ROLE_SESSION_NAME
+    ) -> boto3.Session:
+        """
+        Return a session with refreshable credentials of *role_arn*, assuming it on first use.
+
+        :param role_arn: Role to assume.
+        :param session: boto3 session to assume the role with.  ``None``
+            means the default session.
+        :param session_name: Role session name.
+        :return: boto3 session in the region of *session*.
+        """
+        key = (role_arn, session_name)
+        with self._lock:
+            role_sessions = self._role_sessions_of(session)
+            if key in role_sessions:
+                return role_sessions[key]
+            role_locks = self._default_role_locks if session is None else self._role_locks.setdefault(session, {})
+            role_lock = role_locks.setdefault(key, Lock())
+
+        # Concurrent callers of the same role wait here and assume it once.
+        with role_lock:
+            with self._lock:
+                role_session = self._role_sessions_of(session).get(key)
+            if role_session is None:
+                role_session = self._assume_role(role_arn, session, session_name)
+                with self._lock:
+                    role_session = self._role_sessions_of(session).setdefault(key, role_session)
+            return role_session
+
+    def _role_sessions_of(self, session: Optional[boto3.Session]) -> Dict[tuple, boto3.Session]:
+        return self._default_role_sessions if session is None else self._role_sessions.setdefault(session, {})
+
+    def _assume_role(self, role_arn: str, session: Optional[boto3.Session], session_name: str) -> boto3.Session:
+        if session is None:
+            return cached_role_session(role_arn, session_name)
+
+        # The on-disk cache doesn't know whose credentials assumed the role,
+        # so roles assumed with a caller's session stay in memory only.
+        sts = self.client("sts", session=session)
+
+        def _assume(_refresh: bool) -> dict:
+            LOG.debug("Assuming role %s", role_arn)
+            return sts.assume_role(RoleArn=role_arn, RoleSessionName=session_name)["Credentials"]
+
+        return refreshable_role_session(_assume, region=session.region_name)
+
+
+CLIENT_REGISTRY = ClientRegistry()
+
+
+def get_role_session(
+    role_arn: str, session: boto3.Session = None, session_name: str = ROLE_SESSION_NAME
+) -> boto3.Session:
+    """
+    Return a shared session of *role_arn* from the process-wide :class:`ClientRegistry`.
+
+    :param role_arn: Role to assume.
+    :param session: boto3 session to assume the role with.  ``None`` means the default session.
+    :param session_name: Role session name.
+    :return: boto3 session with refreshable credentials.
+    """
+    return CLIENT_REGISTRY.role_session(role_arn, session=session, session_name=session_name)
+
+
+def get_cached_client(
+    service_name: str, region: str = None, session: boto3.Session = None, role_arn: Optional[str] = None
+):
+    """
+    Return a shared client from the process-wide :class:`ClientRegistry`.
+
+    :param service_name: AWS service, e.g. ``ec2``.
+    :param region: AWS region.  ``None`` means the region of the session.
+    :param session: boto3 session.  ``None`` means the default session.
+    :param role_arn: Role to assume with *session* before creating the client.
+    :return: boto3 client.
+    """
+    return CLIENT_REGISTRY.client(service_name, region=region, session=session, role_arn=role_arn)
@@ -0,0 +1,150 @@
+"""
+On-disk cache of assumed-role credentials.
+
+Command line tools run as separate processes, often back to back in one
+CI job: ``ih-plan upload``, ``ih-plan download``, ``ih-s3-reprepro
+includedeb``.  Each of them used to call ``sts:AssumeRole`` for the same
+role.  The cache keeps the credentials of a role and session name on disk
+until shortly before they expire, in the directory
+:func:`~infrahouse_toolkit.aws.aws_sso_login` caches SSO credentials in,
+readable only by the user.
+
+:func:`cached_role_session` returns a boto3 session with botocore
+:class:`~botocore.credentials.RefreshableCredentials`, so a long-running
+process re-assumes the role before the credentials expire and stores the
+new credentials in the cache.  Within a process, role sessions are shared
+through :func:`~infrahouse_toolkit.aws.client_registry.get_role_session`,
+which builds them with :func:`refreshable_role_session` too.
+
+Credentials handed to a program that can't refresh them, such as s3fs,
+must stay valid for as long as it runs.  Callers like that ask for a
+longer remaining lifetime with ``min_lifetime``.
+"""
+
+import time
+from datetime import timezone
+from logging import getLogger
+from os import path as osp
+from typing import Callable, Dict, Optional
+
+import boto3
+from botocore.credentials import RefreshableCredentials
+from diskcache import Cache
+
+from infrahouse_toolkit.fs import ensure_permissions
+
+LOG = getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY = "~/.infrahouse-toolkit"
+
+# botocore refreshes credentials that expire in less than 15 minutes, so
+# credentials closer to their expiry than that aren't reused.
+EXPIRY_MARGIN = 15 * 60
+
+# Minimum remaining lifetime of credentials that are exported as static
+# environment variables.  Roles are assumed for an hour, so cached
+# credentials are reused only during the first ten minutes.
+STATIC_CREDENTIALS_MIN_LIFETIME = 50 * 60
+
+
+def cached_role_credentials(  # pylint: disable=too-many-arguments
+    role_arn: str,
+    session_name: str,
+    region: Optional[str] = None,
+    cache_directory: Optional[str] = None,
+    refresh: bool = False,
+    min_lifetime: float = EXPIRY_MARGIN,
+) -> Dict:
+    """
+    Return credentials of a role, assuming it only if the cache has no fresh ones.
+
+    :param role_arn: Role to assume.
+    :param session_name: Role session name.  Credentials are cached per
+        role and session name.
+    :param region: AWS region of the STS endpoint.
+    :param cache_directory: Cache directory.  By default, ``~/.infrahouse-toolkit``.
+    :param refresh: Assume the role even if the cache has fresh credentials.
+    :param min_lifetime: Assume the role if the cached credentials expire
+        in less than this many seconds.
+    :return: ``Credentials`` of the ``AssumeRole`` response: a dictionary with
+        ``AccessKeyId``, ``SecretAccessKey``, ``SessionToken`` and ``Expiration`` keys.
+    """
+    cache_directory = osp.expanduser(cache_directory or DEFAULT_CACHE_DIRECTORY)
+    with Cache(directory=cache_directory) as cache_reference:
+        cache_key = f"ih-role-credentials-{role_arn}-{session_name}"
+        credentials = None if refresh else cache_reference.get(cache_key)
+        if credentials and credentials["Expiration"].timestamp() - time.time() < min_lifetime:
+            LOG.debug("Cached credentials of role %s expire in less than %d seconds", role_arn, min_lifetime)
+            credentials = None
+        if credentials:
+            LOG.debug("Using cached credentials of role %s", role_arn)
+        else:
+            LOG.debug("Assuming role %s", role_arn)
+            sts = boto3.client("sts", region_name=region)
+            credentials = sts.assume_role(RoleArn=role_arn, RoleSessionName=session_name)["Credentials"]
+            reusable_for = credentials["Expiration"].timestamp() - time.time() - EXPIRY_MARGIN
+            if reusable_for > 0:
+                cache_reference.set(cache_key, credentials, expire=reusable_for)
+
+    ensure_permissions(cache_directory, 0o700)
+    return credentials
+
+
+def refreshable_metadata(credentials: Dict) -> Dict:
+    """
+    Convert ``AssumeRole`` credentials to the metadata :class:`~botocore.credentials.RefreshableCredentials` expects.
+
+    :param credentials: ``Credentials`` of an ``AssumeRole`` response.
+    :return: Dictionary with ``access_key``, ``secret_key``, ``token`` and ``expiry_time`` keys.
+    """
+    return {
+        "access_key": credentials["AccessKeyId"],
+        "secret_key": credentials["SecretAccessKey"],
+        "token": credentials["SessionToken"],
+        "expiry_time": credentials["Expiration"].astimezone(timezone.utc).isoformat(),
+    }
+
+
+def refreshable_role_session(get_credentials: Callable[[bool], Dict], region: Optional[str] = None) -> boto3.Session:
+    """
+    Return a boto3 session with credentials of a role that refresh themselves.
+
+    :param get_credentials: Function that returns ``Credentials`` of an
+        ``AssumeRole`` response.  Its argument is ``False`` for the first
+        credentials of the session and ``True`` when botocore refreshes them.
+    :param region: AWS region of the session.
+    :return: boto3 session with refreshable credentials.
+    """
+
+    def _refresh(refresh: bool = True) -> Dict:
+        return refreshable_metadata(get_credentials(refresh))
+
+    session = boto3.Session(region_name=region)
+    # pylint: disable=protected-access
+    session._session._credentials = RefreshableCredentials.create_from_metadata(
+        metadata=_refresh(refresh=False), refresh_using=_refresh, method="sts-assume-role"
+    )
+    return session
+
+
+def cached_role_session(
+    role_arn: str, session_name: str, region: Optional[str] = None, cache_directory: Optional[str] = None
+) -> boto3.Session:
+    """
+    Return a boto3 session of a role with credentials from the cache.
+
+    The credentials refresh themselves: when they are about to expire, the
+    role is assumed again and the cache is updated.
+
+    :param role_arn: Role to assume.
+    :param session_name: Role session name.
+    :param region: AWS region of the session.
+    :param cache_directory: Cache directory.  By default, ``~/.infrahouse-toolkit``.
+    :return: boto3 session with refreshable credentials.
+    """
+    return refreshable_role_session(
+        lambda refresh: cached_role_credentials(
+            role_arn, session_name, region=region, cache_directory=cache_directory, refresh=refresh
+        ),
+        region=region,
+    )
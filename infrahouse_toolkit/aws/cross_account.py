@@ -0,0 +1,219 @@
+"""
+Tag-based resource discovery in several AWS accounts at once.
+
+:class:`CrossAccountSearch` runs
+:func:`~infrahouse_toolkit.aws.resource_discovery.iter_resources_by_tags`
+in every account concurrently.  All accounts share one
+:class:`~infrahouse_toolkit.aws.resource_discovery.ExistenceVerifier`, so
+``concurrency`` bounds the existence checks of the whole search rather
+than of each account, and every record is tagged with the account it was
+found in.
+
+Accounts come from AWS profiles (:func:`accounts_from_profiles`) or from
+one role that exists in every account (:func:`accounts_from_role_template`)::
+
+    accounts = accounts_from_role_template(
+        session, "arn:aws:iam::{account_id}:role/teardown", ["111111111111", "222222222222"]
+    )
+    for resource in CrossAccountSearch(accounts).iter_resources([{"key": "environment", "value": "ci"}]):
+        print(resource["account"], resource["arn"])
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from queue import Queue
+from threading import Event, Lock
+from typing import Dict, Iterator, List, Optional
+
+import boto3
+from infrahouse_core.aws import get_aws_session
+from infrahouse_core.aws.config import AWSConfig
+
+from infrahouse_toolkit.aws.client_registry import get_role_session
+from infrahouse_toolkit.aws.resource_discovery import (
+    BACKEND_TAGGING,
+    DEFAULT_VERIFY_CONCURRENCY,
+    ExistenceVerifier,
+    iter_resources_by_tags,
+)
+
+LOG = getLogger(__name__)
+
+# Accounts searched at the same time.  Each one pages the Tagging API in
+# all its regions with its own threads; existence checks share one pool.
+DEFAULT_ACCOUNT_CONCURRENCY = 8
+
+ACCOUNT_ID_PLACEHOLDER = "{account_id}"
+
+Account = namedtuple("Account", ["name", "session", "role_arn"], defaults=[None])
+Account.__doc__ = """An AWS account to search.
+
+``name`` identifies the account in results, e.g. a profile name or an
+account ID.  ``session`` is an authenticated boto3 session.  When
+``role_arn`` is set, the search assumes that role with ``session`` first.
+"""
+
+
+def accounts_from_profiles(aws_config: AWSConfig, profiles: List[str], region: Optional[str] = None) -> List[Account]:
+    """
+    Authenticate with every profile.
+
+    Profiles are logged in one after another because an SSO login may
+    open a browser.  Profiles of the same SSO session share the cached
+    token, so the login happens at most once per SSO session.
+
+    :param aws_config: AWS configuration.
+    :param profiles: Profile names.
+    :param region: Region of the sessions.  ``None`` means the profile region.
+    :return: One :class:`Account` per profile, named after the profile.
+    """
+    return [Account(profile, get_aws_session(aws_config, profile, region)) for profile in dict.fromkeys(profiles)]
+
+
+def accounts_from_role_template(session: boto3.Session, role_template: str, account_ids: List[str]) -> List[Account]:
+    """
+    Assume the same role in every account.
+
+    The roles are assumed when the search of each account starts, so an
+    account whose role can't be assumed only fails its own search.
+
+    :param session: boto3 session to assume the roles with.
+    :param role_template: Role ARN with an ``{account_id}`` placeholder,
+        e.g. ``arn:aws:iam::{account_id}:role/teardown``.
+    :param account_ids: Account IDs to substitute into *role_template*.
+    :return: One :class:`Account` per account ID, named after the account ID.
+    :raise ValueError: If *role_template* has no ``{account_id}`` placeholder.
+    """
+    if ACCOUNT_ID_PLACEHOLDER not in role_template:
+        raise ValueError(f"Role template {role_template!r} has no {ACCOUNT_ID_PLACEHOLDER} placeholder")
+    return [
+        Account(account_id, session, role_template.replace(ACCOUNT_ID_PLACEHOLDER, account_id))
+        for account_id in dict.fromkeys(account_ids)
+    ]
+
+
+class CrossAccountSearch:
+    """
+    Search for tagged resources in several accounts concurrently.
+
+    Accounts whose search fails, e.g. because a role can't be assumed,
+    are logged and recorded in :attr:`failed`; the other accounts'
+    results are still returned.
+
+    :param accounts: Accounts to search.
+    :param concurrency: Maximum number of existence checks running in
+        parallel across all accounts.
+    :param account_concurrency: Maximum number of accounts searched at the same time.
+    """
+
+    def __init__(
+        self,
+        accounts: List[Account],
+        concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+        account_concurrency: int = DEFAULT_ACCOUNT_CONCURRENCY,
+    ):
+        if not accounts:
+            raise ValueError("At least one account is required")
+        self.accounts = list(accounts)
+        self.failed: Dict[str, Exception] = {}
+        self._concurrency = concurrency
+        self._account_concurrency = account_concurrency
+        self._lock = Lock()
+
+    def iter_resources(  # pylint: disable=too-many-arguments
+        self,
+        tag_filters: List[Dict],
+        verify: bool = True,
+        iam_scan: bool = True,
+        regions: Optional[List[str]] = None,
+        backend: str = BACKEND_TAGGING,
+    ) -> Iterator[Dict]:
+        """
+        Yield resources of all accounts as they are found.
+
+        Records of different accounts are interleaved; within an account
+        they come in :func:`~infrahouse_toolkit.aws.resource_discovery.iter_resources_by_tags`
+        order.  Closing the generator early stops all searches.
+
+        :param tag_filters: See :func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`.
+        :param verify: See :func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`.
+        :param iam_scan: See :func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`.
+        :param regions: Regions to search in every account.  Defaults to
+            the region of each account's session.
+        :param backend: See :func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`.
+        :return: Iterator of dicts with ``account``, ``arn``, ``tags``,
+            ``exists`` and ``region`` keys.
+        """
+        self.failed = {}
+        found: Queue = Queue()
+        stop = Event()
+        search_kwargs = {"verify": verify, "iam_scan": iam_scan, "regions": regions, "backend": backend}
+        with ExistenceVerifier(None, concurrency=self._concurrency) as verifier, ThreadPoolExecutor(
+            max_workers=min(len(self.accounts), self._account_concurrency), thread_name_prefix="ih-account"
+        ) as executor:
+            try:
+                for account in self.accounts:
+                    executor.submit(self._search, account, tag_filters, search_kwargs, verifier, found, stop)
+                pending = len(self.accounts)
+                while pending:
+                    resource = found.get()
+                    if resource is None:
+                        pending -= 1
+                    else:
+                        yield resource
+            finally:
+                stop.set()
+
+    def find_resources(  # pylint: disable=too-many-arguments
+        self,
+        tag_filters: List[Dict],
+        verify: bool = True,
+        iam_scan: bool = True,
+        regions: Optional[List[str]] = None,
+        backend: str = BACKEND_TAGGING,
+    ) -> List[Dict]:
+        """
+        Find resources of all accounts.
+
+        Takes the same parameters as :meth:`iter_resources`.
+
+        :return: List of dicts with ``account``, ``arn``, ``tags``, ``exists``
+            and ``region`` keys, grouped by account in the order of :attr:`accounts`.
+        """
+        order = {account.name: position for position, account in enumerate(self.accounts)}
+        resources = self.iter_resources(tag_filters, verify=verify, iam_scan=iam_scan, regions=regions, backend=backend)
+        return sorted(resources, key=lambda resource: order[resource["account"]])
+
+    def _search(  # pylint: disable=too-many-arguments
+        self,
+        account: Account,
+        tag_filters: List[Dict],
+        search_kwargs: Dict,
+        verifier: ExistenceVerifier,
+        found: Queue,
+        stop: Event,
+    ) -> None:
+        """Run the search in one account, putting tagged records and then ``None`` on *found*."""
+        try:
+            if stop.is_set():
+                return
+            LOG.info("Searching account %s ...", account.name)
+            session = account.session
+            if account.role_arn:
+                session = get_role_session(account.role_arn, session=session)
+            resources = iter_resources_by_tags(session, tag_filters, verifier=verifier, **search_kwargs)
+            try:
+                for resource in resources:
+                    if stop.is_set():
+                        break
+                    resource["account"] = account.name
+                    found.put(resource)
+            finally:
+                resources.close()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            LOG.error("Search in account %s failed: %s", account.name, err)
+            with self._lock:
+                self.failed[account.name] = err
+        finally:
+            found.put(None)
@@ -0,0 +1,155 @@
+"""
+Resumable journal of ``ih-aws resources delete`` runs.
+
+A :class:`DeletionJournal` is a JSON Lines file.  The first line describes
+the run; every following line records the state of one ARN at a point in
+time.  Lines are only ever appended and flushed one by one, so a run that
+is interrupted by Ctrl-C, an expired token or a CI timeout leaves a
+journal that is complete up to its last deletion.  The last line of an
+ARN wins when the journal is read back.
+
+``ih-aws resources delete --resume <journal>`` skips discovery and only
+re-verifies and deletes the ARNs that are still :data:`PENDING` or
+:data:`FAILED`.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from logging import getLogger
+from os import path as osp
+from threading import Lock
+from typing import Dict, List, Optional
+
+from infrahouse_toolkit.fs import ensure_permissions
+
+LOG = getLogger(__name__)
+
+DEFAULT_JOURNAL_DIRECTORY = "~/.infrahouse-toolkit/journals"
+
+PENDING = "pending"
+DELETED = "deleted"
+FAILED = "failed"
+SKIPPED = "skipped"
+GONE = "gone"
+
+# States of ARNs a resumed run still has to delete.
+UNFINISHED_STATES = {PENDING, FAILED}
+
+
+def default_journal_path(directory: str = DEFAULT_JOURNAL_DIRECTORY) -> str:
+    """
+    Return a new journal path in *directory*, named after the current time.
+
+    :param directory: Journal directory.  It is created with ``0o700``
+        permissions when missing.
+    :return: Path of a journal file that doesn't exist yet.
+    """
+    directory = osp.expanduser(directory)
+    os.makedirs(directory, exist_ok=True)
+    ensure_permissions(directory, 0o700)
+    name = datetime.now(tz=timezone.utc).strftime("delete-%Y%m%dT%H%M%S.%fZ.jsonl")
+    return osp.join(directory, name)
+
+
+class DeletionJournal:
+    """
+    Append-only record of the ARNs of a deletion run and their states.
+
+    Use :meth:`create` to start a journal and :meth:`open` to resume one.
+    Writes are thread-safe.
+
+    :param path: Path of the journal file.
+    :param header: Description of the run from the first line of the file.
+    :param states: Last known state of every ARN, in the order ARNs were
+        added to the journal.
+    """
+
+    def __init__(self, path: str, header: Dict, states: Dict[str, str]):
+        self.path = path
+        self.header = header
+        self._states = states
+        self._lock = Lock()
+
+    @classmethod
+    def create(cls, path: str, arns: List[str], **header) -> "DeletionJournal":
+        """
+        Start a journal with all *arns* :data:`PENDING`.
+
+        :param path: Path of the journal file.  It must not exist.
+        :param arns: ARNs confirmed for deletion.
+        :param header: Extra JSON-serializable details of the run, e.g. tag filters.
+        :return: The new journal.
+        :raise FileExistsError: If *path* exists.
+        """
+        header = dict(header, type="header", created=time.time())
+        with open(path, "x", encoding="utf-8") as journal_file:
+            journal_file.write(json.dumps(header) + "\n")
+            now = time.time()
+            for arn in arns:
+                journal_file.write(json.dumps({"arn": arn, "state": PENDING, "time": now}) + "\n")
+        os.chmod(path, 0o600)
+        return cls(path, header, {arn: PENDING for arn in arns})
+
+    @classmethod
+    def open(cls, path: str) -> "DeletionJournal":
+        """
+        Read an existing journal.
+
+        A truncated last line, as left by a killed process, is ignored.
+
+        :param path: Path of the journal file.
+        :return: The journal with the last recorded state of every ARN.
+        :raise ValueError: If the file isn't a deletion journal.
+        """
+        header: Optional[Dict] = None
+        states: Dict[str, str] = {}
+        with open(path, encoding="utf-8") as journal_file:
+            for number, line in enumerate(journal_file, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    LOG.warning("Ignoring unreadable line %d of %s", number, path)
+                    continue
+                if header is None:
+                    if record.get("type") != "header":
+                        raise ValueError(f"{path} is not a deletion journal")
+                    header = record
+                else:
+                    states[record["arn"]] = record["state"]
+        if header is None:
+            raise ValueError(f"{path} is not a deletion journal")
+        return cls(path, header, states)
+
+    @property
+    def states(self) -> Dict[str, str]:
+        """Last known state of every ARN."""
+        with self._lock:
+            return dict(self._states)
+
+    def unfinished(self) -> List[str]:
+        """
+        Return the ARNs a resumed run still has to delete.
+
+        :return: ARNs whose state is in :data:`UNFINISHED_STATES`, in journal order.
+        """
+        with self._lock:
+            return [arn for arn, state in self._states.items() if state in UNFINISHED_STATES]
+
+    def record(self, arn: str, state: str, message: Optional[str] = None) -> None:
+        """
+        Append the new state of an ARN.
+
+        :param arn: Amazon Resource Name.
+        :param state: One of :data:`PENDING`, :data:`DELETED`, :data:`FAILED`,
+            :data:`SKIPPED` or :data:`GONE` (found missing when resuming).
+        :param message: Optional error message.
+        """
+        entry = {"arn": arn, "state": state, "time": time.time()}
+        if message:
+            entry["message"] = message
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(json.dumps(entry) + "\n")
+            self._states[arn] = state
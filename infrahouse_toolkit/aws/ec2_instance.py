@@ -3,32 +3,44 @@ Module for EC2Instance class - a class tha represents an EC2 instance.
 """
 
 from logging import getLogger
+from threading import Lock
+from typing import Dict, Iterable, Optional
 
 from cached_property import cached_property_with_ttl
-from ec2_metadata import ec2_metadata
 
 from infrahouse_toolkit.aws import get_client
+from infrahouse_toolkit.aws.instance_metadata import get_instance_metadata
 
 LOG = getLogger()
 
+# Seconds a describe response is reused by the same object.
+DESCRIBE_CACHE_TTL = 10
+
+# Instance IDs per describe_instances call when instances are described in bulk.
+DESCRIBE_BATCH_SIZE = 200
+
 
 class EC2Instance:
     """
     EC2Instance represents an EC2 instance.
 
+    Describe responses are cached for :data:`DESCRIBE_CACHE_TTL` seconds;
+    call :meth:`invalidate_cache` to read the current state sooner.
+
     :param instance_id: Instance id. If omitted, the local instance is read from metadata.
     :type instance_id: str
     """
 
     def __init__(self, instance_id: str = None):
         self._instance_id = instance_id
+        self._bulk_description: Optional["_BulkDescription"] = None
 
     @property
     def availability_zone(self) -> str:
         """
         :return: Availability zone where this instance is hosted.
         """
-        return ec2_metadata.availability_zone
+        return get_instance_metadata().availability_zone
 
     @property
     def instance_id(self) -> str:
@@ -37,7 +49,7 @@ class EC2Instance:
             if the class instance was created w/o specifying it.
         """
         if self._instance_id is None:
-            self._instance_id = ec2_metadata.instance_id
+            self._instance_id = get_instance_metadata().instance_id
         return self._instance_id
 
     @property
@@ -54,12 +66,21 @@ class EC2Instance:
         """
         return {tag["Key"]: tag["Value"] for tag in self._describe_instance["Tags"]}
 
+    def invalidate_cache(self):
+        """Forget cached describe responses, so the next lookup reads the current state."""
+        self._bulk_description = None
+        del self._describe_instance
+
     @property
     def _ec2_client(self):
         return get_client("ec2")
 
-    @cached_property_with_ttl(ttl=10)
+    @cached_property_with_ttl(ttl=DESCRIBE_CACHE_TTL)
     def _describe_instance(self):
+        if self._bulk_description is not None:
+            description = self._bulk_description.describe(self.instance_id)
+            if description is not None:
+                return description
         return self._ec2_client.describe_instances(
             InstanceIds=[
                 self.instance_id,
@@ -69,3 +90,64 @@ class EC2Instance:
         ][0][
             "Instances"
         ][0]
+
+
+def describe_in_bulk(instances: Iterable[EC2Instance], batch_size: int = DESCRIBE_BATCH_SIZE) -> None:
+    """
+    Let many instances be described with a few ``describe_instances`` calls.
+
+    Nothing is described right away: the first instance that reads its
+    description describes all instances given here that still haven't, and
+    caches the responses in them, as if each of them was described on its
+    own.  Callers that only need the instance IDs make no calls at all.
+
+    Instances are looked up with an ``instance-id`` filter, so an instance
+    that doesn't exist anymore doesn't fail the rest of its batch.  It's
+    described on its own when it's read, like any other instance.
+
+    :param instances: Instances to describe.
+    :param batch_size: Maximum number of instance IDs per call.
+    """
+    bulk = _BulkDescription(instances, batch_size)
+    for instance in bulk.instances:
+        instance._bulk_description = bulk  # pylint: disable=protected-access
+
+
+class _BulkDescription:  # pylint: disable=too-few-public-methods
+    """Instances that are described together on the first read of any of them."""
+
+    def __init__(self, instances: Iterable[EC2Instance], batch_size: int):
+        self.instances = list(instances)
+        self._batch_size = batch_size
+        self._lock = Lock()
+        self._descriptions: Optional[Dict[str, dict]] = None
+
+    def describe(self, instance_id: str) -> Optional[dict]:
+        """
+        :param instance_id: Instance to return the description of.
+        :return: Description of the instance, or ``None`` if it wasn't found.
+        """
+        with self._lock:
+            if self._descriptions is None:
+                self._descriptions = self._describe()
+                for instance in self.instances:
+                    # pylint: disable=protected-access
+                    instance._bulk_description = None
+                    if instance.instance_id in self._descriptions and instance.instance_id != instance_id:
+                        instance._describe_instance = self._descriptions[instance.instance_id]
+            return self._descriptions.get(instance_id)
+
+    def _describe(self) -> Dict[str, dict]:
+        instance_ids = [instance.instance_id for instance in self.instances]
+        descriptions = {}
+        for start in range(0, len(instance_ids), self._batch_size):
+            kwargs = {"Filters": [{"Name": "instance-id", "Values": instance_ids[start : start + self._batch_size]}]}
+            while True:
+                response = get_client("ec2").describe_instances(**kwargs)
+                for reservation in response["Reservations"]:
+                    for description in reservation["Instances"]:
+                        descriptions[description["InstanceId"]] = description
+                if not response.get("NextToken"):
+                    break
+                kwargs["NextToken"] = response["NextToken"]
+        return descriptions
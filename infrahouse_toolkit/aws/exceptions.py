@@ -11,3 +11,7 @@ from infrahouse_toolkit.exceptions import IHException
 
 class IHAWSException(IHException):
     """AWS related InfraHouse exception"""
+
+
+class IHResourceExplorerUnavailable(IHAWSException):
+    """AWS Resource Explorer can't answer a query; the caller should use the Tagging API."""
@@ -0,0 +1,158 @@
+"""
+Process-wide cache of the local instance metadata.
+
+Commands that run on an EC2 instance look up the local instance again and
+again: every ``ASGInstance()`` reads its instance ID from the instance
+metadata service (IMDS), and lifecycle hook loops do it every few seconds.
+The fields :class:`InstanceMetadata` holds don't change while the
+instance runs, so :class:`InstanceMetadataProvider` reads them once with
+one IMDSv2 token and keeps them for the life of the process.  It also
+keeps them in a file on ``/dev/shm``, a tmpfs, so the next command on the
+instance doesn't call IMDS at all.  tmpfs is empty after a reboot, and an
+image baked from the instance doesn't carry the file along.
+
+Tests replace the provider with a :class:`StaticMetadataProvider`::
+
+    with mock.patch.object(
+        instance_metadata, "METADATA_PROVIDER", StaticMetadataProvider(InstanceMetadata("i-123", ...))
+    ):
+        ...
+"""
+
+import json
+from collections import namedtuple
+from logging import getLogger
+from os import getuid
+from os import path as osp
+from os import remove, replace, stat
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Optional
+
+from ec2_metadata import ec2_metadata
+
+LOG = getLogger(__name__)
+
+TMPFS_DIRECTORY = "/dev/shm"
+
+InstanceMetadata = namedtuple(
+    "InstanceMetadata", ["instance_id", "availability_zone", "region", "private_ip", "hostname"]
+)
+InstanceMetadata.__doc__ = """Metadata of the local EC2 instance that doesn't change while it runs.
+
+``hostname`` is the private DNS name, e.g. ``ip-10-1-2-3.ec2.internal``.
+"""
+
+
+def default_cache_file() -> Optional[str]:
+    """
+    :return: Path of the metadata cache file of the current user,
+        or ``None`` if the host has no ``/dev/shm``.
+    """
+    if not osp.isdir(TMPFS_DIRECTORY):
+        return None
+    return osp.join(TMPFS_DIRECTORY, f"infrahouse-toolkit-instance-metadata-{getuid()}.json")
+
+
+class InstanceMetadataProvider:
+    """
+    Thread-safe reader of the local instance metadata.
+
+    The metadata is read from the cache file if it's there, or else from
+    IMDS, and is kept in memory after that.
+
+    :param cache_file: File to keep the metadata in across processes.
+        By default, a per-user file on ``/dev/shm``.  ``None`` disables it.
+    """
+
+    def __init__(self, cache_file: Optional[str] = ""):
+        self._cache_file = default_cache_file() if cache_file == "" else cache_file
+        self._lock = Lock()
+        self._metadata: Optional[InstanceMetadata] = None
+
+    @property
+    def metadata(self) -> InstanceMetadata:
+        """
+        :return: Metadata of the local instance.
+        """
+        with self._lock:
+            if self._metadata is None:
+                self._metadata = self._read_cache_file() or self._fetch()
+            return self._metadata
+
+    def invalidate_cache(self):
+        """Forget the metadata, so the next lookup reads it from IMDS again."""
+        with self._lock:
+            self._metadata = None
+            if self._cache_file and osp.exists(self._cache_file):
+                LOG.debug("Removing %s", self._cache_file)
+                remove(self._cache_file)
+
+    def _fetch(self) -> InstanceMetadata:
+        # ec2_metadata reuses one IMDSv2 token for all requests of the process.
+        LOG.debug("Reading instance metadata from IMDS")
+        document = ec2_metadata.instance_identity_document
+        metadata = InstanceMetadata(
+            instance_id=document["instanceId"],
+            availability_zone=document["availabilityZone"],
+            region=document["region"],
+            private_ip=document["privateIp"],
+            hostname=ec2_metadata.private_hostname,
+        )
+        self._write_cache_file(metadata)
+        return metadata
+
+    def _read_cache_file(self) -> Optional[InstanceMetadata]:
+        if not self._cache_file:
+            return None
+        try:
+            result = stat(self._cache_file)
+            # /dev/shm is writable by everyone: trust only our own, private file.
+            if result.st_uid != getuid() or result.st_mode & 0o077:
+                LOG.warning("Ignoring %s: it's not a private file of the current user", self._cache_file)
+                return None
+            with open(self._cache_file, encoding="utf-8") as cache_file:
+                return InstanceMetadata(**json.load(cache_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as err:
+            LOG.warning("Ignoring %s: %s", self._cache_file, err)
+            return None
+
+    def _write_cache_file(self, metadata: InstanceMetadata):
+        if not self._cache_file:
+            return
+        try:
+            # NamedTemporaryFile creates the file with 0600 permissions.
+            with NamedTemporaryFile(
+                "w", dir=osp.dirname(self._cache_file), prefix=".instance-metadata-", delete=False
+            ) as cache_file:
+                json.dump(metadata._asdict(), cache_file)
+            replace(cache_file.name, self._cache_file)
+        except OSError as err:
+            LOG.warning("Failed to save instance metadata in %s: %s", self._cache_file, err)
+
+
+class StaticMetadataProvider(InstanceMetadataProvider):
+    """
+    Provider of fixed metadata that never calls IMDS.  Meant for tests.
+
+    :param metadata: Metadata to provide.
+    """
+
+    def __init__(self, metadata: InstanceMetadata):
+        super().__init__(cache_file=None)
+        self._static_metadata = metadata
+
+    def _fetch(self) -> InstanceMetadata:
+        return self._static_metadata
+
+
+METADATA_PROVIDER = InstanceMetadataProvider()
+
+
+def get_instance_metadata() -> InstanceMetadata:
+    """
+    :return: Metadata of the local instance from the process-wide provider.
+    """
+    return METADATA_PROVIDER.metadata
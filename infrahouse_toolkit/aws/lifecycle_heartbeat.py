@@ -0,0 +1,130 @@
+"""
+Keep a lifecycle hook from expiring while a long operation runs.
+
+An instance waits in ``Pending:Wait`` or ``Terminating:Wait`` until its
+lifecycle hook is completed or the hook's ``HeartbeatTimeout`` passes.
+Commands that drain Elasticsearch nodes, upload logs or bootstrap MySQL
+may run longer than that, so they must record heartbeats.
+:class:`LifecycleHeartbeat` does it from a background thread, at a
+fraction of the timeout, for as long as the ``with`` block runs::
+
+    with LifecycleHeartbeat("terminating"):
+        upload_logs()
+
+It reads the instance's lifecycle state and the hook's timeout once, on
+entry.  If the instance isn't waiting for a hook, or they can't be read,
+it does nothing: heartbeats are best-effort and never fail the operation.
+"""
+
+from logging import getLogger
+from threading import Event, Thread
+from typing import Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from infrahouse_toolkit.aws import get_client
+from infrahouse_toolkit.aws.instance_metadata import get_instance_metadata
+
+LOG = getLogger(__name__)
+
+# Heartbeats are recorded this many times per HeartbeatTimeout, so one or
+# two failed heartbeats don't let the hook expire.
+DEFAULT_HEARTBEATS_PER_TIMEOUT = 3
+
+WAIT_STATES = ("Pending:Wait", "Terminating:Wait")
+
+
+class LifecycleHeartbeat:
+    """
+    Context manager that records lifecycle action heartbeats in a background thread.
+
+    :param hook_name: Lifecycle hook name.
+    :param instance_id: Instance the hook waits for.  By default, the local instance.
+    :param region: AWS region of the autoscaling group.
+    :param heartbeats_per_timeout: How many heartbeats to record per ``HeartbeatTimeout`` of the hook.
+    """
+
+    def __init__(
+        self,
+        hook_name: str,
+        instance_id: Optional[str] = None,
+        region: Optional[str] = None,
+        heartbeats_per_timeout: int = DEFAULT_HEARTBEATS_PER_TIMEOUT,
+    ):
+        self._hook_name = hook_name
+        self._instance_id = instance_id
+        self._region = region
+        self._heartbeats_per_timeout = heartbeats_per_timeout
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self.interval: Optional[float] = None
+
+    def __enter__(self):
+        try:
+            instance_id = self._instance_id or get_instance_metadata().instance_id
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            # Off EC2, or with IMDS disabled, there's no local instance to extend a hook of.
+            LOG.warning("Can't read the local instance ID, no heartbeats will be recorded: %s", err)
+            return self
+
+        try:
+            instances = self._autoscaling_client.describe_auto_scaling_instances(InstanceIds=[instance_id])[
+                "AutoScalingInstances"
+            ]
+            if not instances or instances[0]["LifecycleState"] not in WAIT_STATES:
+                LOG.debug("Instance %s isn't waiting for a lifecycle hook, no heartbeats needed.", instance_id)
+                return self
+
+            asg_name = instances[0]["AutoScalingGroupName"]
+            hooks = self._autoscaling_client.describe_lifecycle_hooks(
+                AutoScalingGroupName=asg_name, LifecycleHookNames=[self._hook_name]
+            )["LifecycleHooks"]
+        except (BotoCoreError, ClientError) as err:
+            LOG.warning("Can't read lifecycle hook %s, no heartbeats will be recorded: %s", self._hook_name, err)
+            return self
+
+        if not hooks:
+            LOG.warning(
+                "Lifecycle hook %s isn't found in %s, no heartbeats will be recorded.", self._hook_name, asg_name
+            )
+            return self
+
+        self.interval = hooks[0]["HeartbeatTimeout"] / self._heartbeats_per_timeout
+        LOG.debug("Extending lifecycle hook %s every %.0f seconds", self._hook_name, self.interval)
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run, args=(instance_id, asg_name), name="ih-lifecycle-heartbeat", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def _autoscaling_client(self):
+        return get_client("autoscaling", region=self._region)
+
+    def _run(self, instance_id: str, asg_name: str):
+        # The hook may have been waiting for a while already, so extend it right away.
+        while True:
+            try:
+                self._autoscaling_client.record_lifecycle_action_heartbeat(
+                    LifecycleHookName=self._hook_name,
+                    AutoScalingGroupName=asg_name,
+                    InstanceId=instance_id,
+                )
+            except ClientError as err:
+                # ValidationError means the hook isn't waiting anymore: it was completed or expired.
+                if err.response["Error"]["Code"] == "ValidationError":
+                    LOG.warning("Stopping heartbeats of lifecycle hook %s: %s", self._hook_name, err)
+                    return
+                LOG.warning("Failed to extend lifecycle hook %s: %s", self._hook_name, err)
+            except BotoCoreError as err:
+                LOG.warning("Failed to extend lifecycle hook %s: %s", self._hook_name, err)
+
+            if self._stop.wait(self.interval):
+                return
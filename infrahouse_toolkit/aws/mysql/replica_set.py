@@ -6,6 +6,7 @@ replica bootstrap using a DynamoDB distributed lock.
 """
 
 import os
+from contextlib import nullcontext
 from logging import getLogger
 from typing import List, Optional
 
@@ -15,6 +16,8 @@ from infrahouse_core.aws.ec2_instance import EC2Instance
 from infrahouse_core.aws.exceptions import IHItemNotFound
 
 from infrahouse_toolkit.aws.asg import ASG
+from infrahouse_toolkit.aws.instance_metadata import get_instance_metadata
+from infrahouse_toolkit.aws.lifecycle_heartbeat import LifecycleHeartbeat
 from infrahouse_toolkit.aws.mysql.exceptions import (
     MySQLBootstrapError,
     MySQLInstanceNotFound,
@@ -121,7 +124,7 @@ class MySQLReplicaSet:  # pylint: disable=too-many-instance-attributes
 
     # --- Public methods (alphabetical) ---
 
-    def bootstrap(self) -> None:
+    def bootstrap(self, lifecycle_hook: Optional[str] = None) -> None:
         """
         Run the full bootstrap sequence for this EC2 instance.
 
@@ -133,6 +136,9 @@ class MySQLReplicaSet:  # pylint: disable=too-many-instance-attributes
         6. Register with ELB target groups.
         7. Enable scale-in protection for the master.
 
+        :param lifecycle_hook: Launch lifecycle hook to extend while bootstrapping.
+            The hook isn't completed.
+        :type lifecycle_hook: Optional[str]
         :raises MySQLBootstrapError: If any step fails.
         :raises RuntimeError: If the distributed lock cannot be acquired.
         :raises ClientError: If target group registration fails.
@@ -141,7 +147,7 @@ class MySQLReplicaSet:  # pylint: disable=too-many-instance-attributes
             LOG.info("Bootstrap marker exists at %s, skipping bootstrap", self._bootstrap_marker)
             return
 
-        ec2 = EC2Instance(region=self._aws_region)
+        ec2 = EC2Instance(instance_id=get_instance_metadata().instance_id, region=self._aws_region)
         mysql_instance = MySQLInstance(
             ec2,
             cluster_id=self._cluster_id,
@@ -150,28 +156,33 @@ class MySQLReplicaSet:  # pylint: disable=too-many-instance-attributes
             aws_region=self._aws_region,
         )
         LOG.info("Instance ID: %s", mysql_instance.instance_id)
+        heartbeat = (
+            LifecycleHeartbeat(lifecycle_hook, instance_id=mysql_instance.instance_id, region=self._aws_region)
+            if lifecycle_hook
+            else nullcontext()
+        )
+        with heartbeat:
+            is_master = False
 
-        is_master = False
-
-        LOG.info("Attempting to acquire lock: %s", self._lock_name)
-        with self._table.lock(self._lock_name, timeout=self.LOCK_ACQUIRE_TIMEOUT, key_name="pk"):
-            LOG.info("Checking for existing master")
-            master_instance_id = self.get_master_instance_id()
+            LOG.info("Attempting to acquire lock: %s", self._lock_name)
+            with self._table.lock(self._lock_name, timeout=self.LOCK_ACQUIRE_TIMEOUT, key_name="pk"):
+                LOG.info("Checking for existing master")
+                master_instance_id = self.get_master_instance_id()
 
-            if master_instance_id is None:
-                is_master = True
-                self._bootstrap_as_master(mysql_instance)
-            else:
-                self._bootstrap_as_replica(mysql_instance, master_instance_id)
+                if master_instance_id is None:
+                    is_master = True
+                    self._bootstrap_as_master(mysql_instance)
+                else:
+                    self._bootstrap_as_replica(mysql_instance, master_instance_id)
 
-        role = "master" if is_master else "replica"
-        mysql_instance.tag_role(role)
-        mysql_instance.register_target_groups(self._aws_region, self._read_tg_arn, self._write_tg_arn, is_master)
+            role = "master" if is_master else "replica"
+            mysql_instance.tag_role(role)
+            mysql_instance.register_target_groups(self._aws_region, self._read_tg_arn, self._write_tg_arn, is_master)
 
-        if is_master:
-            asg_instance = ASGInstance(instance_id=mysql_instance.instance_id)
-            asg_instance.protect()
-            LOG.info("Scale-in protection enabled for master %s", mysql_instance.instance_id)
+            if is_master:
+                asg_instance = ASGInstance(instance_id=mysql_instance.instance_id)
+                asg_instance.protect()
+                LOG.info("Scale-in protection enabled for master %s", mysql_instance.instance_id)
 
         mysql_instance.write_marker(self._bootstrap_marker, f"{role}\n")
         LOG.info("Bootstrap complete, marker written to %s", self._bootstrap_marker)
@@ -281,7 +292,7 @@ class MySQLReplicaSet:  # pylint: disable=too-many-instance-attributes
         :rtype: ASG
         """
         if self.__asg is None:
-            self.__asg = ASG(ASGInstance().asg_name)
+            self.__asg = ASG(ASGInstance(instance_id=get_instance_metadata().instance_id).asg_name)
         return self.__asg
 
     def _bootstrap_as_master(self, mysql_instance: MySQLInstance) -> None:
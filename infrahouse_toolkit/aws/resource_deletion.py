@@ -0,0 +1,409 @@
+"""
+Dependency-ordered deletion of resources found by
+:mod:`infrahouse_toolkit.aws.resource_discovery`.
+
+AWS refuses to delete a resource while something still uses it: a
+security group attached to an ENI, a launch template referenced by an
+ASG, an ECS cluster with services.  :func:`plan_deletion_tiers` sorts
+resources into tiers so that dependents are deleted before the resources
+they depend on.  :class:`DeletionScheduler` deletes each tier on a worker
+pool and retries resources that failed with a dependency error once
+their prerequisites are gone.  Deletions that are still throttled after
+the client's own retries are retried the same way.
+
+Some deletions are asynchronous: a terminated instance keeps its ENIs and
+security groups until it shuts down, and an ASG is gone only after its
+instances are.  Before the next tier, the scheduler waits for them with
+the service's waiters.
+"""
+
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from logging import getLogger
+from threading import BoundedSemaphore
+from typing import Callable, Dict, List, Optional, Tuple
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from infrahouse_core.aws import EC2Instance
+
+from infrahouse_toolkit.aws.arn import parse_arn
+from infrahouse_toolkit.aws.client_registry import get_cached_client
+from infrahouse_toolkit.aws.resource_discovery import (
+    DEFAULT_VERIFY_CONCURRENCY,
+    SERVICE_CONCURRENCY_LIMITS,
+    resource_for_arn,
+)
+from infrahouse_toolkit.aws.resource_wrappers import (
+    TERMINATE_INSTANCES_LIMIT,
+    terminate_instances,
+)
+from infrahouse_toolkit.aws.throttling import is_throttling_error
+
+LOG = getLogger(__name__)
+
+DEFAULT_DELETE_RETRIES = 8
+DEFAULT_RETRY_DELAY = 5
+MAX_RETRY_DELAY = 60
+DEFAULT_SETTLE_TIMEOUT = 1800
+SETTLE_POLL_INTERVAL = 15
+
+# "service/type" -> resource types that must be gone before it can be deleted.
+DELETION_PREREQUISITES = {
+    "ec2/instance": {"autoscaling/autoScalingGroup"},
+    "ec2/launch-template": {"autoscaling/autoScalingGroup", "ec2/instance"},
+    "ec2/volume": {"ec2/instance"},
+    "ec2/network-interface": {
+        "ec2/instance",
+        "ec2/natgateway",
+        "ecs/service",
+        "elasticloadbalancing/loadbalancer",
+        "lambda/function",
+    },
+    "ec2/security-group": {
+        "autoscaling/autoScalingGroup",
+        "ec2/instance",
+        "ec2/launch-template",
+        "ec2/network-interface",
+        "ec2/security-group-rule",
+        "ecs/service",
+        "elasticloadbalancing/loadbalancer",
+        "lambda/function",
+    },
+    "ecs/cluster": {"ecs/service"},
+    "ecs/capacity-provider": {"ecs/cluster"},
+    "ecs/task-definition": {"ecs/service"},
+    "elasticloadbalancing/targetgroup": {"autoscaling/autoScalingGroup", "elasticloadbalancing/loadbalancer"},
+    "acm/certificate": {"cloudfront/distribution", "elasticloadbalancing/loadbalancer"},
+    "cloudfront/cache-policy": {"cloudfront/distribution"},
+    "cloudfront/function": {"cloudfront/distribution"},
+    "cloudfront/response-headers-policy": {"cloudfront/distribution"},
+    "s3": {"cloudfront/distribution"},
+    "iam/instance-profile": {"autoscaling/autoScalingGroup", "ec2/instance", "ec2/launch-template"},
+    "iam/role": {"ecs/service", "ecs/task-definition", "iam/instance-profile", "lambda/function"},
+    "iam/policy": {"iam/role"},
+}
+
+# Error codes AWS returns when a resource is still in use by another one.
+DEPENDENCY_ERROR_CODES = {
+    "ClusterContainsContainerInstancesException",
+    "ClusterContainsServicesException",
+    "ClusterContainsTasksException",
+    "DeleteConflict",
+    "DependencyViolation",
+    "ResourceInUse",
+    "ResourceInUseException",
+    "ResourceInUseFault",
+}
+
+# Batch delete functions of resource classes from infrahouse-core.  The
+# toolkit's own wrappers have a ``delete_many()`` class method instead.
+BATCH_DELETERS: Dict[type, Callable[[list], List[Optional[Exception]]]] = {
+    EC2Instance: terminate_instances,
+}
+
+AsyncDeletion = namedtuple("AsyncDeletion", ["service", "waiter", "argument", "limit"])
+AsyncDeletion.__doc__ = """boto3 waiter that tells when an asynchronous deletion is complete.
+
+``argument`` is the waiter's parameter for resource names, and ``limit``
+is how many names it accepts at once.
+"""
+
+# "service/type" -> waiter of resources that are still being deleted after the delete call returns.
+ASYNC_DELETION_WAITERS = {
+    "ec2/instance": AsyncDeletion("ec2", "instance_terminated", "InstanceIds", TERMINATE_INSTANCES_LIMIT),
+    "autoscaling/autoScalingGroup": AsyncDeletion("autoscaling", "group_not_exists", "AutoScalingGroupNames", 50),
+}
+
+DeletionOutcome = namedtuple("DeletionOutcome", ["arn", "status", "resource_class", "message"])
+DeletionOutcome.__doc__ = """Result of deleting one resource.
+
+``status`` is one of ``deleted``, ``failed`` or ``skipped``.
+"""
+
+
+def resource_kind(arn: str) -> str:
+    """
+    Return the ``service/type`` kind of an ARN as used in :data:`DELETION_PREREQUISITES`.
+
+    :param arn: Amazon Resource Name.
+    :return: ``service/type``, or just ``service`` for ARNs without a type.
+    """
+    parsed = parse_arn(arn)
+    if not parsed:
+        return "unknown"
+    if parsed["resource_type"]:
+        return f"{parsed['service']}/{parsed['resource_type']}"
+    return parsed["service"]
+
+
+def is_dependency_error(exc: Exception) -> bool:
+    """
+    Tell whether a deletion failed because another resource still uses this one.
+
+    :param exc: Exception raised by ``resource.delete()``.
+    :return: ``True`` for dependency-violation style errors.
+    """
+    return isinstance(exc, ClientError) and exc.response.get("Error", {}).get("Code") in DEPENDENCY_ERROR_CODES
+
+
+def plan_deletion_tiers(arns: List[str]) -> List[List[str]]:
+    """
+    Group ARNs into tiers that can be deleted one after another.
+
+    Resources in a tier don't depend on each other and can be deleted in
+    parallel.  Everything a resource depends on (per
+    :data:`DELETION_PREREQUISITES`) is in an earlier tier.  Within a tier
+    ARNs keep their input order.
+
+    :param arns: Amazon Resource Names to delete.
+    :return: List of tiers, each a list of ARNs.
+    """
+    kinds = {arn: resource_kind(arn) for arn in arns}
+    present = set(kinds.values())
+    remaining = {kind: DELETION_PREREQUISITES.get(kind, set()) & present for kind in present}
+    tier_of: Dict[str, int] = {}
+    tier = 0
+    while remaining:
+        ready = {kind for kind, prerequisites in remaining.items() if not prerequisites - tier_of.keys()}
+        if not ready:
+            LOG.warning("Cyclic deletion prerequisites between %s", ", ".join(sorted(remaining)))
+            ready = set(remaining)
+        for kind in ready:
+            tier_of[kind] = tier
+            del remaining[kind]
+        tier += 1
+
+    tiers: List[List[str]] = [[] for _ in range(tier)]
+    for arn in arns:
+        tiers[tier_of[kinds[arn]]].append(arn)
+    return [t for t in tiers if t]
+
+
+def batch_deleter(resource: object) -> Optional[Callable[[list], List[Optional[Exception]]]]:
+    """
+    Return the function that deletes many resources of the same class as *resource*.
+
+    :param resource: Resource from :func:`~infrahouse_toolkit.aws.resource_discovery.resource_for_arn`.
+    :return: The ``delete_many()`` class method of the resource class, its
+        :data:`BATCH_DELETERS` entry, or ``None`` when resources of that
+        class can only be deleted one by one.
+    """
+    if resource is None:
+        return None
+    deleter = getattr(type(resource), "delete_many", None)
+    return deleter if callable(deleter) else BATCH_DELETERS.get(type(resource))
+
+
+class DeletionScheduler:  # pylint: disable=too-few-public-methods
+    """
+    Delete resources in dependency order with a bounded worker pool.
+
+    Each tier from :func:`plan_deletion_tiers` is deleted concurrently.
+    Resources that fail with a dependency error (see
+    :func:`is_dependency_error`) or a throttling error (see
+    :func:`~infrahouse_toolkit.aws.throttling.is_throttling_error`) are
+    retried together with the next tier
+    and, after the last tier, in rounds with exponential backoff until they
+    succeed or *retries* rounds are used up.
+
+    Resources with a :func:`batch_deleter`, such as EC2 instances and
+    :class:`~infrahouse_toolkit.aws.resource_wrappers.EBSVolume`, are
+    deleted together per class and region by one worker, with the
+    multi-ID APIs of the service where it has them.
+
+    Instances and ASGs (see :data:`ASYNC_DELETION_WAITERS`) are still
+    shutting down when their delete calls return.  Before the next tier
+    starts, the scheduler waits until they are gone, so resources they
+    use don't fail with dependency errors meanwhile.
+
+    :param session: Authenticated boto3 session.
+    :param concurrency: Maximum number of concurrent deletions.
+    :param retries: Number of extra rounds for resources blocked by a dependency.
+    :param retry_delay: Delay in seconds before the first extra round.  It
+        doubles every round up to :data:`MAX_RETRY_DELAY`.
+    :param on_result: Optional callback that receives a
+        :class:`DeletionOutcome` for every resource as soon as it is
+        final.  It is always called from the thread that called :meth:`run`.
+    :param settle_timeout: How long in seconds to wait for asynchronous
+        deletions of a tier before the next one starts anyway.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        session: boto3.Session,
+        concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+        retries: int = DEFAULT_DELETE_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        on_result: Optional[Callable[[DeletionOutcome], None]] = None,
+        settle_timeout: float = DEFAULT_SETTLE_TIMEOUT,
+    ):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be a positive integer, got {concurrency}")
+        self._session = session
+        self._concurrency = concurrency
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._on_result = on_result
+        self._settle_timeout = settle_timeout
+        self._semaphores = {
+            service: BoundedSemaphore(min(limit, concurrency)) for service, limit in SERVICE_CONCURRENCY_LIMITS.items()
+        }
+
+    def run(self, arns: List[str]) -> List[DeletionOutcome]:
+        """
+        Delete the given resources.
+
+        :param arns: Amazon Resource Names to delete.
+        :return: One :class:`DeletionOutcome` per ARN, in the order of *arns*.
+        :raise KeyboardInterrupt: If interrupted.  Deletions in progress
+            finish, but queued ones are cancelled.
+        """
+        outcomes: Dict[str, DeletionOutcome] = {}
+        blocked: Dict[str, DeletionOutcome] = {}
+        executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="ih-delete")
+        try:
+            tiers = plan_deletion_tiers(arns)
+            for position, tier in enumerate(tiers):
+                blocked = self._delete_round(executor, list(blocked) + tier, outcomes)
+                if position < len(tiers) - 1:
+                    self._wait_until_gone(
+                        [arn for arn in tier if arn in outcomes and outcomes[arn].status == "deleted"]
+                    )
+
+            delay = self._retry_delay
+            for attempt in range(1, self._retries + 1):
+                if not blocked:
+                    break
+                LOG.info(
+                    "%d resource(s) blocked by dependencies, retry %d/%d in %s seconds",
+                    len(blocked),
+                    attempt,
+                    self._retries,
+                    delay,
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                blocked = self._delete_round(executor, list(blocked), outcomes)
+        except KeyboardInterrupt:
+            # Don't start queued deletions: their outcomes would never be reported.
+            LOG.warning("Interrupted, cancelling deletions that haven't started yet")
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        for outcome in blocked.values():
+            outcomes[outcome.arn] = outcome
+            self._report(outcome)
+        return [outcomes[arn] for arn in arns]
+
+    def _delete_round(
+        self, executor, arns: List[str], outcomes: Dict[str, DeletionOutcome]
+    ) -> Dict[str, DeletionOutcome]:
+        """Delete *arns* concurrently; return the failed outcomes of those blocked by a dependency."""
+        blocked = {}
+        futures = [executor.submit(self._delete_group, group) for group in self._group(arns)]
+        for future in as_completed(futures):
+            for outcome, exc in future.result():
+                if exc is not None and (is_dependency_error(exc) or is_throttling_error(exc)):
+                    LOG.debug("Deletion of %s is blocked: %s", outcome.arn, exc)
+                    blocked[outcome.arn] = outcome
+                    continue
+                outcomes[outcome.arn] = outcome
+                self._report(outcome)
+        # Keep the input order for the next round.
+        return {arn: blocked[arn] for arn in arns if arn in blocked}
+
+    def _wait_until_gone(self, arns: List[str]) -> None:
+        """Wait until asynchronously deleted resources among *arns* are gone."""
+        pending: Dict[tuple, List[str]] = {}
+        for arn in arns:
+            kind = resource_kind(arn)
+            if kind in ASYNC_DELETION_WAITERS:
+                parsed = parse_arn(arn)
+                # An ASG's resource ID is "<uuid>:autoScalingGroupName/<name>".
+                name = parsed["resource_id"].split("autoScalingGroupName/")[-1]
+                pending.setdefault((kind, parsed["region"]), []).append(name)
+
+        for (kind, region), names in pending.items():
+            deletion = ASYNC_DELETION_WAITERS[kind]
+            LOG.info("Waiting for %d %s resource(s) in %s to be deleted", len(names), kind, region)
+            waiter = get_cached_client(deletion.service, region=region, session=self._session).get_waiter(
+                deletion.waiter
+            )
+            for start in range(0, len(names), deletion.limit):
+                try:
+                    waiter.wait(
+                        **{deletion.argument: names[start : start + deletion.limit]},
+                        WaiterConfig={
+                            "Delay": SETTLE_POLL_INTERVAL,
+                            "MaxAttempts": max(1, int(self._settle_timeout // SETTLE_POLL_INTERVAL)),
+                        },
+                    )
+                except (BotoCoreError, ClientError) as err:
+                    # Dependents still get their retries.
+                    LOG.warning("Gave up waiting for %s resource(s) in %s to be deleted: %s", kind, region, err)
+
+    def _group(self, arns: List[str]) -> List[List[Tuple[str, object]]]:
+        """
+        Split a round into units of work for the worker pool.
+
+        Resources with a :func:`batch_deleter` are grouped by class and
+        region; every other resource is a unit of its own.
+        """
+        groups: Dict[tuple, List[Tuple[str, object]]] = {}
+        units = []
+        for arn in arns:
+            # No region override: regional ARNs carry their own region, which
+            # matters when resources from several regions are deleted at once.
+            resource = resource_for_arn(arn, session=self._session)
+            if batch_deleter(resource) is not None:
+                groups.setdefault((type(resource), parse_arn(arn)["region"]), []).append((arn, resource))
+            else:
+                units.append([(arn, resource)])
+        return list(groups.values()) + units
+
+    def _delete_group(self, group: List[Tuple[str, object]]) -> List[Tuple[DeletionOutcome, Optional[Exception]]]:
+        delete_many = batch_deleter(group[0][1])
+        if delete_many is None:
+            return [self._delete_one(*group[0])]
+
+        arns = [arn for arn, _ in group]
+        resources = [resource for _, resource in group]
+        resource_class = type(resources[0]).__name__
+        LOG.debug("Deleting %d %s resource(s) at once", len(group), resource_class)
+        with self._semaphores.get(parse_arn(arns[0])["service"]) or nullcontext():
+            errors = delete_many(resources)
+        return [self._outcome(arn, resource_class, exc) for arn, exc in zip(arns, errors)]
+
+    def _delete_one(self, arn: str, resource) -> Tuple[DeletionOutcome, Optional[Exception]]:
+        if resource is None:
+            return DeletionOutcome(arn, "skipped", None, "no resource class available"), None
+
+        resource_class = type(resource).__name__
+        parsed = parse_arn(arn)
+        with self._semaphores.get(parsed["service"]) or nullcontext():
+            try:
+                resource.delete()
+            except (ClientError, BotoCoreError) as exc:
+                return self._outcome(arn, resource_class, exc)
+        return self._outcome(arn, resource_class, None)
+
+    @staticmethod
+    def _outcome(
+        arn: str, resource_class: str, exc: Optional[Exception]
+    ) -> Tuple[DeletionOutcome, Optional[Exception]]:
+        if exc is None:
+            return DeletionOutcome(arn, "deleted", resource_class, None), None
+        if isinstance(exc, ClientError):
+            message = exc.response.get("Error", {}).get("Message", str(exc))
+        else:
+            message = str(exc)
+        return DeletionOutcome(arn, "failed", resource_class, message), exc
+
+    def _report(self, outcome: DeletionOutcome) -> None:
+        if self._on_result is not None:
+            self._on_result(outcome)
@@ -7,10 +7,16 @@ classes for existence checks (``resource.exists``) and deletion
 logic lives in infrahouse-core.
 """
 
+import csv
+import io
 import json
-import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from logging import getLogger
-from typing import Dict, List, Optional
+from queue import Queue
+from threading import BoundedSemaphore, Event, Lock
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import boto3
 from botocore.exceptions import ClientError
@@ -39,671 +45,724 @@ from infrahouse_core.aws import (
     SQSQueue,
     Zone,
 )
+from infrahouse_core.aws.base import AWSResource
 from tabulate import tabulate
 
+from infrahouse_toolkit.aws.arn import parse_arn
+from infrahouse_toolkit.aws.client_registry import get_cached_client
+from infrahouse_toolkit.aws.exceptions import IHResourceExplorerUnavailable
+from infrahouse_toolkit.aws.resource_explorer import search_resources
+from infrahouse_toolkit.aws.resource_record import ResourceRecord, TagSetTable
+from infrahouse_toolkit.aws.resource_types import (
+    ANY_RESOURCE_TYPE,
+    RESOURCE_TYPES,
+    register_resource_type,
+)
+from infrahouse_toolkit.aws.resource_verification import (
+    BatchCheck,
+    plan_existence_checks,
+    run_batch_check,
+)
+from infrahouse_toolkit.aws.resource_wrappers import (
+    EBSVolume,
+    ECSCapacityProvider,
+    ECSCluster,
+    ECSService,
+    ECSTaskDefinition,
+    KeyPair,
+    LaunchTemplate,
+    NetworkInterface,
+    SecurityGroupRule,
+)
+from infrahouse_toolkit.aws.tag_query import (
+    TagExpression,
+    iam_tag_filter,
+    plan_tag_query,
+    tag_expression,
+)
+from infrahouse_toolkit.aws.throttling import is_throttling_error
+
 LOG = getLogger(__name__)
 
+DEFAULT_VERIFY_CONCURRENCY = 10
+
+# Discovery backends of find_resources_by_tags(): the Resource Groups
+# Tagging API, paged per region, or a Resource Explorer aggregator index.
+BACKEND_TAGGING = "tagging"
+BACKEND_EXPLORER = "explorer"
+DISCOVERY_BACKENDS = [BACKEND_TAGGING, BACKEND_EXPLORER]
+
+# Services whose resources have no region.
+GLOBAL_SERVICES = {"cloudfront", "iam", "route53"}
+
+# Upper bound on concurrent existence checks per AWS service.  These keep
+# a high ``--concurrency`` from tripping the (much lower) control-plane
+# throttling limits of some services.  Services not listed here are only
+# bounded by the global concurrency.
+SERVICE_CONCURRENCY_LIMITS = {
+    "ec2": 8,
+    "iam": 4,
+    "cloudfront": 4,
+    "route53": 2,
+}
+
 # ---------------------------------------------------------------------------
-# ARN parsing
+# ARN → infrahouse-core resource class mapping
 # ---------------------------------------------------------------------------
 
+# infrahouse-core classes that aren't AWSResource subclasses -> attribute
+# of their lazily created client and the client's service.
+CORE_CLIENT_ATTRIBUTES = {
+    ASG: ("_autoscaling_client_instance", "autoscaling"),
+    EC2Instance: ("_ec2_client", "ec2"),
+    Zone: ("_client_instance", "route53"),
+}
+
 
-def parse_arn(arn: str) -> Optional[Dict[str, Optional[str]]]:
+def resource_for_arn(arn: str, region: str = None, role_arn: str = None, session: boto3.Session = None):
     """
-    Parse an ARN into its components.
+    Instantiate an ``infrahouse-core`` resource class for the given ARN.
 
-    ARN format: ``arn:partition:service:region:account-id:resource-type/resource-id``
-    or: ``arn:partition:service:region:account-id:resource-type:resource-id``
+    The resource gets its boto3 client from the shared
+    :mod:`~infrahouse_toolkit.aws.client_registry`, so resources of the
+    same service and region don't each build their own client.
 
-    :param arn: Amazon Resource Name string.
-    :return: Dictionary with keys ``partition``, ``service``, ``region``,
-        ``account``, ``resource``, ``resource_type``, and ``resource_id``.
-        Returns ``None`` when the ARN cannot be parsed.
+    :param arn: Amazon Resource Name.
+    :param region: AWS region override (uses the ARN region when ``None``).
+    :param role_arn: IAM role ARN for cross-account access.
+    :param session: Authenticated boto3 session.  When provided the resource
+        class uses this session for all API calls (e.g. inheriting
+        ``--aws-profile`` credentials).
+    :return: An infrahouse-core resource instance with ``exists`` / ``delete()``
+        interface, or ``None`` when no matching class is available.
     """
-    pattern = r"^arn:(?P<partition>[^:]+):(?P<service>[^:]+):(?P<region>[^:]*):(?P<account>[^:]*):(?P<resource>.+)$"
-    match = re.match(pattern, arn)
-    if not match:
-        return None
+    resource = _instantiate_resource(arn, region=region, role_arn=role_arn, session=session)
+    # pylint: disable=protected-access
+    if isinstance(resource, AWSResource):
+        attribute, service_name = "_client_instance", resource._service_name
+    else:
+        attribute, service_name = CORE_CLIENT_ATTRIBUTES.get(type(resource), (None, None))
+    if attribute and getattr(resource, attribute) is None:
+        setattr(
+            resource,
+            attribute,
+            get_cached_client(service_name, region=resource._region, session=session, role_arn=role_arn),
+        )
+    return resource
 
-    result = match.groupdict()
 
-    resource = result["resource"]
-    colon_pos = resource.find(":")
-    slash_pos = resource.find("/")
+def _instantiate_resource(arn: str, region: str = None, role_arn: str = None, session: boto3.Session = None):
+    """Map an ARN to a resource class instance; see :func:`resource_for_arn`."""
+    parsed = parse_arn(arn)
+    if not parsed:
+        return None
+    factory = RESOURCE_TYPES.lookup(parsed["service"], parsed["resource_type"])
+    if factory is None:
+        return None
+    parsed["arn"] = arn
+    return factory(parsed, region or parsed["region"] or None, role_arn, session)
+
 
-    if colon_pos != -1 and (slash_pos == -1 or colon_pos < slash_pos):
-        parts = resource.split(":", 1)
-        result["resource_type"] = parts[0]
-        result["resource_id"] = parts[1]
-    elif slash_pos != -1:
-        parts = resource.split("/", 1)
-        result["resource_type"] = parts[0]
-        result["resource_id"] = parts[1]
-    else:
-        result["resource_type"] = None
-        result["resource_id"] = resource
+def _ecs_service(arn: Dict, region: Optional[str], _: Optional[str], session: Optional[boto3.Session]):
+    # resource_id is "cluster-name/service-name"
+    parts = arn["resource_id"].split("/", 1)
+    if len(parts) != 2:
+        return None
+    return ECSService(cluster=parts[0], service_name=parts[1], region=region, session=session)
+
+
+def _sqs_queue(arn: Dict, region: Optional[str], role_arn: Optional[str], session: Optional[boto3.Session]):
+    # SQS is URL-identified — derive the URL from the ARN
+    queue_url = f"https://sqs.{region}.amazonaws.com/{arn['account']}/{arn['resource_id']}"
+    return SQSQueue(queue_url, region=region, role_arn=role_arn, session=session)
+
+
+# Factories take (parsed ARN, region, role ARN, session).  Global services
+# (IAM, S3, CloudFront, Route 53) ignore the region.
+_BUILTIN_RESOURCE_TYPES = {
+    # EC2
+    ("ec2", "instance"): lambda a, r, role, s: EC2Instance(
+        instance_id=a["resource_id"], region=r, role_arn=role, session=s
+    ),
+    ("ec2", "security-group"): lambda a, r, role, s: SecurityGroup(
+        a["resource_id"], region=r, role_arn=role, session=s
+    ),
+    ("ec2", "natgateway"): lambda a, r, role, s: NATGateway(a["resource_id"], region=r, role_arn=role, session=s),
+    ("ec2", "network-interface"): lambda a, r, role, s: NetworkInterface(a["resource_id"], region=r, session=s),
+    ("ec2", "security-group-rule"): lambda a, r, role, s: SecurityGroupRule(a["resource_id"], region=r, session=s),
+    ("ec2", "volume"): lambda a, r, role, s: EBSVolume(a["resource_id"], region=r, session=s),
+    ("ec2", "key-pair"): lambda a, r, role, s: KeyPair(a["resource_id"], region=r, session=s),
+    ("ec2", "launch-template"): lambda a, r, role, s: LaunchTemplate(a["resource_id"], region=r, session=s),
+    # IAM
+    ("iam", "role"): lambda a, r, role, s: IAMRole(a["resource_id"], role_arn=role, session=s),
+    ("iam", "policy"): lambda a, r, role, s: IAMPolicy(a["arn"], role_arn=role, session=s),
+    ("iam", "instance-profile"): lambda a, r, role, s: IAMInstanceProfile(a["resource_id"], role_arn=role, session=s),
+    # S3 (no region in the ARN)
+    ("s3", ANY_RESOURCE_TYPE): lambda a, r, role, s: S3Bucket(a["resource_id"], role_arn=role, session=s),
+    # ELB (ARN-identified)
+    ("elasticloadbalancing", "loadbalancer"): lambda a, r, role, s: ELBLoadBalancer(
+        a["arn"], region=r, role_arn=role, session=s
+    ),
+    ("elasticloadbalancing", "targetgroup"): lambda a, r, role, s: ELBTargetGroup(
+        a["arn"], region=r, role_arn=role, session=s
+    ),
+    ("lambda", "function"): lambda a, r, role, s: LambdaFunction(a["resource_id"], region=r, role_arn=role, session=s),
+    ("dynamodb", "table"): lambda a, r, role, s: DynamoDBTable(a["resource_id"], region=r, role_arn=role, session=s),
+    ("secretsmanager", "secret"): lambda a, r, role, s: Secret(a["arn"], region=r, role_arn=role, session=s),
+    ("logs", "log-group"): lambda a, r, role, s: CloudWatchLogGroup(
+        a["resource_id"], region=r, role_arn=role, session=s
+    ),
+    ("events", "rule"): lambda a, r, role, s: EventBridgeRule(a["resource_id"], region=r, role_arn=role, session=s),
+    ("sns", ANY_RESOURCE_TYPE): lambda a, r, role, s: SNSTopic(a["arn"], region=r, role_arn=role, session=s),
+    ("sqs", ANY_RESOURCE_TYPE): _sqs_queue,
+    ("autoscaling", "autoScalingGroup"): lambda a, r, role, s: ASG(
+        a["resource_id"], region=r, role_arn=role, session=s
+    ),
+    # CloudFront (no region in the ARN)
+    ("cloudfront", "distribution"): lambda a, r, role, s: CloudFrontDistribution(
+        a["resource_id"], role_arn=role, session=s
+    ),
+    ("cloudfront", "cache-policy"): lambda a, r, role, s: CloudFrontCachePolicy(
+        a["resource_id"], role_arn=role, session=s
+    ),
+    ("cloudfront", "function"): lambda a, r, role, s: CloudFrontFunction(a["resource_id"], role_arn=role, session=s),
+    ("cloudfront", "response-headers-policy"): lambda a, r, role, s: CloudFrontResponseHeadersPolicy(
+        a["resource_id"], role_arn=role, session=s
+    ),
+    ("acm", "certificate"): lambda a, r, role, s: ACMCertificate(a["arn"], region=r, role_arn=role, session=s),
+    ("route53", "hostedzone"): lambda a, r, role, s: Zone(zone_id=a["resource_id"], role_arn=role, session=s),
+    # ECS
+    ("ecs", "task-definition"): lambda a, r, role, s: ECSTaskDefinition(a["arn"], region=r, session=s),
+    ("ecs", "service"): _ecs_service,
+    ("ecs", "cluster"): lambda a, r, role, s: ECSCluster(cluster_name=a["resource_id"], region=r, session=s),
+    ("ecs", "capacity-provider"): lambda a, r, role, s: ECSCapacityProvider(name=a["resource_id"], region=r, session=s),
+}
 
-    return result
+for (_service, _resource_type), _factory in _BUILTIN_RESOURCE_TYPES.items():
+    register_resource_type(_service, _resource_type, _factory)
 
 
 # ---------------------------------------------------------------------------
-# Lightweight resource wrappers (too simple for infrahouse-core)
+# Discovery
 # ---------------------------------------------------------------------------
 
 
-class LaunchTemplate:
-    """Minimal wrapper for EC2 launch templates."""
-
-    def __init__(self, template_id: str, region: str = None, session: boto3.Session = None):
-        self._template_id = template_id
-        self._region = region
-        self._session = session
-        self._client_instance = None
-
-    @property
-    def _client(self):
-        """Lazy-initialise the EC2 client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ec2", region_name=self._region)
-        return self._client_instance
-
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the launch template still exists."""
-        try:
-            resp = self._client.describe_launch_templates(LaunchTemplateIds=[self._template_id])
-            return bool(resp.get("LaunchTemplates"))
-        except ClientError as exc:
-            if exc.response["Error"]["Code"] == "InvalidLaunchTemplateId.NotFound":
-                return False
-            raise
-
-    def delete(self) -> None:
-        """Delete the launch template."""
-        self._client.delete_launch_template(LaunchTemplateId=self._template_id)
+def _tag_filter_matches(tags: Dict[str, str], tag_filter: Dict) -> bool:
+    """Check whether a resource's tags satisfy a single filter.
 
+    :param tags: Resource tag dict (``{key: value, ...}``).
+    :param tag_filter: Filter dict with ``"key"`` and optional ``"value"``.
+    :return: ``True`` when the filter matches.
+    """
+    key = tag_filter["key"]
+    if "value" in tag_filter:
+        return tags.get(key) == tag_filter["value"]
+    return key in tags
 
-class KeyPair:
-    """Minimal wrapper for EC2 key pairs."""
 
-    def __init__(self, key_pair_id: str, region: str = None, session: boto3.Session = None):
-        self._key_pair_id = key_pair_id
-        self._region = region
-        self._session = session
-        self._client_instance = None
-
-    @property
-    def _client(self):
-        """Lazy-initialise the EC2 client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ec2", region_name=self._region)
-        return self._client_instance
-
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the key pair still exists."""
-        try:
-            resp = self._client.describe_key_pairs(KeyPairIds=[self._key_pair_id])
-            return bool(resp.get("KeyPairs"))
-        except ClientError as exc:
-            if exc.response["Error"]["Code"] == "InvalidKeyPair.NotFound":
-                return False
-            raise
-
-    def delete(self) -> None:
-        """Delete the key pair."""
-        self._client.delete_key_pair(KeyPairId=self._key_pair_id)
+def _iam_role_tags_bulk(client) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """
+    Yield ``(role_arn, tags)`` for every IAM role in the account.
 
+    ``get_account_authorization_details`` returns role tags inline, so a
+    whole page of roles costs one API call.
+    """
+    for page in client.get_paginator("get_account_authorization_details").paginate(Filter=["Role"]):
+        for role in page.get("RoleDetailList", []):
+            yield role["Arn"], {t["Key"]: t["Value"] for t in role.get("Tags", [])}
 
-class NetworkInterface:
-    """Minimal wrapper for EC2 network interfaces.
 
-    Supports existence checks and deletion with automatic force-detach
-    when the ENI is still attached.
+def _iam_role_tags_per_role(client, concurrency: int) -> Iterator[Tuple[str, Dict[str, str]]]:
     """
+    Yield ``(role_arn, tags)`` for every IAM role, one ``list_role_tags`` call per role.
 
-    def __init__(self, eni_id: str, region: str = None, session: boto3.Session = None):
-        self._eni_id = eni_id
-        self._region = region
-        self._session = session
-        self._client_instance = None
-
-    @property
-    def _client(self):
-        """Lazy-initialise the EC2 client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ec2", region_name=self._region)
-        return self._client_instance
+    Tag lookups run on a small thread pool.  Roles whose tags can't be
+    read are skipped.
+    """
 
-    def _describe(self) -> Optional[Dict]:
-        """Return the ENI description dict or ``None`` if not found."""
+    def _tags(role: Dict) -> Optional[Dict[str, str]]:
         try:
-            resp = self._client.describe_network_interfaces(NetworkInterfaceIds=[self._eni_id])
-            interfaces = resp.get("NetworkInterfaces", [])
-            return interfaces[0] if interfaces else None
+            response = client.list_role_tags(RoleName=role["RoleName"])
+            return {t["Key"]: t["Value"] for t in response.get("Tags", [])}
         except ClientError as exc:
-            if exc.response["Error"]["Code"] == "InvalidNetworkInterfaceID.NotFound":
-                return None
-            raise
+            LOG.debug("Can't read tags of %s: %s", role["Arn"], exc)
+            return None
 
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the network interface still exists."""
-        return self._describe() is not None
-
-    def delete(self) -> None:
-        """Detach (if attached) and delete the network interface."""
-        info = self._describe()
-        if info is None:
-            return
-        attachment = info.get("Attachment")
-        if attachment and info.get("Status") == "in-use":
-            self._client.detach_network_interface(
-                AttachmentId=attachment["AttachmentId"],
-                Force=True,
-            )
-            LOG.info("Detached %s (attachment %s)", self._eni_id, attachment["AttachmentId"])
-            waiter = self._client.get_waiter("network_interface_available")
-            waiter.wait(NetworkInterfaceIds=[self._eni_id])
-        self._client.delete_network_interface(NetworkInterfaceId=self._eni_id)
-
-
-class EBSVolume:
-    """Minimal wrapper for EBS volumes."""
-
-    def __init__(self, volume_id: str, region: str = None, session: boto3.Session = None):
-        self._volume_id = volume_id
-        self._region = region
-        self._session = session
-        self._client_instance = None
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ih-iam-tags") as executor:
+        for page in client.get_paginator("list_roles").paginate():
+            roles = page.get("Roles", [])
+            for role, role_tags in zip(roles, executor.map(_tags, roles)):
+                if role_tags is not None:
+                    yield role["Arn"], role_tags
 
-    @property
-    def _client(self):
-        """Lazy-initialise the EC2 client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ec2", region_name=self._region)
-        return self._client_instance
 
-    def _describe(self) -> Optional[Dict]:
-        """Return the volume description dict or ``None`` if not found."""
-        try:
-            resp = self._client.describe_volumes(VolumeIds=[self._volume_id])
-            volumes = resp.get("Volumes", [])
-            return volumes[0] if volumes else None
-        except ClientError as exc:
-            if exc.response["Error"]["Code"] == "InvalidVolume.NotFound":
-                return None
-            raise
-
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the volume still exists and is not deleted."""
-        info = self._describe()
-        if info is None:
-            return False
-        return info.get("State") != "deleted"
-
-    def delete(self) -> None:
-        """Detach (if attached) and delete the volume."""
-        info = self._describe()
-        if info is None:
-            return
-        if info.get("State") == "in-use":
-            for attachment in info.get("Attachments", []):
-                self._client.detach_volume(
-                    VolumeId=self._volume_id,
-                    InstanceId=attachment["InstanceId"],
-                    Force=True,
-                )
-            waiter = self._client.get_waiter("volume_available")
-            waiter.wait(VolumeIds=[self._volume_id])
-        self._client.delete_volume(VolumeId=self._volume_id)
+def list_iam_roles(session: boto3.Session, concurrency: int = SERVICE_CONCURRENCY_LIMITS["iam"]) -> List[Dict]:
+    """
+    List all IAM roles in the account with their tags.
 
+    Roles and their tags are read in bulk with
+    ``get_account_authorization_details``.  When the caller isn't allowed
+    to use it (``iam:GetAccountAuthorizationDetails``), the function falls
+    back to ``list_roles`` plus concurrent ``list_role_tags`` calls.
 
-class SecurityGroupRule:
-    """Minimal wrapper for EC2 security group rules."""
+    :param session: Authenticated boto3 session.
+    :param concurrency: Number of parallel ``list_role_tags`` calls in the
+        fallback path.
+    :return: List of dicts with ``arn``, ``tags``, and ``exists`` keys.
+    """
+    client = get_cached_client("iam", session=session)
+    try:
+        return [{"arn": arn, "tags": role_tags, "exists": True} for arn, role_tags in _iam_role_tags_bulk(client)]
+    except ClientError as exc:
+        LOG.debug("Bulk IAM role scan failed (%s) — reading role tags one by one", exc)
 
-    def __init__(self, rule_id: str, region: str = None, session: boto3.Session = None):
-        self._rule_id = rule_id
-        self._region = region
-        self._session = session
-        self._client_instance = None
+    return [
+        {"arn": arn, "tags": role_tags, "exists": True}
+        for arn, role_tags in _iam_role_tags_per_role(client, concurrency)
+    ]
 
-    @property
-    def _client(self):
-        """Lazy-initialise the EC2 client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ec2", region_name=self._region)
-        return self._client_instance
 
-    def _describe(self) -> Optional[Dict]:
-        """Return the rule description dict or ``None`` if not found."""
-        try:
-            resp = self._client.describe_security_group_rules(SecurityGroupRuleIds=[self._rule_id])
-            rules = resp.get("SecurityGroupRules", [])
-            return rules[0] if rules else None
-        except ClientError as exc:
-            if exc.response["Error"]["Code"] == "InvalidSecurityGroupRuleId.NotFound":
-                return None
-            raise
+def find_iam_roles_by_tag(
+    session: boto3.Session,
+    tag_key: str,
+    tag_value: Optional[str] = None,
+    concurrency: int = SERVICE_CONCURRENCY_LIMITS["iam"],
+) -> List[Dict]:
+    """
+    Find IAM roles matching a tag using the direct IAM API.
 
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the security group rule still exists."""
-        return self._describe() is not None
+    The Resource Groups Tagging API sometimes misses IAM roles, so this
+    function provides a fallback by enumerating all roles with
+    :func:`list_iam_roles` and checking their tags.
 
-    def delete(self) -> None:
-        """Delete the security group rule."""
-        info = self._describe()
-        if info is None:
-            return
-        group_id = info["GroupId"]
-        if info.get("IsEgress"):
-            self._client.revoke_security_group_egress(
-                GroupId=group_id,
-                SecurityGroupRuleIds=[self._rule_id],
-            )
-        else:
-            self._client.revoke_security_group_ingress(
-                GroupId=group_id,
-                SecurityGroupRuleIds=[self._rule_id],
-            )
+    :param session: Authenticated boto3 session.
+    :param tag_key: Tag key to search for.
+    :param tag_value: Tag value to match.  When ``None``, matches any
+        role that has *tag_key* regardless of value.
+    :param concurrency: Number of parallel ``list_role_tags`` calls in the
+        fallback path.
+    :return: List of dicts with ``arn``, ``tags``, and ``exists`` keys.
+    """
+    tag_filter = {"key": tag_key} if tag_value is None else {"key": tag_key, "value": tag_value}
+    return [role for role in list_iam_roles(session, concurrency) if _tag_filter_matches(role["tags"], tag_filter)]
 
 
-class ECSCapacityProvider:
-    """Minimal wrapper for ECS capacity providers."""
+def _check_exists(arn: str, region: str = None, session: boto3.Session = None) -> bool:
+    """
+    Check whether a resource still exists using its infrahouse-core class.
 
-    def __init__(self, name: str, region: str = None, session: boto3.Session = None):
-        self._name = name
-        self._region = region
-        self._session = session
-        self._client_instance = None
-
-    @property
-    def _client(self):
-        """Lazy-initialise the ECS client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ecs", region_name=self._region)
-        return self._client_instance
-
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the capacity provider is ACTIVE."""
-        try:
-            resp = self._client.describe_capacity_providers(capacityProviders=[self._name])
-            for cp in resp.get("capacityProviders", []):
-                if cp["status"] == "ACTIVE":
-                    return True
-            return False
-        except ClientError:
-            return False
+    Falls back to ``True`` (assume exists) when no class is available
+    for the given ARN.
 
-    def delete(self) -> None:
-        """Delete the capacity provider."""
-        self._client.delete_capacity_provider(capacityProvider=self._name)
+    :param arn: Amazon Resource Name.
+    :param region: AWS region override.
+    :param session: Authenticated boto3 session (forwarded to
+        :func:`resource_for_arn`).
+    :return: ``True`` if the resource exists or cannot be verified.
+    :raise ClientError: When the check is still throttled after the
+        client's retries.  Reporting the resource as existing would hide
+        the fact that it wasn't checked.
+    """
+    resource = resource_for_arn(arn, region=region, session=session)
+    if resource is None:
+        LOG.debug("No resource class for %s — assuming it exists", arn)
+        return True
+    try:
+        return resource.exists
+    except ClientError as exc:
+        if is_throttling_error(exc):
+            raise
+        LOG.debug("Error checking existence of %s: %s", arn, exc)
+        return True
+    except IndexError:
+        LOG.debug("Resource %s not found (empty API response) — treating as deleted", arn)
+        return False
 
 
-class ECSCluster:
-    """Minimal wrapper for ECS clusters."""
+class ExistenceVerifier:
+    """
+    Run :func:`_check_exists` for many ARNs on a bounded thread pool.
 
-    def __init__(self, cluster_name: str, region: str = None, session: boto3.Session = None):
-        self._cluster_name = cluster_name
-        self._region = region
-        self._session = session
-        self._client_instance = None
-
-    @property
-    def _client(self):
-        """Lazy-initialise the ECS client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ecs", region_name=self._region)
-        return self._client_instance
-
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the cluster is ACTIVE."""
-        try:
-            resp = self._client.describe_clusters(clusters=[self._cluster_name])
-            for cluster in resp.get("clusters", []):
-                if cluster["status"] == "ACTIVE":
-                    return True
-            return False
-        except ClientError:
-            return False
+    ARNs are submitted as they are discovered, so verification overlaps
+    with paging through the Tagging API.  The total number of in-flight
+    checks is bounded by *concurrency*; checks against services listed
+    in *service_limits* are additionally bounded per service.
 
-    def delete(self) -> None:
-        """Delete the cluster."""
-        self._client.delete_cluster(cluster=self._cluster_name)
+    One verifier can serve several accounts: pass the account's session
+    to :meth:`submit` or :meth:`submit_many`.  The per-service caps apply
+    to each session separately, because AWS throttles every account on
+    its own.
 
+    Use it as a context manager so the worker pool is shut down::
 
-class ECSService:
-    """Minimal wrapper for ECS services.
+        with ExistenceVerifier(session, concurrency=10) as verifier:
+            future = verifier.submit(arn)
+            ...
+            exists = future.result()
 
-    Deletion sets ``desiredCount`` to 0, then deletes the service with
-    ``force=True`` to remove it even when tasks are still running.
+    :param session: Authenticated boto3 session.
+    :param region: AWS region override (forwarded to :func:`_check_exists`).
+    :param concurrency: Maximum number of concurrent existence checks.
+    :param service_limits: Per-service concurrency caps.  Defaults to
+        :data:`SERVICE_CONCURRENCY_LIMITS`.
     """
 
-    def __init__(self, cluster: str, service_name: str, region: str = None, session: boto3.Session = None):
-        self._cluster = cluster
-        self._service_name = service_name
-        self._region = region
+    def __init__(
+        self,
+        session: boto3.Session,
+        region: str = None,
+        concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+        service_limits: Optional[Dict[str, int]] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be a positive integer, got {concurrency}")
         self._session = session
-        self._client_instance = None
-
-    @property
-    def _client(self):
-        """Lazy-initialise the ECS client."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ecs", region_name=self._region)
-        return self._client_instance
-
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the service is ACTIVE or DRAINING."""
-        try:
-            resp = self._client.describe_services(cluster=self._cluster, services=[self._service_name])
-            for svc in resp.get("services", []):
-                if svc["status"] in ("ACTIVE", "DRAINING"):
-                    return True
-            return False
-        except ClientError:
-            return False
-
-    def delete(self) -> None:
-        """Scale to zero and force-delete the service."""
-        try:
-            self._client.update_service(
-                cluster=self._cluster,
-                service=self._service_name,
-                desiredCount=0,
-            )
-        except ClientError:
-            pass  # Service may already be draining or inactive.
-        self._client.delete_service(
-            cluster=self._cluster,
-            service=self._service_name,
-            force=True,
-        )
+        self._region = region
+        self._concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ih-verify")
+        self._limits = SERVICE_CONCURRENCY_LIMITS if service_limits is None else service_limits
+        self._lock = Lock()
+        self._semaphores: Dict[Optional[boto3.Session], Dict[str, BoundedSemaphore]] = {}
 
+    def __enter__(self):
+        return self
 
-class ECSTaskDefinition:
-    """Minimal wrapper for ECS task definitions.
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(cancel=exc_type is not None)
 
-    Deletion is a two-step process: deregister (ACTIVE -> INACTIVE),
-    then ``delete_task_definitions`` to permanently remove.  No
-    dependency teardown needed, so a full infrahouse-core class would
-    be overkill.
-    """
-
-    def __init__(self, arn: str, region: str = None, session: boto3.Session = None):
-        self._arn = arn
-        self._region = region
-        self._session = session
-        self._client_instance = None
+    def submit(self, arn: str, region: str = None, session: boto3.Session = None) -> Future:
+        """
+        Schedule an existence check for *arn*.
+
+        :param arn: Amazon Resource Name.
+        :param region: AWS region override for this check.  Defaults to the
+            verifier's region.
+        :param session: Session of the account *arn* belongs to.  Defaults
+            to the verifier's session.
+        :return: A future that resolves to the :func:`_check_exists` result.
+        """
+        return self._executor.submit(self._check, arn, region or self._region, session or self._session)
 
-    @property
-    def _client(self):
-        """Lazy-initialise the ECS client (mirrors infrahouse-core pattern)."""
-        if self._client_instance is None:
-            self._client_instance = (self._session or boto3).client("ecs", region_name=self._region)
-        return self._client_instance
+    def submit_many(self, arns: List[str], region: str = None, session: boto3.Session = None) -> List[Future]:
+        """
+        Schedule existence checks for several ARNs, batching where possible.
+
+        ARNs are grouped with :func:`plan_existence_checks`; each batch runs
+        as a single task issuing one describe call.  The remaining ARNs are
+        checked individually as with :meth:`submit`.
+
+        :param arns: Amazon Resource Names.
+        :param region: AWS region override for these checks.  Defaults to
+            the verifier's region.
+        :param session: Session of the account *arns* belong to.  Defaults
+            to the verifier's session.
+        :return: One future per ARN, in the order of *arns*.
+        """
+        region = region or self._region
+        session = session or self._session
+        batches, singles = plan_existence_checks(arns, region=region)
+        futures: Dict[str, Future] = {arn: self.submit(arn, region=region, session=session) for arn in singles}
+        for batch in batches:
+            members = {arn: Future() for arn in batch.arns}
+            futures.update(members)
+            task = self._executor.submit(self._check_batch, batch, members, session)
+            task.add_done_callback(partial(self._settle_batch, members))
+        return [futures[arn] for arn in arns]
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """
+        Stop the worker pool.
 
-    @property
-    def exists(self) -> bool:
-        """Return ``True`` if the task definition is ACTIVE or INACTIVE.
+        :param cancel: Cancel checks that have not started yet.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def _limiter(self, session: boto3.Session, service: str):
+        """Return the concurrency cap of *service* in the account of *session*."""
+        with self._lock:
+            semaphores = self._semaphores.get(session)
+            if semaphores is None:
+                semaphores = {
+                    name: BoundedSemaphore(min(limit, self._concurrency))
+                    for name, limit in self._limits.items()
+                    if limit > 0
+                }
+                self._semaphores[session] = semaphores
+        return semaphores.get(service) or nullcontext()
 
-        Both ACTIVE and INACTIVE revisions still exist in AWS and appear
-        in the Resource Groups Tagging API.  We must report INACTIVE ones
-        as existing — otherwise they become invisible to the delete command.
+    def _check(self, arn: str, region: Optional[str], session: boto3.Session) -> bool:
+        parsed = parse_arn(arn)
+        with self._limiter(session, parsed["service"]) if parsed else nullcontext():
+            return _check_exists(arn, region=region, session=session)
 
-        Revisions in ``DELETE_IN_PROGRESS`` state are treated as gone
-        because the deletion has already been requested.
-        """
+    def _check_batch(self, batch: BatchCheck, members: Dict[str, Future], session: boto3.Session) -> None:
+        # Members cancelled by the caller are left alone.
+        members = {arn: future for arn, future in members.items() if future.set_running_or_notify_cancel()}
         try:
-            resp = self._client.describe_task_definition(taskDefinition=self._arn)
-            return resp["taskDefinition"]["status"] != "DELETE_IN_PROGRESS"
-        except ClientError:
-            return False
-
-    def delete(self) -> None:
-        """Deregister and then permanently delete the task definition.
+            with self._limiter(session, batch.service):
+                results = self._run_batch(batch, session)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for future in members.values():
+                future.set_exception(exc)
+            return
+        for arn, future in members.items():
+            future.set_result(results[arn])
 
-        AWS requires deregistration (ACTIVE -> INACTIVE) before a task
-        definition can be deleted.  Already-INACTIVE revisions skip
-        straight to deletion.
+    @staticmethod
+    def _settle_batch(members: Dict[str, Future], task: Future) -> None:
         """
-        try:
-            self._client.deregister_task_definition(taskDefinition=self._arn)
-        except ClientError:
-            pass  # Already INACTIVE — proceed to delete.
-        self._client.delete_task_definitions(taskDefinitions=[self._arn])
+        Resolve the member futures the batch task left pending.
 
+        That happens when the task is cancelled before it runs, e.g. by
+        :meth:`shutdown` with *cancel*, or when it fails unexpectedly.
+        Without this, the members' ``result()`` would block forever.
+        """
+        for future in members.values():
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            else:
+                future.set_exception(
+                    task.exception() or RuntimeError("Batched existence check finished without a result")
+                )
 
-# ---------------------------------------------------------------------------
-# ARN → infrahouse-core resource class mapping
-# ---------------------------------------------------------------------------
+    def _run_batch(self, batch: BatchCheck, session: boto3.Session) -> Dict[str, bool]:
+        """Run a batched check, falling back to per-ARN checks when the batched call fails."""
+        try:
+            return run_batch_check(batch, session=session)
+        except ClientError as exc:
+            if is_throttling_error(exc):
+                # Checking one by one would only make more calls to a throttled API.
+                raise
+            LOG.debug(
+                "Batched check of %d %s/%s failed (%s) — checking one by one",
+                len(batch.arns),
+                batch.service,
+                batch.resource_type,
+                exc,
+            )
+            return {arn: _check_exists(arn, region=batch.region, session=session) for arn in batch.arns}
 
 
-def resource_for_arn(
-    arn: str, region: str = None, role_arn: str = None, session: boto3.Session = None
-):  # pylint: disable=too-many-return-statements,too-many-branches
+def _resource_region(arn: str, queried_region: Optional[str]) -> Optional[str]:
     """
-    Instantiate an ``infrahouse-core`` resource class for the given ARN.
+    Return the region a discovered resource lives in.
 
-    :param arn: Amazon Resource Name.
-    :param region: AWS region override (uses the ARN region when ``None``).
-    :param role_arn: IAM role ARN for cross-account access.
-    :param session: Authenticated boto3 session.  When provided the resource
-        class uses this session for all API calls (e.g. inheriting
-        ``--aws-profile`` credentials).
-    :return: An infrahouse-core resource instance with ``exists`` / ``delete()``
-        interface, or ``None`` when no matching class is available.
+    Uses the ARN region when there is one.  Resources of global services
+    have no region (``None``); other region-less ARNs (S3 buckets) belong
+    to the region whose Tagging API endpoint returned them.
     """
     parsed = parse_arn(arn)
     if not parsed:
+        return queried_region
+    if parsed["region"]:
+        return parsed["region"]
+    if parsed["service"] in GLOBAL_SERVICES:
         return None
+    return queried_region
 
-    service = parsed["service"]
-    resource_type = parsed["resource_type"]
-    resource_id = parsed["resource_id"]
-    arn_region = region or parsed["region"] or None
-    account = parsed["account"]
-
-    # EC2 resources
-    if service == "ec2":
-        if resource_type == "instance":
-            return EC2Instance(instance_id=resource_id, region=arn_region, role_arn=role_arn, session=session)
-        if resource_type == "security-group":
-            return SecurityGroup(resource_id, region=arn_region, role_arn=role_arn, session=session)
-        if resource_type == "natgateway":
-            return NATGateway(resource_id, region=arn_region, role_arn=role_arn, session=session)
-        if resource_type == "network-interface":
-            return NetworkInterface(resource_id, region=arn_region, session=session)
-        if resource_type == "security-group-rule":
-            return SecurityGroupRule(resource_id, region=arn_region, session=session)
-        if resource_type == "volume":
-            return EBSVolume(resource_id, region=arn_region, session=session)
-        if resource_type == "key-pair":
-            return KeyPair(resource_id, region=arn_region, session=session)
-        if resource_type == "launch-template":
-            return LaunchTemplate(resource_id, region=arn_region, session=session)
-        return None
-
-    # IAM (global — no region)
-    if service == "iam":
-        if resource_type == "role":
-            return IAMRole(resource_id, role_arn=role_arn, session=session)
-        if resource_type == "policy":
-            return IAMPolicy(arn, role_arn=role_arn, session=session)
-        if resource_type == "instance-profile":
-            return IAMInstanceProfile(resource_id, role_arn=role_arn, session=session)
-        return None
-
-    # S3 (global — no region in ARN)
-    if service == "s3":
-        return S3Bucket(resource_id, role_arn=role_arn, session=session)
-
-    # ELB (ARN-identified)
-    if service == "elasticloadbalancing":
-        if resource_type == "loadbalancer":
-            return ELBLoadBalancer(arn, region=arn_region, role_arn=role_arn, session=session)
-        if resource_type == "targetgroup":
-            return ELBTargetGroup(arn, region=arn_region, role_arn=role_arn, session=session)
-        return None
-
-    # Lambda
-    if service == "lambda" and resource_type == "function":
-        return LambdaFunction(resource_id, region=arn_region, role_arn=role_arn, session=session)
-
-    # DynamoDB
-    if service == "dynamodb" and resource_type == "table":
-        return DynamoDBTable(resource_id, region=arn_region, role_arn=role_arn, session=session)
-
-    # Secrets Manager
-    if service == "secretsmanager" and resource_type == "secret":
-        return Secret(arn, region=arn_region, role_arn=role_arn, session=session)
-
-    # CloudWatch Logs
-    if service == "logs" and resource_type == "log-group":
-        return CloudWatchLogGroup(resource_id, region=arn_region, role_arn=role_arn, session=session)
-
-    # EventBridge
-    if service == "events" and resource_type == "rule":
-        return EventBridgeRule(resource_id, region=arn_region, role_arn=role_arn, session=session)
-
-    # SNS (ARN-identified)
-    if service == "sns":
-        return SNSTopic(arn, region=arn_region, role_arn=role_arn, session=session)
-
-    # SQS (URL-identified — derive from ARN)
-    if service == "sqs":
-        queue_url = f"https://sqs.{arn_region}.amazonaws.com/{account}/{resource_id}"
-        return SQSQueue(queue_url, region=arn_region, role_arn=role_arn, session=session)
-
-    # Auto Scaling
-    if service == "autoscaling" and resource_type == "autoScalingGroup":
-        return ASG(resource_id, region=arn_region, role_arn=role_arn, session=session)
-
-    # CloudFront (global — no region in ARN)
-    if service == "cloudfront":
-        if resource_type == "distribution":
-            return CloudFrontDistribution(resource_id, role_arn=role_arn, session=session)
-        if resource_type == "cache-policy":
-            return CloudFrontCachePolicy(resource_id, role_arn=role_arn, session=session)
-        if resource_type == "function":
-            return CloudFrontFunction(resource_id, role_arn=role_arn, session=session)
-        if resource_type == "response-headers-policy":
-            return CloudFrontResponseHeadersPolicy(resource_id, role_arn=role_arn, session=session)
-        return None
-
-    # ACM
-    if service == "acm" and resource_type == "certificate":
-        return ACMCertificate(arn, region=arn_region, role_arn=role_arn, session=session)
 
-    # Route 53 (global)
-    if service == "route53" and resource_type == "hostedzone":
-        return Zone(zone_id=resource_id, role_arn=role_arn, session=session)
-
-    # ECS
-    if service == "ecs":
-        if resource_type == "task-definition":
-            return ECSTaskDefinition(arn, region=arn_region, session=session)
-        if resource_type == "service":
-            # resource_id is "cluster-name/service-name"
-            parts = resource_id.split("/", 1)
-            if len(parts) == 2:
-                return ECSService(cluster=parts[0], service_name=parts[1], region=arn_region, session=session)
-        if resource_type == "cluster":
-            return ECSCluster(cluster_name=resource_id, region=arn_region, session=session)
-        if resource_type == "capacity-provider":
-            return ECSCapacityProvider(name=resource_id, region=arn_region, session=session)
-        return None
-
-    return None
-
-
-# ---------------------------------------------------------------------------
-# Discovery
-# ---------------------------------------------------------------------------
-
-
-def find_iam_roles_by_tag(session: boto3.Session, tag_key: str, tag_value: Optional[str] = None) -> List[Dict]:
+def _scan_tagging_api(  # pylint: disable=too-many-arguments,too-many-locals
+    session: boto3.Session,
+    region: Optional[str],
+    api_tag_filters: List[Dict],
+    residual: Optional[TagExpression],
+    tag_sets: TagSetTable,
+    verifier: Optional[ExistenceVerifier],
+    found: Queue,
+    stop: Event,
+) -> None:
     """
-    Find IAM roles matching a tag using the direct IAM API.
-
-    The Resource Groups Tagging API sometimes misses IAM roles, so this
-    function provides a fallback by enumerating all roles and checking
-    their tags.
-
-    :param session: Authenticated boto3 session.
-    :param tag_key: Tag key to search for.
-    :param tag_value: Tag value to match.  When ``None``, matches any
-        role that has *tag_key* regardless of value.
-    :return: List of dicts with ``arn``, ``tags``, and ``exists`` keys.
+    Page through the Tagging API in one region.
+
+    Resources whose tags don't match *residual*, the part of the tag
+    expression the API filter can't express, are dropped before their
+    existence is checked.  Tags are shared through *tag_sets*.  Puts
+    ``(record, future)`` pairs on *found* in discovery order as soon
+    as each page arrives, followed by ``None`` when the scan is over (also
+    on error).  *future* resolves to the existence check result, or is
+    ``None`` when *verifier* is ``None``.  Paging ends early when *stop*
+    is set.
     """
-    client = session.client("iam")
-    roles: List[Dict] = []
-
-    for page in client.get_paginator("list_roles").paginate():
-        for role in page.get("Roles", []):
-            try:
-                tag_response = client.list_role_tags(RoleName=role["RoleName"])
-                role_tags = {t["Key"]: t["Value"] for t in tag_response.get("Tags", [])}
-                if tag_value is None:
-                    match = tag_key in role_tags
-                else:
-                    match = role_tags.get(tag_key) == tag_value
-                if match:
-                    roles.append({"arn": role["Arn"], "tags": role_tags, "exists": True})
-            except ClientError:
-                continue
-    return roles
-
+    try:
+        LOG.info("Searching via Resource Groups Tagging API in %s ...", region or "the default region")
+        client = get_cached_client("resourcegroupstaggingapi", region=region, session=session)
+        seen_arns = set()
+        for page in client.get_paginator("get_resources").paginate(TagFilters=api_tag_filters):
+            if stop.is_set():
+                break
+            page_resources = []
+            for mapping in page.get("ResourceTagMappingList", []):
+                arn = mapping["ResourceARN"]
+                if arn in seen_arns:
+                    continue
+                tags = {tag["Key"]: tag["Value"] for tag in mapping.get("Tags", [])}
+                if residual is not None and not residual.matches(tags):
+                    continue
+                page_resources.append(ResourceRecord(arn, tag_sets.intern(tags), True, _resource_region(arn, region)))
+                seen_arns.add(arn)
+            if verifier is None:
+                futures = [None] * len(page_resources)
+            else:
+                futures = verifier.submit_many([r["arn"] for r in page_resources], region=region, session=session)
+            for pair in zip(page_resources, futures):
+                found.put(pair)
+    finally:
+        found.put(None)
+
+
+def _queue_explorer_results(
+    session: boto3.Session,
+    resources: List[Dict],
+    regions: List[str],
+    tag_sets: TagSetTable,
+    verifier: Optional[ExistenceVerifier],
+) -> Queue:
+    """
+    Queue Resource Explorer results like :func:`_scan_tagging_api` does.
 
-def _check_exists(arn: str, region: str = None, session: boto3.Session = None) -> bool:
+    Global resources come first, then each region in the order given.
+    Existence checks are submitted for all of them at once.
     """
-    Check whether a resource still exists using its infrahouse-core class.
+    order = {region: position for position, region in enumerate([None] + list(regions))}
+    resources = sorted(resources, key=lambda resource: order.get(resource["region"], len(order)))
+    if verifier is None:
+        futures = [None] * len(resources)
+    else:
+        futures = verifier.submit_many([r["arn"] for r in resources], session=session)
+    found: Queue = Queue()
+    for resource, future in zip(resources, futures):
+        found.put(
+            (ResourceRecord(resource["arn"], tag_sets.intern(resource["tags"]), True, resource["region"]), future)
+        )
+    found.put(None)
+    return found
 
-    Falls back to ``True`` (assume exists) when no class is available
-    for the given ARN.
 
-    :param arn: Amazon Resource Name.
-    :param region: AWS region override.
-    :param session: Authenticated boto3 session (forwarded to
-        :func:`resource_for_arn`).
-    :return: ``True`` if the resource exists or cannot be verified.
+def iter_resources_by_tags(  # pylint: disable=too-many-locals,too-many-arguments,too-many-branches
+    session: boto3.Session,
+    tag_filters: Union[List[Dict], TagExpression],
+    verify: bool = True,
+    concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+    iam_scan: bool = True,
+    regions: Optional[List[str]] = None,
+    backend: str = BACKEND_TAGGING,
+    verifier: Optional[ExistenceVerifier] = None,
+) -> Iterator[Dict]:
     """
-    resource = resource_for_arn(arn, region=region, session=session)
-    if resource is None:
-        LOG.debug("No resource class for %s — assuming it exists", arn)
-        return True
-    try:
-        return resource.exists
-    except ClientError as exc:
-        LOG.debug("Error checking existence of %s: %s", arn, exc)
-        return True
-    except IndexError:
-        LOG.debug("Resource %s not found (empty API response) — treating as deleted", arn)
-        return False
+    Yield resources matching one or more tag key/value pairs as they are found.
 
+    Streaming variant of :func:`find_resources_by_tags` with the same
+    parameters and the same records in the same order.  A record is
+    yielded as soon as its Tagging API page has arrived and its existence
+    check has finished, so callers can print or process results while
+    later pages are still being fetched.  Memory use doesn't grow with the
+    number of resources already yielded.
 
-def _tag_filter_matches(tags: Dict[str, str], tag_filter: Dict) -> bool:
-    """Check whether a resource's tags satisfy a single filter.
+    Closing the generator early stops paging in all regions.
 
-    :param tags: Resource tag dict (``{key: value, ...}``).
-    :param tag_filter: Filter dict with ``"key"`` and optional ``"value"``.
-    :return: ``True`` when the filter matches.
+    :param session: Authenticated boto3 session.
+    :param tag_filters: See :func:`find_resources_by_tags`.
+    :param verify: See :func:`find_resources_by_tags`.
+    :param concurrency: See :func:`find_resources_by_tags`.
+    :param iam_scan: See :func:`find_resources_by_tags`.
+    :param regions: See :func:`find_resources_by_tags`.
+    :param backend: See :func:`find_resources_by_tags`.
+    :param verifier: Existence verifier to share with other searches,
+        e.g. in other accounts.  By default the search starts its own with
+        *concurrency* workers.  The caller shuts a shared verifier down.
+    :return: Iterator of :class:`~infrahouse_toolkit.aws.resource_record.ResourceRecord`
+        mappings with ``arn``, ``tags``, ``exists`` and ``region`` keys.
     """
-    key = tag_filter["key"]
-    if "value" in tag_filter:
-        return tags.get(key) == tag_filter["value"]
-    return key in tags
+    regions = regions or [session.region_name]
+    seen_arns: set = set()
+    tag_sets = TagSetTable()
+    expression = tag_expression(tag_filters)
+    plan = plan_tag_query(expression)
+    LOG.debug("Tag filter %s: Tagging API filter %s, residual %s", expression, plan.tag_filters, plan.residual)
 
+    explorer_resources = None
+    if backend == BACKEND_EXPLORER:
+        try:
+            explorer_resources = search_resources(session, expression, regions=regions)
+        except IHResourceExplorerUnavailable as exc:
+            LOG.warning("%s, falling back to the Tagging API.", exc)
+
+    stop = Event()
+    with (
+        nullcontext(verifier) if verifier else ExistenceVerifier(session, concurrency=concurrency)
+    ) as existence_verifier, ThreadPoolExecutor(
+        max_workers=len(regions) + 1, thread_name_prefix="ih-discovery"
+    ) as executor:
+        try:
+            # IAM roles are often missed by the Tagging API — search directly.
+            iam_roles = None
+            if expression is not None and iam_scan:
+                LOG.info("Searching IAM roles directly for %s ...", expression)
+                iam_filter = iam_tag_filter(plan)
+                if iam_filter is None:
+                    iam_roles = executor.submit(list_iam_roles, session)
+                else:
+                    iam_roles = executor.submit(
+                        find_iam_roles_by_tag, session, iam_filter["key"], iam_filter.get("value")
+                    )
+
+            scans = []
+            for region in regions if explorer_resources is None else []:
+                found: Queue = Queue()
+                scan = executor.submit(
+                    _scan_tagging_api,
+                    session,
+                    region,
+                    plan.tag_filters,
+                    plan.residual,
+                    tag_sets,
+                    existence_verifier if verify else None,
+                    found,
+                    stop,
+                )
+                scans.append((scan, found))
+
+            if iam_roles is not None:
+                for role in iam_roles.result():
+                    if expression.matches(role["tags"]):
+                        seen_arns.add(role["arn"])
+                        yield ResourceRecord(role["arn"], tag_sets.intern(role["tags"]), role["exists"], None)
+
+            if explorer_resources is not None:
+                scans.append(
+                    (
+                        None,
+                        _queue_explorer_results(
+                            session, explorer_resources, regions, tag_sets, existence_verifier if verify else None
+                        ),
+                    )
+                )
 
-def find_resources_by_tags(  # pylint: disable=too-many-locals
+            for scan, found in scans:
+                for resource, future in iter(found.get, None):
+                    if resource["arn"] in seen_arns:
+                        continue
+                    if future is not None:
+                        resource["exists"] = future.result()
+                    seen_arns.add(resource["arn"])
+                    yield resource
+                # Re-raise errors from the scan itself.
+                if scan is not None:
+                    scan.result()
+        finally:
+            stop.set()
+
+
+def find_resources_by_tags(  # pylint: disable=too-many-arguments
     session: boto3.Session,
-    tag_filters: List[Dict],
+    tag_filters: Union[List[Dict], TagExpression],
     verify: bool = True,
+    concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+    iam_scan: bool = True,
+    regions: Optional[List[str]] = None,
+    backend: str = BACKEND_TAGGING,
 ) -> List[Dict]:
     """
     Find all resources matching one or more tag key/value pairs.
@@ -716,52 +775,52 @@ def find_resources_by_tags(  # pylint: disable=too-many-locals
     When ``"value"`` is omitted the filter matches any resource that
     carries the tag key, regardless of value.
 
+    *tag_filters* may also be a :mod:`~infrahouse_toolkit.aws.tag_query`
+    expression with OR, NOT, value lists and prefixes.  The part of it the
+    Tagging API can filter by is sent with every scan
+    (:func:`~infrahouse_toolkit.aws.tag_query.plan_tag_query`); the rest
+    is evaluated on the returned tags, so a query still costs one scan
+    per region.
+
+    Use :func:`iter_resources_by_tags` to process results while the
+    search is still running.
+
     :param session: Authenticated boto3 session.
     :param tag_filters: List of ``{"key": "<key>"}`` or
-        ``{"key": "<key>", "value": "<value>"}`` dicts.
+        ``{"key": "<key>", "value": "<value>"}`` dicts, or a tag expression.
     :param verify: When ``True``, verify each resource still exists via
         the infrahouse-core ``resource.exists`` property.
-    :return: List of dicts with ``arn``, ``tags``, and ``exists`` keys.
+    :param concurrency: Maximum number of existence checks running in
+        parallel.  Checks start while the Tagging API is still being paged,
+        and resources of the same type on a page share one describe call.
+        See :class:`ExistenceVerifier` and :func:`plan_existence_checks`.
+    :param iam_scan: When ``False``, skip the direct IAM role scan
+        (:func:`find_iam_roles_by_tag`) and rely on the Tagging API alone.
+    :param regions: Regions to search.  The Tagging API is queried in all
+        of them concurrently; the IAM scan runs once.  Defaults to the
+        session region.
+    :param backend: :data:`BACKEND_TAGGING`, or :data:`BACKEND_EXPLORER`
+        to search all *regions* and global resources with one Resource
+        Explorer query (see :mod:`~infrahouse_toolkit.aws.resource_explorer`).
+        The explorer backend falls back to the Tagging API when the account
+        has no aggregator index.
+    :return: List of :class:`~infrahouse_toolkit.aws.resource_record.ResourceRecord`
+        mappings with ``arn``, ``tags``, ``exists`` and ``region`` keys, in
+        discovery order: IAM roles first, then each region in the order
+        given.  ``region`` is ``None`` for global resources.  Resources with
+        equal tags share one read-only tag mapping.
     """
-    client = session.client("resourcegroupstaggingapi")
-    resources: List[Dict] = []
-    seen_arns: set = set()
-    region = session.region_name
-
-    # IAM roles are often missed by the Tagging API — search directly.
-    if tag_filters:
-        first = tag_filters[0]
-        LOG.info("Searching IAM roles directly for %s=%s ...", first["key"], first.get("value", "*"))
-        iam_roles = find_iam_roles_by_tag(session, first["key"], first.get("value"))
-        for role in iam_roles:
-            if all(_tag_filter_matches(role["tags"], tf) for tf in tag_filters):
-                resources.append(role)
-                seen_arns.add(role["arn"])
-
-    api_tag_filters = []
-    for tag_filter in tag_filters:
-        api_filter = {"Key": tag_filter["key"]}
-        if "value" in tag_filter:
-            api_filter["Values"] = [tag_filter["value"]]
-        api_tag_filters.append(api_filter)
-
-    LOG.info("Searching via Resource Groups Tagging API ...")
-    for page in client.get_paginator("get_resources").paginate(TagFilters=api_tag_filters):
-        for mapping in page.get("ResourceTagMappingList", []):
-            arn = mapping["ResourceARN"]
-            if arn in seen_arns:
-                continue
-            exists = _check_exists(arn, region=region, session=session) if verify else True
-            resources.append(
-                {
-                    "arn": arn,
-                    "tags": {tag["Key"]: tag["Value"] for tag in mapping.get("Tags", [])},
-                    "exists": exists,
-                }
-            )
-            seen_arns.add(arn)
-
-    return resources
+    return list(
+        iter_resources_by_tags(
+            session,
+            tag_filters,
+            verify=verify,
+            concurrency=concurrency,
+            iam_scan=iam_scan,
+            regions=regions,
+            backend=backend,
+        )
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -786,7 +845,13 @@ def _parse_service_and_type(arn: str) -> str:
     return service
 
 
-def format_resources_table(resources: List[Dict], show_deleted: bool = False, show_tags: bool = True) -> str:
+def format_resources_table(
+    resources: List[Dict],
+    show_deleted: bool = False,
+    show_tags: bool = True,
+    show_region: bool = False,
+    show_account: bool = False,
+) -> str:
     """
     Format discovered resources as a ``tabulate`` grid table.
 
@@ -796,6 +861,10 @@ def format_resources_table(resources: List[Dict], show_deleted: bool = False, sh
     :param resources: List of resource dicts from :func:`find_resources_by_tags`.
     :param show_deleted: Include stale/deleted resources in the output.
     :param show_tags: Include a Tags column in the table.
+    :param show_region: Include a Region column in the table.  Useful when
+        resources come from several regions.
+    :param show_account: Include an Account column, for results of
+        :class:`~infrahouse_toolkit.aws.cross_account.CrossAccountSearch`.
     :return: Formatted string ready for printing.
     """
     selected = resources if show_deleted else [r for r in resources if r["exists"]]
@@ -803,12 +872,16 @@ def format_resources_table(resources: List[Dict], show_deleted: bool = False, sh
         return "No resources found."
 
     rows: List[list] = []
-    headers = ["Service/Type", "ARN"]
+    headers = ["Account"] if show_account else []
+    headers += ["Region"] if show_region else []
+    headers += ["Service/Type", "ARN"]
     if show_tags:
         headers.append("Tags")
 
-    for resource in sorted(selected, key=lambda r: r["arn"]):
-        row = [
+    for resource in sorted(selected, key=lambda r: (r.get("account", ""), r["arn"])):
+        row = [resource["account"]] if show_account else []
+        row += [resource.get("region") or "global"] if show_region else []
+        row += [
             _parse_service_and_type(resource["arn"]),
             resource["arn"],
         ]
@@ -822,9 +895,16 @@ def format_resources_table(resources: List[Dict], show_deleted: bool = False, sh
         rows,
         headers=headers,
         tablefmt="grid" if show_tags else "outline",
+        # Account IDs may start with zeros.
+        disable_numparse=True,
     )
 
 
+def _json_ready(resource: Mapping) -> Dict:
+    """Return a resource record or dict as a plain dict :func:`json.dumps` accepts."""
+    return dict(resource, tags=dict(resource["tags"]))
+
+
 def format_resources_json(resources: List[Dict], show_deleted: bool = False) -> str:
     """
     Format discovered resources as JSON.
@@ -833,9 +913,61 @@ def format_resources_json(resources: List[Dict], show_deleted: bool = False) ->
     :param show_deleted: Include stale/deleted resources in the output.
     :return: JSON string.
     """
-    if show_deleted:
-        return json.dumps(resources, indent=2)
-    return json.dumps([r for r in resources if r["exists"]], indent=2)
+    return json.dumps([_json_ready(r) for r in resources if show_deleted or r["exists"]], indent=2)
+
+
+def iter_resources_ndjson(resources: Iterable[Dict], show_deleted: bool = False) -> Iterator[str]:
+    """
+    Format discovered resources as newline-delimited JSON, one line per resource.
+
+    Lines are produced as *resources* are consumed, so passing
+    :func:`iter_resources_by_tags` streams output while discovery runs.
+
+    :param resources: Resource dicts from :func:`iter_resources_by_tags`.
+    :param show_deleted: Include stale/deleted resources in the output.
+    :return: Iterator of compact JSON strings without a trailing newline.
+    """
+    for resource in resources:
+        if show_deleted or resource["exists"]:
+            yield json.dumps(_json_ready(resource), separators=(",", ":"))
+
+
+def iter_resources_csv(
+    resources: Iterable[Dict], show_deleted: bool = False, show_account: bool = False
+) -> Iterator[str]:
+    """
+    Format discovered resources as CSV rows, starting with a header row.
+
+    Tags are a compact JSON object in a single column.  Rows are produced
+    as *resources* are consumed, like :func:`iter_resources_ndjson`.
+
+    :param resources: Resource dicts from :func:`iter_resources_by_tags`.
+    :param show_deleted: Include stale/deleted resources in the output.
+    :param show_account: Start every row with an ``account`` column.
+    :return: Iterator of CSV lines without a trailing newline.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="")
+
+    def _row(values: list) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield _row((["account"] if show_account else []) + ["region", "service_type", "arn", "exists", "tags"])
+    for resource in resources:
+        if show_deleted or resource["exists"]:
+            yield _row(
+                ([resource["account"]] if show_account else [])
+                + [
+                    resource.get("region") or "",
+                    _parse_service_and_type(resource["arn"]),
+                    resource["arn"],
+                    resource["exists"],
+                    json.dumps(dict(sorted(resource["tags"].items())), separators=(",", ":")),
+                ]
+            )
 
 
 def format_resources_arns(resources: List[Dict], show_deleted: bool = False) -> str:
@@ -0,0 +1,175 @@
+"""
+Resource discovery with AWS Resource Explorer.
+
+The Resource Groups Tagging API has to be paged in every region.  When the
+account has a Resource Explorer aggregator index, one ``search`` call in
+the aggregator region finds tagged resources in all regions, IAM roles
+included.  :func:`search_resources` is the ``explorer`` backend of
+:func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`;
+it raises :class:`~infrahouse_toolkit.aws.exceptions.IHResourceExplorerUnavailable`
+when there is no aggregator index or the search can't return every match,
+and the caller falls back to the Tagging API.
+
+Resource Explorer ORs query filters with the same prefix, so only the
+most selective tag filter of the
+:func:`~infrahouse_toolkit.aws.tag_query.plan_tag_query` plan goes into
+the query, its values OR'd; the whole tag expression is then evaluated on
+the returned tags.
+"""
+
+from logging import getLogger
+from typing import Dict, List, Optional, Union
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from infrahouse_toolkit.aws.client_registry import get_cached_client
+from infrahouse_toolkit.aws.exceptions import IHResourceExplorerUnavailable
+from infrahouse_toolkit.aws.tag_query import (
+    TagExpression,
+    plan_tag_query,
+    tag_expression,
+)
+
+LOG = getLogger(__name__)
+
+SERVICE_NAME = "resource-explorer-2"
+
+# Region name Resource Explorer reports for resources of global services.
+GLOBAL_REGION = "global"
+
+
+def list_indexes(session: boto3.Session) -> Dict[str, str]:
+    """
+    Return the Resource Explorer indexes of the account.
+
+    :param session: Authenticated boto3 session.
+    :return: Dictionary from region to index type, ``LOCAL`` or ``AGGREGATOR``.
+    """
+    client = get_cached_client(SERVICE_NAME, session=session)
+    return {
+        index["Region"]: index["Type"]
+        for page in client.get_paginator("list_indexes").paginate()
+        for index in page.get("Indexes", [])
+    }
+
+
+def build_query_string(
+    tag_filter: Optional[Dict], regions: Optional[List[str]] = None, with_global: bool = True
+) -> str:
+    """
+    Build a Resource Explorer query for one tag filter and a set of regions.
+
+    :param tag_filter: ``{"key": "<key>"}``, ``{"key": "<key>", "value": "<value>"}``
+        or ``{"key": "<key>", "values": [...]}`` for any of several values,
+        or ``None`` for all resources.
+    :param regions: Regions to search.  ``None`` searches all regions.
+    :param with_global: Add global resources (IAM, CloudFront, ...) to *regions*.
+    :return: Query string for ``search``.
+    """
+    terms = []
+    if tag_filter is not None:
+        if "value" in tag_filter:
+            terms.append(f"tag:{tag_filter['key']}={tag_filter['value']}")
+        elif "values" in tag_filter:
+            terms.extend(f"tag:{tag_filter['key']}={value}" for value in tag_filter["values"])
+        else:
+            terms.append(f"tag.key:{tag_filter['key']}")
+    if regions is not None:
+        terms.extend(f"region:{region}" for region in list(regions) + ([GLOBAL_REGION] if with_global else []))
+    return " ".join(_quote(term) for term in terms) or "*"
+
+
+def search_resources(
+    session: boto3.Session, tag_filters: Union[List[Dict], TagExpression], regions: Optional[List[str]] = None
+) -> List[Dict]:
+    """
+    Find resources matching tag filters with Resource Explorer.
+
+    The query runs once over all *regions*.  When it matches more resources
+    than Resource Explorer returns for one query (1000), it is split into
+    one query per region.
+
+    :param session: Authenticated boto3 session.
+    :param tag_filters: List of ``{"key": "<key>"}`` or
+        ``{"key": "<key>", "value": "<value>"}`` dicts, combined with AND
+        logic, or a :mod:`~infrahouse_toolkit.aws.tag_query` expression.
+    :param regions: Regions to search.  Global resources are always
+        included.  ``None`` searches all regions.
+    :return: List of dicts with ``arn``, ``tags`` and ``region`` keys;
+        ``region`` is ``None`` for global resources.
+    :raise IHResourceExplorerUnavailable: When the account has no
+        aggregator index, the caller can't use it, or a region has more
+        matches than one query returns.
+    """
+    expression = tag_expression(tag_filters)
+    plan = plan_tag_query(expression)
+    query_filter = None
+    if plan.tag_filters:
+        query_filter = {"key": plan.tag_filters[0]["Key"]}
+        if "Values" in plan.tag_filters[0]:
+            query_filter["values"] = plan.tag_filters[0]["Values"]
+    try:
+        found = _search_all(session, query_filter, regions)
+    except (ClientError, BotoCoreError) as exc:
+        raise IHResourceExplorerUnavailable(f"Resource Explorer search failed: {exc}") from exc
+
+    resources = []
+    seen_arns = set()
+    for item in found:
+        tags = _tags(item)
+        if item["Arn"] in seen_arns or (expression is not None and not expression.matches(tags)):
+            continue
+        seen_arns.add(item["Arn"])
+        region = item.get("Region")
+        resources.append(
+            {"arn": item["Arn"], "tags": tags, "region": None if region in (None, "", GLOBAL_REGION) else region}
+        )
+    return resources
+
+
+def _search_all(session: boto3.Session, tag_filter: Optional[Dict], regions: Optional[List[str]]) -> List[Dict]:
+    """Search in the aggregator region, one query per region if a single one is incomplete."""
+    indexes = list_indexes(session)
+    aggregator_regions = [region for region, index_type in indexes.items() if index_type == "AGGREGATOR"]
+    if not aggregator_regions:
+        raise IHResourceExplorerUnavailable("No Resource Explorer aggregator index in the account")
+    client = get_cached_client(SERVICE_NAME, region=aggregator_regions[0], session=session)
+
+    found, complete = _search(client, build_query_string(tag_filter, regions))
+    if complete:
+        return found
+
+    LOG.debug("Resource Explorer returned a partial result, searching region by region")
+    found = []
+    for region in list(regions or sorted(indexes)) + [GLOBAL_REGION]:
+        region_found, complete = _search(client, build_query_string(tag_filter, [region], with_global=False))
+        if not complete:
+            raise IHResourceExplorerUnavailable(f"Too many matches in {region} for one Resource Explorer query")
+        found.extend(region_found)
+    return found
+
+
+def _search(client, query: str) -> tuple:
+    """Run one paginated search; return the resources and whether the result is complete."""
+    LOG.debug("Resource Explorer query: %s", query)
+    resources = []
+    complete = True
+    for page in client.get_paginator("search").paginate(QueryString=query):
+        resources.extend(page.get("Resources", []))
+        complete = complete and page.get("Count", {}).get("Complete", True)
+    return resources, complete
+
+
+def _tags(item: Dict) -> Dict[str, str]:
+    for prop in item.get("Properties", []):
+        if prop.get("Name") == "tags":
+            return {tag["Key"]: tag.get("Value", "") for tag in prop.get("Data") or []}
+    return {}
+
+
+def _quote(term: str) -> str:
+    """Quote a query term with whitespace, e.g. a tag value with spaces."""
+    if any(char.isspace() for char in term):
+        return '"' + term.replace('"', '\\"') + '"'
+    return term
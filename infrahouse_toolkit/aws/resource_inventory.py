@@ -0,0 +1,228 @@
+"""
+Local tag inventory for repeated resource queries.
+
+:func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`
+pages the Tagging API and scans IAM on every call.  :class:`TagInventory`
+instead scans each region once without tag filters, stores an inverted
+tag index (:class:`TagIndex`) per account and region on disk, and answers
+later queries from it until the entry expires.
+"""
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from os import path as osp
+from typing import Dict, List, Optional, Set, Union
+
+import boto3
+from diskcache import Cache
+
+from infrahouse_toolkit.aws.client_registry import get_cached_client
+from infrahouse_toolkit.aws.resource_discovery import (
+    DEFAULT_VERIFY_CONCURRENCY,
+    ExistenceVerifier,
+    find_resources_by_tags,
+    list_iam_roles,
+)
+from infrahouse_toolkit.aws.resource_record import ResourceRecord, TagSetTable
+from infrahouse_toolkit.aws.tag_query import (
+    TagExpression,
+    plan_tag_query,
+    tag_expression,
+)
+from infrahouse_toolkit.fs import ensure_permissions
+
+LOG = getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY = "~/.infrahouse-toolkit"
+DEFAULT_INVENTORY_TTL = 3600
+
+# Cache key scope of IAM roles, which don't belong to a region.
+GLOBAL_SCOPE = "global"
+
+
+class TagIndex:
+    """
+    Inverted index from tags to the resources that carry them.
+
+    :param resources: Resource dicts with ``arn``, ``tags`` and ``region``
+        keys, in discovery order.
+    """
+
+    def __init__(self, resources: List[Dict]):
+        self.resources = resources
+        self._by_tag: Dict[tuple, Set[int]] = defaultdict(set)
+        self._by_key: Dict[str, Set[int]] = defaultdict(set)
+        for position, resource in enumerate(resources):
+            for key, value in resource["tags"].items():
+                self._by_tag[(key, value)].add(position)
+                self._by_key[key].add(position)
+
+    def __len__(self):
+        return len(self.resources)
+
+    def match(self, tag_filters: Union[List[Dict], TagExpression]) -> List[Dict]:
+        """
+        Return resources matching the tag filters.
+
+        The index answers the part of the query a Tagging API filter could
+        express (see :func:`~infrahouse_toolkit.aws.tag_query.plan_tag_query`);
+        the rest is evaluated on the tags of the candidates.
+
+        :param tag_filters: List of ``{"key": "<key>"}`` or
+            ``{"key": "<key>", "value": "<value>"}`` dicts, as built by
+            ``build_tag_filters`` and combined with AND logic, or a tag expression.
+        :return: Matching resource dicts in discovery order.
+        """
+        plan = plan_tag_query(tag_expression(tag_filters))
+        if plan.tag_filters:
+            candidates = [
+                (
+                    set().union(*(self._by_tag.get((tf["Key"], value), set()) for value in tf["Values"]))
+                    if "Values" in tf
+                    else self._by_key.get(tf["Key"], set())
+                )
+                for tf in plan.tag_filters
+            ]
+            candidates.sort(key=len)
+            positions = sorted(set(candidates[0]).intersection(*candidates[1:]))
+        else:
+            positions = range(len(self.resources))
+        return [
+            self.resources[position]
+            for position in positions
+            if plan.residual is None or plan.residual.matches(self.resources[position]["tags"])
+        ]
+
+
+class TagInventory:
+    """
+    Answer tag queries from a local, per-region :class:`TagIndex` cache.
+
+    Each region is scanned once without tag filters and stored in a
+    ``diskcache`` directory under a key made of the account ID and the
+    region.  IAM roles are stored once per account.  Entries expire after
+    *ttl* seconds.
+
+    :param session: Authenticated boto3 session.
+    :param cache_directory: Directory of the ``diskcache`` store.  It is
+        shared with the SSO credentials cache and kept at ``0o700``.
+    :param ttl: Lifetime of a stored index in seconds.
+    :param refresh: Rebuild every index that is used instead of reading
+        it from the cache.
+    """
+
+    def __init__(
+        self,
+        session: boto3.Session,
+        cache_directory: str = DEFAULT_CACHE_DIRECTORY,
+        ttl: int = DEFAULT_INVENTORY_TTL,
+        refresh: bool = False,
+    ):
+        self._session = session
+        self._cache_directory = osp.expanduser(cache_directory)
+        self._ttl = ttl
+        self._refresh = refresh
+        self._account_id = None
+
+    @property
+    def account_id(self) -> str:
+        """AWS account ID of the session."""
+        if self._account_id is None:
+            self._account_id = get_cached_client("sts", session=self._session).get_caller_identity()["Account"]
+        return self._account_id
+
+    def find(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        tag_filters: Union[List[Dict], TagExpression],
+        verify: bool = True,
+        concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+        iam_scan: bool = True,
+        regions: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find resources matching the tag filters.
+
+        Takes the same arguments and returns the same records in the same
+        order as :func:`~infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`.
+        Tag matching is done locally; only indexes that are missing,
+        expired or to be refreshed cost API calls.  With *verify* the
+        matches are still checked for existence, because the index may be
+        up to *ttl* seconds old.
+
+        :return: List of dicts with ``arn``, ``tags``, ``exists`` and ``region`` keys.
+        """
+        regions = regions or [self._session.region_name]
+        scopes = ([GLOBAL_SCOPE] if iam_scan else []) + list(regions)
+        indexes = self.indexes(scopes, concurrency=concurrency)
+
+        resources: List[ResourceRecord] = []
+        seen_arns: set = set()
+        tag_sets = TagSetTable()
+        for scope in scopes:
+            for resource in indexes[scope].match(tag_filters):
+                if resource["arn"] not in seen_arns:
+                    seen_arns.add(resource["arn"])
+                    resources.append(
+                        ResourceRecord(resource["arn"], tag_sets.intern(resource["tags"]), True, resource["region"])
+                    )
+
+        if verify and resources:
+            by_region = defaultdict(list)
+            for resource in resources:
+                by_region[resource["region"]].append(resource)
+            with ExistenceVerifier(self._session, concurrency=concurrency) as verifier:
+                futures = {
+                    region: verifier.submit_many([r["arn"] for r in group], region=region)
+                    for region, group in by_region.items()
+                }
+                for region, group in by_region.items():
+                    for resource, future in zip(group, futures[region]):
+                        resource["exists"] = future.result()
+        return resources
+
+    def indexes(self, scopes: List[str], concurrency: int = DEFAULT_VERIFY_CONCURRENCY) -> Dict[str, TagIndex]:
+        """
+        Return the tag index of every scope, building missing ones concurrently.
+
+        :param scopes: Region names and/or :data:`GLOBAL_SCOPE` for IAM roles.
+        :param concurrency: Passed to :func:`list_iam_roles` for the IAM scan.
+        :return: Dictionary from scope to :class:`TagIndex`.
+        """
+        with Cache(directory=self._cache_directory) as cache:
+            found = {}
+            if not self._refresh:
+                for scope in scopes:
+                    index = cache.get(self._cache_key(scope))
+                    if index is not None:
+                        LOG.debug("Using tag inventory of %s with %d resource(s)", scope, len(index))
+                        found[scope] = index
+
+            missing = [scope for scope in scopes if scope not in found]
+            if missing:
+                with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="ih-inventory") as executor:
+                    built = executor.map(lambda scope: self._build(scope, concurrency), missing)
+                    for scope, index in zip(missing, built):
+                        cache.set(self._cache_key(scope), index, expire=self._ttl)
+                        found[scope] = index
+
+        ensure_permissions(self._cache_directory, 0o700)
+        return found
+
+    def _build(self, scope: str, concurrency: int) -> TagIndex:
+        LOG.info("Building tag inventory of %s ...", scope)
+        if scope == GLOBAL_SCOPE:
+            resources = [dict(role, region=None) for role in list_iam_roles(self._session, concurrency)]
+        else:
+            resources = find_resources_by_tags(self._session, [], verify=False, iam_scan=False, regions=[scope])
+        # Discovery returns ResourceRecord objects with shared read-only tags;
+        # the index is pickled into the cache, so it keeps plain dicts.
+        return TagIndex(
+            [
+                {"arn": resource["arn"], "tags": dict(resource["tags"]), "region": resource["region"]}
+                for resource in resources
+            ]
+        )
+
+    def _cache_key(self, scope: str) -> str:
+        return f"ih-aws-tag-inventory-{self.account_id}-{scope}"
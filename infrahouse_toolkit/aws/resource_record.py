@@ -0,0 +1,121 @@
+"""
+Compact records of discovered resources.
+
+A discovery result used to be a plain dict per resource with its own tag
+dict.  Resources created by the same Terraform module carry the same
+tags, so most of the memory of a large result went to identical tag dicts
+and copies of the same key and value strings.
+
+:class:`ResourceRecord` keeps the fields of a resource in ``__slots__``
+and points to a tag dict shared by every resource with the same tags
+through a :class:`TagSetTable`.  It is a
+:class:`~collections.abc.MutableMapping` with the keys of the old dicts,
+so ``record["arn"]``, ``record.get("region")``, ``dict(record)`` and
+comparisons with dicts keep working.  Shared tags are read-only; use
+:meth:`ResourceRecord.to_dict` for a plain, JSON-serializable copy.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional
+
+RECORD_KEYS = ("arn", "tags", "exists", "region")
+
+
+class TagSetTable:
+    """
+    Table of shared, read-only tag dicts.
+
+    Tag keys and values are interned, and equal tag sets are stored once
+    however many resources carry them.  Use one table per search; it is
+    safe to share between threads.
+    """
+
+    def __init__(self):
+        self._tag_sets: Dict[frozenset, Mapping[str, str]] = {}
+
+    def __len__(self):
+        return len(self._tag_sets)
+
+    def intern(self, tags: Mapping[str, str]) -> Mapping[str, str]:
+        """
+        Return the shared tag dict equal to *tags*.
+
+        :param tags: Tags of a resource.
+        :return: Read-only mapping equal to *tags*.
+        """
+        shared = self._tag_sets.get(frozenset(tags.items()))
+        if shared is None:
+            interned = {sys.intern(key): sys.intern(value) for key, value in tags.items()}
+            # dict.setdefault() is atomic, so concurrent scans agree on one copy.
+            shared = self._tag_sets.setdefault(frozenset(interned.items()), MappingProxyType(interned))
+        return shared
+
+
+class ResourceRecord(MutableMapping):
+    """
+    A discovered resource with the interface of a ``dict``.
+
+    Keys are ``arn``, ``tags``, ``exists`` and ``region``, preceded by
+    ``account`` for results of
+    :class:`~infrahouse_toolkit.aws.cross_account.CrossAccountSearch`.
+    Existing keys can be assigned; other keys can't be added.
+
+    :param arn: Amazon Resource Name.
+    :param tags: Tags, usually shared through :meth:`TagSetTable.intern`.
+    :param exists: Whether the resource still exists.
+    :param region: Region of the resource, ``None`` for global resources.
+    :param account: Account the resource was found in, if the search
+        covered several accounts.
+    """
+
+    __slots__ = ("arn", "tags", "exists", "region", "account")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        arn: str,
+        tags: Mapping[str, str],
+        exists: bool = True,
+        region: Optional[str] = None,
+        account: Optional[str] = None,
+    ):
+        self.arn = arn
+        self.tags = tags
+        self.exists = exists
+        self.region = region
+        self.account = account
+
+    def __getitem__(self, key: str):
+        if key in RECORD_KEYS or (key == "account" and self.account is not None):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__slots__:
+            raise KeyError(f"{type(self).__name__} has no {key!r} field")
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key != "account" or self.account is None:
+            raise KeyError(key)
+        self.account = None
+
+    def __iter__(self) -> Iterator[str]:
+        if self.account is not None:
+            yield "account"
+        yield from RECORD_KEYS
+
+    def __len__(self) -> int:
+        return len(RECORD_KEYS) + (self.account is not None)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{key}={self[key]!r}' for key in self)})"
+
+    def to_dict(self) -> Dict:
+        """
+        Return the record as a plain dict with its own tag dict.
+
+        :return: Dict with the keys of the record, ready for :func:`json.dumps`.
+        """
+        return {key: dict(self.tags) if key == "tags" else self[key] for key in self}
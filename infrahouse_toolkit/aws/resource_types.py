@@ -0,0 +1,126 @@
+"""
+Registry of resource classes by ARN service and resource type.
+
+:func:`~infrahouse_toolkit.aws.resource_discovery.resource_for_arn` looks
+the ``(service, resource_type)`` pair of a parsed ARN up in
+:data:`RESOURCE_TYPES` and calls the registered factory, so dispatch costs
+one or two dictionary lookups however many types are registered.
+
+Other packages can add resource types through the
+``infrahouse_toolkit.resource_types`` entry point group.  Each entry point
+names a callable that receives the registry::
+
+    # setup.py of a plugin
+    entry_points={
+        "infrahouse_toolkit.resource_types": ["my-plugin = my_plugin:register"],
+    }
+
+    # my_plugin.py
+    def register(registry):
+        registry.register("ec2", "vpc", lambda arn, region, role_arn, session: Vpc(arn["resource_id"], region=region))
+
+Entry points are loaded on the first lookup, after the built-in types, so
+a plugin may also replace a built-in factory.
+"""
+
+from importlib.metadata import entry_points
+from logging import getLogger
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+import boto3
+
+LOG = getLogger(__name__)
+
+ENTRY_POINT_GROUP = "infrahouse_toolkit.resource_types"
+
+# Resource type of factories that handle every ARN of a service, e.g. SNS
+# topics, whose ARNs have no resource type.
+ANY_RESOURCE_TYPE = "*"
+
+ResourceFactory = Callable[[Dict[str, Optional[str]], Optional[str], Optional[str], Optional[boto3.Session]], object]
+"""
+Callable that builds a resource from ``(parsed_arn, region, role_arn, session)``.
+
+``parsed_arn`` is the dictionary :func:`~infrahouse_toolkit.aws.arn.parse_arn`
+returns plus an ``arn`` key with the ARN itself.  ``region`` is the region
+override or the region of the ARN.  The factory may return ``None`` when
+it can't handle the ARN.
+"""
+
+
+class ResourceTypeRegistry:
+    """
+    Mapping from ``(service, resource_type)`` to resource factories.
+
+    :param entry_point_group: Entry point group that plugins register
+        their resource types in.
+    """
+
+    def __init__(self, entry_point_group: str = ENTRY_POINT_GROUP):
+        self._entry_point_group = entry_point_group
+        self._factories: Dict[Tuple[str, Optional[str]], ResourceFactory] = {}
+        self._lock = Lock()
+        self._plugins_loaded = False
+
+    def __len__(self):
+        return len(self._factories)
+
+    def register(self, service: str, resource_type: Optional[str], factory: ResourceFactory) -> None:
+        """
+        Register a factory for ARNs of the given service and resource type.
+
+        :param service: ARN service, e.g. ``ec2``.
+        :param resource_type: ARN resource type, e.g. ``instance``, or
+            :data:`ANY_RESOURCE_TYPE` for all ARNs of the service.
+        :param factory: :data:`ResourceFactory`.
+        """
+        if (service, resource_type) in self._factories:
+            LOG.debug("Replacing resource factory of %s/%s", service, resource_type)
+        self._factories[(service, resource_type)] = factory
+
+    def lookup(self, service: str, resource_type: Optional[str]) -> Optional[ResourceFactory]:
+        """
+        Return the factory for ARNs of the given service and resource type.
+
+        :param service: ARN service.
+        :param resource_type: ARN resource type.
+        :return: :data:`ResourceFactory`, or ``None`` when the type isn't registered.
+        """
+        if not self._plugins_loaded:
+            self.load_entry_points()
+        factory = self._factories.get((service, resource_type))
+        if factory is None:
+            factory = self._factories.get((service, ANY_RESOURCE_TYPE))
+        return factory
+
+    def load_entry_points(self) -> None:
+        """
+        Let installed plugins register their resource types.
+
+        Runs once; a plugin that fails to load is logged and skipped.
+        """
+        with self._lock:
+            if self._plugins_loaded:
+                return
+            for entry_point in entry_points(group=self._entry_point_group):
+                try:
+                    entry_point.load()(self)
+                    LOG.debug("Loaded resource types from %s", entry_point.value)
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    LOG.warning("Can't load resource types from %s: %s", entry_point.value, err)
+            self._plugins_loaded = True
+
+
+RESOURCE_TYPES = ResourceTypeRegistry()
+
+
+def register_resource_type(service: str, resource_type: Optional[str], factory: ResourceFactory) -> None:
+    """
+    Register a factory in the process-wide :data:`RESOURCE_TYPES` registry.
+
+    :param service: ARN service, e.g. ``ec2``.
+    :param resource_type: ARN resource type, or :data:`ANY_RESOURCE_TYPE`.
+    :param factory: :data:`ResourceFactory`.
+    """
+    RESOURCE_TYPES.register(service, resource_type, factory)
@@ -0,0 +1,210 @@
+"""
+Batched existence checks for resources found by
+:mod:`infrahouse_toolkit.aws.resource_discovery`.
+
+Most EC2 and ECS describe APIs accept many IDs per call.  Instead of one
+``describe_*`` call per ARN, :func:`plan_existence_checks` groups ARNs by
+service, resource type and region, and :func:`run_batch_check` verifies a
+whole group with one call.
+"""
+
+from collections import namedtuple
+from typing import Dict, List, Tuple
+
+import boto3
+
+from infrahouse_toolkit.aws.arn import parse_arn
+from infrahouse_toolkit.aws.client_registry import get_cached_client
+
+# EC2 filter values are capped at 200 per filter.  Filters are used instead
+# of the ``*Ids`` parameters because one unknown ID fails the whole
+# ``*Ids`` request with ``*.NotFound``, whereas a filter simply omits it.
+_EC2_FILTER_CHUNK = 200
+
+_BatchSpec = namedtuple("_BatchSpec", ["client_service", "chunk_size", "check"])
+_BatchSpec.__doc__ = """How to check existence of many resources of one type with one API call.
+
+``check(client, scope, ids)`` returns ``{id: exists}`` for the IDs it found.
+IDs missing from the result are reported as deleted.
+"""
+
+BatchCheck = namedtuple("BatchCheck", ["service", "resource_type", "region", "scope", "arns", "ids"])
+BatchCheck.__doc__ = """One planned batched existence check.
+
+``arns`` and ``ids`` are parallel lists.  ``scope`` is the parent resource
+the IDs live in (the cluster name for ECS services), or ``None``.
+"""
+
+
+def _ec2_filtered(  # pylint: disable=too-many-arguments
+    client, operation: str, result_key: str, filter_name: str, ids: List[str], filter_param: str = "Filters"
+):
+    """Yield items of a paginated EC2 describe call filtered by resource ID."""
+    kwargs = {filter_param: [{"Name": filter_name, "Values": ids}]}
+    for page in client.get_paginator(operation).paginate(**kwargs):
+        yield from page.get(result_key, [])
+
+
+def _batch_instances(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    found = {}
+    for reservation in _ec2_filtered(client, "describe_instances", "Reservations", "instance-id", ids):
+        for instance in reservation.get("Instances", []):
+            found[instance["InstanceId"]] = instance["State"]["Name"] not in ("terminated", "shutting-down")
+    return found
+
+
+def _batch_security_groups(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    return {
+        group["GroupId"]: True
+        for group in _ec2_filtered(client, "describe_security_groups", "SecurityGroups", "group-id", ids)
+    }
+
+
+def _batch_nat_gateways(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    return {
+        gateway["NatGatewayId"]: gateway.get("State", "") not in ("deleting", "deleted")
+        for gateway in _ec2_filtered(
+            client, "describe_nat_gateways", "NatGateways", "nat-gateway-id", ids, filter_param="Filter"
+        )
+    }
+
+
+def _batch_network_interfaces(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    return {
+        eni["NetworkInterfaceId"]: True
+        for eni in _ec2_filtered(
+            client, "describe_network_interfaces", "NetworkInterfaces", "network-interface-id", ids
+        )
+    }
+
+
+def _batch_volumes(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    return {
+        volume["VolumeId"]: volume.get("State") != "deleted"
+        for volume in _ec2_filtered(client, "describe_volumes", "Volumes", "volume-id", ids)
+    }
+
+
+def _batch_security_group_rules(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    return {
+        rule["SecurityGroupRuleId"]: True
+        for rule in _ec2_filtered(
+            client, "describe_security_group_rules", "SecurityGroupRules", "security-group-rule-id", ids
+        )
+    }
+
+
+def _batch_key_pairs(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    response = client.describe_key_pairs(Filters=[{"Name": "key-pair-id", "Values": ids}])
+    return {key_pair["KeyPairId"]: True for key_pair in response.get("KeyPairs", [])}
+
+
+def _batch_launch_templates(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    # describe_launch_templates has no ID filter.  An unknown ID fails the
+    # call, in which case the whole chunk falls back to per-ARN checks.
+    found = {}
+    for page in client.get_paginator("describe_launch_templates").paginate(LaunchTemplateIds=ids):
+        for template in page.get("LaunchTemplates", []):
+            found[template["LaunchTemplateId"]] = True
+    return found
+
+
+def _batch_ecs_services(client, scope: str, ids: List[str]) -> Dict[str, bool]:
+    response = client.describe_services(cluster=scope, services=ids)
+    return {svc["serviceName"]: svc["status"] in ("ACTIVE", "DRAINING") for svc in response.get("services", [])}
+
+
+def _batch_ecs_clusters(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    response = client.describe_clusters(clusters=ids)
+    return {cluster["clusterName"]: cluster["status"] == "ACTIVE" for cluster in response.get("clusters", [])}
+
+
+def _batch_ecs_capacity_providers(client, _scope, ids: List[str]) -> Dict[str, bool]:
+    response = client.describe_capacity_providers(capacityProviders=ids)
+    return {cp["name"]: cp["status"] == "ACTIVE" for cp in response.get("capacityProviders", [])}
+
+
+# (service, resource type) -> how to check many of them at once.  The
+# semantics of each check mirror the ``exists`` property of the class
+# :func:`resource_for_arn` returns for that type.
+_BATCH_SPECS = {
+    ("ec2", "instance"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_instances),
+    ("ec2", "security-group"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_security_groups),
+    ("ec2", "natgateway"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_nat_gateways),
+    ("ec2", "network-interface"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_network_interfaces),
+    ("ec2", "volume"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_volumes),
+    ("ec2", "security-group-rule"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_security_group_rules),
+    ("ec2", "key-pair"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_key_pairs),
+    ("ec2", "launch-template"): _BatchSpec("ec2", _EC2_FILTER_CHUNK, _batch_launch_templates),
+    ("ecs", "service"): _BatchSpec("ecs", 10, _batch_ecs_services),
+    ("ecs", "cluster"): _BatchSpec("ecs", 100, _batch_ecs_clusters),
+    ("ecs", "capacity-provider"): _BatchSpec("ecs", 10, _batch_ecs_capacity_providers),
+}
+
+
+def plan_existence_checks(  # pylint: disable=too-many-locals
+    arns: List[str], region: str = None
+) -> Tuple[List[BatchCheck], List[str]]:
+    """
+    Group ARNs into batched existence checks.
+
+    ARNs are grouped by service, resource type, region and (for ECS
+    services) cluster, then split into chunks no larger than the describe
+    API accepts.  ARNs of types without a batched check are returned
+    separately and must be checked one by one.
+
+    :param arns: Amazon Resource Names to verify.
+    :param region: AWS region override (uses the ARN region when ``None``).
+    :return: A tuple of planned :class:`BatchCheck` chunks and the list of
+        ARNs that need individual checks.
+    """
+    groups: Dict[tuple, List[Tuple[str, str]]] = {}
+    singles: List[str] = []
+    for arn in arns:
+        parsed = parse_arn(arn)
+        spec_key = (parsed["service"], parsed["resource_type"]) if parsed else None
+        if spec_key not in _BATCH_SPECS:
+            singles.append(arn)
+            continue
+        scope = None
+        resource_id = parsed["resource_id"]
+        if spec_key == ("ecs", "service"):
+            if "/" not in resource_id:
+                singles.append(arn)
+                continue
+            scope, resource_id = resource_id.split("/", 1)
+        group_key = spec_key + (region or parsed["region"] or None, scope)
+        groups.setdefault(group_key, []).append((arn, resource_id))
+
+    batches: List[BatchCheck] = []
+    for (service, resource_type, group_region, scope), members in groups.items():
+        chunk_size = _BATCH_SPECS[(service, resource_type)].chunk_size
+        for start in range(0, len(members), chunk_size):
+            chunk = members[start : start + chunk_size]
+            batches.append(
+                BatchCheck(
+                    service=service,
+                    resource_type=resource_type,
+                    region=group_region,
+                    scope=scope,
+                    arns=[arn for arn, _ in chunk],
+                    ids=[resource_id for _, resource_id in chunk],
+                )
+            )
+    return batches, singles
+
+
+def run_batch_check(batch: BatchCheck, session: boto3.Session = None) -> Dict[str, bool]:
+    """
+    Check existence of all resources in a planned batch with one API call.
+
+    :param batch: A chunk returned by :func:`plan_existence_checks`.
+    :param session: Authenticated boto3 session.
+    :return: Dictionary mapping each ARN in the batch to its existence.
+    :raise ClientError: When the describe call fails.  Callers are expected
+        to fall back to checking the ARNs one by one.
+    """
+    spec = _BATCH_SPECS[(batch.service, batch.resource_type)]
+    client = get_cached_client(spec.client_service, region=batch.region, session=session)
+    found = spec.check(client, batch.scope, batch.ids)
+    return {arn: found.get(resource_id, False) for arn, resource_id in zip(batch.arns, batch.ids)}
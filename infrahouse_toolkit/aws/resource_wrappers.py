@@ -0,0 +1,717 @@
+"""
+Lightweight resource wrappers for :mod:`infrahouse_toolkit.aws.resource_discovery`.
+
+These resource types are too simple for infrahouse-core.  Each wrapper
+has the same ``exists`` / ``delete()`` interface as the infrahouse-core
+resource classes.
+
+Wrappers with a ``delete_many()`` class method can also delete many
+resources of one region at once, with as few API calls as the service
+allows; the deletion scheduler uses it instead of ``delete()``.
+:func:`terminate_instances` does the same for infrahouse-core's
+:class:`~infrahouse_core.aws.EC2Instance`.
+"""
+
+import time
+from logging import getLogger
+from typing import Dict, List, Optional
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
+from infrahouse_core.aws import EC2Instance
+
+from infrahouse_toolkit.aws.client_registry import get_cached_client
+
+LOG = getLogger(__name__)
+
+# Seconds between availability polls of detached volumes and network
+# interfaces.  botocore's waiters poll every 15-20 seconds, once per resource.
+DEFAULT_DETACH_POLL_INTERVAL = 5
+
+# Seconds to wait for all detached resources to become available.
+DEFAULT_DETACH_TIMEOUT = 600
+
+# Maximum number of values in one EC2 describe filter.
+EC2_FILTER_VALUES_LIMIT = 200
+
+# Maximum number of IDs in one terminate_instances call.
+TERMINATE_INSTANCES_LIMIT = 1000
+
+# Maximum number of ARNs in one delete_task_definitions call.
+DELETE_TASK_DEFINITIONS_LIMIT = 10
+
+
+def _delete_one_by_one(resources: list) -> List[Optional[Exception]]:
+    """Fallback of batch deletes: call ``delete()`` of every resource and collect the errors."""
+    errors: List[Optional[Exception]] = []
+    for resource in resources:
+        try:
+            resource.delete()
+            errors.append(None)
+        except (ClientError, BotoCoreError) as exc:
+            errors.append(exc)
+    return errors
+
+
+def terminate_instances(instances: List[EC2Instance]) -> List[Optional[Exception]]:
+    """
+    Terminate many EC2 instances of one region with one call per 1000 instances.
+
+    When a call fails, e.g. because one instance is protected from
+    termination, the instances of that call are terminated one by one
+    so that each gets its own result.
+
+    :param instances: Instances of the same region and session.
+    :return: ``None`` or the exception of each instance, in input order.
+    """
+    # pylint: disable=protected-access
+    client = get_cached_client("ec2", region=instances[0]._region, session=instances[0]._session)
+    errors: List[Optional[Exception]] = []
+    for start in range(0, len(instances), TERMINATE_INSTANCES_LIMIT):
+        chunk = instances[start : start + TERMINATE_INSTANCES_LIMIT]
+        try:
+            client.terminate_instances(InstanceIds=[instance.instance_id for instance in chunk])
+            LOG.info("Terminated %d instance(s)", len(chunk))
+            errors.extend([None] * len(chunk))
+        except ClientError as exc:
+            LOG.debug("Terminating %d instance(s) at once failed (%s), terminating one by one", len(chunk), exc)
+            errors.extend(_delete_one_by_one(chunk))
+    return errors
+
+
+def _delete_after_detach(resources: list, poll_interval: float, timeout: float) -> List[Optional[Exception]]:
+    """
+    Detach and delete volumes or network interfaces of one class and region.
+
+    All detach calls are issued first.  Then the whole set is polled with
+    one filtered describe call per :data:`EC2_FILTER_VALUES_LIMIT`
+    resources, and every resource is deleted as soon as it is available,
+    so the total time is that of the slowest detach.
+
+    :param resources: :class:`EBSVolume` or :class:`NetworkInterface`
+        objects of the same region and session.
+    :param poll_interval: Seconds between availability polls.
+    :param timeout: Seconds to wait for the resources to become available.
+    :return: ``None`` or the exception of each resource, in input order.
+        Resources still not available after *timeout* get a
+        :class:`~botocore.exceptions.WaiterError`, like the waiter
+        ``delete()`` uses would raise.
+    """
+    # pylint: disable=protected-access
+    if not resources:
+        return []
+    by_id = {resource._resource_id: resource for resource in resources}
+    client = resources[0]._client
+    errors: Dict[str, Exception] = {}
+    pending = set(by_id)
+    detached = False
+    deadline = time.monotonic() + timeout
+    while pending:
+        try:
+            infos = resources[0]._describe_many(client, sorted(pending))
+        except ClientError as exc:
+            errors.update((resource_id, exc) for resource_id in pending)
+            break
+
+        for resource_id in sorted(pending):
+            info = infos.get(resource_id)
+            resource = by_id[resource_id]
+            try:
+                if info is None or resource._is_gone(info):
+                    pending.discard(resource_id)
+                elif resource._is_available(info):
+                    pending.discard(resource_id)
+                    resource._delete_available()
+                elif not detached:
+                    resource._detach(info)
+            except ClientError as exc:
+                pending.discard(resource_id)
+                errors[resource_id] = exc
+        detached = True
+
+        if pending:
+            if time.monotonic() >= deadline:
+                for resource_id in pending:
+                    errors[resource_id] = WaiterError(
+                        name=resources[0]._WAITER_NAME,
+                        reason=f"{resource_id} not available after {timeout} seconds",
+                        last_response=infos.get(resource_id),
+                    )
+                break
+            LOG.debug("Waiting for %d detached resource(s) to become available", len(pending))
+            time.sleep(poll_interval)
+
+    return [errors.get(resource._resource_id) for resource in resources]
+
+
+def _describe_ec2_by_filter(client, operation: str, filter_name: str, ids: List[str]) -> Dict[str, Dict]:
+    """Describe EC2 resources by ID filter, which unlike ID lists doesn't fail on missing IDs."""
+    result_key, id_key = {
+        "describe_volumes": ("Volumes", "VolumeId"),
+        "describe_network_interfaces": ("NetworkInterfaces", "NetworkInterfaceId"),
+        "describe_security_group_rules": ("SecurityGroupRules", "SecurityGroupRuleId"),
+    }[operation]
+    found = {}
+    for start in range(0, len(ids), EC2_FILTER_VALUES_LIMIT):
+        chunk = ids[start : start + EC2_FILTER_VALUES_LIMIT]
+        for page in client.get_paginator(operation).paginate(Filters=[{"Name": filter_name, "Values": chunk}]):
+            for item in page.get(result_key, []):
+                found[item[id_key]] = item
+    return found
+
+
+class LaunchTemplate:
+    """Minimal wrapper for EC2 launch templates."""
+
+    def __init__(self, template_id: str, region: str = None, session: boto3.Session = None):
+        self._template_id = template_id
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the EC2 client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ec2", region=self._region, session=self._session)
+        return self._client_instance
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the launch template still exists."""
+        try:
+            resp = self._client.describe_launch_templates(LaunchTemplateIds=[self._template_id])
+            return bool(resp.get("LaunchTemplates"))
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "InvalidLaunchTemplateId.NotFound":
+                return False
+            raise
+
+    def delete(self) -> None:
+        """Delete the launch template."""
+        self._client.delete_launch_template(LaunchTemplateId=self._template_id)
+
+
+class KeyPair:
+    """Minimal wrapper for EC2 key pairs."""
+
+    def __init__(self, key_pair_id: str, region: str = None, session: boto3.Session = None):
+        self._key_pair_id = key_pair_id
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the EC2 client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ec2", region=self._region, session=self._session)
+        return self._client_instance
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the key pair still exists."""
+        try:
+            resp = self._client.describe_key_pairs(KeyPairIds=[self._key_pair_id])
+            return bool(resp.get("KeyPairs"))
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "InvalidKeyPair.NotFound":
+                return False
+            raise
+
+    def delete(self) -> None:
+        """Delete the key pair."""
+        self._client.delete_key_pair(KeyPairId=self._key_pair_id)
+
+
+class NetworkInterface:
+    """Minimal wrapper for EC2 network interfaces.
+
+    Supports existence checks and deletion with automatic force-detach
+    when the ENI is still attached.
+    """
+
+    def __init__(self, eni_id: str, region: str = None, session: boto3.Session = None):
+        self._eni_id = eni_id
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the EC2 client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ec2", region=self._region, session=self._session)
+        return self._client_instance
+
+    def _describe(self) -> Optional[Dict]:
+        """Return the ENI description dict or ``None`` if not found."""
+        try:
+            resp = self._client.describe_network_interfaces(NetworkInterfaceIds=[self._eni_id])
+            interfaces = resp.get("NetworkInterfaces", [])
+            return interfaces[0] if interfaces else None
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "InvalidNetworkInterfaceID.NotFound":
+                return None
+            raise
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the network interface still exists."""
+        return self._describe() is not None
+
+    def delete(self) -> None:
+        """Detach (if attached) and delete the network interface."""
+        info = self._describe()
+        if info is None:
+            return
+        attachment = info.get("Attachment")
+        if attachment and info.get("Status") == "in-use":
+            self._client.detach_network_interface(
+                AttachmentId=attachment["AttachmentId"],
+                Force=True,
+            )
+            LOG.info("Detached %s (attachment %s)", self._eni_id, attachment["AttachmentId"])
+            waiter = self._client.get_waiter("network_interface_available")
+            waiter.wait(NetworkInterfaceIds=[self._eni_id])
+        self._client.delete_network_interface(NetworkInterfaceId=self._eni_id)
+
+    @classmethod
+    def delete_many(
+        cls,
+        interfaces: List["NetworkInterface"],
+        poll_interval: float = DEFAULT_DETACH_POLL_INTERVAL,
+        timeout: float = DEFAULT_DETACH_TIMEOUT,
+    ) -> List[Optional[Exception]]:
+        """
+        Detach and delete many network interfaces of one region at once.
+
+        Detaches are issued together and availability is polled for the
+        whole set; see :func:`_delete_after_detach`.
+
+        :param interfaces: Network interfaces of the same region and session.
+        :param poll_interval: Seconds between availability polls.
+        :param timeout: Seconds to wait for detached interfaces.
+        :return: ``None`` or the exception of each interface, in input order.
+        """
+        return _delete_after_detach(interfaces, poll_interval, timeout)
+
+    # Hooks of _delete_after_detach()
+    _WAITER_NAME = "network_interface_available"
+
+    @property
+    def _resource_id(self) -> str:
+        return self._eni_id
+
+    @staticmethod
+    def _describe_many(client, eni_ids: List[str]) -> Dict[str, Dict]:
+        return _describe_ec2_by_filter(client, "describe_network_interfaces", "network-interface-id", eni_ids)
+
+    @staticmethod
+    def _is_gone(info: Dict) -> bool:  # pylint: disable=unused-argument
+        return False
+
+    @staticmethod
+    def _is_available(info: Dict) -> bool:
+        return info.get("Status") == "available"
+
+    def _detach(self, info: Dict) -> None:
+        attachment = info.get("Attachment")
+        if attachment and info.get("Status") == "in-use":
+            self._client.detach_network_interface(AttachmentId=attachment["AttachmentId"], Force=True)
+            LOG.info("Detached %s (attachment %s)", self._eni_id, attachment["AttachmentId"])
+
+    def _delete_available(self) -> None:
+        self._client.delete_network_interface(NetworkInterfaceId=self._eni_id)
+
+
+class EBSVolume:
+    """Minimal wrapper for EBS volumes."""
+
+    def __init__(self, volume_id: str, region: str = None, session: boto3.Session = None):
+        self._volume_id = volume_id
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the EC2 client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ec2", region=self._region, session=self._session)
+        return self._client_instance
+
+    def _describe(self) -> Optional[Dict]:
+        """Return the volume description dict or ``None`` if not found."""
+        try:
+            resp = self._client.describe_volumes(VolumeIds=[self._volume_id])
+            volumes = resp.get("Volumes", [])
+            return volumes[0] if volumes else None
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "InvalidVolume.NotFound":
+                return None
+            raise
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the volume still exists and is not deleted."""
+        info = self._describe()
+        if info is None:
+            return False
+        return info.get("State") != "deleted"
+
+    def delete(self) -> None:
+        """Detach (if attached) and delete the volume."""
+        info = self._describe()
+        if info is None:
+            return
+        if info.get("State") == "in-use":
+            for attachment in info.get("Attachments", []):
+                self._client.detach_volume(
+                    VolumeId=self._volume_id,
+                    InstanceId=attachment["InstanceId"],
+                    Force=True,
+                )
+            waiter = self._client.get_waiter("volume_available")
+            waiter.wait(VolumeIds=[self._volume_id])
+        self._client.delete_volume(VolumeId=self._volume_id)
+
+    @classmethod
+    def delete_many(
+        cls,
+        volumes: List["EBSVolume"],
+        poll_interval: float = DEFAULT_DETACH_POLL_INTERVAL,
+        timeout: float = DEFAULT_DETACH_TIMEOUT,
+    ) -> List[Optional[Exception]]:
+        """
+        Detach and delete many volumes of one region at once.
+
+        Detaches are issued together and availability is polled for the
+        whole set; see :func:`_delete_after_detach`.
+
+        :param volumes: Volumes of the same region and session.
+        :param poll_interval: Seconds between availability polls.
+        :param timeout: Seconds to wait for detached volumes.
+        :return: ``None`` or the exception of each volume, in input order.
+        """
+        return _delete_after_detach(volumes, poll_interval, timeout)
+
+    # Hooks of _delete_after_detach()
+    _WAITER_NAME = "volume_available"
+
+    @property
+    def _resource_id(self) -> str:
+        return self._volume_id
+
+    @staticmethod
+    def _describe_many(client, volume_ids: List[str]) -> Dict[str, Dict]:
+        return _describe_ec2_by_filter(client, "describe_volumes", "volume-id", volume_ids)
+
+    @staticmethod
+    def _is_gone(info: Dict) -> bool:
+        return info.get("State") in ("deleting", "deleted")
+
+    @staticmethod
+    def _is_available(info: Dict) -> bool:
+        return info.get("State") == "available"
+
+    def _detach(self, info: Dict) -> None:
+        if info.get("State") == "in-use":
+            for attachment in info.get("Attachments", []):
+                self._client.detach_volume(VolumeId=self._volume_id, InstanceId=attachment["InstanceId"], Force=True)
+
+    def _delete_available(self) -> None:
+        self._client.delete_volume(VolumeId=self._volume_id)
+
+
+class SecurityGroupRule:
+    """Minimal wrapper for EC2 security group rules."""
+
+    def __init__(self, rule_id: str, region: str = None, session: boto3.Session = None):
+        self._rule_id = rule_id
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the EC2 client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ec2", region=self._region, session=self._session)
+        return self._client_instance
+
+    def _describe(self) -> Optional[Dict]:
+        """Return the rule description dict or ``None`` if not found."""
+        try:
+            resp = self._client.describe_security_group_rules(SecurityGroupRuleIds=[self._rule_id])
+            rules = resp.get("SecurityGroupRules", [])
+            return rules[0] if rules else None
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "InvalidSecurityGroupRuleId.NotFound":
+                return None
+            raise
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the security group rule still exists."""
+        return self._describe() is not None
+
+    def delete(self) -> None:
+        """Delete the security group rule."""
+        info = self._describe()
+        if info is None:
+            return
+        group_id = info["GroupId"]
+        if info.get("IsEgress"):
+            self._client.revoke_security_group_egress(
+                GroupId=group_id,
+                SecurityGroupRuleIds=[self._rule_id],
+            )
+        else:
+            self._client.revoke_security_group_ingress(
+                GroupId=group_id,
+                SecurityGroupRuleIds=[self._rule_id],
+            )
+
+    @classmethod
+    def delete_many(cls, rules: List["SecurityGroupRule"]) -> List[Optional[Exception]]:
+        """
+        Revoke many security group rules of one region at once.
+
+        The rules are described with one filtered call per 200 rules and
+        revoked with one call per security group and direction.  Rules of
+        a failed revoke call are deleted one by one.
+
+        :param rules: Rules of the same region and session.
+        :return: ``None`` or the exception of each rule, in input order.
+        """
+        # pylint: disable=protected-access
+        client = rules[0]._client
+        try:
+            infos = _describe_ec2_by_filter(
+                client, "describe_security_group_rules", "security-group-rule-id", [r._rule_id for r in rules]
+            )
+        except ClientError as exc:
+            return [exc] * len(rules)
+
+        by_group: Dict[tuple, List[SecurityGroupRule]] = {}
+        for rule in rules:
+            info = infos.get(rule._rule_id)
+            if info is not None:
+                by_group.setdefault((info["GroupId"], bool(info.get("IsEgress"))), []).append(rule)
+
+        errors: Dict[str, Optional[Exception]] = {}
+        for (group_id, is_egress), group in by_group.items():
+            revoke = client.revoke_security_group_egress if is_egress else client.revoke_security_group_ingress
+            try:
+                revoke(GroupId=group_id, SecurityGroupRuleIds=[rule._rule_id for rule in group])
+            except ClientError as exc:
+                LOG.debug(
+                    "Revoking %d rule(s) of %s at once failed (%s), revoking one by one", len(group), group_id, exc
+                )
+                errors.update(zip([rule._rule_id for rule in group], _delete_one_by_one(group)))
+        return [errors.get(rule._rule_id) for rule in rules]
+
+
+class ECSCapacityProvider:
+    """Minimal wrapper for ECS capacity providers."""
+
+    def __init__(self, name: str, region: str = None, session: boto3.Session = None):
+        self._name = name
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the ECS client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ecs", region=self._region, session=self._session)
+        return self._client_instance
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the capacity provider is ACTIVE."""
+        try:
+            resp = self._client.describe_capacity_providers(capacityProviders=[self._name])
+            for cp in resp.get("capacityProviders", []):
+                if cp["status"] == "ACTIVE":
+                    return True
+            return False
+        except ClientError:
+            return False
+
+    def delete(self) -> None:
+        """Delete the capacity provider."""
+        self._client.delete_capacity_provider(capacityProvider=self._name)
+
+
+class ECSCluster:
+    """Minimal wrapper for ECS clusters."""
+
+    def __init__(self, cluster_name: str, region: str = None, session: boto3.Session = None):
+        self._cluster_name = cluster_name
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the ECS client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ecs", region=self._region, session=self._session)
+        return self._client_instance
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the cluster is ACTIVE."""
+        try:
+            resp = self._client.describe_clusters(clusters=[self._cluster_name])
+            for cluster in resp.get("clusters", []):
+                if cluster["status"] == "ACTIVE":
+                    return True
+            return False
+        except ClientError:
+            return False
+
+    def delete(self) -> None:
+        """Delete the cluster."""
+        self._client.delete_cluster(cluster=self._cluster_name)
+
+
+class ECSService:
+    """Minimal wrapper for ECS services.
+
+    Deletion sets ``desiredCount`` to 0, then deletes the service with
+    ``force=True`` to remove it even when tasks are still running.
+    """
+
+    def __init__(self, cluster: str, service_name: str, region: str = None, session: boto3.Session = None):
+        self._cluster = cluster
+        self._service_name = service_name
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the ECS client."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ecs", region=self._region, session=self._session)
+        return self._client_instance
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the service is ACTIVE or DRAINING."""
+        try:
+            resp = self._client.describe_services(cluster=self._cluster, services=[self._service_name])
+            for svc in resp.get("services", []):
+                if svc["status"] in ("ACTIVE", "DRAINING"):
+                    return True
+            return False
+        except ClientError:
+            return False
+
+    def delete(self) -> None:
+        """Scale to zero and force-delete the service."""
+        try:
+            self._client.update_service(
+                cluster=self._cluster,
+                service=self._service_name,
+                desiredCount=0,
+            )
+        except ClientError:
+            pass  # Service may already be draining or inactive.
+        self._client.delete_service(
+            cluster=self._cluster,
+            service=self._service_name,
+            force=True,
+        )
+
+
+class ECSTaskDefinition:
+    """Minimal wrapper for ECS task definitions.
+
+    Deletion is a two-step process: deregister (ACTIVE -> INACTIVE),
+    then ``delete_task_definitions`` to permanently remove.  No
+    dependency teardown needed, so a full infrahouse-core class would
+    be overkill.
+    """
+
+    def __init__(self, arn: str, region: str = None, session: boto3.Session = None):
+        self._arn = arn
+        self._region = region
+        self._session = session
+        self._client_instance = None
+
+    @property
+    def _client(self):
+        """Lazy-initialise the ECS client (mirrors infrahouse-core pattern)."""
+        if self._client_instance is None:
+            self._client_instance = get_cached_client("ecs", region=self._region, session=self._session)
+        return self._client_instance
+
+    @property
+    def exists(self) -> bool:
+        """Return ``True`` if the task definition is ACTIVE or INACTIVE.
+
+        Both ACTIVE and INACTIVE revisions still exist in AWS and appear
+        in the Resource Groups Tagging API.  We must report INACTIVE ones
+        as existing — otherwise they become invisible to the delete command.
+
+        Revisions in ``DELETE_IN_PROGRESS`` state are treated as gone
+        because the deletion has already been requested.
+        """
+        try:
+            resp = self._client.describe_task_definition(taskDefinition=self._arn)
+            return resp["taskDefinition"]["status"] != "DELETE_IN_PROGRESS"
+        except ClientError:
+            return False
+
+    def delete(self) -> None:
+        """Deregister and then permanently delete the task definition.
+
+        AWS requires deregistration (ACTIVE -> INACTIVE) before a task
+        definition can be deleted.  Already-INACTIVE revisions skip
+        straight to deletion.
+        """
+        try:
+            self._client.deregister_task_definition(taskDefinition=self._arn)
+        except ClientError:
+            pass  # Already INACTIVE — proceed to delete.
+        self._client.delete_task_definitions(taskDefinitions=[self._arn])
+
+    @classmethod
+    def delete_many(cls, definitions: List["ECSTaskDefinition"]) -> List[Optional[Exception]]:
+        """
+        Deregister task definitions and delete them ten per call.
+
+        ECS has no batch deregister call, so revisions are still
+        deregistered one by one.  Revisions ``delete_task_definitions``
+        reports as failures, and those of a failed call, are deleted one
+        by one.
+
+        :param definitions: Task definitions of the same region and session.
+        :return: ``None`` or the exception of each task definition, in input order.
+        """
+        # pylint: disable=protected-access
+        client = definitions[0]._client
+        for definition in definitions:
+            try:
+                client.deregister_task_definition(taskDefinition=definition._arn)
+            except ClientError:
+                pass  # Already INACTIVE — proceed to delete.
+
+        errors: List[Optional[Exception]] = []
+        for start in range(0, len(definitions), DELETE_TASK_DEFINITIONS_LIMIT):
+            chunk = definitions[start : start + DELETE_TASK_DEFINITIONS_LIMIT]
+            try:
+                response = client.delete_task_definitions(taskDefinitions=[d._arn for d in chunk])
+            except ClientError as exc:
+                LOG.debug("Deleting %d task definition(s) at once failed (%s)", len(chunk), exc)
+                errors.extend(_delete_one_by_one(chunk))
+                continue
+            failed = {failure.get("arn") for failure in response.get("failures", [])}
+            for definition in chunk:
+                errors.append(_delete_one_by_one([definition])[0] if definition._arn in failed else None)
+        return errors
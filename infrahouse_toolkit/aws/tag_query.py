@@ -0,0 +1,434 @@
+"""
+Tag query expressions and their Tagging API pushdown.
+
+``ih-aws resources`` filters take a small query language on top of the
+AND-only ``--tag`` filters::
+
+    service in (api, worker) and not environment=prod
+    team=platform or owner=ops*
+    created_by and (environment=dev or environment="load test")
+
+========================  ==============================================
+``key``                   the resource has the tag
+``key=value``             the tag has this value
+``key!=value``            the tag is missing or has another value
+``key=prefix*``           the tag value starts with *prefix*
+``key in (a, b)``         the tag has one of the values
+``not``, ``and``, ``or``  in order of precedence; use parentheses to group
+========================  ==============================================
+
+Keys and values may be quoted with ``"`` or ``'``; a quoted value is
+never a prefix.
+
+The Resource Groups Tagging API only filters by an AND of tag keys, each
+with an optional list of allowed values.  :func:`plan_tag_query` splits an
+expression into the strongest such filter it implies, which the API
+evaluates, and the residual expression that is left to evaluate on the
+returned tags.  ``service in (api, worker) and not environment=prod``
+becomes one scan for ``service`` with the values ``api`` and ``worker``,
+and only ``not environment=prod`` is checked locally.
+"""
+
+import re
+from collections import namedtuple
+from typing import Dict, FrozenSet, List, Optional, Union
+
+# Limits of ``TagFilters`` in ``tag:GetResources``.
+MAX_TAG_FILTERS = 50
+MAX_TAG_FILTER_VALUES = 20
+
+KEYWORDS = {"and", "or", "not", "in"}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<quoted>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<operator>!=|[=(),])
+        |(?P<word>[^\s=!(),"']+)
+    )""",
+    re.VERBOSE,
+)
+_WORD = re.compile(r"[^\s=!(),\"']+")
+
+
+class HasTag(namedtuple("HasTag", ["key"])):
+    """The resource has the tag *key*, with any value."""
+
+    __slots__ = ()
+
+    def matches(self, tags: Dict[str, str]) -> bool:
+        """
+        Evaluate the expression on resource tags.
+
+        :param tags: Tags of a resource.
+        :return: ``True`` when the tags satisfy the expression.
+        """
+        return self.key in tags
+
+    def __str__(self):
+        return _quote(self.key)
+
+
+class TagIn(namedtuple("TagIn", ["key", "values"])):
+    """The tag *key* has one of *values*, a frozenset."""
+
+    __slots__ = ()
+
+    def matches(self, tags: Dict[str, str]) -> bool:
+        """
+        Evaluate the expression on resource tags.
+
+        :param tags: Tags of a resource.
+        :return: ``True`` when the tags satisfy the expression.
+        """
+        return tags.get(self.key) in self.values
+
+    def __str__(self):
+        if len(self.values) == 1:
+            return f"{_quote(self.key)}={_quote(next(iter(self.values)), value=True)}"
+        return f"{_quote(self.key)} in ({', '.join(_quote(v, value=True) for v in sorted(self.values))})"
+
+
+class TagPrefix(namedtuple("TagPrefix", ["key", "prefix"])):
+    """The value of the tag *key* starts with *prefix*."""
+
+    __slots__ = ()
+
+    def matches(self, tags: Dict[str, str]) -> bool:
+        """
+        Evaluate the expression on resource tags.
+
+        :param tags: Tags of a resource.
+        :return: ``True`` when the tags satisfy the expression.
+        """
+        return self.key in tags and tags[self.key].startswith(self.prefix)
+
+    def __str__(self):
+        return f"{_quote(self.key)}={_quote(self.prefix, value=True)}*"
+
+
+class Not(namedtuple("Not", ["operand"])):
+    """The operand doesn't match."""
+
+    __slots__ = ()
+
+    def matches(self, tags: Dict[str, str]) -> bool:
+        """
+        Evaluate the expression on resource tags.
+
+        :param tags: Tags of a resource.
+        :return: ``True`` when the tags satisfy the expression.
+        """
+        return not self.operand.matches(tags)
+
+    def __str__(self):
+        if isinstance(self.operand, TagIn) and len(self.operand.values) == 1:
+            return f"{_quote(self.operand.key)}!={_quote(next(iter(self.operand.values)), value=True)}"
+        return f"not {_group(self.operand, (And, Or))}"
+
+
+class And(namedtuple("And", ["operands"])):
+    """All operands, a tuple, match."""
+
+    __slots__ = ()
+
+    def matches(self, tags: Dict[str, str]) -> bool:
+        """
+        Evaluate the expression on resource tags.
+
+        :param tags: Tags of a resource.
+        :return: ``True`` when the tags satisfy the expression.
+        """
+        return all(operand.matches(tags) for operand in self.operands)
+
+    def __str__(self):
+        return " and ".join(_group(operand, (Or,)) for operand in self.operands)
+
+
+class Or(namedtuple("Or", ["operands"])):
+    """At least one of the operands, a tuple, matches."""
+
+    __slots__ = ()
+
+    def matches(self, tags: Dict[str, str]) -> bool:
+        """
+        Evaluate the expression on resource tags.
+
+        :param tags: Tags of a resource.
+        :return: ``True`` when the tags satisfy the expression.
+        """
+        return any(operand.matches(tags) for operand in self.operands)
+
+    def __str__(self):
+        return " or ".join(str(operand) for operand in self.operands)
+
+
+TagExpression = Union[HasTag, TagIn, TagPrefix, Not, And, Or]
+
+TagQueryPlan = namedtuple("TagQueryPlan", ["tag_filters", "residual"])
+TagQueryPlan.__doc__ = """Split of a tag expression between the Tagging API and the client.
+
+``tag_filters`` is the ``TagFilters`` argument of ``tag:GetResources``:
+a list of ``{"Key": ..., "Values": [...]}`` dicts, most selective first,
+``Values`` omitted for any value.  ``residual`` is the expression
+resources returned for ``tag_filters`` still have to match, or ``None``
+when the API filter is exact.
+"""
+
+
+def parse_tag_query(text: str) -> TagExpression:
+    """
+    Parse a tag query.
+
+    :param text: Query, e.g. ``service in (a, b) and not environment=prod``.
+    :return: Parsed expression.
+    :raise ValueError: If the query is not valid.
+    """
+    return _Parser(text).parse()
+
+
+def tag_expression(tag_filters: Union[List[Dict], TagExpression, None]) -> Optional[TagExpression]:
+    """
+    Turn a list of tag filter dicts into the equivalent expression.
+
+    :param tag_filters: List of ``{"key": "<key>"}`` or
+        ``{"key": "<key>", "value": "<value>"}`` dicts, combined with AND
+        logic, or an expression, which is returned as is.
+    :return: Expression, or ``None`` for no filters.
+    """
+    if tag_filters is None or isinstance(tag_filters, (HasTag, TagIn, TagPrefix, Not, And, Or)):
+        return tag_filters
+    operands = tuple(
+        TagIn(tf["key"], frozenset([tf["value"]])) if "value" in tf else HasTag(tf["key"]) for tf in tag_filters
+    )
+    if not operands:
+        return None
+    return operands[0] if len(operands) == 1 else And(operands)
+
+
+def conjunction(*expressions: Optional[TagExpression]) -> Optional[TagExpression]:
+    """
+    Combine expressions with AND logic.
+
+    :param expressions: Expressions; ``None`` entries are ignored.
+    :return: Combined expression, or ``None`` when there is none.
+    """
+    operands = tuple(
+        operand for expression in expressions if expression is not None for operand in _conjuncts(expression)
+    )
+    if not operands:
+        return None
+    return operands[0] if len(operands) == 1 else And(operands)
+
+
+def plan_tag_query(expression: Optional[TagExpression]) -> TagQueryPlan:
+    """
+    Split an expression into a Tagging API filter and a residual expression.
+
+    The API filter is built from what every match must satisfy: the tag
+    keys the expression requires and, where it allows only some values,
+    those values.  Keys with the fewest allowed values come first.  The
+    top-level AND operands the API filter represents exactly are dropped
+    from the residual.
+
+    :param expression: Expression to plan, or ``None`` to match everything.
+    :return: :data:`TagQueryPlan`.
+    """
+    if expression is None:
+        return TagQueryPlan([], None)
+
+    implied = _implied(expression)
+    ranked = sorted(implied.items(), key=lambda item: (item[1] is None, len(item[1] or ()), item[0]))
+    pushed: Dict[str, Optional[FrozenSet[str]]] = {}
+    for key, values in ranked[:MAX_TAG_FILTERS]:
+        pushed[key] = values if values and len(values) <= MAX_TAG_FILTER_VALUES else None
+
+    residual = [
+        operand
+        for operand in _conjuncts(expression)
+        if _exact(operand) is None or pushed.get(_exact(operand)[0], False) != _exact(operand)[1]
+    ]
+    tag_filters = [
+        {"Key": key} if values is None else {"Key": key, "Values": sorted(values)} for key, values in pushed.items()
+    ]
+    return TagQueryPlan(tag_filters, conjunction(*residual))
+
+
+def iam_tag_filter(plan: TagQueryPlan) -> Optional[Dict]:
+    """
+    Pick the filter of a plan that narrows an IAM role scan the most.
+
+    :param plan: :data:`TagQueryPlan`.
+    :return: ``{"key": ...}`` or ``{"key": ..., "value": ...}``, or ``None``
+        when the plan has no filter.
+    """
+    for tag_filter in plan.tag_filters:
+        if len(tag_filter.get("Values", [])) == 1:
+            return {"key": tag_filter["Key"], "value": tag_filter["Values"][0]}
+    return {"key": plan.tag_filters[0]["Key"]} if plan.tag_filters else None
+
+
+def _conjuncts(expression: TagExpression) -> tuple:
+    return expression.operands if isinstance(expression, And) else (expression,)
+
+
+def _exact(expression: TagExpression) -> Optional[tuple]:
+    """Return ``(key, values)`` when a Tagging API filter represents *expression* exactly."""
+    if isinstance(expression, HasTag):
+        return expression.key, None
+    if isinstance(expression, TagIn):
+        return expression.key, expression.values
+    if isinstance(expression, Or):
+        parts = [_exact(operand) for operand in expression.operands]
+        if all(parts) and len({key for key, _ in parts}) == 1:
+            if any(values is None for _, values in parts):
+                return parts[0][0], None
+            return parts[0][0], frozenset().union(*(values for _, values in parts))
+    return None
+
+
+def _implied(expression: TagExpression) -> Dict[str, Optional[FrozenSet[str]]]:
+    """
+    Return the tag conditions every match of *expression* satisfies.
+
+    :return: Dictionary from tag key to the allowed values, ``None`` for any value.
+    """
+    if isinstance(expression, HasTag):
+        return {expression.key: None}
+    if isinstance(expression, TagIn):
+        return {expression.key: expression.values}
+    if isinstance(expression, TagPrefix):
+        return {expression.key: None}
+    if isinstance(expression, And):
+        implied: Dict[str, Optional[FrozenSet[str]]] = {}
+        for operand in expression.operands:
+            for key, values in _implied(operand).items():
+                if key not in implied or implied[key] is None:
+                    implied[key] = values
+                elif values is not None:
+                    implied[key] = implied[key] & values
+        return implied
+    if isinstance(expression, Or):
+        branches = [_implied(operand) for operand in expression.operands]
+        return {
+            key: (
+                None
+                if any(branch[key] is None for branch in branches)
+                else frozenset().union(*(branch[key] for branch in branches))
+            )
+            for key in set.intersection(*(set(branch) for branch in branches))
+        }
+    return {}
+
+
+def _quote(text: str, value: bool = False) -> str:
+    if _WORD.fullmatch(text) and text.lower() not in KEYWORDS:
+        if not (value and text.endswith("*")):
+            return text
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _group(expression: TagExpression, kinds: tuple) -> str:
+    return f"({expression})" if isinstance(expression, kinds) else str(expression)
+
+
+class _Parser:  # pylint: disable=too-few-public-methods
+    """Recursive descent parser of tag queries."""
+
+    def __init__(self, text: str):
+        self._text = text
+        self._tokens = self._tokenize(text)
+        self._position = 0
+
+    def parse(self) -> TagExpression:
+        """Parse the whole query."""
+        if not self._tokens:
+            raise ValueError("Empty tag query")
+        expression = self._or()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected {self._peek()[1]!r} in tag query {self._text!r}")
+        return expression
+
+    @staticmethod
+    def _tokenize(text: str) -> List[tuple]:
+        tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None:
+                raise ValueError(f"Can't parse tag query {text!r} at {text[position:]!r}")
+            kind = match.lastgroup
+            token = match.group(kind)
+            if kind == "quoted":
+                token = re.sub(r"\\(.)", r"\1", token[1:-1])
+            elif kind == "word" and token.lower() in KEYWORDS:
+                kind = "keyword"
+            tokens.append((kind, token))
+            position = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[tuple]:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _accept(self, kind: str, token: str = None) -> Optional[tuple]:
+        current = self._peek()
+        if current and current[0] == kind and (token is None or current[1].lower() == token):
+            self._position += 1
+            return current
+        return None
+
+    def _expect(self, kind: str, token: str = None) -> tuple:
+        current = self._accept(kind, token)
+        if current is None:
+            found = self._peek()
+            raise ValueError(
+                f"Expected {token or 'a tag key or value'} but found {found[1] if found else 'end of query'!r}"
+                f" in tag query {self._text!r}"
+            )
+        return current
+
+    def _or(self) -> TagExpression:
+        operands = [self._and()]
+        while self._accept("keyword", "or"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _and(self) -> TagExpression:
+        operands = [self._not()]
+        while self._accept("keyword", "and"):
+            operands.append(self._not())
+        return conjunction(*operands)
+
+    def _not(self) -> TagExpression:
+        if self._accept("keyword", "not"):
+            return Not(self._not())
+        if self._accept("operator", "("):
+            expression = self._or()
+            self._expect("operator", ")")
+            return expression
+        return self._term()
+
+    def _term(self) -> TagExpression:
+        key = self._accept("word") or self._expect("quoted")
+        if self._accept("operator", "="):
+            return self._value(key[1])
+        if self._accept("operator", "!="):
+            value = self._value(key[1])
+            return Not(value)
+        if self._accept("keyword", "in"):
+            self._expect("operator", "(")
+            values = [self._literal()]
+            while self._accept("operator", ","):
+                values.append(self._literal())
+            self._expect("operator", ")")
+            return TagIn(key[1], frozenset(values))
+        return HasTag(key[1])
+
+    def _value(self, key: str) -> TagExpression:
+        kind, token = self._accept("word") or self._accept("keyword") or self._expect("quoted")
+        if kind != "quoted" and token.endswith("*"):
+            return TagPrefix(key, token[:-1])
+        return TagIn(key, frozenset([token]))
+
+    def _literal(self) -> str:
+        return (self._accept("word") or self._accept("keyword") or self._expect("quoted"))[1]
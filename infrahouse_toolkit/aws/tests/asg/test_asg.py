@@ -0,0 +1,141 @@
+"""Tests for :class:`infrahouse_toolkit.aws.asg.ASG` and :class:`infrahouse_toolkit.aws.asg_instance.ASGInstance`."""
+
+from unittest import mock
+
+import pytest
+
+from infrahouse_toolkit.aws import get_client
+from infrahouse_toolkit.aws.asg import ASG
+from infrahouse_toolkit.aws.asg_instance import ASGInstance
+from infrahouse_toolkit.aws.client_registry import CLIENT_REGISTRY
+
+
+@pytest.fixture
+def autoscaling():
+    """Patch the clients of the legacy classes with one mock."""
+    client = mock.MagicMock()
+    client.describe_auto_scaling_groups.return_value = {
+        "AutoScalingGroups": [{"Instances": [{"InstanceId": "i-1"}, {"InstanceId": "i-2"}]}]
+    }
+    client.describe_auto_scaling_instances.return_value = {"AutoScalingInstances": [{"LifecycleState": "InService"}]}
+
+    def describe_instances(InstanceIds=None, Filters=None):  # pylint: disable=invalid-name
+        return {
+            "Reservations": [
+                {
+                    "Instances": [
+                        {
+                            "InstanceId": instance_id,
+                            "State": {"Name": "running"},
+                            "Tags": [{"Key": "Name", "Value": "es"}],
+                        }
+                        for instance_id in InstanceIds or Filters[0]["Values"]
+                    ]
+                }
+            ]
+        }
+
+    client.describe_instances.side_effect = describe_instances
+    with mock.patch("infrahouse_toolkit.aws.asg.get_client", return_value=client), mock.patch(
+        "infrahouse_toolkit.aws.asg_instance.get_client", return_value=client
+    ), mock.patch("infrahouse_toolkit.aws.ec2_instance.get_client", return_value=client):
+        yield client
+
+
+def test_instances_are_current_by_default(autoscaling) -> None:
+    """Without a cache TTL, every access describes the group again."""
+    asg = ASG("foo")
+    asg.instances  # pylint: disable=pointless-statement
+    asg.instances  # pylint: disable=pointless-statement
+    assert autoscaling.describe_auto_scaling_groups.call_count == 2
+
+
+def test_instances_are_cached(autoscaling) -> None:
+    """With a cache TTL, the group is described once until the cache is invalidated."""
+    asg = ASG("foo", cache_ttl=10)
+    assert [i.instance_id for i in asg.instances] == ["i-1", "i-2"]
+    assert len(asg.instances) == 2
+    assert autoscaling.describe_auto_scaling_groups.call_count == 1
+
+    asg.invalidate_cache()
+    asg.instances  # pylint: disable=pointless-statement
+    assert autoscaling.describe_auto_scaling_groups.call_count == 2
+
+    asg.complete_lifecycle_action(instance_id="i-1")
+    asg.instances  # pylint: disable=pointless-statement
+    assert autoscaling.describe_auto_scaling_groups.call_count == 3
+
+
+def test_instances_are_described_in_bulk(autoscaling) -> None:
+    """Reading every member of a large group takes one group and a few instance descriptions."""
+    autoscaling.describe_auto_scaling_groups.return_value = {
+        "AutoScalingGroups": [
+            {"Instances": [{"InstanceId": f"i-{i}", "LifecycleState": "InService"} for i in range(300)]}
+        ]
+    }
+    for instance in ASG("foo").instances:
+        assert instance.lifecycle_state == "InService"
+        assert instance.state == "running"
+        assert instance.tags == {"Name": "es"}
+
+    assert autoscaling.describe_auto_scaling_groups.call_count == 1
+    assert autoscaling.describe_instances.call_count == 2
+    assert autoscaling.describe_auto_scaling_instances.call_count == 0
+
+
+def test_instances_are_reused(autoscaling) -> None:
+    """Reading the instances again reuses them and their cached descriptions."""
+    asg = ASG("foo", cache_ttl=10)
+    first = asg.instances
+    assert [i.state for i in first] == ["running", "running"]
+    second = asg.instances
+    assert [i.state for i in second] == ["running", "running"]
+    assert all(a is b for a, b in zip(first, second))
+    assert autoscaling.describe_instances.call_count == 1
+
+    asg.invalidate_cache()
+    assert asg.instances[0] is not first[0]
+    assert asg.instances[0].state == "running"
+    assert autoscaling.describe_instances.call_count == 2
+
+
+def test_instances_are_described_on_first_read(autoscaling) -> None:
+    """Listing the instances and their IDs describes no instance."""
+    instances = ASG("foo").instances
+    assert [i.instance_id for i in instances] == ["i-1", "i-2"]
+    assert autoscaling.describe_instances.call_count == 0
+
+    assert instances[1].state == "running"
+    autoscaling.describe_instances.assert_called_once_with(Filters=[{"Name": "instance-id", "Values": ["i-1", "i-2"]}])
+
+
+def test_bulk_describe_falls_back_to_single_describes(autoscaling) -> None:
+    """An instance missing from the bulk response describes itself."""
+    autoscaling.describe_instances.side_effect = [
+        {"Reservations": [{"Instances": [{"InstanceId": "i-2", "State": {"Name": "running"}}]}]},
+        {"Reservations": [{"Instances": [{"InstanceId": "i-1", "State": {"Name": "terminated"}}]}]},
+    ]
+    instances = ASG("foo").instances
+    assert instances[0].state == "terminated"
+    assert instances[1].state == "running"
+    assert autoscaling.describe_instances.call_count == 2
+    assert autoscaling.describe_instances.call_args == mock.call(InstanceIds=["i-1"])
+
+
+def test_lifecycle_state_is_cached(autoscaling) -> None:
+    """The instance is described once; marking it unhealthy invalidates the cache."""
+    instance = ASGInstance(instance_id="i-1")
+    assert instance.lifecycle_state == instance.lifecycle_state == "InService"
+    assert autoscaling.describe_auto_scaling_instances.call_count == 1
+
+    instance.mark_unhealthy()
+    instance.lifecycle_state  # pylint: disable=pointless-statement
+    assert autoscaling.describe_auto_scaling_instances.call_count == 2
+
+
+def test_get_client_is_memoized() -> None:
+    """``get_client()`` returns the client the registry shares."""
+    client = get_client("autoscaling", region="us-west-2")
+    assert get_client("autoscaling", region="us-west-2") is client
+    assert CLIENT_REGISTRY.client("autoscaling", region="us-west-2") is client
+    assert client.meta.config.tcp_keepalive
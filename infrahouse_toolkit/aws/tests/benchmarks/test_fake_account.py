@@ -0,0 +1,24 @@
+"""Tests for :class:`infrahouse_toolkit.aws.benchmarks.fake_account.FakeAccount`."""
+
+from infrahouse_toolkit.aws.benchmarks.fake_account import STALE_EVERY, FakeAccount
+from infrahouse_toolkit.aws.resource_discovery import find_resources_by_tags
+
+
+def test_discovery_sees_synthetic_resources() -> None:
+    """Tagging API paging, IAM and existence checks are answered from the synthetic data."""
+    account = FakeAccount(250, roles=150)
+    resources = find_resources_by_tags(account.session(), [{"key": "service", "value": "svc-1"}])
+
+    assert len(resources) == 5 + 3
+    assert [r["arn"] for r in resources if not r["exists"]] == []
+    assert account.calls[("resourcegroupstaggingapi", "GetResources")] == 1
+    assert account.calls[("iam", "GetAccountAuthorizationDetails")] == 2
+
+
+def test_stale_resources_are_reported_as_gone() -> None:
+    """Every STALE_EVERY-th resource is still tagged but no longer exists."""
+    account = FakeAccount(STALE_EVERY * 10)
+    resources = find_resources_by_tags(account.session(), [{"key": "environment"}], iam_scan=False)
+
+    assert len(resources) == STALE_EVERY * 10
+    assert sum(1 for r in resources if not r["exists"]) == 10
@@ -0,0 +1,46 @@
+"""Tests for :func:`infrahouse_toolkit.aws.benchmarks.run_scenario`."""
+
+import pytest
+
+from infrahouse_toolkit.aws.benchmarks import SCENARIOS, format_results, run_scenario
+from infrahouse_toolkit.aws.benchmarks.fake_account import STALE_EVERY
+
+
+@pytest.mark.parametrize(
+    "scenario, expected_found, makes_iam_calls",
+    [
+        ("find_resources_by_tags", 60, True),
+        ("find_resources_as_dicts", 60, True),
+        ("find_iam_roles_by_tag", 20, True),
+        ("cmd_delete", 40 - 40 // STALE_EVERY + 20, True),
+        ("resource_for_arn", 60, False),
+    ],
+)
+def test_scenarios(scenario, expected_found, makes_iam_calls) -> None:
+    """Every scenario runs against a small synthetic account and counts its API calls."""
+    result = run_scenario(scenario, 40, 20, trace_memory=scenario == "find_iam_roles_by_tag")
+    assert result.found == expected_found
+    assert ("iam" in result.api_calls) == makes_iam_calls
+    assert result.wall_time > 0
+    assert (result.peak_memory is not None) == (scenario == "find_iam_roles_by_tag")
+    assert scenario in format_results([result])
+
+
+def test_all_scenarios_are_tested() -> None:
+    """Keep the parametrization above in sync with the scenario list."""
+    assert set(SCENARIOS) == {
+        "find_resources_by_tags",
+        "find_resources_as_dicts",
+        "find_iam_roles_by_tag",
+        "cmd_delete",
+        "resource_for_arn",
+    }
+
+
+def test_retained_memory() -> None:
+    """Scenarios that return their result report the memory it holds; compact records hold less."""
+    compact = run_scenario("find_resources_by_tags", 400, 0)
+    as_dicts = run_scenario("find_resources_as_dicts", 400, 0)
+    assert compact.found == as_dicts.found == 400
+    assert compact.retained_memory < as_dicts.retained_memory
+    assert run_scenario("resource_for_arn", 4, 0).retained_memory is None
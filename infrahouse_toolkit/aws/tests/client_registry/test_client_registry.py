@@ -0,0 +1,173 @@
+"""Tests for :class:`infrahouse_toolkit.aws.client_registry.ClientRegistry`."""
+
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from threading import Event
+from unittest.mock import ANY, MagicMock, patch
+
+import boto3
+
+from infrahouse_toolkit.aws.client_registry import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    ClientRegistry,
+)
+
+
+def test_same_key_same_client() -> None:
+    """A client is created once per session, service and region."""
+    session = MagicMock()
+    session.client.side_effect = lambda *args, **kwargs: MagicMock()
+    registry = ClientRegistry()
+
+    ec2 = registry.client("ec2", region="us-east-1", session=session)
+    assert registry.client("ec2", region="us-east-1", session=session) is ec2
+    assert registry.client("ec2", region="us-west-2", session=session) is not ec2
+    assert registry.client("ecs", region="us-east-1", session=session) is not ec2
+    assert session.client.call_count == 3
+    session.client.assert_any_call("ec2", region_name="us-east-1", config=ANY)
+    config = session.client.call_args.kwargs["config"]
+    assert config.max_pool_connections == DEFAULT_MAX_POOL_CONNECTIONS
+    assert config.tcp_keepalive
+    assert config.connect_timeout == DEFAULT_CONNECT_TIMEOUT
+
+
+def test_sessions_do_not_share_clients() -> None:
+    """Clients of different sessions are independent."""
+    registry = ClientRegistry()
+    first, second = MagicMock(), MagicMock()
+    assert registry.client("ec2", session=first) is first.client.return_value
+    assert registry.client("ec2", session=second) is second.client.return_value
+
+
+def test_concurrent_callers_share_one_client() -> None:
+    """Threads asking for the same client at once get one instance."""
+    session = MagicMock()
+
+    def _slow_client(*args, **kwargs):
+        time.sleep(0.01)
+        return MagicMock()
+
+    session.client.side_effect = _slow_client
+    registry = ClientRegistry()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: registry.client("ec2", session=session), range(32)))
+
+    assert session.client.call_count == 1
+    assert all(c is clients[0] for c in clients)
+
+
+def test_clients_are_dropped_with_session() -> None:
+    """The registry doesn't keep sessions alive."""
+    registry = ClientRegistry()
+    session = boto3.Session(region_name="us-east-1", aws_access_key_id="AKIDEXAMPLE", aws_secret_access_key="secret")
+    registry.client("ec2", session=session)
+    assert registry._clients  # pylint: disable=protected-access
+    del session
+    gc.collect()
+    assert not registry._clients  # pylint: disable=protected-access
+
+
+def test_role_clients_use_assumed_credentials() -> None:
+    """Clients for a role are signed with credentials from sts:AssumeRole."""
+    session = MagicMock()
+    session.region_name = "us-east-1"
+    sts = session.client.return_value
+    sts.assume_role.return_value = {
+        "Credentials": {
+            "AccessKeyId": "AKIDEXAMPLE",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        }
+    }
+    role_arn = "arn:aws:iam::123456789012:role/admin"
+    registry = ClientRegistry()
+
+    ec2 = registry.client("ec2", session=session, role_arn=role_arn)
+    assert registry.client("ec2", session=session, role_arn=role_arn) is ec2
+    assert registry.client("ecs", session=session, role_arn=role_arn) is not ec2
+
+    sts.assume_role.assert_called_once_with(RoleArn=role_arn, RoleSessionName=ANY)
+    assert ec2.meta.region_name == "us-east-1"
+    assert ec2._request_signer._credentials.access_key == "AKIDEXAMPLE"  # pylint: disable=protected-access
+
+
+def test_concurrent_callers_assume_role_once() -> None:
+    """Threads asking for the same role session at once share one assumed role."""
+    session = MagicMock()
+    session.region_name = "us-east-1"
+    sts = session.client.return_value
+
+    def _slow_assume_role(**kwargs):
+        time.sleep(0.01)
+        return {
+            "Credentials": {
+                "AccessKeyId": "AKIDEXAMPLE",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(tz=timezone.utc) + timedelta(hours=1),
+            }
+        }
+
+    sts.assume_role.side_effect = _slow_assume_role
+    role_arn = "arn:aws:iam::123456789012:role/admin"
+    registry = ClientRegistry()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: registry.role_session(role_arn, session=session), range(32)))
+
+    assert sts.assume_role.call_count == 1
+    assert all(s is sessions[0] for s in sessions)
+
+
+def test_assuming_role_does_not_block_other_clients() -> None:
+    """A slow STS call holds up callers of its role only."""
+    session = MagicMock()
+    session.region_name = "us-east-1"
+    sts = session.client.return_value
+    started = Event()
+    release = Event()
+
+    def _blocked_assume_role(**kwargs):
+        started.set()
+        release.wait(5)
+        return {
+            "Credentials": {
+                "AccessKeyId": "AKIDEXAMPLE",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(tz=timezone.utc) + timedelta(hours=1),
+            }
+        }
+
+    sts.assume_role.side_effect = _blocked_assume_role
+    registry = ClientRegistry()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        role_session = executor.submit(registry.role_session, "arn:aws:iam::123456789012:role/admin", session=session)
+        assert started.wait(5)
+        try:
+            # Would wait for the STS call above if the registry lock were held during it.
+            with ThreadPoolExecutor(max_workers=1) as other:
+                assert other.submit(registry.client, "ec2", session=session).result(timeout=1) is not None
+        finally:
+            release.set()
+        assert role_session.result(timeout=5) is not None
+
+
+def test_default_session_roles_use_credential_cache() -> None:
+    """Roles assumed with the default session come from the on-disk cache, once per session name."""
+    registry = ClientRegistry()
+    role_arn = "arn:aws:iam::123456789012:role/admin"
+    with patch(
+        "infrahouse_toolkit.aws.client_registry.cached_role_session", side_effect=lambda *args: MagicMock()
+    ) as cached_role_session:
+        first = registry.role_session(role_arn)
+        assert registry.role_session(role_arn) is first
+        assert registry.role_session(role_arn, session_name="other") is not first
+
+    assert [c.args for c in cached_role_session.call_args_list] == [
+        (role_arn, "infrahouse-toolkit"),
+        (role_arn, "other"),
+    ]
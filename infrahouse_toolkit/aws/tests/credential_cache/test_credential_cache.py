@@ -0,0 +1,103 @@
+"""Tests for :mod:`infrahouse_toolkit.aws.credential_cache`."""
+
+import stat
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from unittest import mock
+
+import pytest
+
+from infrahouse_toolkit.aws.credential_cache import (
+    EXPIRY_MARGIN,
+    STATIC_CREDENTIALS_MIN_LIFETIME,
+    cached_role_credentials,
+    cached_role_session,
+)
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/foo"
+
+
+@pytest.fixture
+def sts():
+    """
+    Patch the STS client of the cache.
+
+    Every ``AssumeRole`` call returns new keys valid for an hour.
+    """
+    numbers = count(1)
+
+    def _assume_role(**kwargs):  # pylint: disable=unused-argument
+        number = next(numbers)
+        return {
+            "Credentials": {
+                "AccessKeyId": f"AKID{number}",
+                "SecretAccessKey": f"secret{number}",
+                "SessionToken": f"token{number}",
+                "Expiration": datetime.now(tz=timezone.utc) + timedelta(hours=1),
+            }
+        }
+
+    with mock.patch("infrahouse_toolkit.aws.credential_cache.boto3.client") as client:
+        client.return_value.assume_role.side_effect = _assume_role
+        yield client.return_value
+
+
+def test_credentials_are_reused(sts, tmp_path) -> None:
+    """Credentials are cached per role and session name in a private directory."""
+    cache_directory = str(tmp_path / "cache")
+    first = cached_role_credentials(ROLE_ARN, "foo", cache_directory=cache_directory)
+    assert cached_role_credentials(ROLE_ARN, "foo", cache_directory=cache_directory) == first
+    assert cached_role_credentials(ROLE_ARN, "bar", cache_directory=cache_directory) != first
+    assert cached_role_credentials(ROLE_ARN, "foo", cache_directory=cache_directory, refresh=True) != first
+    assert sts.assume_role.call_count == 3
+    sts.assume_role.assert_called_with(RoleArn=ROLE_ARN, RoleSessionName="foo")
+    assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == 0o700
+
+
+def test_short_lived_credentials_are_not_cached(sts, tmp_path) -> None:
+    """Credentials botocore would refresh right away aren't reused."""
+    sts.assume_role.side_effect = None
+    sts.assume_role.return_value = {
+        "Credentials": {
+            "AccessKeyId": "AKID",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.now(tz=timezone.utc) + timedelta(seconds=EXPIRY_MARGIN - 60),
+        }
+    }
+    cached_role_credentials(ROLE_ARN, "foo", cache_directory=str(tmp_path))
+    cached_role_credentials(ROLE_ARN, "foo", cache_directory=str(tmp_path))
+    assert sts.assume_role.call_count == 2
+
+
+def test_min_lifetime(sts, tmp_path) -> None:
+    """Callers that can't refresh credentials get cached ones only if they live long enough."""
+    first = cached_role_credentials(ROLE_ARN, "foo", cache_directory=str(tmp_path))
+    assert (
+        cached_role_credentials(
+            ROLE_ARN, "foo", cache_directory=str(tmp_path), min_lifetime=STATIC_CREDENTIALS_MIN_LIFETIME
+        )
+        == first
+    )
+
+    with mock.patch("infrahouse_toolkit.aws.credential_cache.time.time", return_value=time.time() + 20 * 60):
+        assert cached_role_credentials(ROLE_ARN, "foo", cache_directory=str(tmp_path)) == first
+        static = cached_role_credentials(
+            ROLE_ARN, "foo", cache_directory=str(tmp_path), min_lifetime=STATIC_CREDENTIALS_MIN_LIFETIME
+        )
+    assert static["AccessKeyId"] == "AKID2"
+    assert sts.assume_role.call_count == 2
+
+
+def test_cached_role_session(sts, tmp_path) -> None:
+    """Sessions of separate invocations share cached credentials; a refresh assumes the role again."""
+    cached_role_session(ROLE_ARN, "foo", region="us-west-2", cache_directory=str(tmp_path))
+    session = cached_role_session(ROLE_ARN, "foo", region="us-west-2", cache_directory=str(tmp_path))
+    assert session.region_name == "us-west-2"
+    assert session.get_credentials().get_frozen_credentials().access_key == "AKID1"
+    assert sts.assume_role.call_count == 1
+
+    # pylint: disable=protected-access
+    session.get_credentials()._refresh_using()
+    assert cached_role_credentials(ROLE_ARN, "foo", cache_directory=str(tmp_path))["AccessKeyId"] == "AKID2"
@@ -0,0 +1,78 @@
+"""Tests for :class:`infrahouse_toolkit.aws.cross_account.CrossAccountSearch`."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infrahouse_toolkit.aws.benchmarks.fake_account import FakeAccount
+from infrahouse_toolkit.aws.cross_account import (
+    Account,
+    CrossAccountSearch,
+    accounts_from_role_template,
+)
+from infrahouse_toolkit.aws.resource_discovery import (
+    find_resources_by_tags,
+    iter_resources_by_tags,
+)
+
+TAG_FILTERS = [{"key": "environment", "value": "benchmark"}]
+
+
+def test_results_of_all_accounts() -> None:
+    """Every account is searched and its resources are tagged with the account name."""
+    first, second = FakeAccount(30, roles=2), FakeAccount(10)
+    search = CrossAccountSearch([Account("first", first.session()), Account("second", second.session())])
+
+    resources = search.find_resources(TAG_FILTERS)
+
+    assert [r["account"] for r in resources] == ["first"] * 32 + ["second"] * 10
+    expected = find_resources_by_tags(FakeAccount(30, roles=2).session(), TAG_FILTERS)
+    assert [{k: v for k, v in r.items() if k != "account"} for r in resources[:32]] == expected
+    assert sum(not r["exists"] for r in resources) == 1
+    assert not search.failed
+
+
+def test_failed_account_does_not_stop_others() -> None:
+    """An account whose search fails is reported in ``failed``; other accounts still return results."""
+    broken = MagicMock()
+
+    def _search(session, *args, **kwargs):
+        if session is broken:
+            raise RuntimeError("token expired")
+        return iter_resources_by_tags(session, *args, **kwargs)
+
+    search = CrossAccountSearch([Account("broken", broken), Account("ok", FakeAccount(10).session())])
+    with patch("infrahouse_toolkit.aws.cross_account.iter_resources_by_tags", side_effect=_search):
+        resources = list(search.iter_resources(TAG_FILTERS, iam_scan=False))
+
+    assert {r["account"] for r in resources} == {"ok"}
+    assert len(resources) == 10
+    assert list(search.failed) == ["broken"]
+
+
+def test_accounts_from_role_template() -> None:
+    """The account ID is substituted into the role; duplicates are searched once."""
+    session = MagicMock()
+    accounts = accounts_from_role_template(
+        session, "arn:aws:iam::{account_id}:role/teardown", ["111111111111", "222222222222", "111111111111"]
+    )
+    assert accounts == [
+        Account("111111111111", session, "arn:aws:iam::111111111111:role/teardown"),
+        Account("222222222222", session, "arn:aws:iam::222222222222:role/teardown"),
+    ]
+
+    with pytest.raises(ValueError):
+        accounts_from_role_template(session, "arn:aws:iam::111111111111:role/teardown", ["111111111111"])
+
+
+def test_role_accounts_assume_their_role() -> None:
+    """The search of a role account runs with the session of the assumed role."""
+    base, assumed = MagicMock(), FakeAccount(10).session()
+    with patch("infrahouse_toolkit.aws.cross_account.get_role_session", return_value=assumed) as mock_role:
+        resources = CrossAccountSearch(
+            accounts_from_role_template(base, "arn:aws:iam::{account_id}:role/teardown", ["111111111111"])
+        ).find_resources(TAG_FILTERS, iam_scan=False)
+
+    mock_role.assert_called_once_with("arn:aws:iam::111111111111:role/teardown", session=base)
+    assert {r["account"] for r in resources} == {"111111111111"}
+    assert len(resources) == 10
@@ -0,0 +1,68 @@
+"""Tests for :class:`infrahouse_toolkit.aws.deletion_journal.DeletionJournal`."""
+
+import os
+import stat
+from os import path as osp
+
+import pytest
+
+from infrahouse_toolkit.aws.deletion_journal import (
+    DELETED,
+    FAILED,
+    GONE,
+    PENDING,
+    DeletionJournal,
+    default_journal_path,
+)
+
+ARNS = [f"arn:aws:sns:us-east-1:123456789012:topic-{i}" for i in range(4)]
+
+
+def test_create_and_open(tmp_path) -> None:
+    """States recorded in one process are read back by the next; the last record of an ARN wins."""
+    path = str(tmp_path / "journal.jsonl")
+    journal = DeletionJournal.create(path, ARNS, tag_filters=[{"key": "environment", "value": "dev"}])
+    journal.record(ARNS[0], DELETED)
+    journal.record(ARNS[1], FAILED, "AccessDenied")
+    journal.record(ARNS[2], GONE)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    resumed = DeletionJournal.open(path)
+    assert resumed.header["tag_filters"] == [{"key": "environment", "value": "dev"}]
+    assert resumed.states == {ARNS[0]: DELETED, ARNS[1]: FAILED, ARNS[2]: GONE, ARNS[3]: PENDING}
+    assert resumed.unfinished() == [ARNS[1], ARNS[3]]
+
+
+def test_open_ignores_truncated_line(tmp_path) -> None:
+    """A line cut short by a killed process doesn't prevent resuming."""
+    path = str(tmp_path / "journal.jsonl")
+    DeletionJournal.create(path, ARNS[:2])
+    with open(path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"arn": "' + ARNS[0] + '", "sta')
+
+    assert DeletionJournal.open(path).unfinished() == ARNS[:2]
+
+
+def test_open_rejects_other_files(tmp_path) -> None:
+    """Files without a journal header are refused."""
+    path = tmp_path / "other.jsonl"
+    path.write_text('{"arn": "x", "state": "pending"}\n')
+    with pytest.raises(ValueError):
+        DeletionJournal.open(str(path))
+
+
+def test_create_refuses_to_overwrite(tmp_path) -> None:
+    """An existing journal is never overwritten."""
+    path = str(tmp_path / "journal.jsonl")
+    DeletionJournal.create(path, ARNS)
+    with pytest.raises(FileExistsError):
+        DeletionJournal.create(path, ARNS)
+
+
+def test_default_journal_path(tmp_path) -> None:
+    """Default journals go to a private directory."""
+    directory = tmp_path / "journals"
+    path = default_journal_path(str(directory))
+    assert osp.dirname(path) == str(directory)
+    assert not osp.exists(path)
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
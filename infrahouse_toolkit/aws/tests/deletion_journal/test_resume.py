@@ -0,0 +1,101 @@
+"""Tests for ``ih-aws resources delete --resume``."""
+
+from concurrent.futures import Future
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from click.testing import CliRunner
+
+from infrahouse_toolkit.aws.benchmarks.fake_account import FakeAccount
+from infrahouse_toolkit.aws.deletion_journal import (
+    DELETED,
+    GONE,
+    PENDING,
+    DeletionJournal,
+)
+from infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_delete import cmd_delete
+
+
+def test_resume_deletes_only_unfinished(tmp_path) -> None:
+    """A resumed run skips discovery, re-verifies pending ARNs and records every outcome."""
+    account = FakeAccount(20)
+    arns = [arn for arn in account.arns if ":sns:" in arn or ":sqs:" in arn]
+    path = str(tmp_path / "journal.jsonl")
+    journal = DeletionJournal.create(path, arns)
+    journal.record(arns[0], DELETED)
+
+    result = CliRunner().invoke(
+        cmd_delete,
+        ["--resume", path],
+        obj={"aws_session": account.session(), "aws_config": None},
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert f"Resuming {path}: {len(arns) - 1} of {len(arns)} resource(s) left." in result.output
+    assert ("resourcegroupstaggingapi", "GetResources") not in account.calls
+    states = DeletionJournal.open(path).states
+    # The last queue of the synthetic account is stale: gone before the run.
+    assert states == {arn: GONE if arn.endswith("queue-19") else DELETED for arn in arns}
+    assert DeletionJournal.open(path).unfinished() == []
+
+
+def test_resume_refuses_tag_filters(tmp_path) -> None:
+    """--resume takes its resources from the journal only."""
+    path = str(tmp_path / "journal.jsonl")
+    DeletionJournal.create(path, [])
+    result = CliRunner().invoke(
+        cmd_delete, ["--resume", path, "--tag", "environment=dev"], obj={"aws_session": None, "aws_config": None}
+    )
+    assert result.exit_code == 2
+
+
+def test_resume_refuses_journal(tmp_path) -> None:
+    """--resume writes to the journal it resumes, not to another one."""
+    path = str(tmp_path / "journal.jsonl")
+    DeletionJournal.create(path, [])
+    result = CliRunner().invoke(
+        cmd_delete,
+        ["--resume", path, "--journal", str(tmp_path / "other.jsonl")],
+        obj={"aws_session": None, "aws_config": None},
+    )
+    assert result.exit_code == 2
+    assert "--journal" in result.output
+
+
+def test_resume_dry_run_leaves_journal_alone(tmp_path) -> None:
+    """A dry run lists what it would delete and records nothing, not even resources that are gone."""
+    account = FakeAccount(20)
+    arns = [arn for arn in account.arns if ":sqs:" in arn]
+    path = str(tmp_path / "journal.jsonl")
+    DeletionJournal.create(path, arns)
+
+    result = CliRunner().invoke(
+        cmd_delete,
+        ["--resume", path, "--dry-run"],
+        obj={"aws_session": account.session(), "aws_config": None},
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Dry run" in result.output
+    assert not any(arn.endswith("queue-19") for arn in result.output.split())
+    assert DeletionJournal.open(path).states == {arn: PENDING for arn in arns}
+
+
+def test_resume_keeps_unchecked_resources_pending(tmp_path) -> None:
+    """An AWS error while checking a resource exits with an error and leaves it pending."""
+    arns = ["arn:aws:sns:us-east-1:123456789012:topic-0", "arn:aws:sqs:us-east-1:123456789012:queue-0"]
+    path = str(tmp_path / "journal.jsonl")
+    DeletionJournal.create(path, arns)
+    gone, denied = Future(), Future()
+    gone.set_result(False)
+    denied.set_exception(ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetQueueUrl"))
+
+    with mock.patch("infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_delete.ExistenceVerifier") as verifier_class:
+        verifier_class.return_value.__enter__.return_value.submit_many.return_value = [gone, denied]
+        result = CliRunner().invoke(cmd_delete, ["--resume", path], obj={"aws_session": None, "aws_config": None})
+
+    assert result.exit_code == 1
+    assert "still pending in the journal" in result.output
+    assert DeletionJournal.open(path).states == {arns[0]: GONE, arns[1]: PENDING}
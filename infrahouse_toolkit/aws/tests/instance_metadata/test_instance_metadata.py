@@ -0,0 +1,69 @@
+"""Tests for :mod:`infrahouse_toolkit.aws.instance_metadata`."""
+
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from infrahouse_toolkit.aws import instance_metadata
+from infrahouse_toolkit.aws.ec2_instance import EC2Instance
+from infrahouse_toolkit.aws.instance_metadata import (
+    InstanceMetadata,
+    InstanceMetadataProvider,
+    StaticMetadataProvider,
+)
+
+METADATA = InstanceMetadata("i-123", "us-west-2b", "us-west-2", "10.1.2.3", "ip-10-1-2-3.us-west-2.compute.internal")
+
+
+@pytest.fixture
+def imds():
+    """Mock ec2_metadata with one instance identity document."""
+    with mock.patch.object(instance_metadata, "ec2_metadata") as ec2_metadata:
+        ec2_metadata.instance_identity_document = {
+            "instanceId": METADATA.instance_id,
+            "availabilityZone": METADATA.availability_zone,
+            "region": METADATA.region,
+            "privateIp": METADATA.private_ip,
+        }
+        ec2_metadata.private_hostname = METADATA.hostname
+        yield ec2_metadata
+
+
+def test_metadata_is_read_once_per_boot(imds, tmp_path) -> None:
+    """The first provider reads IMDS; the next one, e.g. in another process, reads the cache file."""
+    cache_file = str(tmp_path / "metadata.json")
+    assert InstanceMetadataProvider(cache_file=cache_file).metadata == METADATA
+    assert os.stat(cache_file).st_mode & 0o777 == 0o600
+
+    imds.instance_identity_document = None
+    assert InstanceMetadataProvider(cache_file=cache_file).metadata == METADATA
+
+
+def test_untrusted_cache_file_is_ignored(imds, tmp_path) -> None:
+    """A cache file other users can write is not trusted."""
+    cache_file = tmp_path / "metadata.json"
+    cache_file.write_text(json.dumps(METADATA._replace(instance_id="i-spoofed")._asdict()))
+    cache_file.chmod(0o666)
+    assert InstanceMetadataProvider(cache_file=str(cache_file)).metadata == METADATA
+
+
+def test_invalidate_cache(imds, tmp_path) -> None:
+    """After invalidation, IMDS is read again."""
+    cache_file = tmp_path / "metadata.json"
+    provider = InstanceMetadataProvider(cache_file=str(cache_file))
+    assert provider.metadata.instance_id == "i-123"
+
+    provider.invalidate_cache()
+    assert not cache_file.exists()
+    imds.instance_identity_document = dict(imds.instance_identity_document, instanceId="i-456")
+    assert provider.metadata.instance_id == "i-456"
+
+
+def test_static_provider() -> None:
+    """The stand-in serves the local instance of the legacy classes."""
+    with mock.patch.object(instance_metadata, "METADATA_PROVIDER", StaticMetadataProvider(METADATA)):
+        instance = EC2Instance()
+        assert instance.instance_id == "i-123"
+        assert instance.availability_zone == "us-west-2b"
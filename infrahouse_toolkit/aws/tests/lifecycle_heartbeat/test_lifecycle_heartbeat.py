@@ -0,0 +1,116 @@
+"""Tests for :class:`infrahouse_toolkit.aws.lifecycle_heartbeat.LifecycleHeartbeat`."""
+
+from threading import Event
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from infrahouse_toolkit.aws.lifecycle_heartbeat import LifecycleHeartbeat
+
+
+@pytest.fixture
+def autoscaling():
+    """Mock autoscaling client of an instance waiting for a hook with a 30 seconds timeout."""
+    client = mock.MagicMock()
+    client.describe_auto_scaling_instances.return_value = {
+        "AutoScalingInstances": [{"AutoScalingGroupName": "foo", "LifecycleState": "Terminating:Wait"}]
+    }
+    client.describe_lifecycle_hooks.return_value = {"LifecycleHooks": [{"HeartbeatTimeout": 30}]}
+    with mock.patch("infrahouse_toolkit.aws.lifecycle_heartbeat.get_client", return_value=client):
+        yield client
+
+
+def test_heartbeats_at_fraction_of_timeout(autoscaling) -> None:
+    """The hook is extended right away and then every third of its timeout, until the block exits."""
+    beaten = Event()
+    autoscaling.record_lifecycle_action_heartbeat.side_effect = lambda **kwargs: beaten.set()
+    with LifecycleHeartbeat("terminating", instance_id="i-1") as heartbeat:
+        assert beaten.wait(5)
+        assert heartbeat.interval == 10
+
+    autoscaling.describe_lifecycle_hooks.assert_called_once_with(
+        AutoScalingGroupName="foo", LifecycleHookNames=["terminating"]
+    )
+    autoscaling.record_lifecycle_action_heartbeat.assert_called_once_with(
+        LifecycleHookName="terminating", AutoScalingGroupName="foo", InstanceId="i-1"
+    )
+
+
+def test_no_heartbeats_outside_wait_state(autoscaling) -> None:
+    """An instance that isn't waiting for a hook doesn't need heartbeats."""
+    autoscaling.describe_auto_scaling_instances.return_value = {
+        "AutoScalingInstances": [{"AutoScalingGroupName": "foo", "LifecycleState": "InService"}]
+    }
+    with LifecycleHeartbeat("terminating", instance_id="i-1") as heartbeat:
+        pass
+
+    assert heartbeat.interval is None
+    autoscaling.describe_lifecycle_hooks.assert_not_called()
+    autoscaling.record_lifecycle_action_heartbeat.assert_not_called()
+
+
+def test_heartbeats_stop_when_hook_is_gone(autoscaling) -> None:
+    """When the hook isn't waiting anymore, the thread stops on its own."""
+    autoscaling.describe_lifecycle_hooks.return_value = {"LifecycleHooks": [{"HeartbeatTimeout": 0}]}
+    autoscaling.record_lifecycle_action_heartbeat.side_effect = ClientError(
+        {"Error": {"Code": "ValidationError", "Message": "No active Lifecycle Action found"}},
+        "RecordLifecycleActionHeartbeat",
+    )
+    with LifecycleHeartbeat("terminating", instance_id="i-1") as heartbeat:
+        heartbeat._thread.join(5)  # pylint: disable=protected-access
+        assert not heartbeat._thread.is_alive()  # pylint: disable=protected-access
+
+    assert autoscaling.record_lifecycle_action_heartbeat.call_count == 1
+
+
+def test_describe_errors_disable_heartbeats(autoscaling) -> None:
+    """Missing permissions to read the hook don't fail the operation."""
+    autoscaling.describe_lifecycle_hooks.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "not authorized"}}, "DescribeLifecycleHooks"
+    )
+    with LifecycleHeartbeat("terminating", instance_id="i-1") as heartbeat:
+        pass
+
+    assert heartbeat.interval is None
+    autoscaling.record_lifecycle_action_heartbeat.assert_not_called()
+
+
+def test_metadata_errors_disable_heartbeats(autoscaling) -> None:
+    """Without IMDS, e.g. off EC2, the operation runs without heartbeats."""
+    with mock.patch(
+        "infrahouse_toolkit.aws.lifecycle_heartbeat.get_instance_metadata",
+        side_effect=ConnectionError("IMDS is unreachable"),
+    ):
+        with LifecycleHeartbeat("terminating") as heartbeat:
+            pass
+
+    assert heartbeat.interval is None
+    autoscaling.describe_auto_scaling_instances.assert_not_called()
+    autoscaling.record_lifecycle_action_heartbeat.assert_not_called()
+
+
+def test_heartbeats_survive_connection_errors(autoscaling) -> None:
+    """A failed heartbeat, e.g. an endpoint timeout, doesn't stop the next ones."""
+    autoscaling.describe_lifecycle_hooks.return_value = {"LifecycleHooks": [{"HeartbeatTimeout": 0}]}
+    beaten = Event()
+    autoscaling.record_lifecycle_action_heartbeat.side_effect = _calls(
+        EndpointConnectionError(endpoint_url="https://autoscaling.us-east-1.amazonaws.com"), beaten
+    )
+    with LifecycleHeartbeat("terminating", instance_id="i-1"):
+        assert beaten.wait(5)
+
+    assert autoscaling.record_lifecycle_action_heartbeat.call_count >= 2
+
+
+def _calls(error: Exception, done: Event):
+    """Side effect that raises *error* on the first call and sets *done* on the next ones."""
+    calls = []
+
+    def _call(**kwargs):  # pylint: disable=unused-argument
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise error
+        done.set()
+
+    return _call
@@ -0,0 +1,19 @@
+"""Fixtures."""
+
+from unittest import mock
+
+import pytest
+
+from infrahouse_toolkit.aws import instance_metadata
+from infrahouse_toolkit.aws.instance_metadata import (
+    InstanceMetadata,
+    StaticMetadataProvider,
+)
+
+
+@pytest.fixture(autouse=True)
+def local_instance():
+    """Serve the local instance metadata without IMDS."""
+    metadata = InstanceMetadata("i-local", "us-east-1a", "us-east-1", "10.0.1.10", "ip-10-0-1-10.ec2.internal")
+    with mock.patch.object(instance_metadata, "METADATA_PROVIDER", StaticMetadataProvider(metadata)):
+        yield metadata
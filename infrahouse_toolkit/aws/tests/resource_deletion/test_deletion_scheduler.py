@@ -0,0 +1,224 @@
+"""Tests for :class:`infrahouse_toolkit.aws.resource_deletion.DeletionScheduler`."""
+
+import time
+from threading import Lock
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from infrahouse_core.aws import EC2Instance
+
+from infrahouse_toolkit.aws.resource_deletion import DeletionScheduler, batch_deleter
+from infrahouse_toolkit.aws.resource_wrappers import EBSVolume, terminate_instances
+
+INSTANCE = "arn:aws:ec2:us-east-1:123456789012:instance/i-1"
+SECURITY_GROUP = "arn:aws:ec2:us-east-1:123456789012:security-group/sg-1"
+TOPIC = "arn:aws:sns:us-east-1:123456789012:my-topic"
+QUEUE = "arn:aws:sqs:us-east-1:123456789012:my-queue"
+
+
+def _error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": f"{code} message"}}, "Delete")
+
+
+class _FakeAWS:
+    """Resource factory that records deletion order and fails on demand."""
+
+    def __init__(self, failures=None):
+        self.deleted = []
+        self._failures = failures or {}
+        self._lock = Lock()
+
+    def resource_for_arn(self, arn, region=None, session=None):
+        if arn.startswith("unsupported"):
+            return None
+        resource = MagicMock()
+        resource.delete.side_effect = lambda: self._delete(arn)
+        return resource
+
+    def _delete(self, arn):
+        with self._lock:
+            errors = self._failures.get(arn)
+            if errors:
+                raise errors.pop(0)
+            self.deleted.append(arn)
+
+
+@pytest.fixture()
+def session() -> MagicMock:
+    """Return a mock session."""
+    s = MagicMock()
+    s.region_name = "us-east-1"
+    return s
+
+
+def test_deletes_in_dependency_order(session: MagicMock) -> None:
+    """Instances go before security groups; results follow input order."""
+    fake = _FakeAWS()
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn):
+        outcomes = DeletionScheduler(session, concurrency=4).run([SECURITY_GROUP, TOPIC, INSTANCE])
+
+    assert fake.deleted.index(INSTANCE) < fake.deleted.index(SECURITY_GROUP)
+    assert [o.arn for o in outcomes] == [SECURITY_GROUP, TOPIC, INSTANCE]
+    assert all(o.status == "deleted" for o in outcomes)
+
+
+def test_dependency_violation_is_retried(session: MagicMock) -> None:
+    """A resource blocked by a dependency is retried until it goes away."""
+    fake = _FakeAWS({SECURITY_GROUP: [_error("DependencyViolation"), _error("DependencyViolation")]})
+    reported = []
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn), patch(
+        "infrahouse_toolkit.aws.resource_deletion.time.sleep"
+    ) as mock_sleep:
+        outcomes = DeletionScheduler(session, retries=3, retry_delay=1, on_result=reported.append).run(
+            [SECURITY_GROUP, INSTANCE]
+        )
+
+    assert [o.status for o in outcomes] == ["deleted", "deleted"]
+    assert fake.deleted == [INSTANCE, SECURITY_GROUP]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+    assert sorted(o.arn for o in reported) == sorted([SECURITY_GROUP, INSTANCE])
+
+
+def test_throttled_deletion_is_retried(session: MagicMock) -> None:
+    """A deletion still throttled after the client's retries gets another round."""
+    fake = _FakeAWS({TOPIC: [_error("Throttling")]})
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn), patch(
+        "infrahouse_toolkit.aws.resource_deletion.time.sleep"
+    ):
+        outcomes = DeletionScheduler(session, retries=1).run([TOPIC])
+
+    assert [o.status for o in outcomes] == ["deleted"]
+
+
+def test_blocked_resource_retried_with_next_tier(session: MagicMock) -> None:
+    """A blocked resource joins the next tier's round before any backoff."""
+    fake = _FakeAWS({INSTANCE: [_error("ResourceInUse")]})
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn), patch(
+        "infrahouse_toolkit.aws.resource_deletion.time.sleep"
+    ) as mock_sleep:
+        outcomes = DeletionScheduler(session).run([INSTANCE, SECURITY_GROUP])
+
+    assert [o.status for o in outcomes] == ["deleted", "deleted"]
+    mock_sleep.assert_not_called()
+
+
+def test_retries_exhausted(session: MagicMock) -> None:
+    """When retries run out the last error is reported as a failure."""
+    fake = _FakeAWS({SECURITY_GROUP: [_error("DependencyViolation")] * 5})
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn), patch(
+        "infrahouse_toolkit.aws.resource_deletion.time.sleep"
+    ):
+        (outcome,) = DeletionScheduler(session, retries=2).run([SECURITY_GROUP])
+
+    assert outcome.status == "failed"
+    assert outcome.message == "DependencyViolation message"
+
+
+def test_other_errors_fail_immediately_and_unsupported_skipped(session: MagicMock) -> None:
+    """Non-dependency errors aren't retried; ARNs without a class are skipped."""
+    fake = _FakeAWS({QUEUE: [_error("AccessDenied")]})
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn), patch(
+        "infrahouse_toolkit.aws.resource_deletion.time.sleep"
+    ) as mock_sleep:
+        outcomes = DeletionScheduler(session).run([QUEUE, "unsupported:arn", TOPIC])
+
+    assert [o.status for o in outcomes] == ["failed", "skipped", "deleted"]
+    mock_sleep.assert_not_called()
+
+
+class _BatchResource:
+    """Resource class with a ``delete_many()`` class method."""
+
+    batches = []
+
+    def __init__(self, arn):
+        self.arn = arn
+
+    def delete(self):
+        raise AssertionError("deleted one by one")
+
+    @classmethod
+    def delete_many(cls, resources):
+        cls.batches.append([r.arn for r in resources])
+        return [_error("DependencyViolation") if r.arn == VOLUME_BUSY else None for r in resources]
+
+
+VOLUME = "arn:aws:ec2:us-east-1:123456789012:volume/vol-1"
+VOLUME_BUSY = "arn:aws:ec2:us-east-1:123456789012:volume/vol-2"
+VOLUME_WEST = "arn:aws:ec2:us-west-2:123456789012:volume/vol-3"
+
+
+def test_interrupt_cancels_queued_deletions(session: MagicMock) -> None:
+    """After Ctrl-C, deletions that haven't started yet don't run."""
+    topics = [f"{TOPIC}-{i}" for i in range(10)]
+    fake = _FakeAWS()
+
+    def slow_resource_for_arn(arn, region=None, session=None):
+        resource = fake.resource_for_arn(arn, region=region, session=session)
+        resource.delete.side_effect = lambda: (time.sleep(0.2), fake._delete(arn))  # pylint: disable=protected-access
+        return resource
+
+    def interrupt(_):
+        raise KeyboardInterrupt
+
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=slow_resource_for_arn):
+        with pytest.raises(KeyboardInterrupt):
+            DeletionScheduler(session, concurrency=1, on_result=interrupt).run(topics)
+
+    # The first deletion was reported, the one in progress finished, the rest were cancelled.
+    assert len(fake.deleted) <= 2
+
+
+def test_waits_for_terminations_between_tiers(session: MagicMock) -> None:
+    """The next tier starts only after terminated instances are gone."""
+    asg = (
+        "arn:aws:autoscaling:us-east-1:123456789012:autoScalingGroup:"
+        "11111111-2222-3333-4444-555555555555:autoScalingGroupName/my-asg"
+    )
+    fake = _FakeAWS()
+    client = MagicMock()
+    client.get_waiter.return_value.wait.side_effect = lambda **kwargs: fake.deleted.append(kwargs)
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=fake.resource_for_arn), patch(
+        "infrahouse_toolkit.aws.resource_deletion.get_cached_client", return_value=client
+    ) as mock_client:
+        outcomes = DeletionScheduler(session, settle_timeout=60).run([SECURITY_GROUP, INSTANCE, asg])
+
+    assert [o.status for o in outcomes] == ["deleted", "deleted", "deleted"]
+    assert [c.args[0] for c in mock_client.call_args_list] == ["autoscaling", "ec2"]
+    assert [c.args[0] for c in client.get_waiter.call_args_list] == ["group_not_exists", "instance_terminated"]
+    config = {"Delay": 15, "MaxAttempts": 4}
+    assert fake.deleted == [
+        asg,
+        {"AutoScalingGroupNames": ["my-asg"], "WaiterConfig": config},
+        INSTANCE,
+        {"InstanceIds": ["i-1"], "WaiterConfig": config},
+        SECURITY_GROUP,
+    ]
+
+
+def test_batch_deletion(session: MagicMock) -> None:
+    """Resources with delete_many() are deleted together per class and region."""
+    _BatchResource.batches = []
+
+    def _resource_for_arn(arn, region=None, session=None):  # pylint: disable=unused-argument
+        return _BatchResource(arn) if ":volume/" in arn else _FakeAWS().resource_for_arn(arn)
+
+    with patch("infrahouse_toolkit.aws.resource_deletion.resource_for_arn", side_effect=_resource_for_arn):
+        outcomes = DeletionScheduler(session, retries=0).run([VOLUME, VOLUME_BUSY, TOPIC, VOLUME_WEST])
+
+    assert sorted(_BatchResource.batches) == [[VOLUME, VOLUME_BUSY], [VOLUME_WEST]]
+    assert [(o.status, o.resource_class) for o in outcomes] == [
+        ("deleted", "_BatchResource"),
+        ("failed", "_BatchResource"),
+        ("deleted", "MagicMock"),
+        ("deleted", "_BatchResource"),
+    ]
+
+
+def test_batch_deleter() -> None:
+    """Batch deleters come from delete_many() or BATCH_DELETERS."""
+    assert batch_deleter(EC2Instance(instance_id="i-0abcdef1234567890", region="us-east-1")) is terminate_instances
+    assert batch_deleter(EBSVolume("vol-1")) == EBSVolume.delete_many
+    assert batch_deleter(MagicMock()) is None
+    assert batch_deleter(None) is None
@@ -0,0 +1,52 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_deletion.plan_deletion_tiers`."""
+
+from infrahouse_toolkit.aws.resource_deletion import plan_deletion_tiers
+
+ASG = "arn:aws:autoscaling:us-east-1:123456789012:autoScalingGroup:guid:autoScalingGroupName/my-asg"
+LAUNCH_TEMPLATE = "arn:aws:ec2:us-east-1:123456789012:launch-template/lt-1"
+INSTANCE = "arn:aws:ec2:us-east-1:123456789012:instance/i-1"
+ENI = "arn:aws:ec2:us-east-1:123456789012:network-interface/eni-1"
+VOLUME = "arn:aws:ec2:us-east-1:123456789012:volume/vol-1"
+SECURITY_GROUP = "arn:aws:ec2:us-east-1:123456789012:security-group/sg-1"
+ECS_SERVICE = "arn:aws:ecs:us-east-1:123456789012:service/my-cluster/my-service"
+ECS_CLUSTER = "arn:aws:ecs:us-east-1:123456789012:cluster/my-cluster"
+CAPACITY_PROVIDER = "arn:aws:ecs:us-east-1:123456789012:capacity-provider/my-cp"
+TOPIC = "arn:aws:sns:us-east-1:123456789012:my-topic"
+
+
+def _tier_of(tiers, arn):
+    return next(idx for idx, tier in enumerate(tiers) if arn in tier)
+
+
+def test_dependents_come_first() -> None:
+    """Known relationships are respected regardless of input order."""
+    arns = [SECURITY_GROUP, CAPACITY_PROVIDER, VOLUME, LAUNCH_TEMPLATE, ECS_CLUSTER, ENI, INSTANCE, ECS_SERVICE, ASG]
+    tiers = plan_deletion_tiers(arns)
+
+    assert sorted(arn for tier in tiers for arn in tier) == sorted(arns)
+    for before, after in [
+        (ASG, LAUNCH_TEMPLATE),
+        (ASG, INSTANCE),
+        (INSTANCE, ENI),
+        (INSTANCE, VOLUME),
+        (ENI, SECURITY_GROUP),
+        (ECS_SERVICE, ECS_CLUSTER),
+        (ECS_CLUSTER, CAPACITY_PROVIDER),
+    ]:
+        assert _tier_of(tiers, before) < _tier_of(tiers, after), f"{before} must be deleted before {after}"
+
+
+def test_unrelated_resources_share_first_tier() -> None:
+    """Resources without prerequisites are deleted together, in input order."""
+    tiers = plan_deletion_tiers([TOPIC, ASG, "not-an-arn"])
+    assert tiers == [[TOPIC, ASG, "not-an-arn"]]
+
+
+def test_prerequisites_absent_from_input_are_ignored() -> None:
+    """A security group alone doesn't wait for types that aren't being deleted."""
+    assert plan_deletion_tiers([SECURITY_GROUP, VOLUME]) == [[SECURITY_GROUP, VOLUME]]
+
+
+def test_empty() -> None:
+    """No ARNs, no tiers."""
+    assert not plan_deletion_tiers([])
@@ -29,6 +29,18 @@ def test_check_exists_returns_true_on_client_error() -> None:
         assert _check_exists(arn) is True
 
 
+def test_check_exists_raises_on_throttling() -> None:
+    """A throttled check must not be reported as an existing resource."""
+    arn = "arn:aws:ec2:us-east-1:123456789012:instance/i-0abcdef1234567890"
+    mock_resource = MagicMock()
+    error_response = {"Error": {"Code": "RequestLimitExceeded", "Message": "Request limit exceeded."}}
+    type(mock_resource).exists = PropertyMock(side_effect=ClientError(error_response, "DescribeInstances"))
+
+    with patch("infrahouse_toolkit.aws.resource_discovery.resource_for_arn", return_value=mock_resource):
+        with pytest.raises(ClientError):
+            _check_exists(arn)
+
+
 def test_check_exists_returns_true_for_unsupported_arn() -> None:
     """Unsupported ARNs (resource_for_arn returns None) should assume exists."""
     arn = "arn:aws:redshift:us-east-1:123456789012:cluster:my-cluster"
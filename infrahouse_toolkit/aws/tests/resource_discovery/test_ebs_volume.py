@@ -1,9 +1,9 @@
 """Tests for :class:`infrahouse_toolkit.aws.resource_discovery.EBSVolume`."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, WaiterError
 
 from infrahouse_toolkit.aws.resource_discovery import EBSVolume
 
@@ -100,3 +100,53 @@ def test_delete_already_gone(vol: EBSVolume, mock_ec2_client: MagicMock) -> None
     )
     vol.delete()
     mock_ec2_client.delete_volume.assert_not_called()
+
+
+def _volumes(client: MagicMock, *volume_ids: str) -> list:
+    volumes = []
+    for volume_id in volume_ids:
+        v = EBSVolume(volume_id, region="us-east-1")
+        v._client_instance = client
+        volumes.append(v)
+    return volumes
+
+
+def test_delete_many(mock_ec2_client: MagicMock) -> None:
+    """Detaches are issued together, and each volume is deleted once it is available."""
+    attached = {"VolumeId": "vol-1", "State": "in-use", "Attachments": [{"InstanceId": "i-1", "VolumeId": "vol-1"}]}
+    mock_ec2_client.get_paginator.return_value.paginate.side_effect = [
+        [{"Volumes": [attached, {"VolumeId": "vol-2", "State": "available", "Attachments": []}]}],
+        [{"Volumes": [{"VolumeId": "vol-1", "State": "available", "Attachments": []}]}],
+    ]
+
+    with patch("infrahouse_toolkit.aws.resource_wrappers.time.sleep") as mock_sleep:
+        errors = EBSVolume.delete_many(_volumes(mock_ec2_client, "vol-1", "vol-2", "vol-3"), poll_interval=3)
+
+    assert errors == [None, None, None]
+    mock_ec2_client.get_paginator.assert_called_with("describe_volumes")
+    assert mock_ec2_client.get_paginator.return_value.paginate.call_args_list[0].kwargs == {
+        "Filters": [{"Name": "volume-id", "Values": ["vol-1", "vol-2", "vol-3"]}]
+    }
+    mock_ec2_client.detach_volume.assert_called_once_with(VolumeId="vol-1", InstanceId="i-1", Force=True)
+    assert [c.kwargs for c in mock_ec2_client.delete_volume.call_args_list] == [
+        {"VolumeId": "vol-2"},
+        {"VolumeId": "vol-1"},
+    ]
+    mock_sleep.assert_called_once_with(3)
+    mock_ec2_client.get_waiter.assert_not_called()
+
+
+def test_delete_many_timeout(mock_ec2_client: MagicMock) -> None:
+    """Volumes that never become available fail with a WaiterError; others are still deleted."""
+    attached = {"VolumeId": "vol-1", "State": "in-use", "Attachments": [{"InstanceId": "i-1", "VolumeId": "vol-1"}]}
+    mock_ec2_client.get_paginator.return_value.paginate.return_value = [
+        {"Volumes": [attached, {"VolumeId": "vol-2", "State": "available", "Attachments": []}]}
+    ]
+    mock_ec2_client.delete_volume.side_effect = [
+        ClientError({"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}}, "DeleteVolume")
+    ]
+
+    errors = EBSVolume.delete_many(_volumes(mock_ec2_client, "vol-1", "vol-2"), timeout=0)
+
+    assert isinstance(errors[0], WaiterError)
+    assert isinstance(errors[1], ClientError)
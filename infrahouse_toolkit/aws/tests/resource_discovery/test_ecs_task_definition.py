@@ -0,0 +1,30 @@
+"""Tests for :class:`infrahouse_toolkit.aws.resource_discovery.ECSTaskDefinition`."""
+
+from unittest.mock import MagicMock, call
+
+from infrahouse_toolkit.aws.resource_discovery import ECSTaskDefinition
+
+
+def test_delete_many() -> None:
+    """Revisions are deleted ten per call; reported failures are retried one by one."""
+    client = MagicMock()
+    arns = [f"arn:aws:ecs:us-east-1:123456789012:task-definition/web:{i}" for i in range(12)]
+    definitions = []
+    for arn in arns:
+        definition = ECSTaskDefinition(arn, region="us-east-1")
+        definition._client_instance = client
+        definitions.append(definition)
+    client.delete_task_definitions.side_effect = [
+        {"failures": [{"arn": arns[3], "reason": "still in use"}]},
+        {"failures": []},
+        {"failures": []},
+    ]
+
+    assert ECSTaskDefinition.delete_many(definitions) == [None] * 12
+
+    assert client.deregister_task_definition.call_count == 13
+    assert client.delete_task_definitions.call_args_list == [
+        call(taskDefinitions=arns[:10]),
+        call(taskDefinitions=[arns[3]]),
+        call(taskDefinitions=arns[10:]),
+    ]
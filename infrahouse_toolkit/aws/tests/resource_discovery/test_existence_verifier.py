@@ -0,0 +1,144 @@
+"""Tests for :class:`infrahouse_toolkit.aws.resource_discovery.ExistenceVerifier`."""
+
+import time
+from concurrent.futures import CancelledError
+from threading import Event, Lock, Timer
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from infrahouse_toolkit.aws.resource_discovery import ExistenceVerifier
+
+EC2_ARN = "arn:aws:ec2:us-east-1:123456789012:instance/i-{:017x}"
+SNS_ARN = "arn:aws:sns:us-east-1:123456789012:topic-{}"
+
+
+class _ConcurrencyProbe:
+    """Stand-in for ``_check_exists`` that records peak parallelism per service."""
+
+    def __init__(self, delay: float = 0.02):
+        self._delay = delay
+        self._lock = Lock()
+        self._running = {}
+        self.peak = {}
+
+    def __call__(self, arn, region=None, session=None):
+        service = arn.split(":")[2]
+        with self._lock:
+            self._running[service] = self._running.get(service, 0) + 1
+            self.peak[service] = max(self.peak.get(service, 0), self._running[service])
+        time.sleep(self._delay)
+        with self._lock:
+            self._running[service] -= 1
+        return not arn.endswith("deleted")
+
+
+def test_submit_returns_check_result() -> None:
+    """Futures resolve to whatever _check_exists returns."""
+    probe = _ConcurrencyProbe(delay=0)
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=probe):
+        with ExistenceVerifier(MagicMock(), concurrency=4) as verifier:
+            alive = verifier.submit(SNS_ARN.format("alive"))
+            gone = verifier.submit(SNS_ARN.format("deleted"))
+            assert alive.result() is True
+            assert gone.result() is False
+
+
+def test_global_concurrency_is_bounded() -> None:
+    """No more than ``concurrency`` checks run at once."""
+    probe = _ConcurrencyProbe()
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=probe):
+        with ExistenceVerifier(MagicMock(), concurrency=3, service_limits={}) as verifier:
+            futures = [verifier.submit(SNS_ARN.format(i)) for i in range(12)]
+            assert all(f.result() for f in futures)
+    assert probe.peak["sns"] == 3
+
+
+def test_service_limit_is_respected() -> None:
+    """Per-service caps apply on top of the global concurrency."""
+    probe = _ConcurrencyProbe()
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=probe):
+        with ExistenceVerifier(MagicMock(), concurrency=8, service_limits={"ec2": 2}) as verifier:
+            futures = [verifier.submit(EC2_ARN.format(i)) for i in range(10)]
+            futures += [verifier.submit(SNS_ARN.format(i)) for i in range(10)]
+            assert all(f.result() for f in futures)
+    assert probe.peak["ec2"] <= 2
+    assert probe.peak["sns"] > 2
+
+
+def test_service_limit_is_per_session() -> None:
+    """Accounts sharing a verifier are throttled separately, so each gets its own per-service cap."""
+    probe = _ConcurrencyProbe()
+    first, second = MagicMock(), MagicMock()
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=probe) as mock_check:
+        with ExistenceVerifier(None, concurrency=8, service_limits={"ec2": 2}) as verifier:
+            futures = [verifier.submit(EC2_ARN.format(i), session=first) for i in range(10)]
+            futures += [verifier.submit(EC2_ARN.format(i), session=second) for i in range(10)]
+            assert all(f.result() for f in futures)
+    assert 2 < probe.peak["ec2"] <= 4
+    assert {c.kwargs["session"] for c in mock_check.call_args_list} == {first, second}
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_invalid_concurrency(concurrency: int) -> None:
+    """Concurrency must be positive."""
+    with pytest.raises(ValueError):
+        ExistenceVerifier(MagicMock(), concurrency=concurrency)
+
+
+def test_submit_many_batches_and_falls_back() -> None:
+    """Batchable ARNs share one call; a failed batch falls back to individual checks."""
+    volumes = [f"arn:aws:ec2:us-east-1:123456789012:volume/vol-{i}" for i in range(3)]
+    topic = SNS_ARN.format("alive")
+
+    error = ClientError({"Error": {"Code": "InternalError", "Message": "boom"}}, "DescribeVolumes")
+    with patch("infrahouse_toolkit.aws.resource_discovery.run_batch_check", side_effect=error) as mock_batch, patch(
+        "infrahouse_toolkit.aws.resource_discovery._check_exists", return_value=True
+    ) as mock_check:
+        with ExistenceVerifier(MagicMock(), concurrency=4) as verifier:
+            futures = verifier.submit_many([volumes[0], topic, volumes[1], volumes[2]])
+            assert [f.result() for f in futures] == [True] * 4
+
+    mock_batch.assert_called_once()
+    assert sorted(c.args[0] for c in mock_check.call_args_list) == sorted(volumes + [topic])
+
+
+def test_submit_many_maps_batch_results() -> None:
+    """Results of a batched check are mapped back to the right ARN."""
+    volumes = [f"arn:aws:ec2:us-east-1:123456789012:volume/vol-{i}" for i in range(3)]
+    with patch(
+        "infrahouse_toolkit.aws.resource_discovery.run_batch_check",
+        return_value={volumes[0]: True, volumes[1]: False, volumes[2]: True},
+    ), patch("infrahouse_toolkit.aws.resource_discovery._check_exists") as mock_check:
+        with ExistenceVerifier(MagicMock()) as verifier:
+            futures = verifier.submit_many(volumes)
+            assert [f.result() for f in futures] == [True, False, True]
+    mock_check.assert_not_called()
+
+
+def test_shutdown_cancels_queued_batches() -> None:
+    """Batched checks that never ran are cancelled instead of blocking their callers."""
+    volumes = [f"arn:aws:ec2:us-east-1:123456789012:volume/vol-{i}" for i in range(3)]
+    started, release = Event(), Event()
+
+    def _blocking_check(arn, region=None, session=None):
+        started.set()
+        release.wait(5)
+        return True
+
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=_blocking_check), patch(
+        "infrahouse_toolkit.aws.resource_discovery.run_batch_check"
+    ) as mock_batch:
+        verifier = ExistenceVerifier(MagicMock(), concurrency=1)
+        running = verifier.submit(SNS_ARN.format("alive"))
+        assert started.wait(5)
+        futures = verifier.submit_many(volumes)
+        Timer(0.1, release.set).start()
+        verifier.shutdown(cancel=True)
+
+    assert running.result() is True
+    for future in futures:
+        with pytest.raises(CancelledError):
+            future.result(timeout=1)
+    mock_batch.assert_not_called()
@@ -0,0 +1,104 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag`."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from infrahouse_toolkit.aws.resource_discovery import find_iam_roles_by_tag
+
+ROLES = [
+    ("role-a", {"service": "foo", "environment": "dev"}),
+    ("role-b", {"service": "bar"}),
+    ("role-c", {}),
+]
+
+
+def _arn(name: str) -> str:
+    return f"arn:aws:iam::123456789012:role/{name}"
+
+
+@pytest.fixture()
+def mock_iam_client() -> MagicMock:
+    """Return a mock IAM client with both bulk and per-role paginators."""
+    client = MagicMock()
+    bulk_page = {
+        "RoleDetailList": [
+            {"RoleName": name, "Arn": _arn(name), "Tags": [{"Key": k, "Value": v} for k, v in tags.items()]}
+            for name, tags in ROLES
+        ]
+    }
+    list_page = {"Roles": [{"RoleName": name, "Arn": _arn(name)} for name, _ in ROLES]}
+
+    def get_paginator(operation):
+        paginator = MagicMock()
+        paginator.paginate.return_value = (
+            [bulk_page] if operation == "get_account_authorization_details" else [list_page]
+        )
+        return paginator
+
+    client.get_paginator.side_effect = get_paginator
+    client.list_role_tags.side_effect = lambda RoleName: {
+        "Tags": [{"Key": k, "Value": v} for k, v in dict(ROLES)[RoleName].items()]
+    }
+    return client
+
+
+@pytest.fixture()
+def session(mock_iam_client: MagicMock) -> MagicMock:
+    """Return a session that hands out the mock IAM client."""
+    s = MagicMock()
+    s.client.return_value = mock_iam_client
+    return s
+
+
+def test_bulk_scan_matches_value(session: MagicMock, mock_iam_client: MagicMock) -> None:
+    """Role tags come from get_account_authorization_details without per-role calls."""
+    roles = find_iam_roles_by_tag(session, "service", "foo")
+
+    assert roles == [{"arn": _arn("role-a"), "tags": dict(ROLES)["role-a"], "exists": True}]
+    mock_iam_client.list_role_tags.assert_not_called()
+
+
+def test_bulk_scan_matches_key_only(session: MagicMock) -> None:
+    """Without a value any role carrying the key matches."""
+    roles = find_iam_roles_by_tag(session, "service")
+    assert [r["arn"] for r in roles] == [_arn("role-a"), _arn("role-b")]
+
+
+def test_falls_back_to_per_role_tags(session: MagicMock, mock_iam_client: MagicMock) -> None:
+    """Without iam:GetAccountAuthorizationDetails the per-role scan gives the same result, in order."""
+    denied = ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetAccountAuthorizationDetails")
+    bulk = MagicMock()
+    bulk.paginate.side_effect = denied
+    per_role = mock_iam_client.get_paginator.side_effect
+    mock_iam_client.get_paginator.side_effect = lambda op: (
+        bulk if op == "get_account_authorization_details" else per_role(op)
+    )
+
+    roles = find_iam_roles_by_tag(session, "service")
+
+    assert [r["arn"] for r in roles] == [_arn("role-a"), _arn("role-b")]
+    assert mock_iam_client.list_role_tags.call_count == len(ROLES)
+
+
+def test_per_role_skips_unreadable_roles(session: MagicMock, mock_iam_client: MagicMock) -> None:
+    """A role whose tags can't be read is skipped, not fatal."""
+    denied = ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetAccountAuthorizationDetails")
+    bulk = MagicMock()
+    bulk.paginate.side_effect = denied
+    per_role = mock_iam_client.get_paginator.side_effect
+    mock_iam_client.get_paginator.side_effect = lambda op: (
+        bulk if op == "get_account_authorization_details" else per_role(op)
+    )
+    tags_of = mock_iam_client.list_role_tags.side_effect
+
+    def list_role_tags(RoleName):
+        if RoleName == "role-a":
+            raise ClientError({"Error": {"Code": "NoSuchEntity", "Message": "gone"}}, "ListRoleTags")
+        return tags_of(RoleName=RoleName)
+
+    mock_iam_client.list_role_tags.side_effect = list_role_tags
+
+    roles = find_iam_roles_by_tag(session, "service")
+    assert [r["arn"] for r in roles] == [_arn("role-b")]
@@ -0,0 +1,193 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_discovery.find_resources_by_tags`."""
+
+import random
+import time
+from unittest.mock import MagicMock, patch
+
+from infrahouse_toolkit.aws.exceptions import IHResourceExplorerUnavailable
+from infrahouse_toolkit.aws.resource_discovery import find_resources_by_tags
+from infrahouse_toolkit.aws.tag_query import TagIn, parse_tag_query
+
+TOPIC_ARN = "arn:aws:sns:us-east-1:123456789012:topic-{}"
+
+
+def _mock_session(pages: list) -> MagicMock:
+    """Return a session whose Tagging API paginator yields *pages* of ARNs."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"ResourceTagMappingList": [{"ResourceARN": arn, "Tags": [{"Key": "service", "Value": "foo"}]} for arn in page]}
+        for page in pages
+    ]
+    session = MagicMock()
+    session.client.return_value = client
+    session.region_name = "us-east-1"
+    return session
+
+
+def _slow_check(arn, region=None, session=None):
+    """Finish checks in random order; ARNs ending in an odd digit are gone."""
+    time.sleep(random.uniform(0, 0.01))
+    return int(arn[-1]) % 2 == 0
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag", return_value=[])
+def test_order_and_exists_preserved(mock_iam) -> None:
+    """Concurrent verification keeps discovery order and per-ARN results."""
+    arns = [TOPIC_ARN.format(i) for i in range(20)]
+    session = _mock_session([arns[:7], arns[7:15], arns[15:]])
+
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=_slow_check):
+        resources = find_resources_by_tags(session, [{"key": "service", "value": "foo"}], concurrency=5)
+
+    assert [r["arn"] for r in resources] == arns
+    assert [r["exists"] for r in resources] == [int(arn[-1]) % 2 == 0 for arn in arns]
+    assert all(r["tags"] == {"service": "foo"} for r in resources)
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag", return_value=[])
+def test_no_verify_skips_checks(mock_iam) -> None:
+    """With verify=False every resource is reported as existing without API calls."""
+    session = _mock_session([[TOPIC_ARN.format(1), TOPIC_ARN.format(3)]])
+
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists") as mock_check:
+        resources = find_resources_by_tags(session, [{"key": "service", "value": "foo"}], verify=False)
+
+    mock_check.assert_not_called()
+    assert all(r["exists"] for r in resources)
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag")
+def test_iam_roles_come_first_and_are_not_duplicated(mock_iam) -> None:
+    """Roles from the IAM fallback are listed first and skipped in the Tagging API results."""
+    role_arn = "arn:aws:iam::123456789012:role/my-role"
+    mock_iam.return_value = [{"arn": role_arn, "tags": {"service": "foo"}, "exists": True}]
+    session = _mock_session([[role_arn, TOPIC_ARN.format(2)]])
+
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", return_value=True):
+        resources = find_resources_by_tags(session, [{"key": "service", "value": "foo"}])
+
+    assert [r["arn"] for r in resources] == [role_arn, TOPIC_ARN.format(2)]
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag")
+def test_iam_scan_can_be_skipped(mock_iam) -> None:
+    """iam_scan=False relies on the Tagging API alone."""
+    session = _mock_session([[TOPIC_ARN.format(2)]])
+
+    resources = find_resources_by_tags(session, [{"key": "service", "value": "foo"}], verify=False, iam_scan=False)
+
+    mock_iam.assert_not_called()
+    assert [r["arn"] for r in resources] == [TOPIC_ARN.format(2)]
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag")
+def test_multiple_regions(mock_iam) -> None:
+    """Every region is scanned; results follow the region order and carry their region."""
+    role_arn = "arn:aws:iam::123456789012:role/my-role"
+    mock_iam.return_value = [{"arn": role_arn, "tags": {"service": "foo"}, "exists": True}]
+    regional = {
+        "us-east-1": ["arn:aws:sns:us-east-1:123456789012:topic-0"],
+        "us-west-2": ["arn:aws:sns:us-west-2:123456789012:topic-0", role_arn],
+    }
+
+    def _client(service_name, region_name=None, config=None):
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = [
+            {"ResourceTagMappingList": [{"ResourceARN": arn, "Tags": []} for arn in regional[region_name]]}
+        ]
+        return client
+
+    session = MagicMock()
+    session.client.side_effect = _client
+    session.region_name = "us-east-1"
+
+    resources = find_resources_by_tags(
+        session, [{"key": "service", "value": "foo"}], verify=False, regions=["us-west-2", "us-east-1"]
+    )
+
+    mock_iam.assert_called_once()
+    assert [(r["arn"], r["region"]) for r in resources] == [
+        (role_arn, None),
+        ("arn:aws:sns:us-west-2:123456789012:topic-0", "us-west-2"),
+        ("arn:aws:sns:us-east-1:123456789012:topic-0", "us-east-1"),
+    ]
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.search_resources")
+def test_explorer_backend(mock_search) -> None:
+    """The explorer backend replaces the per-region Tagging API scans; global resources come first."""
+    session = _mock_session([[TOPIC_ARN.format(9)]])
+    west_topic = "arn:aws:sns:us-west-2:123456789012:topic-west"
+    distribution = "arn:aws:cloudfront::123456789012:distribution/E1"
+    mock_search.return_value = [
+        {"arn": west_topic, "tags": {"service": "foo"}, "region": "us-west-2"},
+        {"arn": TOPIC_ARN.format(2), "tags": {"service": "foo"}, "region": "us-east-1"},
+        {"arn": distribution, "tags": {"service": "foo"}, "region": None},
+    ]
+
+    resources = find_resources_by_tags(
+        session,
+        [{"key": "service", "value": "foo"}],
+        verify=False,
+        iam_scan=False,
+        regions=["us-east-1", "us-west-2"],
+        backend="explorer",
+    )
+
+    mock_search.assert_called_once_with(
+        session, TagIn("service", frozenset(["foo"])), regions=["us-east-1", "us-west-2"]
+    )
+    session.client.assert_not_called()
+    assert [(r["arn"], r["region"]) for r in resources] == [
+        (distribution, None),
+        (TOPIC_ARN.format(2), "us-east-1"),
+        (west_topic, "us-west-2"),
+    ]
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.search_resources")
+def test_explorer_backend_falls_back_to_tagging_api(mock_search) -> None:
+    """Without a Resource Explorer aggregator index the Tagging API is used."""
+    mock_search.side_effect = IHResourceExplorerUnavailable("No Resource Explorer aggregator index in the account")
+    session = _mock_session([[TOPIC_ARN.format(2)]])
+
+    resources = find_resources_by_tags(
+        session, [{"key": "service", "value": "foo"}], verify=False, iam_scan=False, backend="explorer"
+    )
+
+    assert [r["arn"] for r in resources] == [TOPIC_ARN.format(2)]
+
+
+@patch("infrahouse_toolkit.aws.resource_discovery.find_iam_roles_by_tag")
+def test_tag_query_is_pushed_down(mock_iam) -> None:
+    """One scan per region filters by the value list; the NOT part is evaluated on the returned tags."""
+    role_arn = "arn:aws:iam::123456789012:role/my-role"
+    mock_iam.return_value = [
+        {"arn": role_arn, "tags": {"service": "a"}, "exists": True},
+        {"arn": "arn:aws:iam::123456789012:role/prod", "tags": {"service": "b", "environment": "prod"}, "exists": True},
+    ]
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            "ResourceTagMappingList": [
+                {"ResourceARN": TOPIC_ARN.format(1), "Tags": [{"Key": "service", "Value": "a"}]},
+                {
+                    "ResourceARN": TOPIC_ARN.format(2),
+                    "Tags": [{"Key": "service", "Value": "b"}, {"Key": "environment", "Value": "prod"}],
+                },
+            ]
+        }
+    ]
+    session = MagicMock()
+    session.client.return_value = client
+    session.region_name = "us-east-1"
+
+    resources = find_resources_by_tags(
+        session, parse_tag_query("service in (a, b) and not environment=prod"), verify=False
+    )
+
+    client.get_paginator.return_value.paginate.assert_called_once_with(
+        TagFilters=[{"Key": "service", "Values": ["a", "b"]}]
+    )
+    mock_iam.assert_called_once_with(session, "service", None)
+    assert [r["arn"] for r in resources] == [role_arn, TOPIC_ARN.format(1)]
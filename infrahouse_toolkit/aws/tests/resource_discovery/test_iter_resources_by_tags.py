@@ -0,0 +1,79 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_discovery.iter_resources_by_tags`."""
+
+import time
+from threading import Event
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from infrahouse_toolkit.aws.resource_discovery import iter_resources_by_tags
+
+TOPIC_ARN = "arn:aws:sns:us-east-1:123456789012:topic-{}"
+
+
+def _mapping(arn: str) -> dict:
+    return {"ResourceARN": arn, "Tags": [{"Key": "service", "Value": "foo"}]}
+
+
+def _session(pages) -> MagicMock:
+    """Return a session whose Tagging API paginator yields *pages* (any iterable)."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = pages
+    session = MagicMock()
+    session.client.return_value = client
+    session.region_name = "us-east-1"
+    return session
+
+
+def test_yields_before_paging_ends() -> None:
+    """The first page is yielded while the paginator is still blocked on the second one."""
+    first_page_consumed = Event()
+    fetched = []
+
+    def _pages():
+        yield {"ResourceTagMappingList": [_mapping(TOPIC_ARN.format(0))]}
+        assert first_page_consumed.wait(timeout=5)
+        fetched.append(1)
+        yield {"ResourceTagMappingList": [_mapping(TOPIC_ARN.format(1))]}
+
+    resources = iter_resources_by_tags(_session(_pages()), [{"key": "service", "value": "foo"}], iam_scan=False)
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", return_value=True):
+        first = next(resources)
+        assert first["arn"] == TOPIC_ARN.format(0)
+        assert not fetched
+        first_page_consumed.set()
+        assert [r["arn"] for r in resources] == [TOPIC_ARN.format(1)]
+
+
+def test_close_stops_paging() -> None:
+    """Closing the generator stops fetching further pages."""
+    fetched = []
+
+    def _pages():
+        for i in range(100):
+            time.sleep(0.01)
+            fetched.append(i)
+            yield {"ResourceTagMappingList": [_mapping(TOPIC_ARN.format(i))]}
+
+    resources = iter_resources_by_tags(
+        _session(_pages()), [{"key": "service", "value": "foo"}], verify=False, iam_scan=False
+    )
+    assert next(resources)["arn"] == TOPIC_ARN.format(0)
+    resources.close()
+    assert len(fetched) < 100
+
+
+def test_scan_error_is_raised() -> None:
+    """A Tagging API error surfaces after the resources found before it."""
+
+    def _pages():
+        yield {"ResourceTagMappingList": [_mapping(TOPIC_ARN.format(0))]}
+        raise ClientError({"Error": {"Code": "AccessDenied", "Message": "no"}}, "GetResources")
+
+    resources = iter_resources_by_tags(
+        _session(_pages()), [{"key": "service", "value": "foo"}], verify=False, iam_scan=False
+    )
+    assert next(resources)["arn"] == TOPIC_ARN.format(0)
+    with pytest.raises(ClientError):
+        next(resources)
@@ -0,0 +1,40 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_discovery.iter_resources_csv`."""
+
+import csv
+
+from infrahouse_toolkit.aws.resource_discovery import iter_resources_csv
+
+
+def test_rows() -> None:
+    """A header row comes first; tags are a JSON column and global resources have no region."""
+    resources = [
+        {"arn": "arn:aws:iam::123456789012:role/r", "tags": {"b": "2", "a": "1,x"}, "exists": True, "region": None},
+        {"arn": "arn:aws:sns:us-east-1:123456789012:gone", "tags": {}, "exists": False, "region": "us-east-1"},
+    ]
+    lines = list(iter_resources_csv(iter(resources)))
+    assert list(csv.reader(lines)) == [
+        ["region", "service_type", "arn", "exists", "tags"],
+        ["", "iam/role", "arn:aws:iam::123456789012:role/r", "True", '{"a":"1,x","b":"2"}'],
+    ]
+
+
+def test_header_only_when_empty() -> None:
+    """Nothing found still produces a header row."""
+    assert list(iter_resources_csv([])) == ["region,service_type,arn,exists,tags"]
+
+
+def test_account_column() -> None:
+    """Results of several accounts start every row with the account."""
+    resources = [
+        {
+            "account": "prod",
+            "arn": "arn:aws:sns:us-east-1:123456789012:t",
+            "tags": {},
+            "exists": True,
+            "region": "us-east-1",
+        },
+    ]
+    assert list(csv.reader(iter_resources_csv(resources, show_account=True))) == [
+        ["account", "region", "service_type", "arn", "exists", "tags"],
+        ["prod", "us-east-1", "sns", "arn:aws:sns:us-east-1:123456789012:t", "True", "{}"],
+    ]
@@ -0,0 +1,25 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_discovery.iter_resources_ndjson`."""
+
+import json
+
+from infrahouse_toolkit.aws.resource_discovery import iter_resources_ndjson
+
+RESOURCES = [
+    {"arn": "arn:aws:sns:us-east-1:123456789012:a", "tags": {"k": "v"}, "exists": True, "region": "us-east-1"},
+    {"arn": "arn:aws:sns:us-east-1:123456789012:b", "tags": {}, "exists": False, "region": "us-east-1"},
+]
+
+
+def test_one_line_per_existing_resource() -> None:
+    """Each existing resource becomes one JSON line; stale ones are hidden."""
+    lines = list(iter_resources_ndjson(iter(RESOURCES)))
+    assert len(lines) == 1
+    assert "\n" not in lines[0]
+    assert json.loads(lines[0]) == RESOURCES[0]
+
+
+def test_show_deleted() -> None:
+    """show_deleted keeps stale resources."""
+    assert [json.loads(line)["arn"] for line in iter_resources_ndjson(RESOURCES, show_deleted=True)] == [
+        r["arn"] for r in RESOURCES
+    ]
@@ -91,3 +91,33 @@ def test_delete_already_gone(eni: NetworkInterface, mock_ec2_client: MagicMock)
     )
     eni.delete()
     mock_ec2_client.delete_network_interface.assert_not_called()
+
+
+def test_delete_many(mock_ec2_client: MagicMock) -> None:
+    """Attached interfaces are detached first and deleted once the whole set is polled available."""
+    interfaces = []
+    for eni_id in ("eni-1", "eni-2"):
+        ni = NetworkInterface(eni_id, region="us-east-1")
+        ni._client_instance = mock_ec2_client
+        interfaces.append(ni)
+    mock_ec2_client.get_paginator.return_value.paginate.side_effect = [
+        [
+            {
+                "NetworkInterfaces": [
+                    {"NetworkInterfaceId": "eni-1", "Status": "in-use", "Attachment": {"AttachmentId": "a-1"}},
+                    {"NetworkInterfaceId": "eni-2", "Status": "in-use", "Attachment": {"AttachmentId": "a-2"}},
+                ]
+            }
+        ],
+        [{"NetworkInterfaces": [{"NetworkInterfaceId": "eni-1", "Status": "available"}]}],
+    ]
+
+    with patch("infrahouse_toolkit.aws.resource_wrappers.time.sleep"):
+        errors = NetworkInterface.delete_many(interfaces)
+
+    assert errors == [None, None]
+    assert mock_ec2_client.detach_network_interface.call_args_list == [
+        call(AttachmentId="a-1", Force=True),
+        call(AttachmentId="a-2", Force=True),
+    ]
+    mock_ec2_client.delete_network_interface.assert_called_once_with(NetworkInterfaceId="eni-1")
@@ -110,3 +110,11 @@ def test_parse_arn_invalid() -> None:
     """Non-ARN strings return None."""
     assert parse_arn("not-an-arn") is None
     assert parse_arn("") is None
+
+
+def test_parse_arn_returns_copies() -> None:
+    """Results are memoized, but changing one doesn't affect the next call."""
+    arn = "arn:aws:sns:us-east-1:123456789012:my-topic"
+    parsed = parse_arn(arn)
+    parsed["service"] = "sqs"
+    assert parse_arn(arn)["service"] == "sns"
@@ -0,0 +1,65 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_verification.plan_existence_checks`."""
+
+from infrahouse_toolkit.aws.resource_verification import plan_existence_checks
+
+
+def test_groups_by_type_and_region() -> None:
+    """ARNs of the same type and region share a batch; others are kept separate."""
+    arns = [
+        "arn:aws:ec2:us-east-1:123456789012:volume/vol-1",
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-1",
+        "arn:aws:ec2:us-east-1:123456789012:volume/vol-2",
+        "arn:aws:ec2:us-west-2:123456789012:volume/vol-3",
+        "arn:aws:sns:us-east-1:123456789012:my-topic",
+    ]
+    batches, singles = plan_existence_checks(arns)
+
+    assert singles == ["arn:aws:sns:us-east-1:123456789012:my-topic"]
+    by_key = {(b.resource_type, b.region): b for b in batches}
+    assert set(by_key) == {("volume", "us-east-1"), ("instance", "us-east-1"), ("volume", "us-west-2")}
+    assert by_key[("volume", "us-east-1")].ids == ["vol-1", "vol-2"]
+    assert by_key[("volume", "us-east-1")].arns == [arns[0], arns[2]]
+
+
+def test_region_override_merges_regions() -> None:
+    """A region override places every ARN in that region."""
+    arns = [
+        "arn:aws:ec2:us-east-1:123456789012:volume/vol-1",
+        "arn:aws:ec2:us-west-2:123456789012:volume/vol-2",
+    ]
+    batches, _ = plan_existence_checks(arns, region="eu-west-1")
+    assert len(batches) == 1
+    assert batches[0].region == "eu-west-1"
+    assert batches[0].ids == ["vol-1", "vol-2"]
+
+
+def test_chunks_respect_api_limits() -> None:
+    """EC2 filters take 200 values, describe_services takes 10."""
+    volumes = [f"arn:aws:ec2:us-east-1:123456789012:volume/vol-{i}" for i in range(450)]
+    services = [f"arn:aws:ecs:us-east-1:123456789012:service/my-cluster/svc-{i}" for i in range(25)]
+    batches, singles = plan_existence_checks(volumes + services)
+
+    assert not singles
+    assert sorted(len(b.ids) for b in batches if b.service == "ec2") == [50, 200, 200]
+    assert sorted(len(b.ids) for b in batches if b.service == "ecs") == [5, 10, 10]
+
+
+def test_ecs_services_grouped_by_cluster() -> None:
+    """describe_services is per cluster, so services are grouped by cluster."""
+    arns = [
+        "arn:aws:ecs:us-east-1:123456789012:service/cluster-a/svc-1",
+        "arn:aws:ecs:us-east-1:123456789012:service/cluster-b/svc-2",
+        "arn:aws:ecs:us-east-1:123456789012:service/cluster-a/svc-3",
+        "arn:aws:ecs:us-east-1:123456789012:service/legacy-service",
+    ]
+    batches, singles = plan_existence_checks(arns)
+
+    assert singles == ["arn:aws:ecs:us-east-1:123456789012:service/legacy-service"]
+    assert {b.scope: b.ids for b in batches} == {"cluster-a": ["svc-1", "svc-3"], "cluster-b": ["svc-2"]}
+
+
+def test_unparseable_arn_is_single() -> None:
+    """Garbage input is left for the individual check."""
+    batches, singles = plan_existence_checks(["not-an-arn"])
+    assert not batches
+    assert singles == ["not-an-arn"]
@@ -126,3 +126,36 @@ def test_resource_for_arn_returns_correct_class(arn: str, expected_class: type)
 def test_resource_for_arn_returns_none_for_unsupported(arn: str) -> None:
     """Unsupported ARNs return None."""
     assert resource_for_arn(arn) is None
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (
+            "arn:aws:ec2:us-east-1:303467602807:instance/i-0a1b2c3d4e5f60001",
+            "arn:aws:ec2:us-east-1:303467602807:instance/i-0a1b2c3d4e5f60002",
+        ),
+        (
+            "arn:aws:autoscaling:us-east-1:303467602807:autoScalingGroup:uuid:autoScalingGroupName/first",
+            "arn:aws:autoscaling:us-east-1:303467602807:autoScalingGroup:uuid:autoScalingGroupName/second",
+        ),
+        (
+            "arn:aws:route53:::hostedzone/Z0123456789ABCDEFGHI",
+            "arn:aws:route53:::hostedzone/Z0123456789ABCDEFGHJ",
+        ),
+        (
+            "arn:aws:sns:us-east-1:303467602807:first-topic",
+            "arn:aws:sns:us-east-1:303467602807:second-topic",
+        ),
+    ],
+)
+def test_resources_in_same_region_share_client(first: str, second: str) -> None:
+    """Resources of the same service and region get the same registry client."""
+    clients = [
+        getattr(resource, attribute)
+        for resource in (resource_for_arn(first), resource_for_arn(second))
+        for attribute in ("_client_instance", "_autoscaling_client_instance", "_ec2_client")
+        if getattr(resource, attribute, None) is not None
+    ]
+    assert len(clients) == 2
+    assert clients[0] is clients[1]
@@ -0,0 +1,90 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_verification.run_batch_check`."""
+
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from infrahouse_toolkit.aws.resource_verification import (
+    plan_existence_checks,
+    run_batch_check,
+)
+
+
+@pytest.fixture()
+def mock_client() -> MagicMock:
+    """Return a mock boto3 client."""
+    return MagicMock()
+
+
+@pytest.fixture()
+def session(mock_client: MagicMock) -> MagicMock:
+    """Return a session that hands out *mock_client*."""
+    s = MagicMock()
+    s.client.return_value = mock_client
+    return s
+
+
+def _single_batch(arns):
+    batches, singles = plan_existence_checks(arns)
+    assert not singles and len(batches) == 1
+    return batches[0]
+
+
+def test_instances(session: MagicMock, mock_client: MagicMock) -> None:
+    """Terminated and missing instances are reported as deleted, in one call."""
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Reservations": [
+                {
+                    "Instances": [
+                        {"InstanceId": "i-1", "State": {"Name": "running"}},
+                        {"InstanceId": "i-2", "State": {"Name": "terminated"}},
+                    ]
+                }
+            ]
+        }
+    ]
+    arns = [f"arn:aws:ec2:us-east-1:123456789012:instance/i-{i}" for i in (1, 2, 3)]
+
+    assert run_batch_check(_single_batch(arns), session=session) == dict(zip(arns, [True, False, False]))
+    mock_client.get_paginator.assert_called_once_with("describe_instances")
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        Filters=[{"Name": "instance-id", "Values": ["i-1", "i-2", "i-3"]}]
+    )
+    session.client.assert_called_once_with("ec2", region_name="us-east-1", config=ANY)
+
+
+def test_volumes(session: MagicMock, mock_client: MagicMock) -> None:
+    """Volumes in the ``deleted`` state don't exist."""
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {"Volumes": [{"VolumeId": "vol-1", "State": "in-use"}, {"VolumeId": "vol-2", "State": "deleted"}]}
+    ]
+    arns = [f"arn:aws:ec2:us-east-1:123456789012:volume/vol-{i}" for i in (1, 2)]
+    assert run_batch_check(_single_batch(arns), session=session) == dict(zip(arns, [True, False]))
+
+
+def test_nat_gateways_use_filter_parameter(session: MagicMock, mock_client: MagicMock) -> None:
+    """describe_nat_gateways spells its filter parameter ``Filter``."""
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {"NatGateways": [{"NatGatewayId": "nat-1", "State": "available"}]}
+    ]
+    arns = ["arn:aws:ec2:us-east-1:123456789012:natgateway/nat-1"]
+    assert run_batch_check(_single_batch(arns), session=session) == {arns[0]: True}
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        Filter=[{"Name": "nat-gateway-id", "Values": ["nat-1"]}]
+    )
+
+
+def test_ecs_services(session: MagicMock, mock_client: MagicMock) -> None:
+    """ECS services are described per cluster; INACTIVE means deleted."""
+    mock_client.describe_services.return_value = {
+        "services": [
+            {"serviceName": "svc-1", "status": "ACTIVE"},
+            {"serviceName": "svc-2", "status": "INACTIVE"},
+        ],
+        "failures": [{"arn": "svc-3", "reason": "MISSING"}],
+    }
+    arns = [f"arn:aws:ecs:us-east-1:123456789012:service/my-cluster/svc-{i}" for i in (1, 2, 3)]
+
+    assert run_batch_check(_single_batch(arns), session=session) == dict(zip(arns, [True, False, False]))
+    mock_client.describe_services.assert_called_once_with(cluster="my-cluster", services=["svc-1", "svc-2", "svc-3"])
@@ -84,3 +84,29 @@ def test_delete_already_gone(sgr: SecurityGroupRule, mock_ec2_client: MagicMock)
     sgr.delete()
     mock_ec2_client.revoke_security_group_ingress.assert_not_called()
     mock_ec2_client.revoke_security_group_egress.assert_not_called()
+
+
+def test_delete_many(mock_ec2_client: MagicMock) -> None:
+    """Rules are revoked with one call per security group and direction."""
+    rules = []
+    for rule_id in ("sgr-1", "sgr-2", "sgr-3", "sgr-4"):
+        rule = SecurityGroupRule(rule_id, region="us-east-1")
+        rule._client_instance = mock_ec2_client
+        rules.append(rule)
+    mock_ec2_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "SecurityGroupRules": [
+                {"SecurityGroupRuleId": "sgr-1", "GroupId": "sg-1", "IsEgress": False},
+                {"SecurityGroupRuleId": "sgr-2", "GroupId": "sg-1", "IsEgress": False},
+                {"SecurityGroupRuleId": "sgr-3", "GroupId": "sg-1", "IsEgress": True},
+            ]
+        }
+    ]
+
+    assert SecurityGroupRule.delete_many(rules) == [None, None, None, None]
+
+    mock_ec2_client.get_paginator.assert_called_once_with("describe_security_group_rules")
+    mock_ec2_client.revoke_security_group_ingress.assert_called_once_with(
+        GroupId="sg-1", SecurityGroupRuleIds=["sgr-1", "sgr-2"]
+    )
+    mock_ec2_client.revoke_security_group_egress.assert_called_once_with(GroupId="sg-1", SecurityGroupRuleIds=["sgr-3"])
@@ -0,0 +1,41 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_wrappers.terminate_instances`."""
+
+from unittest.mock import MagicMock, call, patch
+
+from botocore.exceptions import ClientError
+from infrahouse_core.aws import EC2Instance
+
+from infrahouse_toolkit.aws.resource_wrappers import terminate_instances
+
+
+def _instances(count: int) -> list:
+    return [EC2Instance(instance_id=f"i-{i:017x}", region="us-east-1") for i in range(count)]
+
+
+def test_terminate_instances_in_chunks() -> None:
+    """Instances are terminated up to 1000 per call."""
+    client = MagicMock()
+    instances = _instances(1500)
+    with patch("infrahouse_toolkit.aws.resource_wrappers.get_cached_client", return_value=client):
+        errors = terminate_instances(instances)
+
+    assert errors == [None] * 1500
+    assert client.terminate_instances.call_args_list == [
+        call(InstanceIds=[i.instance_id for i in instances[:1000]]),
+        call(InstanceIds=[i.instance_id for i in instances[1000:]]),
+    ]
+
+
+def test_terminate_instances_falls_back_to_one_by_one() -> None:
+    """When the batch call fails, each instance gets its own result."""
+    client = MagicMock()
+    protected = ClientError({"Error": {"Code": "OperationNotPermitted", "Message": "protected"}}, "TerminateInstances")
+    client.terminate_instances.side_effect = [protected, None, protected]
+    instances = _instances(2)
+    with patch("infrahouse_toolkit.aws.resource_wrappers.get_cached_client", return_value=client), patch.object(
+        EC2Instance, "ec2_client", client
+    ):
+        errors = terminate_instances(instances)
+
+    assert errors == [None, protected]
+    assert client.terminate_instances.call_count == 3
@@ -0,0 +1,116 @@
+"""Tests for :func:`infrahouse_toolkit.aws.resource_explorer.search_resources`."""
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from infrahouse_toolkit.aws.exceptions import IHResourceExplorerUnavailable
+from infrahouse_toolkit.aws.resource_explorer import (
+    build_query_string,
+    search_resources,
+)
+
+
+def _index(region: str, index_type: str) -> dict:
+    return {"Arn": f"arn:aws:resource-explorer-2:{region}:123456789012:index/1", "Region": region, "Type": index_type}
+
+
+def _resource(arn: str, region: str, **tags) -> dict:
+    return {
+        "Arn": arn,
+        "Region": region,
+        "Properties": [{"Name": "tags", "Data": [{"Key": k, "Value": v} for k, v in tags.items()]}],
+    }
+
+
+@pytest.fixture()
+def stubbed_client():
+    """A real resource-explorer-2 client answered by a Stubber, shared by all regions."""
+    client = boto3.client(
+        "resource-explorer-2", region_name="us-east-1", aws_access_key_id="test", aws_secret_access_key="test"
+    )
+    with Stubber(client) as stubber, patch(
+        "infrahouse_toolkit.aws.resource_explorer.get_cached_client", return_value=client
+    ):
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def test_build_query_string() -> None:
+    """The first tag filter and the regions go into the query."""
+    assert build_query_string({"key": "env", "value": "dev"}) == "tag:env=dev"
+    assert build_query_string({"key": "env"}, ["us-east-1"]) == "tag.key:env region:us-east-1 region:global"
+    assert build_query_string({"key": "team", "value": "data eng"}) == '"tag:team=data eng"'
+    assert build_query_string(None, ["us-east-1"], with_global=False) == "region:us-east-1"
+
+
+def test_search_resources(stubbed_client) -> None:
+    """One query finds resources in all regions; further tag filters apply to the returned tags."""
+    stubbed_client.add_response(
+        "list_indexes", {"Indexes": [_index("us-west-2", "LOCAL"), _index("us-east-1", "AGGREGATOR")]}
+    )
+    stubbed_client.add_response(
+        "search",
+        {
+            "Resources": [
+                _resource("arn:aws:iam::123456789012:role/r", "global", env="dev", team="a"),
+                _resource("arn:aws:sns:us-west-2:123456789012:t1", "us-west-2", env="dev", team="a"),
+                _resource("arn:aws:sns:us-west-2:123456789012:t2", "us-west-2", env="dev", team="b"),
+            ],
+            "Count": {"TotalResources": 3, "Complete": True},
+            "ViewArn": "arn:aws:resource-explorer-2:us-east-1:123456789012:view/default/1",
+        },
+        {"QueryString": "tag:env=dev"},
+    )
+
+    resources = search_resources(None, [{"key": "env", "value": "dev"}, {"key": "team", "value": "a"}])
+
+    assert resources == [
+        {"arn": "arn:aws:iam::123456789012:role/r", "tags": {"env": "dev", "team": "a"}, "region": None},
+        {"arn": "arn:aws:sns:us-west-2:123456789012:t1", "tags": {"env": "dev", "team": "a"}, "region": "us-west-2"},
+    ]
+
+
+def test_partial_result_is_split_by_region(stubbed_client) -> None:
+    """A query with more matches than one search returns is repeated region by region."""
+    view = "arn:aws:resource-explorer-2:us-east-1:123456789012:view/default/1"
+    stubbed_client.add_response("list_indexes", {"Indexes": [_index("us-east-1", "AGGREGATOR")]})
+    stubbed_client.add_response(
+        "search",
+        {"Resources": [], "Count": {"TotalResources": 1000, "Complete": False}, "ViewArn": view},
+        {"QueryString": "tag:env=dev region:us-east-1 region:global"},
+    )
+    stubbed_client.add_response(
+        "search",
+        {
+            "Resources": [_resource("arn:aws:sns:us-east-1:123456789012:t1", "us-east-1", env="dev")],
+            "Count": {"TotalResources": 1, "Complete": True},
+            "ViewArn": view,
+        },
+        {"QueryString": "tag:env=dev region:us-east-1"},
+    )
+    stubbed_client.add_response(
+        "search",
+        {"Resources": [], "Count": {"TotalResources": 0, "Complete": True}, "ViewArn": view},
+        {"QueryString": "tag:env=dev region:global"},
+    )
+
+    resources = search_resources(None, [{"key": "env", "value": "dev"}], regions=["us-east-1"])
+
+    assert [r["arn"] for r in resources] == ["arn:aws:sns:us-east-1:123456789012:t1"]
+
+
+def test_no_aggregator_index(stubbed_client) -> None:
+    """Accounts with local indexes only can't be searched across regions."""
+    stubbed_client.add_response("list_indexes", {"Indexes": [_index("us-east-1", "LOCAL")]})
+    with pytest.raises(IHResourceExplorerUnavailable):
+        search_resources(None, [{"key": "env", "value": "dev"}])
+
+
+def test_access_denied(stubbed_client) -> None:
+    """API errors make the backend unavailable rather than failing the search."""
+    stubbed_client.add_client_error("list_indexes", service_error_code="AccessDeniedException", http_status_code=403)
+    with pytest.raises(IHResourceExplorerUnavailable):
+        search_resources(None, [{"key": "env", "value": "dev"}])
@@ -0,0 +1,42 @@
+"""Tests for :class:`infrahouse_toolkit.aws.resource_inventory.TagIndex`."""
+
+import pytest
+
+from infrahouse_toolkit.aws.resource_inventory import TagIndex
+from infrahouse_toolkit.aws.tag_query import parse_tag_query
+
+RESOURCES = [
+    {"arn": "arn:a", "tags": {"service": "foo", "environment": "dev"}, "region": "us-east-1"},
+    {"arn": "arn:b", "tags": {"service": "bar", "environment": "dev"}, "region": "us-east-1"},
+    {"arn": "arn:c", "tags": {"service": "foo"}, "region": "us-east-1"},
+    {"arn": "arn:d", "tags": {}, "region": "us-east-1"},
+]
+
+
+@pytest.mark.parametrize(
+    "tag_filters, expected",
+    [
+        ([{"key": "service", "value": "foo"}], ["arn:a", "arn:c"]),
+        ([{"key": "environment"}], ["arn:a", "arn:b"]),
+        ([{"key": "environment"}, {"key": "service", "value": "foo"}], ["arn:a"]),
+        ([{"key": "service", "value": "baz"}], []),
+        ([{"key": "missing"}, {"key": "service"}], []),
+        ([], ["arn:a", "arn:b", "arn:c", "arn:d"]),
+    ],
+)
+def test_match(tag_filters, expected) -> None:
+    """AND and key-only filters are answered from the index in discovery order."""
+    assert [r["arn"] for r in TagIndex(RESOURCES).match(tag_filters)] == expected
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("service in (foo, bar) and environment", ["arn:a", "arn:b"]),
+        ("service=foo and not environment=dev", ["arn:c"]),
+        ("service=b* or not service", ["arn:b", "arn:d"]),
+    ],
+)
+def test_match_tag_query(query, expected) -> None:
+    """Tag expressions use the index for their pushable part and evaluate the rest."""
+    assert [r["arn"] for r in TagIndex(RESOURCES).match(parse_tag_query(query))] == expected
@@ -0,0 +1,102 @@
+"""Tests for :class:`infrahouse_toolkit.aws.resource_inventory.TagInventory`."""
+
+import stat
+from os import stat as os_stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infrahouse_toolkit.aws.benchmarks.fake_account import FakeAccount
+from infrahouse_toolkit.aws.resource_discovery import find_resources_by_tags
+from infrahouse_toolkit.aws.resource_inventory import TagInventory
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/my-role"
+TOPIC_ARN = "arn:aws:sns:{}:123456789012:topic"
+
+
+def _regional(session, tag_filters, verify, iam_scan, regions):
+    (region,) = regions
+    return [
+        {"arn": TOPIC_ARN.format(region), "tags": {"service": "foo"}, "exists": True, "region": region},
+        {"arn": ROLE_ARN, "tags": {"service": "foo"}, "exists": True, "region": None},
+    ]
+
+
+@pytest.fixture()
+def mock_scans():
+    """Patch the unfiltered regional and IAM scans."""
+    with patch(
+        "infrahouse_toolkit.aws.resource_inventory.find_resources_by_tags", side_effect=_regional
+    ) as regional, patch(
+        "infrahouse_toolkit.aws.resource_inventory.list_iam_roles",
+        return_value=[{"arn": ROLE_ARN, "tags": {"service": "foo"}, "exists": True}],
+    ) as iam:
+        yield regional, iam
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.region_name = "us-east-1"
+    session.client.return_value.get_caller_identity.return_value = {"Account": "123456789012"}
+    return session
+
+
+def test_queries_are_answered_from_cache(tmp_path, mock_scans) -> None:
+    """Regions are scanned once; later queries, even with other filters, use the stored index."""
+    regional, iam = mock_scans
+    session = _session()
+
+    resources = TagInventory(session, cache_directory=str(tmp_path)).find(
+        [{"key": "service", "value": "foo"}], verify=False, regions=["us-east-1", "us-west-2"]
+    )
+    assert [(r["arn"], r["region"]) for r in resources] == [
+        (ROLE_ARN, None),
+        (TOPIC_ARN.format("us-east-1"), "us-east-1"),
+        (TOPIC_ARN.format("us-west-2"), "us-west-2"),
+    ]
+    assert all(r["exists"] for r in resources)
+
+    assert TagInventory(session, cache_directory=str(tmp_path)).find([{"key": "service"}], verify=False) == [
+        resources[0],
+        resources[1],
+    ]
+    assert TagInventory(session, cache_directory=str(tmp_path)).find([{"key": "other"}], verify=False) == []
+
+    assert regional.call_count == 2
+    assert iam.call_count == 1
+    assert stat.S_IMODE(os_stat(tmp_path).st_mode) == 0o700
+
+
+def test_refresh_rebuilds(tmp_path, mock_scans) -> None:
+    """refresh=True scans again even when a stored index exists."""
+    regional, _ = mock_scans
+    TagInventory(_session(), cache_directory=str(tmp_path)).find([{"key": "service"}], verify=False)
+    TagInventory(_session(), cache_directory=str(tmp_path), refresh=True).find([{"key": "service"}], verify=False)
+    assert regional.call_count == 2
+
+
+def test_verify_checks_matches(tmp_path, mock_scans) -> None:
+    """Matches from a possibly stale index are still checked for existence."""
+    with patch("infrahouse_toolkit.aws.resource_discovery._check_exists", side_effect=lambda arn, **_: "iam" in arn):
+        resources = TagInventory(_session(), cache_directory=str(tmp_path)).find(
+            [{"key": "service", "value": "foo"}], iam_scan=False
+        )
+    assert [(r["arn"], r["exists"]) for r in resources] == [
+        (TOPIC_ARN.format("us-east-1"), False),
+        (ROLE_ARN, True),
+    ]
+
+
+def test_index_of_discovered_records(tmp_path) -> None:
+    """The index is built from the records discovery returns and survives the on-disk cache."""
+    account = FakeAccount(20, roles=5)
+    session = account.session()
+    tag_filters = [{"key": "service", "value": "svc-1"}]
+    expected = sorted(r["arn"] for r in find_resources_by_tags(session, tag_filters, verify=False))
+
+    for _ in range(2):
+        resources = TagInventory(session, cache_directory=str(tmp_path)).find(tag_filters, verify=False)
+        assert sorted(r["arn"] for r in resources) == expected
+        assert all(r["tags"]["service"] == "svc-1" for r in resources)
+
+    assert account.calls[("resourcegroupstaggingapi", "GetResources")] == 2
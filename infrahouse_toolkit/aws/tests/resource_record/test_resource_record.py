@@ -0,0 +1,63 @@
+"""Tests for :mod:`infrahouse_toolkit.aws.resource_record`."""
+
+import json
+import sys
+
+import pytest
+
+from infrahouse_toolkit.aws.resource_record import ResourceRecord, TagSetTable
+
+ARN = "arn:aws:sqs:us-west-2:123456789012:foo"
+
+
+def test_record_reads_like_a_dict() -> None:
+    """A record has the keys, values and equality of the dict it replaces."""
+    record = ResourceRecord(ARN, {"service": "foo"}, True, "us-west-2")
+    expected = {"arn": ARN, "tags": {"service": "foo"}, "exists": True, "region": "us-west-2"}
+    assert record == expected
+    assert dict(record) == expected
+    assert list(record) == ["arn", "tags", "exists", "region"]
+    assert record["arn"] == ARN
+    assert record.get("account") is None
+    assert "account" not in record
+    with pytest.raises(KeyError):
+        _ = record["foo"]
+
+
+def test_record_assignment() -> None:
+    """Existing fields can be assigned, ``account`` is added first, and unknown keys are refused."""
+    record = ResourceRecord(ARN, {}, True, None)
+    record["exists"] = False
+    record["account"] = "prod"
+    assert list(record) == ["account", "arn", "tags", "exists", "region"]
+    assert record == {"account": "prod", "arn": ARN, "tags": {}, "exists": False, "region": None}
+    del record["account"]
+    assert len(record) == 4
+    with pytest.raises(KeyError):
+        record["foo"] = "bar"
+    with pytest.raises(KeyError):
+        del record["arn"]
+    with pytest.raises(AttributeError):
+        record.foo = "bar"
+
+
+def test_tag_sets_are_shared() -> None:
+    """Equal tags map to one read-only dict with interned strings."""
+    tag_sets = TagSetTable()
+    first = tag_sets.intern({"service": "foo", "environment": "dev"})
+    second = tag_sets.intern({"environment": "dev", "service": "".join(["f", "oo"])})
+    assert first is second
+    assert tag_sets.intern({"service": "bar"}) is not first
+    assert len(tag_sets) == 2
+    assert first["service"] is sys.intern("foo")
+    with pytest.raises(TypeError):
+        first["service"] = "bar"
+
+
+def test_to_dict_is_json_serializable() -> None:
+    """:meth:`ResourceRecord.to_dict` copies shared tags into a plain dict."""
+    tags = TagSetTable().intern({"service": "foo"})
+    record = ResourceRecord(ARN, tags, False, "us-west-2", account="prod")
+    plain = record.to_dict()
+    assert json.loads(json.dumps(plain)) == plain == dict(record)
+    assert type(plain["tags"]) is dict  # pylint: disable=unidiomatic-typecheck
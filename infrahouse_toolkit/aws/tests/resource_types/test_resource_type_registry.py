@@ -0,0 +1,60 @@
+"""Tests for :class:`infrahouse_toolkit.aws.resource_types.ResourceTypeRegistry`."""
+
+from unittest import mock
+
+from infrahouse_toolkit.aws.resource_types import (
+    ANY_RESOURCE_TYPE,
+    RESOURCE_TYPES,
+    ResourceTypeRegistry,
+)
+
+
+def _entry_point(name, load):
+    entry_point = mock.Mock(value=f"{name}:register")
+    entry_point.load.side_effect = load
+    return entry_point
+
+
+def test_lookup() -> None:
+    """Exact (service, type) matches win over the service-wide factory."""
+    registry = ResourceTypeRegistry(entry_point_group="infrahouse_toolkit.tests.none")
+    instance, anything = mock.Mock(), mock.Mock()
+    registry.register("ec2", "instance", instance)
+    registry.register("ec2", ANY_RESOURCE_TYPE, anything)
+
+    assert registry.lookup("ec2", "instance") is instance
+    assert registry.lookup("ec2", "volume") is anything
+    assert registry.lookup("ec2", None) is anything
+    assert registry.lookup("sns", None) is None
+    assert len(registry) == 2
+
+
+def test_entry_points_loaded_once() -> None:
+    """Plugins register their types on the first lookup and may replace built-in ones."""
+    registry = ResourceTypeRegistry()
+    registry.register("ec2", "instance", mock.Mock(name="builtin"))
+    plugin_factory = mock.Mock(name="plugin")
+
+    def _register(reg):
+        reg.register("ec2", "instance", plugin_factory)
+        reg.register("ec2", "vpc", plugin_factory)
+
+    plugins = [
+        _entry_point("broken", ImportError("no module named broken")),
+        _entry_point("good", lambda: _register),
+    ]
+    with mock.patch("infrahouse_toolkit.aws.resource_types.entry_points", return_value=plugins) as mock_entry_points:
+        assert registry.lookup("ec2", "vpc") is plugin_factory
+        assert registry.lookup("ec2", "instance") is plugin_factory
+        assert registry.lookup("ec2", "subnet") is None
+
+    mock_entry_points.assert_called_once_with(group="infrahouse_toolkit.resource_types")
+
+
+def test_builtin_types_registered() -> None:
+    """Importing resource_discovery registers the built-in resource classes."""
+    # pylint: disable=import-outside-toplevel,unused-import
+    import infrahouse_toolkit.aws.resource_discovery
+
+    assert RESOURCE_TYPES.lookup("ec2", "instance") is not None
+    assert RESOURCE_TYPES.lookup("sns", None) is not None
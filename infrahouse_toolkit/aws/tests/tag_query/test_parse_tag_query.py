@@ -0,0 +1,70 @@
+"""Tests for :func:`infrahouse_toolkit.aws.tag_query.parse_tag_query`."""
+
+import pytest
+
+from infrahouse_toolkit.aws.tag_query import (
+    And,
+    HasTag,
+    Not,
+    Or,
+    TagIn,
+    TagPrefix,
+    parse_tag_query,
+)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("service", HasTag("service")),
+        ("service=api", TagIn("service", frozenset(["api"]))),
+        ("service in (api, worker)", TagIn("service", frozenset(["api", "worker"]))),
+        ("owner=team-*", TagPrefix("owner", "team-")),
+        ('owner="team-*"', TagIn("owner", frozenset(["team-*"]))),
+        ("environment!=prod", Not(TagIn("environment", frozenset(["prod"])))),
+        ("aws:cloudformation:stack-name", HasTag("aws:cloudformation:stack-name")),
+        ("'cost center'=\"R&D 1\"", TagIn("cost center", frozenset(["R&D 1"]))),
+        (
+            "a and b or not c",
+            Or((And((HasTag("a"), HasTag("b"))), Not(HasTag("c")))),
+        ),
+        (
+            "a AND (b OR c) and d",
+            And((HasTag("a"), Or((HasTag("b"), HasTag("c"))), HasTag("d"))),
+        ),
+    ],
+)
+def test_parse(query, expected) -> None:
+    """NOT binds tighter than AND, AND tighter than OR; keywords are case-insensitive."""
+    assert parse_tag_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "service in (a, b) and not environment=prod",
+        'created_by and (environment=dev or environment="load test")',
+        "owner=ops* or not (a and b)",
+        'x="and" and y="v*"',
+    ],
+)
+def test_round_trip(query) -> None:
+    """The string form of an expression parses back to the same expression."""
+    expression = parse_tag_query(query)
+    assert parse_tag_query(str(expression)) == expression
+
+
+@pytest.mark.parametrize("query", ["", "   ", "a and", "(a", "a in b", "a=", "a b", "!a", "a in ()"])
+def test_invalid(query) -> None:
+    """Malformed queries raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_tag_query(query)
+
+
+def test_matches() -> None:
+    """Expressions evaluate on resource tags."""
+    expression = parse_tag_query("service in (api, worker) and not environment=prod and owner=team-*")
+    assert expression.matches({"service": "api", "owner": "team-a"})
+    assert not expression.matches({"service": "api", "owner": "team-a", "environment": "prod"})
+    assert not expression.matches({"service": "web", "owner": "team-a"})
+    assert not expression.matches({"service": "worker"})
@@ -0,0 +1,84 @@
+"""Tests for :func:`infrahouse_toolkit.aws.tag_query.plan_tag_query`."""
+
+import pytest
+
+from infrahouse_toolkit.aws.tag_query import (
+    MAX_TAG_FILTER_VALUES,
+    iam_tag_filter,
+    parse_tag_query,
+    plan_tag_query,
+    tag_expression,
+)
+
+
+@pytest.mark.parametrize(
+    "query, tag_filters, residual",
+    [
+        ("service=api", [{"Key": "service", "Values": ["api"]}], None),
+        (
+            "service in (a, b) and not environment=prod",
+            [{"Key": "service", "Values": ["a", "b"]}],
+            "environment!=prod",
+        ),
+        ("team=a or team=b", [{"Key": "team", "Values": ["a", "b"]}], None),
+        ("team=a or team", [{"Key": "team"}], None),
+        ("owner=ops*", [{"Key": "owner"}], "owner=ops*"),
+        (
+            "created_by and service in (a, b, c) and environment=dev",
+            [
+                {"Key": "environment", "Values": ["dev"]},
+                {"Key": "service", "Values": ["a", "b", "c"]},
+                {"Key": "created_by"},
+            ],
+            None,
+        ),
+        (
+            "(team=a and env=dev) or (team=b and env=prod)",
+            [{"Key": "env", "Values": ["dev", "prod"]}, {"Key": "team", "Values": ["a", "b"]}],
+            "team=a and env=dev or team=b and env=prod",
+        ),
+        ("team=a or owner=b", [], "team=a or owner=b"),
+        ("not team", [], "not team"),
+        ("team in (a, b) and team=b", [{"Key": "team", "Values": ["b"]}], "team in (a, b)"),
+    ],
+)
+def test_plan(query, tag_filters, residual) -> None:
+    """What every match must satisfy goes to the API, most selective first; exact parts leave the residual."""
+    plan = plan_tag_query(parse_tag_query(query))
+    assert plan.tag_filters == tag_filters
+    assert (None if plan.residual is None else str(plan.residual)) == residual
+
+
+def test_contradiction_is_not_pushed_as_empty_values() -> None:
+    """A key that can't have any value is pushed without values and left to the residual."""
+    plan = plan_tag_query(parse_tag_query("team=a and team=b"))
+    assert plan.tag_filters == [{"Key": "team"}]
+    assert not plan.residual.matches({"team": "a"})
+
+
+def test_long_value_lists_push_the_key_only() -> None:
+    """The Tagging API takes at most 20 values per key."""
+    values = ", ".join(f"v{i}" for i in range(MAX_TAG_FILTER_VALUES + 1))
+    plan = plan_tag_query(parse_tag_query(f"team in ({values})"))
+    assert plan.tag_filters == [{"Key": "team"}]
+    assert plan.residual is not None
+
+
+def test_tag_filter_dicts() -> None:
+    """AND-only filter dicts plan to the same TagFilters as before."""
+    plan = plan_tag_query(tag_expression([{"key": "service", "value": "foo"}, {"key": "created_by"}]))
+    assert plan == ([{"Key": "service", "Values": ["foo"]}, {"Key": "created_by"}], None)
+    assert plan_tag_query(None) == ([], None)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("created_by and service=api", {"key": "service", "value": "api"}),
+        ("service in (a, b)", {"key": "service"}),
+        ("not service", None),
+    ],
+)
+def test_iam_tag_filter(query, expected) -> None:
+    """The IAM scan uses a single-valued filter when there is one."""
+    assert iam_tag_filter(plan_tag_query(parse_tag_query(query))) == expected
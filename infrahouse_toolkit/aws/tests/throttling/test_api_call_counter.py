@@ -0,0 +1,66 @@
+"""Tests for :class:`infrahouse_toolkit.aws.throttling.ApiCallCounter`."""
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from infrahouse_toolkit.aws.client_registry import ClientRegistry
+from infrahouse_toolkit.aws.throttling import ApiCallStats
+
+THROTTLED = b'{"__type": "ThrottlingException", "message": "Rate exceeded"}'
+
+
+class _FakeEndpoint:
+    """Answer every HTTP request with the next (status, body) pair."""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+
+    def __call__(self, request, **kwargs):
+        status, body = self._responses.pop(0)
+        return AWSResponse(request.url, status, {}, _Raw(body))
+
+
+class _Raw:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _client(responses, max_attempts: int = 2):
+    registry = ClientRegistry(config=Config(retries={"mode": "standard", "max_attempts": max_attempts}))
+    session = boto3.Session(region_name="us-east-1", aws_access_key_id="AKIDEXAMPLE", aws_secret_access_key="secret")
+    client = registry.client("sqs", session=session)
+    client.meta.events.register("before-send", _FakeEndpoint(responses))
+    return registry, client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Skip botocore's retry delays."""
+    with patch("botocore.endpoint.time.sleep"):
+        yield
+
+
+def test_throttled_call_is_retried_and_counted() -> None:
+    """A throttled attempt is retried and shows up in the counts."""
+    registry, client = _client([(400, THROTTLED), (200, b'{"QueueUrls": []}')])
+    client.list_queues()
+    assert registry.counter.snapshot() == ApiCallStats(calls=1, retries=1, throttles=1)
+
+
+def test_exhausted_retries_raise() -> None:
+    """When every attempt is throttled the error reaches the caller and all attempts are counted."""
+    registry, client = _client([(400, THROTTLED)] * 3, max_attempts=2)
+    with pytest.raises(ClientError):
+        client.list_queues()
+    assert registry.counter.snapshot() == ApiCallStats(calls=1, retries=2, throttles=3)
+
+    registry.counter.reset()
+    assert registry.counter.snapshot() == ApiCallStats(0, 0, 0)
@@ -0,0 +1,112 @@
+"""
+API throttling helpers.
+
+Clients from :mod:`infrahouse_toolkit.aws.client_registry` use botocore's
+``adaptive`` retry mode: every client keeps a client-side token bucket
+whose rate grows while calls succeed and drops sharply when AWS answers
+with a throttling error, and throttled calls are retried with backoff.
+Since the registry shares one client per session, service and region,
+all threads calling the same API share one bucket.
+
+:class:`ApiCallCounter` counts calls, retries and throttling errors of
+those clients so commands can report them at the end of a run.
+"""
+
+from collections import namedtuple
+from threading import Lock
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+# Error codes AWS services return when a caller exceeds the API rate limit.
+THROTTLING_ERROR_CODES = {
+    "BandwidthLimitExceeded",
+    "EC2ThrottledException",
+    "PriorRequestNotComplete",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "SlowDown",
+    "Throttled",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
+
+# Retries of a call after the first attempt (botocore's ``max_attempts``
+# client setting, which doesn't count the first attempt).
+DEFAULT_MAX_RETRIES = 10
+
+ApiCallStats = namedtuple("ApiCallStats", ["calls", "retries", "throttles"])
+ApiCallStats.__doc__ = """Number of API calls, retried attempts and throttled attempts."""
+
+
+def is_throttling_error(exc: Exception) -> bool:
+    """
+    Tell whether an API call failed because the caller was throttled.
+
+    :param exc: Exception raised by a boto3 client.
+    :return: ``True`` for throttling errors.
+    """
+    return isinstance(exc, ClientError) and exc.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+class ApiCallCounter:
+    """
+    Thread-safe counter of API calls, retries and throttling errors.
+
+    :meth:`register` attaches it to a client's event system.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._calls = 0
+        self._retries = 0
+        self._throttles = 0
+
+    def register(self, client: BaseClient) -> None:
+        """
+        Count the calls of *client*.
+
+        :param client: boto3 client.
+        """
+        client.meta.events.register("needs-retry", self._on_attempt)
+        client.meta.events.register("after-call", self._on_call)
+
+    def snapshot(self) -> ApiCallStats:
+        """
+        Return the current counts.
+
+        :return: :class:`ApiCallStats`.
+        """
+        with self._lock:
+            return ApiCallStats(self._calls, self._retries, self._throttles)
+
+    def reset(self) -> None:
+        """Set all counts to zero."""
+        with self._lock:
+            self._calls = self._retries = self._throttles = 0
+
+    def _on_attempt(self, response=None, **kwargs):  # pylint: disable=unused-argument
+        """Count throttled attempts; emitted by botocore after every attempt."""
+        if response is not None and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            with self._lock:
+                self._throttles += 1
+
+    def _on_call(self, parsed=None, **kwargs):  # pylint: disable=unused-argument
+        """Count calls and their retries; emitted by botocore once per call."""
+        retries = (parsed or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0)
+        with self._lock:
+            self._calls += 1
+            self._retries += retries
+
+
+def format_api_call_stats(stats: ApiCallStats) -> str:
+    """
+    Format API call statistics for the end-of-run summary.
+
+    :param stats: Counts from :meth:`ApiCallCounter.snapshot`.
+    :return: One-line summary.
+    """
+    return f"AWS API calls: {stats.calls}, retried: {stats.retries}, throttled: {stats.throttles}."
@@ -0,0 +1,167 @@
+"""
+Cold-start benchmarks of the ``ih-*`` console scripts.
+
+Each command line is resolved in a fresh interpreter started with
+``python -X importtime``: the console script module is imported and its
+subcommands are looked up the way click does before running the last one.
+The benchmark reports the time spent importing modules, once with
+subcommands imported on demand by
+:class:`~infrahouse_toolkit.cli.lazy_group.LazyGroup` and once with every
+subcommand of the script imported, which is what the groups did before.
+Run them with::
+
+    python -m infrahouse_toolkit.cli.benchmarks
+
+or ``make benchmark-startup``.
+"""
+
+import re
+import subprocess
+import sys
+from collections import namedtuple
+from textwrap import dedent
+from typing import List, Tuple
+
+from tabulate import tabulate
+
+# Keep in sync with console_scripts in setup.py.
+CONSOLE_SCRIPTS = {
+    "ih-aws": "infrahouse_toolkit.cli.ih_aws:ih_aws",
+    "ih-certbot": "infrahouse_toolkit.cli.ih_certbot:ih_certbot",
+    "ih-ec2": "infrahouse_toolkit.cli.ih_ec2:ih_ec2",
+    "ih-elastic": "infrahouse_toolkit.cli.ih_elastic:ih_elastic",
+    "ih-github": "infrahouse_toolkit.cli.ih_github:ih_github",
+    "ih-mysql": "infrahouse_toolkit.cli.ih_mysql:ih_mysql",
+    "ih-openvpn": "infrahouse_toolkit.cli.ih_openvpn:ih_openvpn",
+    "ih-plan": "infrahouse_toolkit.cli.ih_plan:ih_plan",
+    "ih-puppet": "infrahouse_toolkit.cli.ih_puppet:ih_puppet",
+    "ih-registry": "infrahouse_toolkit.cli.ih_registry:ih_registry",
+    "ih-s3": "infrahouse_toolkit.cli.ih_s3:ih_s3",
+    "ih-s3-reprepro": "infrahouse_toolkit.cli.ih_s3_reprepro:ih_s3_reprepro",
+    "ih-secrets": "infrahouse_toolkit.cli.ih_secrets:ih_secrets",
+    "ih-skeema": "infrahouse_toolkit.cli.ih_skeema:ih_skeema",
+}
+
+# Command lines benchmarked by default: frequent, mostly cron-driven commands.
+COMMANDS = [
+    "ih-aws credentials",
+    "ih-aws resources list",
+    "ih-ec2 list",
+    "ih-elastic cluster-health",
+    "ih-github runner check-health",
+    "ih-plan publish",
+    "ih-s3 upload-logs",
+    "ih-s3-reprepro list",
+    "ih-secrets get",
+]
+
+StartupResult = namedtuple(
+    "StartupResult", ["command", "lazy_import_time", "lazy_modules", "eager_import_time", "eager_modules"]
+)
+StartupResult.__doc__ = """Import cost of one command line.
+
+``lazy_import_time`` and ``lazy_modules`` are the seconds spent importing
+and the number of modules imported to resolve the command line.
+``eager_import_time`` and ``eager_modules`` are the same with every
+subcommand of the console script imported.
+"""
+
+# Runs in a fresh interpreter: resolves a command line, or every command of a script.
+_PROBE = dedent("""
+    import sys
+    from importlib import import_module
+
+    import click
+
+    def load_all(command, ctx):
+        if isinstance(command, click.Group):
+            for name in command.list_commands(ctx):
+                subcommand = command.get_command(ctx, name)
+                load_all(subcommand, click.Context(subcommand, parent=ctx, info_name=name))
+
+    module, attribute = sys.argv[1].split(":")
+    command = getattr(import_module(module), attribute)
+    ctx = click.Context(command, info_name=attribute)
+    if sys.argv[2] == "eager":
+        load_all(command, ctx)
+    else:
+        for name in sys.argv[3:]:
+            command = command.get_command(ctx, name)
+            ctx = click.Context(command, parent=ctx, info_name=name)
+    """)
+
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|")
+
+
+def measure_imports(command_line: str, eager: bool = False, repeat: int = 3) -> Tuple[float, int]:
+    """
+    Measure the imports needed to resolve a command line in a new interpreter.
+
+    :param command_line: Console script and subcommands, e.g. ``ih-github runner check-health``.
+    :param eager: Import every subcommand of the console script instead.
+    :param repeat: Number of interpreters to start.  The fastest run is
+        reported, the others warm up the file system cache.
+    :return: Seconds spent importing and the number of imported modules.
+    :raise KeyError: If the console script is unknown.
+    """
+    return min(_measure_imports_once(command_line, eager) for _ in range(repeat))
+
+
+def _measure_imports_once(command_line: str, eager: bool) -> Tuple[float, int]:
+    script, *subcommands = command_line.split()
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE,
+            CONSOLE_SCRIPTS[script],
+            "eager" if eager else "lazy",
+            *subcommands,
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    self_times = [int(match.group(1)) for match in map(_IMPORT_TIME.match, result.stderr.splitlines()) if match]
+    return sum(self_times) / 1e6, len(self_times)
+
+
+def run_command(command_line: str, repeat: int = 3) -> StartupResult:
+    """
+    Benchmark one command line with lazy and with eager subcommand imports.
+
+    :param command_line: Console script and subcommands, e.g. ``ih-s3 upload-logs``.
+    :param repeat: See :func:`measure_imports`.
+    :return: Measurements.
+    """
+    return StartupResult(
+        command_line,
+        *measure_imports(command_line, repeat=repeat),
+        *measure_imports(command_line, eager=True, repeat=repeat),
+    )
+
+
+def format_results(results: List[StartupResult]) -> str:
+    """
+    Format benchmark results as a table.
+
+    :param results: Results of :func:`run_command`.
+    :return: Formatted string ready for printing.
+    """
+    rows = [
+        [
+            result.command,
+            f"{result.lazy_import_time * 1000:.0f}",
+            result.lazy_modules,
+            f"{result.eager_import_time * 1000:.0f}",
+            result.eager_modules,
+        ]
+        for result in results
+    ]
+    return tabulate(
+        rows,
+        headers=["Command", "Import time, ms", "Modules", "All subcommands, ms", "All subcommands, modules"],
+        tablefmt="outline",
+    )
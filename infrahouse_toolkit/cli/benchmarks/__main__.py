@@ -0,0 +1,35 @@
+"""Command line entry point of the console script cold-start benchmarks."""
+
+import click
+
+from infrahouse_toolkit.cli.benchmarks import COMMANDS, format_results, run_command
+
+
+@click.command()
+@click.option(
+    "--command",
+    "commands",
+    multiple=True,
+    help="Command line to benchmark, e.g. 'ih-github runner check-health'.  May be repeated.  "
+    "Runs a set of frequent commands by default.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Interpreters to start per measurement.  The fastest run is reported.",
+)
+def main(commands: tuple, repeat: int) -> None:
+    """
+    Benchmark the imports the ih-* console scripts need to start a command.
+    """
+    results = []
+    for command in commands or COMMANDS:
+        click.echo(f"Running {command} ...", err=True)
+        results.append(run_command(command, repeat=repeat))
+    click.echo(format_results(results))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
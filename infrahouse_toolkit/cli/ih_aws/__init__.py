@@ -11,20 +11,24 @@ from logging import getLogger
 
 import click
 from botocore.exceptions import NoRegionError
-from infrahouse_core.aws import get_aws_session
-from infrahouse_core.aws.config import AWSConfig
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_aws.cmd_autoscaling import cmd_autoscaling
-from infrahouse_toolkit.cli.ih_aws.cmd_credentials import cmd_credentials
-from infrahouse_toolkit.cli.ih_aws.cmd_ecs import cmd_ecs
-from infrahouse_toolkit.cli.ih_aws.cmd_resources import cmd_resources
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
+from infrahouse_toolkit.cli.lib import LazyChoice, aws_profiles, aws_regions
 
 AWS_DEFAULT_REGION = "us-west-1"
 LOG = getLogger(__name__)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "autoscaling": "infrahouse_toolkit.cli.ih_aws.cmd_autoscaling:cmd_autoscaling",
+        "credentials": "infrahouse_toolkit.cli.ih_aws.cmd_credentials:cmd_credentials",
+        "ecs": "infrahouse_toolkit.cli.ih_aws.cmd_ecs:cmd_ecs",
+        "resources": "infrahouse_toolkit.cli.ih_aws.cmd_resources:cmd_resources",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -42,14 +46,14 @@ LOG = getLogger(__name__)
 @click.option(
     "--aws-profile",
     help="AWS profile name for authentication.",
-    type=click.Choice(AWSConfig().profiles),
+    type=LazyChoice(aws_profiles),
     default=None,
     show_default=True,
 )
 @click.option(
     "--aws-region",
     help="AWS region to use.",
-    type=click.Choice(AWSConfig().regions),
+    type=LazyChoice(aws_regions),
     show_default=True,
     default=None,
 )
@@ -57,6 +61,10 @@ LOG = getLogger(__name__)
 @click.pass_context
 def ih_aws(ctx, **kwargs):
     """AWS helpers."""
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_core.aws import get_aws_session
+    from infrahouse_core.aws.config import AWSConfig
+
     setup_logging(debug=kwargs["debug"], quiet=not kwargs["verbose"])
     aws_profile = kwargs["aws_profile"]
     aws_region = kwargs["aws_region"]
@@ -74,13 +82,3 @@ def ih_aws(ctx, **kwargs):
         LOG.error(err)
         LOG.error("Use the --aws-region option to specify the AWS region.")
         sys.exit(1)
-
-
-for cmd in [
-    cmd_credentials,
-    cmd_ecs,
-    cmd_autoscaling,
-    cmd_resources,
-]:
-    # noinspection PyTypeChecker
-    ih_aws.add_command(cmd)
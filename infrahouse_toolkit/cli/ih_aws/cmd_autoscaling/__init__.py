@@ -10,26 +10,21 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_aws.cmd_autoscaling.cmd_complete import cmd_complete
-from infrahouse_toolkit.cli.ih_aws.cmd_autoscaling.cmd_mark_unhealthy import (
-    cmd_mark_unhealthy,
-)
-from infrahouse_toolkit.cli.ih_aws.cmd_autoscaling.cmd_scale_in import cmd_scale_in
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
-@click.group(name="autoscaling")
+@click.group(
+    name="autoscaling",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "complete": "infrahouse_toolkit.cli.ih_aws.cmd_autoscaling.cmd_complete:cmd_complete",
+        "mark-unhealthy": "infrahouse_toolkit.cli.ih_aws.cmd_autoscaling.cmd_mark_unhealthy:cmd_mark_unhealthy",
+        "scale-in": "infrahouse_toolkit.cli.ih_aws.cmd_autoscaling.cmd_scale_in:cmd_scale_in",
+    },
+)
 def cmd_autoscaling():
     """
     AWS autoscaling Commands.
     """
-
-
-for cmd in [
-    cmd_mark_unhealthy,
-    cmd_complete,
-    cmd_scale_in,
-]:
-    # noinspection PyTypeChecker
-    cmd_autoscaling.add_command(cmd)
@@ -10,22 +10,21 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_aws.cmd_ecs.cmd_wait_services_stable import (
-    cmd_wait_services_stable,
-)
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="ecs")
+@click.group(
+    name="ecs",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "wait-services-stable": (
+            "infrahouse_toolkit.cli.ih_aws.cmd_ecs.cmd_wait_services_stable:cmd_wait_services_stable"
+        ),
+    },
+)
 def cmd_ecs():
     """
     AWS ECS Commands.
     """
-
-
-for cmd in [
-    cmd_wait_services_stable,
-]:
-    # noinspection PyTypeChecker
-    cmd_ecs.add_command(cmd)
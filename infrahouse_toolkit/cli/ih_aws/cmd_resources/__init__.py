@@ -11,22 +11,20 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_delete import cmd_delete
-from infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_list import cmd_list
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="resources")
+@click.group(
+    name="resources",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "delete": "infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_delete:cmd_delete",
+        "list": "infrahouse_toolkit.cli.ih_aws.cmd_resources.cmd_list:cmd_list",
+    },
+)
 def cmd_resources() -> None:
     """
     Discover and manage AWS resources by tags.
     """
-
-
-for cmd in [
-    cmd_list,
-    cmd_delete,
-]:
-    # noinspection PyTypeChecker
-    cmd_resources.add_command(cmd)
@@ -8,15 +8,34 @@
 
 import sys
 from logging import getLogger
+from typing import List, Optional, Tuple
 
+import boto3
 import click
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+from infrahouse_core.aws.config import AWSConfig
 
+from infrahouse_toolkit.aws.client_registry import CLIENT_REGISTRY
+from infrahouse_toolkit.aws.deletion_journal import (
+    GONE,
+    DeletionJournal,
+    default_journal_path,
+)
+from infrahouse_toolkit.aws.resource_deletion import DeletionOutcome, DeletionScheduler
 from infrahouse_toolkit.aws.resource_discovery import (
+    BACKEND_TAGGING,
+    DEFAULT_VERIFY_CONCURRENCY,
+    DISCOVERY_BACKENDS,
+    ExistenceVerifier,
     find_resources_by_tags,
-    resource_for_arn,
 )
-from infrahouse_toolkit.cli.ih_aws.cmd_resources.tag_filters import build_tag_filters
+from infrahouse_toolkit.aws.throttling import format_api_call_stats
+from infrahouse_toolkit.cli.ih_aws.cmd_resources.regions import resolve_regions
+from infrahouse_toolkit.cli.ih_aws.cmd_resources.tag_filters import (
+    WHERE_HELP,
+    build_tag_query,
+)
+from infrahouse_toolkit.cli.lib import LazyChoice
 
 LOG = getLogger(__name__)
 
@@ -39,6 +58,33 @@ LOG = getLogger(__name__)
     default=None,
     help="Shorthand for --tag environment=VALUE.",
 )
+@click.option(
+    "--where",
+    "-w",
+    default=None,
+    help=WHERE_HELP,
+)
+@click.option(
+    "--region",
+    "regions",
+    multiple=True,
+    type=LazyChoice(lambda: AWSConfig().regions),
+    help="Region to search.  May be repeated; regions are searched concurrently.  Defaults to the session region.",
+)
+@click.option(
+    "--all-regions",
+    is_flag=True,
+    default=False,
+    help="Search all AWS regions concurrently.",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(DISCOVERY_BACKENDS),
+    default=BACKEND_TAGGING,
+    show_default=True,
+    help="Discovery backend.  'explorer' searches all regions with one AWS Resource Explorer query and falls back "
+    "to the Tagging API when the account has no aggregator index.",
+)
 @click.option(
     "--yes",
     "-y",
@@ -52,24 +98,94 @@ LOG = getLogger(__name__)
     default=False,
     help="Show what would be deleted without actually deleting anything.",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_VERIFY_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of parallel existence checks and deletions.  Per-service caps still apply to EC2, IAM "
+    "and other throttle-sensitive APIs.",
+)
+@click.option(
+    "--no-iam-scan",
+    is_flag=True,
+    default=False,
+    help="Skip the direct IAM role scan and rely on the Tagging API alone (faster, may miss IAM roles).",
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write the deletion journal to this file.  Defaults to a new file in ~/.infrahouse-toolkit/journals.",
+)
+@click.option(
+    "--resume",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Resume an interrupted run from its deletion journal.  Skips discovery and only re-verifies and deletes "
+    "the resources the journal still has pending or failed.",
+)
 @click.pass_context
-def cmd_delete(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
-    ctx: click.Context, tags: tuple, service: str, environment: str, yes: bool, dry_run: bool
+def cmd_delete(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    ctx: click.Context,
+    tags: tuple,
+    service: str,
+    environment: str,
+    where: Optional[str],
+    yes: bool,
+    dry_run: bool,
+    concurrency: int,
+    no_iam_scan: bool,
+    regions: tuple,
+    all_regions: bool,
+    journal_path: Optional[str],
+    resume: Optional[str],
+    backend: str,
 ) -> None:
     """
     Delete AWS resources matching the given tag filters.
 
     By default the command prompts interactively for each resource.
     Use ``--yes`` to skip prompts or ``--dry-run`` to preview without deleting.
-    """
-    tag_filters = build_tag_filters(tags, service, environment)
-    if not tag_filters:
-        raise click.UsageError("At least one tag filter is required.  Use --tag, --service, or --environment.")
 
+    Confirmed resources are deleted in dependency order (e.g. an ASG before
+    its launch template, instances before their security groups), each tier
+    in parallel.  Deletions blocked by a dependency are retried.
+
+    Progress is written to a deletion journal.  If the run is interrupted,
+    continue it with ``--resume <journal>``.
+    """
+    tag_filters = build_tag_query(tags, service, environment, where)
     aws_session = ctx.obj["aws_session"]
 
+    if resume:
+        if tag_filters is not None or regions or all_regions:
+            raise click.UsageError("--resume takes the resources from the journal; don't pass tag or region filters.")
+        if journal_path:
+            raise click.UsageError("--resume records progress in the journal it resumes; don't pass --journal.")
+        journal, confirmed = _resume(aws_session, resume, concurrency, dry_run)
+        if dry_run:
+            click.echo("Dry run — the following resources would be deleted:\n")
+            for arn in confirmed:
+                click.echo(f"  {arn}")
+            return
+        _delete(aws_session, confirmed, concurrency, journal, skipped_count=0)
+        return
+
+    if tag_filters is None:
+        raise click.UsageError("At least one tag filter is required.  Use --tag, --service, --environment or --where.")
+
     try:
-        resources = find_resources_by_tags(aws_session, tag_filters, verify=True)
+        resources = find_resources_by_tags(
+            aws_session,
+            tag_filters,
+            verify=True,
+            concurrency=concurrency,
+            iam_scan=not no_iam_scan,
+            regions=resolve_regions(regions, all_regions, ctx.obj["aws_config"]),
+            backend=backend,
+        )
     except ClientError as exc:
         LOG.error("AWS error: %s", exc)
         sys.exit(1)
@@ -90,8 +206,7 @@ def cmd_delete(  # pylint: disable=too-many-arguments,too-many-locals,too-many-b
             click.echo("")
         return
 
-    deleted_count = 0
-    failed_count = 0
+    confirmed = []
     skipped_count = 0
 
     for idx, item in enumerate(existing, 1):
@@ -110,21 +225,99 @@ def cmd_delete(  # pylint: disable=too-many-arguments,too-many-locals,too-many-b
                 click.echo("  Skipped.\n")
                 skipped_count += 1
                 continue
+        confirmed.append(arn)
+
+    journal = None
+    if confirmed:
+        journal = DeletionJournal.create(
+            journal_path or default_journal_path(),
+            confirmed,
+            tag_query=str(tag_filters),
+            regions=list(regions),
+            all_regions=all_regions,
+        )
+    _delete(aws_session, confirmed, concurrency, journal, skipped_count)
+
+
+def _resume(
+    aws_session: boto3.Session, path: str, concurrency: int, dry_run: bool
+) -> Tuple[DeletionJournal, List[str]]:
+    """
+    Open a journal and return it with its unfinished ARNs that still exist.
+
+    Resources that are already gone are recorded in the journal, unless it's a dry run.
+    """
+    try:
+        journal = DeletionJournal.open(path)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--resume") from exc
+
+    unfinished = journal.unfinished()
+    click.echo(f"Resuming {path}: {len(unfinished)} of {len(journal.states)} resource(s) left.")
+    with ExistenceVerifier(aws_session, concurrency=concurrency) as verifier:
+        futures = verifier.submit_many(unfinished)
+        existing = []
+        unchecked = []
+        for arn, future in zip(unfinished, futures):
+            try:
+                exists = future.result()
+            except (BotoCoreError, ClientError) as exc:
+                LOG.error("AWS error while checking %s: %s", arn, exc)
+                unchecked.append(arn)
+                continue
+            if exists:
+                existing.append(arn)
+            elif not dry_run:
+                journal.record(arn, GONE)
+    if unchecked:
+        click.echo(
+            f"Couldn't check {len(unchecked)} resource(s); they are still pending in the journal.  "
+            f"Fix the error and continue with: ih-aws resources delete --resume {path}"
+        )
+        sys.exit(1)
+    click.echo(f"Found {len(existing)} resource(s) to delete.\n")
+    return journal, existing
 
-        resource = resource_for_arn(arn, region=aws_session.region_name, session=aws_session)
-        if resource is None:
-            click.echo(f"  SKIPPED: no resource class available for {arn}\n")
-            skipped_count += 1
-            continue
 
-        click.echo("  Deleting ...")
+def _delete(
+    aws_session: boto3.Session,
+    confirmed: List[str],
+    concurrency: int,
+    journal: Optional[DeletionJournal],
+    skipped_count: int,
+) -> None:
+    """Delete confirmed ARNs, record their outcomes in the journal and print a summary."""
+
+    def _on_result(outcome: DeletionOutcome) -> None:
+        _echo_outcome(outcome)
+        journal.record(outcome.arn, outcome.status, outcome.message)
+
+    if confirmed:
+        click.echo(f"Deletion journal: {journal.path}")
+        click.echo(f"\nDeleting {len(confirmed)} resource(s) in dependency order ...\n")
+        scheduler = DeletionScheduler(aws_session, concurrency=concurrency, on_result=_on_result)
         try:
-            resource.delete()
-            click.echo(f"  OK: {type(resource).__name__} deleted.\n")
-            deleted_count += 1
-        except ClientError as exc:
-            error_msg = exc.response.get("Error", {}).get("Message", str(exc))
-            click.echo(f"  FAILED: {error_msg}\n")
-            failed_count += 1
-
-    click.echo(f"Done. Deleted {deleted_count}, failed {failed_count}, skipped {skipped_count}.")
+            outcomes = scheduler.run(confirmed)
+        except KeyboardInterrupt:
+            click.echo(f"\nInterrupted.  Continue with: ih-aws resources delete --resume {journal.path}")
+            sys.exit(130)
+    else:
+        outcomes = []
+
+    deleted_count = sum(1 for outcome in outcomes if outcome.status == "deleted")
+    failed_count = sum(1 for outcome in outcomes if outcome.status == "failed")
+    skipped_count += sum(1 for outcome in outcomes if outcome.status == "skipped")
+    click.echo(f"\nDone. Deleted {deleted_count}, failed {failed_count}, skipped {skipped_count}.")
+    if failed_count:
+        click.echo(f"Retry the failed deletions with: ih-aws resources delete --resume {journal.path}")
+    click.echo(format_api_call_stats(CLIENT_REGISTRY.counter.snapshot()))
+
+
+def _echo_outcome(outcome: DeletionOutcome) -> None:
+    """Print the result of one deletion."""
+    if outcome.status == "deleted":
+        click.echo(f"  OK: {outcome.resource_class} deleted: {outcome.arn}")
+    elif outcome.status == "skipped":
+        click.echo(f"  SKIPPED: no resource class available for {outcome.arn}")
+    else:
+        click.echo(f"  FAILED: {outcome.arn}: {outcome.message}")
@@ -7,21 +7,54 @@
 """
 
 import sys
+from functools import partial
 from logging import getLogger
+from typing import List, Optional
 
 import click
 from botocore.exceptions import ClientError
+from infrahouse_core.aws.config import AWSConfig
 
+from infrahouse_toolkit.aws.client_registry import CLIENT_REGISTRY
+from infrahouse_toolkit.aws.cross_account import (
+    DEFAULT_ACCOUNT_CONCURRENCY,
+    Account,
+    CrossAccountSearch,
+    accounts_from_profiles,
+    accounts_from_role_template,
+)
 from infrahouse_toolkit.aws.resource_discovery import (
+    BACKEND_TAGGING,
+    DEFAULT_VERIFY_CONCURRENCY,
+    DISCOVERY_BACKENDS,
     find_resources_by_tags,
     format_resources_arns,
     format_resources_json,
     format_resources_table,
+    iter_resources_by_tags,
+    iter_resources_csv,
+    iter_resources_ndjson,
+)
+from infrahouse_toolkit.aws.resource_inventory import (
+    DEFAULT_INVENTORY_TTL,
+    TagInventory,
 )
-from infrahouse_toolkit.cli.ih_aws.cmd_resources.tag_filters import build_tag_filters
+from infrahouse_toolkit.aws.throttling import format_api_call_stats
+from infrahouse_toolkit.cli.ih_aws.cmd_resources.regions import resolve_regions
+from infrahouse_toolkit.cli.ih_aws.cmd_resources.tag_filters import (
+    WHERE_HELP,
+    build_tag_query,
+)
+from infrahouse_toolkit.cli.lib import LazyChoice
 
 LOG = getLogger(__name__)
 
+# Output formats written line by line while discovery is still running.
+STREAMING_WRITERS = {
+    "ndjson": iter_resources_ndjson,
+    "csv": iter_resources_csv,
+}
+
 
 @click.command(name="list")
 @click.option(
@@ -41,14 +74,69 @@ LOG = getLogger(__name__)
     default=None,
     help="Shorthand for --tag environment=VALUE.",
 )
+@click.option(
+    "--where",
+    "-w",
+    default=None,
+    help=WHERE_HELP,
+)
+@click.option(
+    "--region",
+    "regions",
+    multiple=True,
+    type=LazyChoice(lambda: AWSConfig().regions),
+    help="Region to search.  May be repeated; regions are searched concurrently.  Defaults to the session region.",
+)
+@click.option(
+    "--all-regions",
+    is_flag=True,
+    default=False,
+    help="Search all AWS regions concurrently.",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(DISCOVERY_BACKENDS),
+    default=BACKEND_TAGGING,
+    show_default=True,
+    help="Discovery backend.  'explorer' searches all regions with one AWS Resource Explorer query and falls back "
+    "to the Tagging API when the account has no aggregator index.",
+)
+@click.option(
+    "--profile",
+    "profiles",
+    multiple=True,
+    type=LazyChoice(lambda: AWSConfig().profiles),
+    help="Search the account of this AWS profile.  May be repeated; accounts are searched concurrently "
+    "and every resource is reported with its account.",
+)
+@click.option(
+    "--role-template",
+    default=None,
+    help="Role to assume in every --account, with an {account_id} placeholder, "
+    "e.g. arn:aws:iam::{account_id}:role/teardown.",
+)
+@click.option(
+    "--account",
+    "account_ids",
+    multiple=True,
+    help="Account ID to search with --role-template.  May be repeated.",
+)
+@click.option(
+    "--account-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_ACCOUNT_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of accounts searched at the same time.  --concurrency bounds the existence checks "
+    "of all accounts together.",
+)
 @click.option(
     "--output",
     "-o",
     "output_format",
-    type=click.Choice(["table", "json", "arns"]),
+    type=click.Choice(["table", "json", "arns", "ndjson", "csv"]),
     default="table",
     show_default=True,
-    help="Output format.",
+    help="Output format.  ndjson and csv print resources as they are found.",
 )
 @click.option(
     "--no-verify",
@@ -56,6 +144,40 @@ LOG = getLogger(__name__)
     default=False,
     help="Skip per-resource existence checks (faster, may show stale entries).",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_VERIFY_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of parallel existence checks.  Per-service caps still apply to EC2, IAM and other "
+    "throttle-sensitive APIs.",
+)
+@click.option(
+    "--no-iam-scan",
+    is_flag=True,
+    default=False,
+    help="Skip the direct IAM role scan and rely on the Tagging API alone (faster, may miss IAM roles).",
+)
+@click.option(
+    "--inventory",
+    is_flag=True,
+    default=False,
+    help="Answer the query from a local tag inventory.  Each region is scanned once and cached "
+    "in ~/.infrahouse-toolkit for --inventory-ttl seconds.",
+)
+@click.option(
+    "--inventory-ttl",
+    type=click.IntRange(min=0),
+    default=DEFAULT_INVENTORY_TTL,
+    show_default=True,
+    help="Lifetime of the local tag inventory in seconds.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Rebuild the local tag inventory.  Implies --inventory.",
+)
 @click.option(
     "--no-tags",
     is_flag=True,
@@ -63,37 +185,134 @@ LOG = getLogger(__name__)
     help="Hide tags column in table output.",
 )
 @click.pass_context
-def cmd_list(  # pylint: disable=too-many-arguments
+def cmd_list(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
     ctx: click.Context,
     tags: tuple,
     service: str,
     environment: str,
+    where: Optional[str],
     output_format: str,
     no_verify: bool,
+    concurrency: int,
+    no_iam_scan: bool,
     no_tags: bool,
+    regions: tuple,
+    all_regions: bool,
+    inventory: bool,
+    inventory_ttl: int,
+    refresh: bool,
+    backend: str,
+    profiles: tuple,
+    role_template: str,
+    account_ids: tuple,
+    account_concurrency: int,
 ) -> None:
     """
     List AWS resources matching the given tag filters.
     """
-    tag_filters = build_tag_filters(tags, service, environment)
-    if not tag_filters:
-        raise click.UsageError("At least one tag filter is required.  Use --tag, --service, or --environment.")
+    tag_filters = build_tag_query(tags, service, environment, where)
+    if tag_filters is None:
+        raise click.UsageError("At least one tag filter is required.  Use --tag, --service, --environment or --where.")
 
     aws_session = ctx.obj["aws_session"]
+    accounts = _resolve_accounts(ctx, profiles, role_template, account_ids)
+    if accounts and (inventory or refresh):
+        raise click.UsageError("--inventory can't be combined with --profile or --role-template.")
+
+    search_regions = resolve_regions(regions, all_regions, ctx.obj["aws_config"])
+    search_kwargs = {
+        "verify": not no_verify,
+        "iam_scan": not no_iam_scan,
+        "regions": search_regions,
+    }
 
+    search = None
     try:
-        resources = find_resources_by_tags(aws_session, tag_filters, verify=not no_verify)
+        if accounts:
+            search = CrossAccountSearch(accounts, concurrency=concurrency, account_concurrency=account_concurrency)
+            if output_format in STREAMING_WRITERS:
+                resources = search.iter_resources(tag_filters, backend=backend, **search_kwargs)
+            else:
+                resources = search.find_resources(tag_filters, backend=backend, **search_kwargs)
+        elif inventory or refresh:
+            resources = TagInventory(aws_session, ttl=inventory_ttl, refresh=refresh).find(
+                tag_filters, concurrency=concurrency, **search_kwargs
+            )
+        elif output_format in STREAMING_WRITERS:
+            resources = iter_resources_by_tags(
+                aws_session, tag_filters, concurrency=concurrency, backend=backend, **search_kwargs
+            )
+        else:
+            resources = find_resources_by_tags(
+                aws_session, tag_filters, concurrency=concurrency, backend=backend, **search_kwargs
+            )
+
+        if output_format in STREAMING_WRITERS:
+            writer = STREAMING_WRITERS[output_format]
+            if search and output_format == "csv":
+                writer = partial(iter_resources_csv, show_account=True)
+            for line in writer(resources):
+                click.echo(line)
+            _exit_on_failed_accounts(search)
+            return
     except ClientError as exc:
         LOG.error("AWS error: %s", exc)
         sys.exit(1)
+    finally:
+        _log_api_call_stats()
 
     if not resources:
         click.echo("No resources found.")
-        return
-
-    if output_format == "table":
-        click.echo(format_resources_table(resources, show_tags=not no_tags))
+    elif output_format == "table":
+        click.echo(
+            format_resources_table(
+                resources,
+                show_tags=not no_tags,
+                show_region=search_regions is not None and len(search_regions) > 1,
+                show_account=search is not None,
+            )
+        )
     elif output_format == "json":
         click.echo(format_resources_json(resources))
     elif output_format == "arns":
         click.echo(format_resources_arns(resources))
+
+    _exit_on_failed_accounts(search)
+
+
+def _resolve_accounts(
+    ctx: click.Context, profiles: tuple, role_template: Optional[str], account_ids: tuple
+) -> Optional[List[Account]]:
+    """
+    Turn the ``--profile`` / ``--role-template`` / ``--account`` options into accounts to search.
+
+    :return: Accounts, or ``None`` to search only the account of the ``ih-aws`` session.
+    """
+    if profiles and (role_template or account_ids):
+        raise click.UsageError("Use either --profile or --role-template with --account, not both.")
+    if bool(role_template) != bool(account_ids):
+        raise click.UsageError("--role-template and --account must be used together.")
+    if profiles:
+        return accounts_from_profiles(ctx.obj["aws_config"], list(profiles), ctx.obj["aws_region"])
+    if role_template:
+        try:
+            return accounts_from_role_template(ctx.obj["aws_session"], role_template, list(account_ids))
+        except ValueError as err:
+            raise click.BadParameter(str(err), param_hint="--role-template") from err
+    return None
+
+
+def _exit_on_failed_accounts(search: Optional[CrossAccountSearch]) -> None:
+    """Exit with an error when the search failed in some accounts; their errors are logged already."""
+    if search and search.failed:
+        LOG.error("Search failed in %d account(s): %s", len(search.failed), ", ".join(search.failed))
+        sys.exit(1)
+
+
+def _log_api_call_stats() -> None:
+    """Log API call counts to stderr; as a warning when AWS throttled the search."""
+    stats = CLIENT_REGISTRY.counter.snapshot()
+    if stats.throttles:
+        LOG.warning(format_api_call_stats(stats))
+    else:
+        LOG.info(format_api_call_stats(stats))
@@ -0,0 +1,21 @@
+"""Shared region helpers for ``ih-aws resources`` subcommands."""
+
+from typing import List, Optional
+
+from infrahouse_core.aws.config import AWSConfig
+
+
+def resolve_regions(regions: tuple, all_regions: bool, aws_config: AWSConfig) -> Optional[List[str]]:
+    """
+    Turn the ``--region`` / ``--all-regions`` options into a list of regions to search.
+
+    :param regions: Tuple of region names from repeated ``--region`` options.
+    :param all_regions: Value of the ``--all-regions`` flag.
+    :param aws_config: AWS configuration; its ``regions`` list is used for ``--all-regions``.
+    :return: List of regions, or ``None`` to search only the session region.
+    """
+    if all_regions:
+        return list(aws_config.regions)
+    if regions:
+        return list(dict.fromkeys(regions))
+    return None
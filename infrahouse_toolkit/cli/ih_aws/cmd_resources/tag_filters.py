@@ -1,6 +1,21 @@
 """Shared tag filter helpers for ``ih-aws resources`` subcommands."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import click
+
+from infrahouse_toolkit.aws.tag_query import (
+    TagExpression,
+    conjunction,
+    parse_tag_query,
+    tag_expression,
+)
+
+WHERE_HELP = (
+    "Tag query with and/or/not, value lists and prefixes, "
+    'e.g. "service in (api, worker) and not environment=prod" or "owner=team-*".  '
+    "Combined with the other tag filters using AND logic."
+)
 
 
 def build_tag_filters(tags: tuple, service: str, environment: str) -> List[Dict]:
@@ -30,3 +45,21 @@ def build_tag_filters(tags: tuple, service: str, environment: str) -> List[Dict]
         tag_filters.append({"key": "environment", "value": environment})
 
     return tag_filters
+
+
+def build_tag_query(tags: tuple, service: str, environment: str, where: Optional[str]) -> Optional[TagExpression]:
+    """
+    Build a tag expression from the tag filter options and ``--where``.
+
+    :param tags: Tuple of ``key=value`` or ``key`` strings from ``--tag`` options.
+    :param service: Shorthand value for ``--service`` option.
+    :param environment: Shorthand value for ``--environment`` option.
+    :param where: Tag query from the ``--where`` option.
+    :return: Expression of all filters combined with AND logic, or ``None`` when there are none.
+    :raise click.BadParameter: If *where* is not a valid tag query.
+    """
+    try:
+        where_expression = parse_tag_query(where) if where else None
+    except ValueError as err:
+        raise click.BadParameter(str(err), param_hint="--where") from err
+    return conjunction(tag_expression(build_tag_filters(tags, service, environment)), where_expression)
@@ -11,23 +11,27 @@ from logging import getLogger
 
 import click
 from botocore.exceptions import NoRegionError
-from infrahouse_core.aws import get_aws_client, get_aws_session
-from infrahouse_core.aws.config import AWSConfig
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_ec2.cmd_instance_types import cmd_instance_types
-from infrahouse_toolkit.cli.ih_ec2.cmd_launch import cmd_launch
-from infrahouse_toolkit.cli.ih_ec2.cmd_launch_templates import cmd_launch_templates
-from infrahouse_toolkit.cli.ih_ec2.cmd_list import cmd_list
-from infrahouse_toolkit.cli.ih_ec2.cmd_subnets import cmd_subnets
-from infrahouse_toolkit.cli.ih_ec2.cmd_tags import cmd_tags
-from infrahouse_toolkit.cli.ih_ec2.cmd_terminate import cmd_terminate
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
+from infrahouse_toolkit.cli.lib import LazyChoice, aws_profiles, aws_regions
 
 AWS_DEFAULT_REGION = "us-west-1"
 LOG = getLogger(__name__)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "instance-types": "infrahouse_toolkit.cli.ih_ec2.cmd_instance_types:cmd_instance_types",
+        "launch": "infrahouse_toolkit.cli.ih_ec2.cmd_launch:cmd_launch",
+        "launch-templates": "infrahouse_toolkit.cli.ih_ec2.cmd_launch_templates:cmd_launch_templates",
+        "list": "infrahouse_toolkit.cli.ih_ec2.cmd_list:cmd_list",
+        "subnets": "infrahouse_toolkit.cli.ih_ec2.cmd_subnets:cmd_subnets",
+        "tags": "infrahouse_toolkit.cli.ih_ec2.cmd_tags:cmd_tags",
+        "terminate": "infrahouse_toolkit.cli.ih_ec2.cmd_terminate:cmd_terminate",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -38,14 +42,14 @@ LOG = getLogger(__name__)
 @click.option(
     "--aws-profile",
     help="AWS profile name for authentication.",
-    type=click.Choice(AWSConfig().profiles),
+    type=LazyChoice(aws_profiles),
     default=None,
     show_default=True,
 )
 @click.option(
     "--aws-region",
     help="AWS region to use.",
-    type=click.Choice(AWSConfig().regions),
+    type=LazyChoice(aws_regions),
     show_default=True,
     default=None,
 )
@@ -53,6 +57,10 @@ LOG = getLogger(__name__)
 @click.pass_context
 def ih_ec2(ctx, **kwargs):
     """AWS EC2 helpers."""
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_core.aws import get_aws_client, get_aws_session
+    from infrahouse_core.aws.config import AWSConfig
+
     if kwargs["debug"]:
         setup_logging(debug=kwargs["debug"])
 
@@ -71,8 +79,3 @@ def ih_ec2(ctx, **kwargs):
         LOG.error(err)
         LOG.error("Use the --aws-region option to specify the AWS region.")
         sys.exit(1)
-
-
-for cmd in [cmd_launch, cmd_list, cmd_instance_types, cmd_terminate, cmd_subnets, cmd_launch_templates, cmd_tags]:
-    # noinspection PyTypeChecker
-    ih_ec2.add_command(cmd)
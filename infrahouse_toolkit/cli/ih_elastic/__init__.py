@@ -10,19 +10,10 @@ import socket
 import sys
 from logging import getLogger
 
-import boto3
 import click
-from elasticsearch import Elasticsearch
 from infrahouse_core.logging import setup_logging
-from requests.auth import HTTPBasicAuth
 
-from infrahouse_toolkit.cli.ih_elastic.cmd_api import cmd_api
-from infrahouse_toolkit.cli.ih_elastic.cmd_cat import cmd_cat
-from infrahouse_toolkit.cli.ih_elastic.cmd_cluster import cmd_cluster
-from infrahouse_toolkit.cli.ih_elastic.cmd_cluster_health import cmd_cluster_health
-from infrahouse_toolkit.cli.ih_elastic.cmd_passwd import cmd_passwd
-from infrahouse_toolkit.cli.ih_elastic.cmd_security import cmd_security
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots import cmd_snapshots
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 from infrahouse_toolkit.cli.lib import get_elastic_password
 
 LOG = getLogger()
@@ -30,6 +21,16 @@ LOG = getLogger()
 
 @click.group(
     "ih-elastic",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "api": "infrahouse_toolkit.cli.ih_elastic.cmd_api:cmd_api",
+        "cat": "infrahouse_toolkit.cli.ih_elastic.cmd_cat:cmd_cat",
+        "cluster": "infrahouse_toolkit.cli.ih_elastic.cmd_cluster:cmd_cluster",
+        "cluster-health": "infrahouse_toolkit.cli.ih_elastic.cmd_cluster_health:cmd_cluster_health",
+        "passwd": "infrahouse_toolkit.cli.ih_elastic.cmd_passwd:cmd_passwd",
+        "security": "infrahouse_toolkit.cli.ih_elastic.cmd_security:cmd_security",
+        "snapshots": "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots:cmd_snapshots",
+    },
 )
 @click.option(
     "--debug",
@@ -62,7 +63,11 @@ LOG = getLogger()
 )
 @click.option("--es-protocol", help="Elasticsearch protocol", default="http", show_default=True)
 @click.option(
-    "--es-host", help="Elasticsearch host", default=socket.gethostbyname(socket.gethostname()), show_default=True
+    "--es-host",
+    help="Elasticsearch host",
+    # A callable default resolves the local address only when --es-host isn't given.
+    default=lambda: socket.gethostbyname(socket.gethostname()),
+    show_default="IP address of this host",
 )
 @click.option("--es-port", help="Elasticsearch port", default=9200, show_default=True)
 @click.option("--format", help="Output format", type=click.Choice(["text", "json", "cbor", "yaml", "smile"]))
@@ -75,6 +80,11 @@ def ih_elastic(ctx, **kwargs):  # pylint: disable=unused-argument
     """
     Elasticsearch helper.
     """
+    # pylint: disable=import-outside-toplevel
+    import boto3
+    from elasticsearch import Elasticsearch
+    from requests.auth import HTTPBasicAuth
+
     setup_logging(debug=kwargs["debug"], quiet=kwargs["quiet"])
     client = boto3.client("secretsmanager")
     password = kwargs["password"]
@@ -103,8 +113,3 @@ def ih_elastic(ctx, **kwargs):  # pylint: disable=unused-argument
         "es": Elasticsearch(url, basic_auth=(kwargs["username"], password), request_timeout=kwargs["request_timeout"]),
         "format": kwargs["format"],
     }
-
-
-for cmd in [cmd_passwd, cmd_cluster_health, cmd_snapshots, cmd_cat, cmd_cluster, cmd_security, cmd_api]:
-    # noinspection PyTypeChecker
-    ih_elastic.add_command(cmd)
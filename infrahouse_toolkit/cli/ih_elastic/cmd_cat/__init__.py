@@ -10,21 +10,22 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_nodes import cmd_nodes
-from infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_repositories import cmd_repositories
-from infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_shards import cmd_shards
-from infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_snapshots import cmd_snapshots
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="cat")
+@click.group(
+    name="cat",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "nodes": "infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_nodes:cmd_nodes",
+        "repositories": "infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_repositories:cmd_repositories",
+        "shards": "infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_shards:cmd_shards",
+        "snapshots": "infrahouse_toolkit.cli.ih_elastic.cmd_cat.cmd_snapshots:cmd_snapshots",
+    },
+)
 def cmd_cat():
     """
     Compact and aligned text (CAT) APIs.
     """
-
-
-for cmd in [cmd_repositories, cmd_snapshots, cmd_shards, cmd_nodes]:
-    # noinspection PyTypeChecker
-    cmd_cat.add_command(cmd)
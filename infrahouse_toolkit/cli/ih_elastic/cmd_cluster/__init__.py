@@ -10,26 +10,23 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_elastic.cmd_cluster.cmd_allocation_explain import (
-    cmd_allocation_explain,
-)
-from infrahouse_toolkit.cli.ih_elastic.cmd_cluster.cmd_commision_node import (
-    cmd_commission_node,
-)
-from infrahouse_toolkit.cli.ih_elastic.cmd_cluster.cmd_decommision_node import (
-    cmd_decommission_node,
-)
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="cluster")
+@click.group(
+    name="cluster",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "allocation-explain": (
+            "infrahouse_toolkit.cli.ih_elastic.cmd_cluster.cmd_allocation_explain:cmd_allocation_explain"
+        ),
+        "commission-node": "infrahouse_toolkit.cli.ih_elastic.cmd_cluster.cmd_commision_node:cmd_commission_node",
+        "decommission-node": "infrahouse_toolkit.cli.ih_elastic.cmd_cluster.cmd_decommision_node:cmd_decommission_node",
+    },
+)
 def cmd_cluster():
     """
     Cluster level operations.
     """
-
-
-for cmd in [cmd_allocation_explain, cmd_decommission_node, cmd_commission_node]:
-    # noinspection PyTypeChecker
-    cmd_cluster.add_command(cmd)
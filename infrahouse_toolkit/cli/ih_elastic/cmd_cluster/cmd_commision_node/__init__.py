@@ -8,6 +8,7 @@
 
 import json
 import sys
+from contextlib import nullcontext
 from logging import getLogger
 from time import sleep
 
@@ -17,6 +18,8 @@ from elasticsearch.client import ClusterClient
 from infrahouse_core.aws.asg import ASG
 from infrahouse_core.aws.asg_instance import ASGInstance
 
+from infrahouse_toolkit.aws.instance_metadata import get_instance_metadata
+from infrahouse_toolkit.aws.lifecycle_heartbeat import LifecycleHeartbeat
 from infrahouse_toolkit.timeout import timeout
 
 LOG = getLogger()
@@ -34,11 +37,14 @@ def wait_until_complete(client: ClusterClient, hook_name: str = None, wait_time:
     :type hook_name: str
     :raise TimeoutError: if after ``wait_time``, Elasticsearch hasn't moved all shards from the node.
     """
-    local_instance = ASGInstance()
+    local_instance = ASGInstance(instance_id=get_instance_metadata().instance_id)
     asg = ASG(asg_name=local_instance.asg_name)
     if wait_time:
         try:
-            with timeout(wait_time):
+            heartbeat = (
+                LifecycleHeartbeat(hook_name, instance_id=local_instance.instance_id) if hook_name else nullcontext()
+            )
+            with timeout(wait_time), heartbeat:
                 while True:
                     health = client.health()
                     LOG.info(
@@ -48,10 +54,6 @@ def wait_until_complete(client: ClusterClient, hook_name: str = None, wait_time:
                     if health.body["relocating_shards"] == 0:
                         break
 
-                    if hook_name and local_instance.lifecycle_state == "Pending:Wait":
-                        LOG.debug("Extend lifecycle hook %s", hook_name)
-                        asg.record_lifecycle_action_heartbeat(hook_name=hook_name)
-
                     sleep(3)
         except TimeoutError as err:
             if hook_name:
@@ -69,7 +71,7 @@ def complete_lifecycle_action(hook_name, result="CONTINUE"):
     Completes the lifecycle hook.
     If it fails, cancel all instance refreshes in the autoscaling group.
     """
-    asg = ASG(asg_name=ASGInstance().asg_name)
+    asg = ASG(asg_name=ASGInstance(instance_id=get_instance_metadata().instance_id).asg_name)
     try:
         asg.complete_lifecycle_action(hook_name=hook_name, result=result)
 
@@ -17,6 +17,8 @@ from elasticsearch.client import ClusterClient, NodesClient, ShutdownClient
 from infrahouse_core.aws.asg import ASG
 from infrahouse_core.aws.asg_instance import ASGInstance
 
+from infrahouse_toolkit.aws.instance_metadata import get_instance_metadata
+from infrahouse_toolkit.aws.lifecycle_heartbeat import LifecycleHeartbeat
 from infrahouse_toolkit.lock.exceptions import LockAcquireError
 from infrahouse_toolkit.lock.system import SystemLock
 from infrahouse_toolkit.timeout import timeout
@@ -43,20 +45,16 @@ def wait_until_complete(client: ShutdownClient, node_id: str, wait_time: int = 3
     :type hook_name: str
     :raise TimeoutError: if after ``wait_time``, Elasticsearch hasn't moved all shards from the node.
     """
-    local_instance = ASGInstance()
+    local_instance = ASGInstance(instance_id=get_instance_metadata().instance_id)
     asg = ASG(asg_name=local_instance.asg_name)
     if wait_time:
         try:
-            with timeout(wait_time):
+            with timeout(wait_time), LifecycleHeartbeat(hook_name, instance_id=local_instance.instance_id):
                 while client.get_node(node_id=node_id).raw["nodes"][0]["status"] != "COMPLETE":
                     LOG.info(
                         "Current shutdown state:\n %s",
                         json.dumps(client.get_node(node_id=node_id).raw, indent=4),
                     )
-                    if local_instance.lifecycle_state == "Terminating:Wait":
-                        LOG.debug("Extend lifecycle hook %s", hook_name)
-                        asg.record_lifecycle_action_heartbeat(hook_name=hook_name)
-
                     sleep(3)
         except TimeoutError as err:
             LOG.error(err)
@@ -72,7 +70,7 @@ def complete_lifecycle_action():
     Completes the ``terminating`` lifecycle hook.
     If it fails, cancel all instance refreshes in the autoscaling group.
     """
-    asg = ASG(asg_name=ASGInstance().asg_name)
+    asg = ASG(asg_name=ASGInstance(instance_id=get_instance_metadata().instance_id).asg_name)
     try:
         asg.complete_lifecycle_action()
     except ClientError as err:
@@ -126,13 +124,15 @@ def cmd_decommission_node(ctx, **kwargs):
     if health.body["status"] != "green":
         LOG.info("The cluster status is %s - not green and, therefore, aborting.", health.body["status"])
         if kwargs["complete_lifecycle_action"]:
-            ASG(asg_name=ASGInstance().asg_name).cancel_instance_refresh()
+            ASG(
+                asg_name=ASGInstance(instance_id=get_instance_metadata().instance_id).asg_name
+            ).cancel_instance_refresh()
         sys.exit(1)
 
     node_id = list(NodesClient(ctx.obj["es"]).info(node_id="_local")["nodes"].keys())[0]
 
     only_if_terminating = kwargs["only_if_terminating"]
-    local_instance = ASGInstance()
+    local_instance = ASGInstance(instance_id=get_instance_metadata().instance_id)
     shutdown_client = ShutdownClient(ctx.obj["es"])
 
     LOG.info("Current shutdown state:\n %s", json.dumps(shutdown_client.get_node(node_id=node_id).raw, indent=4))
@@ -10,18 +10,19 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key import cmd_api_key
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="security")
+@click.group(
+    name="security",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "api-key": "infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key:cmd_api_key",
+    },
+)
 def cmd_security():
     """
     Security APIs.
     """
-
-
-for cmd in [cmd_api_key]:
-    # noinspection PyTypeChecker
-    cmd_security.add_command(cmd)
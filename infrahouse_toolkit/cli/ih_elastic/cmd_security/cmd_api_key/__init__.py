@@ -10,24 +10,21 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key.cmd_create import (
-    cmd_create,
-)
-from infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key.cmd_delete import (
-    cmd_delete,
-)
-from infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key.cmd_list import cmd_list
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="api-key")
+@click.group(
+    name="api-key",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key.cmd_create:cmd_create",
+        "delete": "infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key.cmd_delete:cmd_delete",
+        "list": "infrahouse_toolkit.cli.ih_elastic.cmd_security.cmd_api_key.cmd_list:cmd_list",
+    },
+)
 def cmd_api_key():
     """
     Work with API keys.
     """
-
-
-for cmd in [cmd_list, cmd_create, cmd_delete]:
-    # noinspection PyTypeChecker
-    cmd_api_key.add_command(cmd)
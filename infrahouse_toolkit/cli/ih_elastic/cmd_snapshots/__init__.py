@@ -10,27 +10,28 @@ from logging import getLogger
 
 import click
 
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_create import cmd_create
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_create_repository import (
-    cmd_create_repository,
-)
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_delete_repository import (
-    cmd_delete_repository,
-)
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_policy import cmd_policy
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_restore import cmd_restore
-from infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_status import cmd_status
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger(__name__)
 
 
-@click.group(name="snapshots")
+@click.group(
+    name="snapshots",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_create:cmd_create",
+        "create-repository": (
+            "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_create_repository:cmd_create_repository"
+        ),
+        "delete-repository": (
+            "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_delete_repository:cmd_delete_repository"
+        ),
+        "policy": "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_policy:cmd_policy",
+        "restore": "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_restore:cmd_restore",
+        "status": "infrahouse_toolkit.cli.ih_elastic.cmd_snapshots.cmd_status:cmd_status",
+    },
+)
 def cmd_snapshots():
     """
     Work with snapshots.
     """
-
-
-for cmd in [cmd_status, cmd_create_repository, cmd_delete_repository, cmd_create, cmd_restore, cmd_policy]:
-    # noinspection PyTypeChecker
-    cmd_snapshots.add_command(cmd)
@@ -11,16 +11,20 @@ from logging import getLogger
 import click
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_github.cmd_backup import cmd_backup
-from infrahouse_toolkit.cli.ih_github.cmd_run import cmd_run
-from infrahouse_toolkit.cli.ih_github.cmd_runner import cmd_runner
-from infrahouse_toolkit.cli.ih_github.cmd_scan import cmd_scan
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
 @click.group(
     "ih-github",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "backup": "infrahouse_toolkit.cli.ih_github.cmd_backup:cmd_backup",
+        "run": "infrahouse_toolkit.cli.ih_github.cmd_run:cmd_run",
+        "runner": "infrahouse_toolkit.cli.ih_github.cmd_runner:cmd_runner",
+        "scan": "infrahouse_toolkit.cli.ih_github.cmd_scan:cmd_scan",
+    },
 )
 @click.option(
     "--debug",
@@ -37,8 +41,3 @@ def ih_github(ctx, **kwargs):  # pylint: disable=unused-argument
     """
     ctx.obj = {"debug": kwargs["debug"]}
     setup_logging(debug=kwargs["debug"])
-
-
-for cmd in [cmd_run, cmd_runner, cmd_backup, cmd_scan]:
-    # noinspection PyTypeChecker
-    ih_github.add_command(cmd)
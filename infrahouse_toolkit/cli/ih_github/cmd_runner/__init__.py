@@ -8,26 +8,24 @@
 
 import logging
 
-import boto3
 import click
 
-from infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_check_health import (
-    cmd_check_health,
-)
-from infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_deregister import cmd_deregister
-from infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_download import cmd_download
-from infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_is_registered import (
-    cmd_is_registered,
-)
-from infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_list import cmd_list
-from infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_register import cmd_register
-from infrahouse_toolkit.cli.ih_secrets.cmd_get import get_secret
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = logging.getLogger()
 
 
 @click.group(
     name="runner",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "check-health": "infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_check_health:cmd_check_health",
+        "deregister": "infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_deregister:cmd_deregister",
+        "download": "infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_download:cmd_download",
+        "is-registered": "infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_is_registered:cmd_is_registered",
+        "list": "infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_list:cmd_list",
+        "register": "infrahouse_toolkit.cli.ih_github.cmd_runner.cmd_register:cmd_register",
+    },
 )
 @click.option("--github-token", help="Personal access token for GitHub.", envvar="GITHUB_TOKEN", show_default=True)
 @click.option("--github-token-secret", help="Read GitHub token from AWS secret.")
@@ -46,6 +44,11 @@ def cmd_runner(ctx, *args, **kwargs):
     LOG.debug("args = %s", args)
     LOG.debug("kwargs = %s", kwargs)
     if kwargs["github_token_secret"]:
+        # pylint: disable=import-outside-toplevel
+        import boto3
+
+        from infrahouse_toolkit.cli.ih_secrets.cmd_get import get_secret
+
         github_token = get_secret(boto3.client("secretsmanager"), kwargs["github_token_secret"])
     else:
         github_token = kwargs["github_token"]
@@ -55,8 +58,3 @@ def cmd_runner(ctx, *args, **kwargs):
         "org": kwargs["org"],
         "registration_token_secret": kwargs["registration_token_secret"],
     }
-
-
-for cmd in [cmd_list, cmd_register, cmd_deregister, cmd_is_registered, cmd_download, cmd_check_health]:
-    # noinspection PyTypeChecker
-    cmd_runner.add_command(cmd)
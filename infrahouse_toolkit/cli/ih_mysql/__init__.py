@@ -12,14 +12,19 @@ from logging import getLogger
 import click
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.aws.config import AWSConfig
-from infrahouse_toolkit.cli.ih_mysql.cmd_bootstrap import cmd_bootstrap
-from infrahouse_toolkit.cli.ih_mysql.cmd_failover import cmd_failover
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
+from infrahouse_toolkit.cli.lib import LazyChoice, aws_profiles, aws_regions
 
 LOG = getLogger(__name__)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "bootstrap": "infrahouse_toolkit.cli.ih_mysql.cmd_bootstrap:cmd_bootstrap",
+        "failover": "infrahouse_toolkit.cli.ih_mysql.cmd_failover:cmd_failover",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -37,14 +42,14 @@ LOG = getLogger(__name__)
 @click.option(
     "--aws-profile",
     help="AWS profile name for authentication.",
-    type=click.Choice(AWSConfig().profiles),
+    type=LazyChoice(aws_profiles),
     default=None,
     show_default=True,
 )
 @click.option(
     "--aws-region",
     help="AWS region to use.",
-    type=click.Choice(AWSConfig().regions),
+    type=LazyChoice(aws_regions),
     show_default=True,
     default=None,
 )
@@ -59,9 +64,3 @@ def ih_mysql(ctx, **kwargs):
         "aws_profile": kwargs["aws_profile"],
         "aws_region": kwargs["aws_region"],
     }
-
-
-# noinspection PyTypeChecker
-ih_mysql.add_command(cmd_bootstrap)
-# noinspection PyTypeChecker
-ih_mysql.add_command(cmd_failover)
@@ -36,9 +36,22 @@ LOG = getLogger(__name__)
 )
 @click.option("--read-tg-arn", default=None, help="ARN of the read target group. All nodes will be registered.")
 @click.option("--write-tg-arn", default=None, help="ARN of the write target group. Only master will be registered.")
+@click.option(
+    "--lifecycle-hook",
+    default=None,
+    help="Launch lifecycle hook to extend while bootstrapping, so it doesn't expire. The hook isn't completed.",
+)
 @click.pass_context
 def cmd_bootstrap(
-    ctx, cluster_id, dynamodb_table, credentials_secret, vpc_cidr, bootstrap_marker, read_tg_arn, write_tg_arn
+    ctx,
+    cluster_id,
+    dynamodb_table,
+    credentials_secret,
+    vpc_cidr,
+    bootstrap_marker,
+    read_tg_arn,
+    write_tg_arn,
+    lifecycle_hook,
 ):  # pylint: disable=too-many-arguments
     """
     Bootstrap Percona server as master or replica.
@@ -73,7 +86,7 @@ def cmd_bootstrap(
     )
 
     try:
-        replica_set.bootstrap()
+        replica_set.bootstrap(lifecycle_hook=lifecycle_hook)
     except MySQLBootstrapError as err:
         LOG.error("%s", err)
         sys.exit(1)
@@ -14,18 +14,20 @@ import click
 from infrahouse_core.logging import setup_logging
 
 from infrahouse_toolkit import DEFAULT_ENCODING
-from infrahouse_toolkit.cli.ih_openvpn.cmd_list import cmd_list_clients
-from infrahouse_toolkit.cli.ih_openvpn.cmd_revoke import cmd_revoke_client
-from infrahouse_toolkit.cli.ih_openvpn.cmd_sync_google_users import (
-    cmd_sync_google_users,
-)
 from infrahouse_toolkit.cli.ih_openvpn.lib import DEFAULT_CONFIG_DIR
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
 @click.group(
     "ih-openvpn",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "list-clients": "infrahouse_toolkit.cli.ih_openvpn.cmd_list:cmd_list_clients",
+        "revoke-client": "infrahouse_toolkit.cli.ih_openvpn.cmd_revoke:cmd_revoke_client",
+        "sync-google-users": "infrahouse_toolkit.cli.ih_openvpn.cmd_sync_google_users:cmd_sync_google_users",
+    },
 )
 @click.option(
     "--debug",
@@ -67,8 +69,3 @@ def ih_openvpn(ctx, **kwargs):  # pylint: disable=unused-argument
         LOG.error("easyrsa executable not found: %s", err)
         LOG.error("Please install openvpn first or specify the easyrsa executable via --easyrsa-path.")
         sys.exit(1)
-
-
-for cmd in [cmd_list_clients, cmd_revoke_client, cmd_sync_google_users]:
-    # noinspection PyTypeChecker
-    ih_openvpn.add_command(cmd)
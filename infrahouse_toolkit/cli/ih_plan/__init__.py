@@ -9,15 +9,20 @@
 
 import click
 
-from infrahouse_toolkit.cli.ih_plan.cmd_download import cmd_download
-from infrahouse_toolkit.cli.ih_plan.cmd_min_permissions import cmd_min_permissions
-from infrahouse_toolkit.cli.ih_plan.cmd_publish import cmd_publish
-from infrahouse_toolkit.cli.ih_plan.cmd_remove import cmd_remove
-from infrahouse_toolkit.cli.ih_plan.cmd_upload import cmd_upload
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 from infrahouse_toolkit.cli.lib import DEFAULT_TF_BACKEND_FILE
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "download": "infrahouse_toolkit.cli.ih_plan.cmd_download:cmd_download",
+        "min-permissions": "infrahouse_toolkit.cli.ih_plan.cmd_min_permissions:cmd_min_permissions",
+        "publish": "infrahouse_toolkit.cli.ih_plan.cmd_publish:cmd_publish",
+        "remove": "infrahouse_toolkit.cli.ih_plan.cmd_remove:cmd_remove",
+        "upload": "infrahouse_toolkit.cli.ih_plan.cmd_upload:cmd_upload",
+    },
+)
 @click.option(
     "--bucket",
     help="AWS S3 bucket name to upload/download the plan. "
@@ -41,8 +46,3 @@ from infrahouse_toolkit.cli.lib import DEFAULT_TF_BACKEND_FILE
 def ih_plan(ctx, bucket, aws_assume_role_arn, tf_backend_file):
     """Terraform plan helpers."""
     ctx.obj = {"aws_assume_role_arn": aws_assume_role_arn, "bucket": bucket, "tf_backend_file": tf_backend_file}
-
-
-for cmd in [cmd_upload, cmd_download, cmd_remove, cmd_publish, cmd_min_permissions]:
-    # noinspection PyTypeChecker
-    ih_plan.add_command(cmd)
@@ -11,12 +11,17 @@ from logging import getLogger
 import click
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_puppet.cmd_apply import cmd_apply
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "apply": "infrahouse_toolkit.cli.ih_puppet.cmd_apply:cmd_apply",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -90,8 +95,3 @@ def ih_puppet(ctx, **kwargs):
         ),
         "cancel_instance_refresh_on_error": kwargs["cancel_instance_refresh_on_error"],
     }
-
-
-for cmd in [cmd_apply]:
-    # noinspection PyTypeChecker
-    ih_puppet.add_command(cmd)
@@ -11,12 +11,17 @@ from logging import getLogger
 import click
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_registry.cmd_upload import cmd_upload
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "upload": "infrahouse_toolkit.cli.ih_registry.cmd_upload:cmd_upload",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -30,8 +35,3 @@ def ih_registry(ctx, **kwargs):
     """InfraHouse Terraform Registry helpers."""
     setup_logging(debug=kwargs["debug"])
     ctx.obj = {"debug": kwargs["debug"]}
-
-
-for cmd in [cmd_upload]:
-    # noinspection PyTypeChecker
-    ih_registry.add_command(cmd)
@@ -11,16 +11,21 @@ from logging import getLogger
 
 import click
 from botocore.exceptions import NoRegionError
-from infrahouse_core.aws import AWSConfig, get_aws_client, get_aws_session
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_s3.cmd_upload_logs import cmd_upload_logs
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
+from infrahouse_toolkit.cli.lib import LazyChoice, aws_profiles, aws_regions
 
 AWS_DEFAULT_REGION = "us-west-1"
 LOG = getLogger(__name__)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "upload-logs": "infrahouse_toolkit.cli.ih_s3.cmd_upload_logs:cmd_upload_logs",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -31,14 +36,14 @@ LOG = getLogger(__name__)
 @click.option(
     "--aws-profile",
     help="AWS profile name for authentication.",
-    type=click.Choice(AWSConfig().profiles),
+    type=LazyChoice(aws_profiles),
     default=None,
     show_default=True,
 )
 @click.option(
     "--aws-region",
     help="AWS region to use.",
-    type=click.Choice(AWSConfig().regions),
+    type=LazyChoice(aws_regions),
     show_default=True,
     default=None,
 )
@@ -46,6 +51,9 @@ LOG = getLogger(__name__)
 @click.pass_context
 def ih_s3(ctx, **kwargs):
     """AWS S3 helpers."""
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_core.aws import AWSConfig, get_aws_client, get_aws_session
+
     setup_logging(debug=kwargs["debug"])
 
     aws_profile = kwargs["aws_profile"]
@@ -63,8 +71,3 @@ def ih_s3(ctx, **kwargs):
         LOG.error(err)
         LOG.error("Use the --aws-region option to specify the AWS region.")
         sys.exit(1)
-
-
-for cmd in [cmd_upload_logs]:
-    # noinspection PyTypeChecker
-    ih_s3.add_command(cmd)
@@ -7,6 +7,7 @@
 """
 
 import sys
+from contextlib import nullcontext
 from logging import getLogger
 from subprocess import PIPE, Popen
 from urllib.parse import urlparse
@@ -16,6 +17,8 @@ from botocore.exceptions import ClientError
 from infrahouse_core.aws.asg import ASG
 from infrahouse_core.aws.asg_instance import ASGInstance
 
+from infrahouse_toolkit.aws.instance_metadata import get_instance_metadata
+from infrahouse_toolkit.aws.lifecycle_heartbeat import LifecycleHeartbeat
 from infrahouse_toolkit.lock.exceptions import LockAcquireError
 from infrahouse_toolkit.lock.system import SystemLock
 
@@ -68,15 +71,21 @@ def cmd_upload_logs(ctx, **kwargs):
     """
     s3_client = ctx.obj["s3_client"]
     url_parts = urlparse(kwargs["s3_path"])
-    local_instance = ASGInstance()
+    local_instance = ASGInstance(instance_id=get_instance_metadata().instance_id)
     only_if_terminating = kwargs["only_if_terminating"]
 
     if only_if_terminating is None or (only_if_terminating and local_instance.lifecycle_state == "Terminating:Wait"):
         try:
+            hook_name = kwargs["complete_lifecycle_action"]
             with SystemLock("/var/tmp/cmd_upload_logs.lock", blocking=False):
+                heartbeat = (
+                    LifecycleHeartbeat(hook_name, instance_id=local_instance.instance_id)
+                    if hook_name
+                    else nullcontext()
+                )
                 try:
                     cmd = ["tar", "zcf", "-", kwargs["local_directory"]]
-                    with Popen(cmd, stdout=PIPE) as proc:
+                    with heartbeat, Popen(cmd, stdout=PIPE) as proc:
                         s3_client.upload_fileobj(
                             proc.stdout,
                             url_parts.netloc,
@@ -85,8 +94,8 @@ def cmd_upload_logs(ctx, **kwargs):
                 except ClientError as err:
                     LOG.exception(err)
                     sys.exit(1)
-                if kwargs["complete_lifecycle_action"]:
-                    ASG(asg_name=local_instance.asg_name).complete_lifecycle_action(kwargs["complete_lifecycle_action"])
+                if hook_name:
+                    ASG(asg_name=local_instance.asg_name).complete_lifecycle_action(hook_name)
 
         except LockAcquireError as err:
             LOG.warning(err)
@@ -11,31 +11,27 @@ from logging import getLogger
 import click
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_check import cmd_check
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_checkpool import cmd_checkpool
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_deleteunreferenced import (
-    cmd_deleteunreferenced,
-)
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_dumpunreferenced import (
-    cmd_dumpunreferenced,
-)
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_export import cmd_export
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_get_secret_value import (
-    cmd_get_secret_value,
-)
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_includedeb import cmd_includedeb
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_list import cmd_list
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_migrate import cmd_migrate
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_remove import cmd_remove
-from infrahouse_toolkit.cli.ih_s3_reprepro.cmd_set_secret_value import (
-    cmd_set_secret_value,
-)
-from infrahouse_toolkit.cli.utils import DEPENDENCIES, check_dependencies
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "check": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_check:cmd_check",
+        "checkpool": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_checkpool:cmd_checkpool",
+        "deleteunreferenced": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_deleteunreferenced:cmd_deleteunreferenced",
+        "dumpunreferenced": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_dumpunreferenced:cmd_dumpunreferenced",
+        "export": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_export:cmd_export",
+        "get-secret-value": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_get_secret_value:cmd_get_secret_value",
+        "includedeb": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_includedeb:cmd_includedeb",
+        "list": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_list:cmd_list",
+        "migrate": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_migrate:cmd_migrate",
+        "remove": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_remove:cmd_remove",
+        "set-secret-value": "infrahouse_toolkit.cli.ih_s3_reprepro.cmd_set_secret_value:cmd_set_secret_value",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -95,22 +91,8 @@ def ih_s3_reprepro(*args, **kwargs):  # pylint: disable=unused-argument
     """
     Tool to manage deb packages to a Debian repository hosted in an S3 bucket.
     """
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_toolkit.cli.utils import DEPENDENCIES, check_dependencies
+
     setup_logging(debug=kwargs["debug"])
     check_dependencies(DEPENDENCIES)
-
-
-for cmd in [
-    cmd_list,
-    cmd_checkpool,
-    cmd_check,
-    cmd_remove,
-    cmd_includedeb,
-    cmd_export,
-    cmd_dumpunreferenced,
-    cmd_deleteunreferenced,
-    cmd_set_secret_value,
-    cmd_get_secret_value,
-    cmd_migrate,
-]:
-    # noinspection PyTypeChecker
-    ih_s3_reprepro.add_command(cmd)
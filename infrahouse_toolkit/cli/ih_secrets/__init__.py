@@ -11,19 +11,23 @@ from logging import getLogger
 
 import click
 from botocore.exceptions import NoRegionError
-from infrahouse_core.aws import get_aws_client, get_aws_session
-from infrahouse_core.aws.config import AWSConfig
 from infrahouse_core.logging import setup_logging
 
-from infrahouse_toolkit.cli.ih_secrets.cmd_get import cmd_get
-from infrahouse_toolkit.cli.ih_secrets.cmd_list import cmd_list
-from infrahouse_toolkit.cli.ih_secrets.cmd_set import cmd_set
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
+from infrahouse_toolkit.cli.lib import LazyChoice, aws_profiles, aws_regions
 
 AWS_DEFAULT_REGION = "us-west-1"
 LOG = getLogger(__name__)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "get": "infrahouse_toolkit.cli.ih_secrets.cmd_get:cmd_get",
+        "list": "infrahouse_toolkit.cli.ih_secrets.cmd_list:cmd_list",
+        "set": "infrahouse_toolkit.cli.ih_secrets.cmd_set:cmd_set",
+    },
+)
 @click.option(
     "--debug",
     help="Enable debug logging.",
@@ -41,14 +45,14 @@ LOG = getLogger(__name__)
 @click.option(
     "--aws-profile",
     help="AWS profile name for authentication.",
-    type=click.Choice(AWSConfig().profiles),
+    type=LazyChoice(aws_profiles),
     default=None,
     show_default=True,
 )
 @click.option(
     "--aws-region",
     help="AWS region to use.",
-    type=click.Choice(AWSConfig().regions),
+    type=LazyChoice(aws_regions),
     show_default=True,
     default=None,
 )
@@ -56,6 +60,10 @@ LOG = getLogger(__name__)
 @click.pass_context
 def ih_secrets(ctx, **kwargs):
     """AWS EC2 helpers."""
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_core.aws import get_aws_client, get_aws_session
+    from infrahouse_core.aws.config import AWSConfig
+
     setup_logging(debug=kwargs["debug"], quiet=not kwargs["verbose"])
     aws_profile = kwargs["aws_profile"]
     aws_region = kwargs["aws_region"]
@@ -72,8 +80,3 @@ def ih_secrets(ctx, **kwargs):
         LOG.error(err)
         LOG.error("Use the --aws-region option to specify the AWS region.")
         sys.exit(1)
-
-
-for cmd in [cmd_list, cmd_get, cmd_set]:
-    # noinspection PyTypeChecker
-    ih_secrets.add_command(cmd)
@@ -11,19 +11,21 @@ import sys
 from logging import getLogger
 from subprocess import check_output
 
-import boto3
 import click
 from infrahouse_core.logging import setup_logging
 
 from infrahouse_toolkit import DEFAULT_ENCODING
-from infrahouse_toolkit.cli.ih_secrets.cmd_get import get_secret
-from infrahouse_toolkit.cli.ih_skeema.cmd_run import cmd_run
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
 
 LOG = getLogger()
 
 
 @click.group(
     "ih-skeema",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "run": "infrahouse_toolkit.cli.ih_skeema.cmd_run:cmd_run",
+    },
 )
 @click.option(
     "--debug",
@@ -62,6 +64,11 @@ def ih_skeema(ctx, **kwargs):  # pylint: disable=unused-argument
     """
     Various Skeema (https://www.skeema.io/) helper commands. See ih-skeema --help for details.
     """
+    # pylint: disable=import-outside-toplevel
+    import boto3
+
+    from infrahouse_toolkit.cli.ih_secrets.cmd_get import get_secret
+
     setup_logging(debug=kwargs["debug"])
     try:
         out = check_output(
@@ -87,8 +94,3 @@ def ih_skeema(ctx, **kwargs):  # pylint: disable=unused-argument
         LOG.error("Skeema executable not found: %s", err)
         LOG.error("Please install Skeema first or specify a skeema executable via --skeema-path.")
         sys.exit(1)
-
-
-for cmd in [cmd_run]:
-    # noinspection PyTypeChecker
-    ih_skeema.add_command(cmd)
@@ -0,0 +1,53 @@
+"""
+.. topic:: ``lazy_group.py``
+
+    A click group that imports its subcommands on demand.
+
+Subcommand modules import boto3, elasticsearch, PyGithub and friends.  A
+group that imports all of them up front makes every run pay for all of
+them, although a run executes one subcommand.  :class:`LazyGroup` knows
+its subcommands by name and import path and imports a subcommand only
+when it is invoked, completed or listed in ``--help``::
+
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={"upload-logs": "infrahouse_toolkit.cli.ih_s3.cmd_upload_logs:cmd_upload_logs"},
+    )
+    def ih_s3():
+        ...
+"""
+
+from importlib import import_module
+from typing import Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    A :class:`click.Group` with subcommands imported on first use.
+
+    :param lazy_subcommands: Dictionary from a subcommand name to
+        ``module:attribute`` of the click command, e.g.
+        ``{"list": "infrahouse_toolkit.cli.ih_secrets.cmd_list:cmd_list"}``.
+    :type lazy_subcommands: dict
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{self.lazy_subcommands[cmd_name]} is not a click command")
+        return command
@@ -1,8 +1,8 @@
 """Auxiliary functions for command line tools."""
 
 import json
+from typing import Callable, Iterable, List, Optional, Tuple
 
-import boto3
 import click
 import hcl
 
@@ -40,19 +40,19 @@ def get_backend_key(tf_file=DEFAULT_TF_BACKEND_FILE) -> str:
 def get_s3_client(role: str = None):
     """
     Get a boto3 S3 client to work with AWS S3.
-    If a role is given, assume it.
+    If a role is given, assume it.  Role credentials are reused from the
+    on-disk cache of :mod:`~infrahouse_toolkit.aws.credential_cache`.
 
     :param role: ARN of a role to be assumed
     :return: A boto3 S3 client object
     """
+    # pylint: disable=import-outside-toplevel
+    import boto3
+
+    from infrahouse_toolkit.aws.credential_cache import cached_role_session
+
     if role:
-        client = boto3.client("sts")
-        response = client.assume_role(DurationSeconds=900, RoleArn=role, RoleSessionName="infrahouse-toolkit")
-        session = boto3.Session(
-            aws_access_key_id=response["Credentials"]["AccessKeyId"],
-            aws_secret_access_key=response["Credentials"]["SecretAccessKey"],
-            aws_session_token=response["Credentials"]["SessionToken"],
-        )
+        session = cached_role_session(role, "infrahouse-toolkit")
     else:
         session = boto3.Session()
 
@@ -70,6 +70,8 @@ def get_elastic_password(secret_key="elastic_secret"):
         ``elastic_secret`` or ``kibana_system_secret`` are the only supported values.
     :type secret_key: str
     """
+    import boto3  # pylint: disable=import-outside-toplevel
+
     try:
         with open("/etc/puppetlabs/facter/facts.d/custom.json", encoding=DEFAULT_OPEN_ENCODING) as f_custom_facts:
             custom_facts = json.load(f_custom_facts)
@@ -97,3 +99,78 @@ def read_from_file_or_prompt(file_path: str, prompt_text="Enter a secret value a
             return val_desc.read()
     else:
         return click.prompt(prompt_text, hide_input=True)
+
+
+class LazyChoice(click.ParamType):
+    """
+    A :class:`click.Choice` that computes its choices the first time they are needed.
+
+    Options are declared when a command module is imported, so choices
+    like the profiles in ``~/.aws/config`` would be computed on every run,
+    even for ``--version``.  A lazy choice computes them only when the
+    option is validated, completed or shown in ``--help``, and then
+    behaves like a :class:`click.Choice` of them.
+
+    :param get_choices: Function with no arguments that returns the choices.
+    :type get_choices: Callable
+    :param case_sensitive: See :class:`click.Choice`.
+    :type case_sensitive: bool
+    """
+
+    name = "choice"
+
+    def __init__(self, get_choices: Callable[[], Iterable[str]], case_sensitive: bool = True):
+        self._get_choices = get_choices
+        self._case_sensitive = case_sensitive
+        self._choice_type: Optional[click.Choice] = None
+
+    @property
+    def choices(self) -> Tuple[str, ...]:
+        """Choices, computed on first access."""
+        return tuple(self._choice.choices)
+
+    @property
+    def _choice(self) -> click.Choice:
+        if self._choice_type is None:
+            self._choice_type = click.Choice(tuple(self._get_choices()), case_sensitive=self._case_sensitive)
+        return self._choice_type
+
+    def to_info_dict(self) -> dict:
+        return self._choice.to_info_dict()
+
+    def get_metavar(self, param: click.Parameter, *args, **kwargs) -> Optional[str]:
+        return self._choice.get_metavar(param, *args, **kwargs)
+
+    def get_missing_message(self, param: click.Parameter, *args, **kwargs) -> str:
+        return self._choice.get_missing_message(param, *args, **kwargs)
+
+    def convert(self, value, param: Optional[click.Parameter], ctx: Optional[click.Context]):
+        return self._choice.convert(value, param, ctx)
+
+    def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> list:
+        return self._choice.shell_complete(ctx, param, incomplete)
+
+
+def aws_profiles() -> List[str]:
+    """
+    Profiles in ``~/.aws/config``, for a :class:`LazyChoice` of ``--aws-profile``.
+
+    :return: Profile names.
+    """
+    # Group modules use it, so boto3 is imported only when the choices are needed.
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_core.aws.config import AWSConfig
+
+    return AWSConfig().profiles
+
+
+def aws_regions() -> List[str]:
+    """
+    Regions AWS offers, for a :class:`LazyChoice` of ``--aws-region``.
+
+    :return: Region names.
+    """
+    # pylint: disable=import-outside-toplevel
+    from infrahouse_core.aws.config import AWSConfig
+
+    return AWSConfig().regions
@@ -0,0 +1,61 @@
+"""Import-time budget of the console scripts."""
+
+import json
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+from infrahouse_toolkit.cli.benchmarks import CONSOLE_SCRIPTS
+
+# Seconds a console script may take to import.  Imports take about 0.3 s
+# on a laptop; the budget leaves room for slow CI runners.
+IMPORT_TIME_BUDGET = 2.0
+
+# Imports the module in a fresh interpreter and reports how long it took,
+# whether it read the AWS config or resolved a host name, and which of the
+# heavy libraries it imported.
+IMPORT_PROBE = dedent("""
+    import importlib
+    import json
+    import sys
+    import time
+
+    side_effects = []
+
+    def audit(event, args):
+        if event == "open" and str(args[0]).endswith("config") and ".aws" in str(args[0]):
+            side_effects.append(f"open {args[0]}")
+        elif event.startswith("socket.gethost"):
+            side_effects.append(event)
+
+    sys.addaudithook(audit)
+    started = time.perf_counter()
+    importlib.import_module(sys.argv[1])
+    seconds = time.perf_counter() - started
+    heavy = sorted({"boto3", "elasticsearch", "github", "infrahouse_core.aws"} & set(sys.modules))
+    print(json.dumps({"seconds": seconds, "side_effects": side_effects, "heavy": heavy}))
+    """)
+
+
+@pytest.mark.parametrize("script", sorted(CONSOLE_SCRIPTS))
+def test_import_time(script, tmp_path) -> None:
+    """
+    Importing a console script is quick, doesn't read ``~/.aws/config`` or
+    query DNS, and leaves boto3 and friends to the commands that use them.
+    """
+    aws_home = tmp_path / ".aws"
+    aws_home.mkdir()
+    (aws_home / "config").write_text("[profile foo]\nregion = us-west-2\n")
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE, CONSOLE_SCRIPTS[script].split(":")[0]],
+        capture_output=True,
+        check=True,
+        env={"HOME": str(tmp_path), "PATH": "/usr/bin:/bin"},
+        text=True,
+    )
+    probe = json.loads(result.stdout.splitlines()[-1])
+    assert probe["side_effects"] == []
+    assert probe["heavy"] == []
+    assert probe["seconds"] < IMPORT_TIME_BUDGET
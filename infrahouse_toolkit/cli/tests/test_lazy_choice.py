@@ -0,0 +1,31 @@
+"""Unit tests for :py:class:`infrahouse_toolkit.cli.lib.LazyChoice`."""
+
+from unittest import mock
+
+import click
+from click.testing import CliRunner
+
+from infrahouse_toolkit.cli.lib import LazyChoice
+
+
+def test_lazy_choice():
+    """Choices are computed once, on first use, and validate like :py:class:`click.Choice`."""
+    get_choices = mock.Mock(return_value=["foo", "bar"])
+
+    @click.command()
+    @click.option("--name", type=LazyChoice(get_choices))
+    @click.version_option("1.0")
+    def cmd(name):
+        click.echo(name)
+
+    runner = CliRunner()
+    assert runner.invoke(cmd, ["--version"]).exit_code == 0
+    assert runner.invoke(cmd, []).exit_code == 0
+    get_choices.assert_not_called()
+
+    assert runner.invoke(cmd, ["--name", "foo"]).output == "foo\n"
+    result = runner.invoke(cmd, ["--name", "baz"])
+    assert result.exit_code == 2
+    assert "'baz' is not one of 'foo', 'bar'" in result.output
+    assert "[foo|bar]" in runner.invoke(cmd, ["--help"]).output
+    get_choices.assert_called_once_with()
@@ -0,0 +1,82 @@
+"""Unit tests for :py:class:`infrahouse_toolkit.cli.lazy_group.LazyGroup`."""
+
+import subprocess
+import sys
+from importlib import import_module
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from infrahouse_toolkit.cli.benchmarks import CONSOLE_SCRIPTS, measure_imports
+from infrahouse_toolkit.cli.lazy_group import LazyGroup
+
+
+def test_lazy_group():
+    """Subcommands are listed without being imported and run when invoked."""
+
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={"get": "infrahouse_toolkit.cli.ih_secrets.cmd_get:cmd_get"},
+    )
+    def cmd():
+        """Test group."""
+
+    @cmd.command()
+    def local():
+        """A regular subcommand."""
+        click.echo("local")
+
+    ctx = click.Context(cmd)
+    assert cmd.list_commands(ctx) == ["get", "local"]
+    assert "get" not in cmd.commands
+    assert cmd.get_command(ctx, "get").name == "get"
+    assert cmd.get_command(ctx, "foo") is None
+    assert CliRunner().invoke(cmd, ["local"]).output == "local\n"
+    assert "No such command 'foo'" in CliRunner().invoke(cmd, ["foo"]).output
+
+
+def test_lazy_group_bad_path():
+    """A lazy subcommand must point to a click command."""
+    group = LazyGroup(lazy_subcommands={"foo": "infrahouse_toolkit.cli.lib:DEFAULT_TF_BACKEND_FILE"})
+    with pytest.raises(TypeError, match="is not a click command"):
+        group.get_command(click.Context(group), "foo")
+
+
+@pytest.mark.parametrize("script", sorted(CONSOLE_SCRIPTS))
+def test_lazy_subcommands_resolve(script):
+    """Every lazy subcommand of every console script imports and has the name it is registered under."""
+
+    def check(command, ctx):
+        if isinstance(command, click.Group):
+            for name in command.list_commands(ctx):
+                subcommand = command.get_command(ctx, name)
+                assert subcommand.name == name
+                check(subcommand, click.Context(subcommand, parent=ctx))
+
+    module, attribute = CONSOLE_SCRIPTS[script].split(":")
+    command = getattr(import_module(module), attribute)
+    check(command, click.Context(command))
+
+
+def test_subcommands_are_not_imported():
+    """Importing a console script doesn't import its subcommands."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import infrahouse_toolkit.cli.ih_github; "
+            "print(sorted(m for m in sys.modules if m.startswith('infrahouse_toolkit.cli.ih_github.')))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_measure_imports():
+    """A command line needs fewer imports than all subcommands of its script."""
+    _, lazy_modules = measure_imports("ih-github runner check-health", repeat=1)
+    _, eager_modules = measure_imports("ih-github runner check-health", eager=True, repeat=1)
+    assert 0 < lazy_modules < eager_modules